@@ -0,0 +1,3 @@
+from .benchmark import run_benchmark, compare_baseline, benchmark_print
+from .benchmark import load_baseline, save_baseline, BENCHMARK_BASELINE, REGRESSION_TOLERANCE
+from .fixtures import synthetic_fund, recorded_fund, SyntheticProvider, BENCHMARK_LENGTHS
@@ -0,0 +1,67 @@
+"""
+Benchmark runner; from the repository root:
+
+    python -m libs.benchmark [--lengths 1y 2y] [--funds 1 4] [--fixtures DIR] [--save]
+
+Exits non-zero if any case regressed against the baseline.
+"""
+import sys
+import argparse
+
+from libs.utils import STANDARD_COLORS
+
+from .benchmark import run_benchmark, benchmark_print
+from .benchmark import load_baseline, save_baseline, compare_baseline
+from .benchmark import BENCHMARK_BASELINE, REGRESSION_TOLERANCE
+from .fixtures import BENCHMARK_LENGTHS
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m libs.benchmark',
+        description="Offline timing and peak memory of every indicator, metric and " +
+        "per-fund production run, compared against a stored baseline.")
+    parser.add_argument('--lengths', nargs='+', default=list(BENCHMARK_LENGTHS.keys()),
+                        choices=list(BENCHMARK_LENGTHS.keys()), help="series lengths")
+    parser.add_argument('--funds', nargs='+', type=int, default=[1, 4],
+                        help="fund counts of whole production runs")
+    parser.add_argument('--groups', nargs='+', default=['fund', 'prod', 'index'],
+                        choices=['fund', 'prod', 'index'], help="benchmark groups")
+    parser.add_argument('--cases', nargs='+', default=None, help="only these cases")
+    parser.add_argument('--fixtures', default=None,
+                        help="directory of recorded '<ticker>.csv' fixtures (default: synthetic)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case")
+    parser.add_argument('--no_memory', action='store_true', help="skip peak memory runs")
+    parser.add_argument('--baseline', default=BENCHMARK_BASELINE, help="baseline file")
+    parser.add_argument('--save', action='store_true',
+                        help="store the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="allowed relative slowdown / memory growth")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(lengths=args.lengths, fund_counts=args.funds,
+                            groups=args.groups, cases=args.cases,
+                            fixture_dir=args.fixtures, repeat=args.repeat,
+                            memory=not args.no_memory)
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare_baseline(results, baseline, tolerance=args.tolerance)
+    benchmark_print(results, baseline=baseline, regressions=regressions)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Benchmark baseline saved to '{args.baseline}'.")
+    elif baseline is None:
+        print(f"{WARNING}No benchmark baseline at '{args.baseline}'; run with '--save' " +
+              f"to record one.{NORMAL}")
+
+    if len(regressions) > 0 and not args.save:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,568 @@
+"""
+Benchmark
+
+Times every entry point 'run_prod' calls for a fund (each indicator, feature detection and
+metric of 'analyze_fund_period', plus the synopsis), whole per-fund production runs, and the
+index metrics of 'run_indexes' (MCI, BCI, CCI, TCI). Each case is swept across series lengths
+(1y / 2y / 5y / 10y of daily bars) and fund counts on offline fixtures, reporting best-of-N time
+and peak (traced) memory. Results are compared against a stored baseline; cases slower or
+larger than the baseline by more than a tolerance are reported as regressions.
+"""
+import io
+import os
+import json
+import time
+import shutil
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+
+import numpy as np
+
+from libs.tools import full_stochastic, ultimate_oscillator, cluster_oscs, RSI
+from libs.tools import awesome_oscillator, momentum_oscillator
+from libs.tools import relative_strength, moving_average_swing_trade
+from libs.tools import triple_moving_average, triple_exp_mov_average
+from libs.tools import hull_moving_average
+from libs.tools import mov_avg_convergence_divergence
+from libs.tools import on_balance_volume
+from libs.tools import find_resistance_support_lines
+from libs.tools import get_trendlines
+from libs.tools import get_high_level_stats
+from libs.tools import bear_bull_power
+from libs.tools import total_power
+from libs.tools import bollinger_bands
+from libs.tools import commodity_channel_index
+from libs.tools import candlesticks
+from libs.tools import risk_comparison
+from libs.tools import rate_of_change_oscillator
+from libs.tools import know_sure_thing
+
+from libs.features import feature_detection_head_and_shoulders
+from libs.features import analyze_price_gaps
+
+from libs.metrics import market_composite_index
+from libs.metrics import bond_composite_index
+from libs.metrics import correlation_composite_index
+from libs.metrics import type_composite_index
+from libs.metrics import future_returns
+from libs.metrics import generate_synopsis
+from libs.metrics import assemble_last_signals
+
+from libs.utils import INDICATOR_CACHE, RENDER_POOL, STANDARD_COLORS
+from libs.utils import set_price_provider, set_price_store_dir, FixtureProvider
+
+from releases.prod import analyze_fund_period
+from releases.indexes import index_data_session
+
+from .fixtures import BENCHMARK_LENGTHS, synthetic_fund, recorded_fund, fixture_tickers
+from .fixtures import SyntheticProvider
+
+WARNING = STANDARD_COLORS["warning"]
+NOTE = STANDARD_COLORS["ticker"]
+NORMAL = STANDARD_COLORS["normal"]
+
+BENCHMARK_DIR = os.path.join("output", "benchmark")
+BENCHMARK_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+# Bump when cases change so old baselines are not compared against
+BENCHMARK_VERSION = 1
+
+# A case regresses when slower (or larger) than its baseline by both margins
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_MIN_SECONDS = 0.005
+REGRESSION_MIN_MB = 1.0
+
+BENCHMARK_CONFIG = {
+    'state': 'run',
+    'period': ['2y'],
+    'interval': ['1d'],
+    'process_steps': 27,
+    'properties': {
+        'Indexes': {
+            'Market Sector': True,
+            'Type Sector': True,
+            'Corporate Bond': True,
+            'Treasury Bond': True,
+            'International Bond': True,
+            'Correlation': {'run': True, 'type': 'short'}
+        }
+    }
+}
+
+
+class QuietProgress(object):
+    """QuietProgress
+
+    Stand-in for ProgressBar, so progress output does not skew timings.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def uptick(self, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def end(self):
+        pass
+
+
+def fund_cases() -> list:
+    """Fund Cases
+
+    Returns:
+        list -- (name, path of the result in a period's analysis, f(fund, context)) of each
+                entry point 'analyze_fund_period' runs, called as it calls them
+    """
+    def fund_kwargs(context: dict) -> dict:
+        return {'name': context['name'], 'plot_output': False,
+                'progress_bar': context['p'], 'view': context['period']}
+
+    return [
+        ('statistics', ['statistics'],
+         lambda fund, ctx: get_high_level_stats(fund)),
+        ('clustered_osc', ['clustered_osc'],
+         lambda fund, ctx: cluster_oscs(fund, function='all', filter_thresh=3,
+                                        **fund_kwargs(ctx))),
+        ('full_stochastic', ['full_stochastic'],
+         lambda fund, ctx: full_stochastic(fund, out_suppress=False, **fund_kwargs(ctx))),
+        ('rsi', ['rsi'],
+         lambda fund, ctx: RSI(fund, out_suppress=False, **fund_kwargs(ctx))),
+        ('ultimate', ['ultimate'],
+         lambda fund, ctx: ultimate_oscillator(fund, out_suppress=False, **fund_kwargs(ctx))),
+        ('awesome', ['awesome'],
+         lambda fund, ctx: awesome_oscillator(fund, **fund_kwargs(ctx))),
+        ('momentum_oscillator', ['momentum_oscillator'],
+         lambda fund, ctx: momentum_oscillator(fund, **fund_kwargs(ctx))),
+        ('on_balance_volume', ['on_balance_volume'],
+         lambda fund, ctx: on_balance_volume(fund, **fund_kwargs(ctx))),
+        ('simple_moving_average', ['simple_moving_average'],
+         lambda fund, ctx: triple_moving_average(fund, **fund_kwargs(ctx))),
+        ('exp_moving_average', ['exp_moving_average'],
+         lambda fund, ctx: triple_exp_mov_average(fund, **fund_kwargs(ctx))),
+        ('sma_swing_trade', ['sma_swing_trade'],
+         lambda fund, ctx: moving_average_swing_trade(fund, **fund_kwargs(ctx))),
+        ('ema_swing_trade', ['ema_swing_trade'],
+         lambda fund, ctx: moving_average_swing_trade(fund, function='ema',
+                                                      **fund_kwargs(ctx))),
+        ('hull_moving_average', ['hull_moving_average'],
+         lambda fund, ctx: hull_moving_average(fund, **fund_kwargs(ctx))),
+        ('macd', ['macd'],
+         lambda fund, ctx: mov_avg_convergence_divergence(fund, **fund_kwargs(ctx))),
+        ('bear_bull_power', ['bear_bull_power'],
+         lambda fund, ctx: bear_bull_power(fund, **fund_kwargs(ctx))),
+        ('total_power', ['total_power'],
+         lambda fund, ctx: total_power(fund, **fund_kwargs(ctx))),
+        ('bollinger_bands', ['bollinger_bands'],
+         lambda fund, ctx: bollinger_bands(fund, **fund_kwargs(ctx))),
+        ('commodity_channels', ['commodity_channels'],
+         lambda fund, ctx: commodity_channel_index(fund, **fund_kwargs(ctx))),
+        ('rate_of_change', ['rate_of_change'],
+         lambda fund, ctx: rate_of_change_oscillator(fund, **fund_kwargs(ctx))),
+        ('know_sure_thing', ['know_sure_thing'],
+         lambda fund, ctx: know_sure_thing(fund, **fund_kwargs(ctx))),
+        ('relative_strength', ['relative_strength'],
+         lambda fund, ctx: relative_strength(
+             ctx['name'], full_data_dict=ctx['dataset'], config=ctx['config'],
+             plot_output=False, meta={}, progress_bar=ctx['p'], period=ctx['period'],
+             interval='1d', view=ctx['period'], sector_match=(None, None, [], {}))[0]),
+        ('risk_ratios', ['statistics', 'risk_ratios'],
+         lambda fund, ctx: risk_comparison(fund, ctx['dataset']['^GSPC'],
+                                           ctx['dataset']['^IRX'], sector_data=None)),
+        ('support_resistance', ['support_resistance'],
+         lambda fund, ctx: find_resistance_support_lines(fund, **fund_kwargs(ctx))),
+        ('head_shoulders', ['features', 'head_shoulders'],
+         lambda fund, ctx: feature_detection_head_and_shoulders(fund, **fund_kwargs(ctx))),
+        ('candlesticks', ['candlesticks'],
+         lambda fund, ctx: candlesticks(fund, **fund_kwargs(ctx))),
+        ('price_gaps', ['price_gaps'],
+         lambda fund, ctx: analyze_price_gaps(fund, **fund_kwargs(ctx))),
+        ('trendlines', ['trendlines'],
+         lambda fund, ctx: get_trendlines(fund, meta={}, **fund_kwargs(ctx))),
+        ('futures', ['futures'],
+         lambda fund, ctx: future_returns(fund, progress_bar=ctx['p'])),
+        ('last_signals', ['last_signals'],
+         lambda fund, ctx: assemble_last_signals(ctx['results'], progress_bar=ctx['p'])),
+        ('synopsis', None,
+         lambda fund, ctx: generate_synopsis(
+             {ctx['name']: {ctx['period']: ctx['results'], 'metadata': {}}},
+             name=ctx['name']))
+    ]
+
+
+INDEX_CASES = [
+    ('mci', market_composite_index),
+    ('bci', bond_composite_index),
+    ('cci', correlation_composite_index),
+    ('tci', type_composite_index)
+]
+
+
+def run_benchmark(**kwargs) -> dict:
+    """Run Benchmark
+
+    Optional Args:
+        lengths {list} -- series lengths, keys of BENCHMARK_LENGTHS
+                          (default: {['1y', '2y', '5y', '10y']})
+        fund_counts {list} -- fund counts of whole production runs (default: {[1, 4]})
+        repeat {int} -- timed runs per case, the best is kept (default: {3})
+        fixture_dir {str} -- recorded '<ticker>.csv' fixtures; None for synthetic data
+                             (default: {None})
+        cases {list} -- only cases with these names (default: {None}, all)
+        groups {list} -- 'fund', 'prod' and / or 'index' (default: {all})
+        memory {bool} -- also measure peak traced memory (default: {True})
+
+    Returns:
+        dict -- {key: {'group', 'case', 'length', 'funds', 'seconds', 'peak_mb'}}
+    """
+    # Cases time the analysis only: saved charts are dropped ('--render=off') rather than
+    # rendered inline into an 'output/temp' that a benchmark run does not create
+    previous = RENDER_POOL.summary()
+    RENDER_POOL.configure(mode='off')
+    try:
+        return benchmark_cases(**kwargs)
+    finally:
+        RENDER_POOL.configure(mode=previous['mode'], workers=previous['workers'])
+
+
+def benchmark_cases(**kwargs) -> dict:
+    """ Runs the cases of 'run_benchmark' (same arguments and results) """
+    lengths = kwargs.get('lengths', list(BENCHMARK_LENGTHS.keys()))
+    fund_counts = kwargs.get('fund_counts', [1, 4])
+    repeat = max(kwargs.get('repeat', 3), 1)
+    fixture_dir = kwargs.get('fixture_dir')
+    cases = kwargs.get('cases')
+    groups = kwargs.get('groups', ['fund', 'prod', 'index'])
+    memory = kwargs.get('memory', True)
+
+    results = {}
+    for length in lengths:
+        bars = BENCHMARK_LENGTHS[length]
+        funds = benchmark_funds(bars, max(fund_counts + [1]), fixture_dir)
+        if funds is None:
+            print(f"{WARNING}Benchmark: fixtures are shorter than {length}; skipped.{NORMAL}")
+            continue
+
+        if 'fund' in groups:
+            name = list(funds['funds'].keys())[0]
+            context = fund_context(name, funds['dataset'], length)
+            for case, path, function in fund_cases():
+                if cases is not None and case not in cases:
+                    result = measure(lambda: function(funds['dataset'][name], context),
+                                     repeat=1, memory=False)
+                else:
+                    result = measure(lambda: function(funds['dataset'][name], context),
+                                     repeat=repeat, memory=memory)
+                    add_result(results, 'fund', case, length, 1, result)
+                # Later cases (e.g. last signals, synopsis) read earlier results
+                store_result(context['results'], path, result['value'])
+
+        if 'prod' in groups and (cases is None or 'analyze_fund' in cases):
+            for count in fund_counts:
+                names = list(funds['funds'].keys())[:count]
+                result = measure(lambda: prod_run(names, funds['dataset'], length),
+                                 repeat=repeat, memory=memory)
+                add_result(results, 'prod', 'analyze_fund', length, count, result)
+
+        if 'index' in groups:
+            results.update(index_benchmark(length, repeat=repeat, memory=memory,
+                                           fixture_dir=fixture_dir, cases=cases))
+
+    return results
+
+
+def benchmark_funds(bars: int, count: int, fixture_dir: str = None) -> dict:
+    """Benchmark Funds
+
+    Arguments:
+        bars {int} -- daily bars of each fund
+        count {int} -- number of funds
+
+    Keyword Arguments:
+        fixture_dir {str} -- recorded fixtures; None for synthetic data (default: {None})
+
+    Returns:
+        dict -- 'funds' {name: pd.DataFrame}, 'dataset' (funds plus '^GSPC' and '^IRX'),
+                None if recorded fixtures are too short
+    """
+    tickers = [ticker for ticker in fixture_tickers(fixture_dir)
+               if ticker not in ('^GSPC', '^IRX')]
+    funds = {}
+    if len(tickers) > 0:
+        for ticker in tickers[:count]:
+            fund = recorded_fund(ticker, bars, fixture_dir)
+            if fund is None:
+                return None
+            funds[ticker] = fund
+    else:
+        for i in range(count):
+            funds[f"SYN{i}"] = synthetic_fund(bars, ticker=f"SYN{i}")
+
+    dates = list(funds.values())[0].index
+    dataset = dict(funds)
+    for index in ('^GSPC', '^IRX'):
+        dataset[index] = recorded_fund(index, bars, fixture_dir) \
+            if index in fixture_tickers(fixture_dir) else None
+        if dataset[index] is None or not dataset[index].index.equals(dates):
+            dataset[index] = synthetic_fund(0, ticker=index, dates=dates)
+
+    return {'funds': funds, 'dataset': dataset}
+
+
+def fund_context(name: str, dataset: dict, period: str) -> dict:
+    """ Arguments shared by the fund cases, and their results so far """
+    config = dict(BENCHMARK_CONFIG)
+    config['period'] = [period]
+    return {'name': name, 'dataset': dataset, 'period': period, 'config': config,
+            'p': QuietProgress(), 'results': {}}
+
+
+def store_result(results: dict, path: list, value):
+    """ Places a case's result where 'analyze_fund_period' keeps it """
+    if path is None:
+        return
+    for key in path[:-1]:
+        results = results.setdefault(key, {})
+    results[path[-1]] = value
+
+
+def prod_run(names: list, dataset: dict, period: str) -> dict:
+    """ Production analysis of funds, as 'run_prod' runs each fund and period """
+    config = dict(BENCHMARK_CONFIG)
+    config['period'] = [period]
+    analysis = {}
+    for name in names:
+        analysis[name] = {'metadata': {}}
+        analysis[name][period] = analyze_fund_period(
+            name, period, 0, {period: dataset}, config, {}, QuietProgress(),
+            sector_match=(None, None, [], {}))
+        analysis[name]['synopsis'] = generate_synopsis(analysis, name=name)
+    return analysis
+
+
+def index_benchmark(length: str, **kwargs) -> dict:
+    """Index Benchmark
+
+    The index metrics' data is fetched once into a session (from a scratch price store, so
+    synthetic data never reaches the real one); each metric is then timed on it.
+
+    Arguments:
+        length {str} -- period of the index metrics
+
+    Optional Args:
+        repeat {int} -- (default: {3})
+        memory {bool} -- (default: {True})
+        fixture_dir {str} -- (default: {None}, synthetic)
+        cases {list} -- (default: {None}, all)
+
+    Returns:
+        dict -- results, as 'run_benchmark'
+    """
+    repeat = kwargs.get('repeat', 3)
+    memory = kwargs.get('memory', True)
+    fixture_dir = kwargs.get('fixture_dir')
+    cases = kwargs.get('cases')
+
+    config = json.loads(json.dumps(BENCHMARK_CONFIG))
+    config['period'] = [length]
+
+    provider = SyntheticProvider()
+    if fixture_dir is not None:
+        provider = FixtureProvider(fixture_dir)
+
+    store_dir = tempfile.mkdtemp(prefix='benchmark_store_')
+    set_price_provider(provider)
+    set_price_store_dir(store_dir)
+
+    results = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            session = index_data_session(config)
+            for interval in list(session.requests.keys()):
+                session.fetch(interval)
+
+        for case, function in INDEX_CASES:
+            if cases is not None and case not in cases:
+                continue
+            result = measure(lambda: function(config=config, plot_output=False,
+                                              session=session),
+                             repeat=repeat, memory=memory)
+            add_result(results, 'index', case, length, 1, result)
+
+    finally:
+        set_price_provider()
+        set_price_store_dir()
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+    return results
+
+
+def measure(function, **kwargs) -> dict:
+    """Measure
+
+    Arguments:
+        function {function} -- f() -> value
+
+    Optional Args:
+        repeat {int} -- timed runs, the best is kept (default: {3})
+        memory {bool} -- one more run under tracemalloc for peak memory (default: {True})
+
+    Returns:
+        dict -- 'seconds', 'peak_mb' (None if not measured), 'value' of the last run
+    """
+    repeat = kwargs.get('repeat', 3)
+    memory = kwargs.get('memory', True)
+
+    seconds = []
+    value = None
+    for _ in range(repeat):
+        # Memoized indicators would otherwise be served from the cache after the first run
+        INDICATOR_CACHE.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            value = function()
+            seconds.append(time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        INDICATOR_CACHE.clear()
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            function()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+
+    INDICATOR_CACHE.clear()
+    return {'seconds': min(seconds), 'peak_mb': peak_mb, 'value': value}
+
+
+def add_result(results: dict, group: str, case: str, length: str, funds: int, result: dict):
+    """ Adds a measured case under its key, e.g. 'fund:rsi:2y:1' """
+    results[f"{group}:{case}:{length}:{funds}"] = {
+        'group': group, 'case': case, 'length': length, 'funds': funds,
+        'seconds': result['seconds'], 'peak_mb': result['peak_mb']
+    }
+
+
+def benchmark_environment() -> dict:
+    """ Machine and library versions a baseline was recorded with """
+    import pandas as pd
+    return {'python': platform.python_version(), 'numpy': np.__version__,
+            'pandas': pd.__version__, 'machine': platform.machine(),
+            'processor': platform.processor(), 'node': platform.node()}
+
+
+def save_baseline(results: dict, path: str = BENCHMARK_BASELINE):
+    """ Stores results as the baseline later runs are compared against """
+    directory = os.path.dirname(path)
+    if directory != '' and not os.path.exists(directory):
+        os.makedirs(directory)
+    baseline = {'version': BENCHMARK_VERSION, 'environment': benchmark_environment(),
+                'saved': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}
+    with open(path, 'w') as b_file:
+        json.dump(baseline, b_file, indent=2)
+
+
+def load_baseline(path: str = BENCHMARK_BASELINE) -> dict:
+    """ Stored baseline, None if missing or from another benchmark version """
+    if not os.path.exists(path):
+        return None
+    with open(path) as b_file:
+        baseline = json.load(b_file)
+    if baseline.get('version') != BENCHMARK_VERSION:
+        print(f"{WARNING}Benchmark baseline '{path}' is from another benchmark version; " +
+              f"not compared.{NORMAL}")
+        return None
+    return baseline
+
+
+def compare_baseline(results: dict, baseline: dict, **kwargs) -> list:
+    """Compare Baseline
+
+    Arguments:
+        results {dict} -- results of 'run_benchmark'
+        baseline {dict} -- baseline of 'load_baseline'
+
+    Optional Args:
+        tolerance {float} -- allowed relative slowdown / growth (default: {REGRESSION_TOLERANCE})
+
+    Returns:
+        list -- regressions: {'key', 'metric', 'baseline', 'current', 'change'}
+    """
+    tolerance = kwargs.get('tolerance', REGRESSION_TOLERANCE)
+    regressions = []
+    if baseline is None:
+        return regressions
+
+    for key, result in results.items():
+        base = baseline['results'].get(key)
+        if base is None:
+            continue
+
+        checks = [('seconds', REGRESSION_MIN_SECONDS), ('peak_mb', REGRESSION_MIN_MB)]
+        for metric, min_change in checks:
+            current = result.get(metric)
+            previous = base.get(metric)
+            if current is None or previous is None:
+                continue
+            if (current > previous * (1.0 + tolerance)) and (current - previous > min_change):
+                regressions.append({'key': key, 'metric': metric, 'baseline': previous,
+                                    'current': current,
+                                    'change': (current - previous) / max(previous, 1e-12)})
+
+    return regressions
+
+
+def benchmark_print(results: dict, **kwargs):
+    """Benchmark Print
+
+    Arguments:
+        results {dict} -- results of 'run_benchmark'
+
+    Optional Args:
+        baseline {dict} -- shows the change of each case against it (default: {None})
+        regressions {list} -- of 'compare_baseline', flagged in the table (default: {[]})
+    """
+    baseline = kwargs.get('baseline')
+    regressions = kwargs.get('regressions', [])
+    flagged = set([regression['key'] for regression in regressions])
+
+    print(" ")
+    print(f"{'case':<28}{'length':>7}{'funds':>6}{'time (ms)':>12}{'peak (MB)':>11}" +
+          f"{'vs. baseline':>14}")
+    ordered = sorted(results.items(), key=lambda item: (
+        item[1]['group'], item[1]['case'], BENCHMARK_LENGTHS.get(item[1]['length'], 0),
+        item[1]['funds']))
+    for key, result in ordered:
+        peak = '' if result['peak_mb'] is None else f"{result['peak_mb']:.1f}"
+        change = ''
+        base = (baseline or {}).get('results', {}).get(key)
+        if base is not None and base.get('seconds'):
+            change = f"{(result['seconds'] - base['seconds']) / base['seconds'] * 100.0:+.1f}%"
+
+        color = WARNING if key in flagged else NORMAL
+        name = f"{result['group']}:{result['case']}"
+        print(f"{color}{name:<28}{result['length']:>7}{result['funds']:>6}" +
+              f"{result['seconds'] * 1000.0:>12.1f}{peak:>11}{change:>14}{NORMAL}")
+
+    fund_results = [result for result in results.values() if result['group'] == 'fund']
+    for length in BENCHMARK_LENGTHS:
+        per_length = [result for result in fund_results if result['length'] == length]
+        if len(per_length) > 0:
+            slowest = sorted(per_length, key=lambda result: result['seconds'])[::-1][:3]
+            print(f"{NOTE}Slowest at {length}: " + ', '.join(
+                [f"{result['case']} ({result['seconds'] * 1000.0:.0f} ms)"
+                 for result in slowest]) + f"{NORMAL}")
+
+    if len(regressions) > 0:
+        print(" ")
+        print(f"{WARNING}PERFORMANCE REGRESSIONS ({len(regressions)}):{NORMAL}")
+        for regression in regressions:
+            print(f"{WARNING}    {regression['key']} {regression['metric']}: " +
+                  f"{regression['baseline']:.4f} -> {regression['current']:.4f} " +
+                  f"({regression['change'] * 100.0:+.1f}%){NORMAL}")
+    print(" ")
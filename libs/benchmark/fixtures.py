@@ -0,0 +1,117 @@
+"""
+Benchmark Fixtures
+
+Offline OHLCV data for the benchmark: deterministic synthetic series (a random walk per ticker,
+seeded by its symbol) or recorded '<ticker>.csv' fixtures, for single funds and as a price
+provider for the price store.
+"""
+import os
+import zlib
+
+import pandas as pd
+import numpy as np
+
+from libs.utils import as_fund_frame
+
+# Daily bars of each benchmarked series length
+BENCHMARK_LENGTHS = {'1y': 252, '2y': 504, '5y': 1260, '10y': 2520}
+
+# Last bar of fund fixtures, so timings do not depend on the day they run
+FIXTURE_END = '2020-05-29'
+
+
+def synthetic_fund(bars: int, **kwargs) -> pd.DataFrame:
+    """Synthetic Fund
+
+    Arguments:
+        bars {int} -- number of daily bars
+
+    Optional Args:
+        ticker {str} -- seeds the series (default: {'SYNTH'})
+        end {str} -- last date (default: {FIXTURE_END})
+        dates {pd.DatetimeIndex} -- dates of the bars, overrides 'bars' and 'end'
+                                    (default: {None})
+
+    Returns:
+        pd.DataFrame -- OHLCV frame shaped like a formatted download (FundFrame attached)
+    """
+    ticker = kwargs.get('ticker', 'SYNTH')
+    dates = kwargs.get('dates')
+    if dates is None:
+        dates = pd.bdate_range(end=kwargs.get('end', FIXTURE_END), periods=bars, name='Date')
+    bars = len(dates)
+
+    rng = np.random.default_rng(zlib.crc32(ticker.encode('utf-8')))
+    drift = rng.normal(0.0003, 0.0002)
+    volatility = rng.uniform(0.008, 0.02)
+
+    close = 50.0 * np.exp(np.cumsum(rng.normal(drift, volatility, bars)))
+    open_ = np.empty(bars)
+    open_[0] = close[0]
+    open_[1:] = close[:-1] * np.exp(rng.normal(0.0, volatility / 3.0, bars - 1))
+    high = np.maximum(open_, close) * (1.0 + np.abs(rng.normal(0.0, volatility / 2.0, bars)))
+    low = np.minimum(open_, close) * (1.0 - np.abs(rng.normal(0.0, volatility / 2.0, bars)))
+    volume = np.round(rng.lognormal(14.0, 0.4, bars))
+
+    fund = pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close,
+                         'Adj Close': close, 'Volume': volume}, index=dates)
+    as_fund_frame(fund)
+    return fund
+
+
+def recorded_fund(ticker: str, bars: int, fixture_dir: str) -> pd.DataFrame:
+    """Recorded Fund
+
+    Arguments:
+        ticker {str} -- fixture name ('<ticker>.csv' in 'fixture_dir')
+        bars {int} -- number of (latest) daily bars
+        fixture_dir {str} -- directory of recorded fixtures
+
+    Returns:
+        pd.DataFrame -- OHLCV frame (FundFrame attached), None if the fixture is missing or
+                        shorter than 'bars'
+    """
+    path = os.path.join(fixture_dir, f"{ticker}.csv")
+    if not os.path.exists(path):
+        return None
+
+    fund = pd.read_csv(path, index_col=0, parse_dates=True).dropna()
+    if len(fund.index) < bars:
+        return None
+
+    fund = fund.iloc[-bars:].copy()
+    fund.index.name = 'Date'
+    as_fund_frame(fund)
+    return fund
+
+
+def fixture_tickers(fixture_dir: str) -> list:
+    """ Tickers of the recorded fixtures in a directory """
+    if fixture_dir is None or not os.path.exists(fixture_dir):
+        return []
+    return sorted([name[:-4] for name in os.listdir(fixture_dir) if name.endswith('.csv')])
+
+
+class SyntheticProvider(object):
+    """SyntheticProvider
+
+    Price provider (see 'set_price_provider') serving synthetic series for any ticker.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, tickers: list, start, end, interval: str = '1d'):
+        self.requests.append({"tickers": list(tickers), "start": start,
+                              "end": end, "interval": interval})
+        dates = pd.bdate_range(start=start, end=end, name='Date')
+        dates = dates[dates < pd.Timestamp(end)]
+        frames = {ticker: synthetic_fund(0, ticker=ticker, dates=dates)
+                  for ticker in tickers}
+
+        if len(tickers) == 1:
+            return frames[tickers[0]]
+        return pd.concat(frames, axis=1)
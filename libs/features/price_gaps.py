@@ -3,7 +3,7 @@ import numpy as np
 from datetime import datetime
 import pprint
 
-from libs.utils import ProgressBar
+from libs.utils import ProgressBar, as_fund_frame
 from libs.tools import trends
 from .feature_utils import feature_plotter
 
@@ -67,26 +67,21 @@ def get_gaps(fund: pd.DataFrame, threshold=0.0) -> list:
     Returns:
         dict -- dict of gap lists
     """
-    gap_index = []
-    gap_date = []
-    gap_direction = []
-    diff = []
-
-    for i in range(1, len(fund['Close'])):
-
-        if (fund['High'][i-1] < fund['Low'][i] * (1.0 - threshold)):
-            # Positive price gap
-            gap_index.append(i)
-            gap_date.append(fund.index[i].strftime("%Y-%m-%d"))
-            gap_direction.append("up")
-            diff.append(fund['High'][i] - fund['High'][i-1])
-
-        elif (fund['High'][i] < fund['Low'][i-1] * (1.0 - threshold)):
-            # Negative price gap
-            gap_index.append(i)
-            gap_date.append(fund.index[i].strftime("%Y-%m-%d"))
-            gap_direction.append("down")
-            diff.append(fund['Low'][i] - fund['Low'][i-1])
+    frame = as_fund_frame(fund)
+    high = frame.high
+    low = frame.low
+
+    # An 'up' gap takes precedence over a 'down' gap on the same bar
+    up = high[:-1] < low[1:] * (1.0 - threshold)
+    down = ~up & (high[1:] < low[:-1] * (1.0 - threshold))
+    gaps_at = np.flatnonzero(up | down) + 1
+
+    gap_index = gaps_at.tolist()
+    gap_date = frame.index[gaps_at].strftime("%Y-%m-%d").tolist()
+    gap_direction = ["up" if is_up else "down" for is_up in up[gaps_at - 1]]
+    diff = np.where(up[gaps_at - 1],
+                    high[gaps_at] - high[gaps_at - 1],
+                    low[gaps_at] - low[gaps_at - 1]).tolist()
 
     gaps = {"indexes": gap_index, "dates": gap_date,
             "direction": gap_direction, "difference": diff}
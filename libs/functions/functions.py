@@ -702,32 +702,26 @@ def nasit_build(data: dict, makeup: dict, has_cash=False, by_price=True):
         key = 'Adj Close'
 
     for tick in data:
-        deltas[tick] = []
-        deltas[tick].append(0.0)
-        data_len = len(data[tick][key])
-        for i in range(1, data_len):
-            diff = (data[tick][key][i] - data[tick]
-                    [key][i-1]) / data[tick][key][i-1]
-            deltas[tick].append(diff)
+        closes = data[tick][key].to_numpy(dtype=float)
+        data_len = len(closes)
+        deltas[tick] = np.zeros(data_len)
+        deltas[tick][1:] = np.diff(closes) / closes[:-1]
 
     if has_cash:
         DIVISOR = CASH_PERCENT / float(data_len) / 2.0
-        deltas['cash'] = [0.0]
-        for i in range(1, data_len):
-            deltas['cash'].append(DIVISOR)
-
-    new_fund = [0.0] * data_len
-    for component in makeup:
-        sym = component['symbol']
-        amt = component['allocation']
-        if sym == 'xCASHx':
-            sym = 'cash'
-        for i, val in enumerate(deltas[sym]):
-            new_fund[i] += val * amt
-
-    new_closes = [START_VALUE]
-    for i in range(1, len(new_fund)):
-        close = new_closes[-1] * (1.0 + new_fund[i])
-        new_closes.append(close)
-
-    return new_closes
+        deltas['cash'] = np.full(data_len, DIVISOR)
+        deltas['cash'][0] = 0.0
+
+    # Daily composite change is the allocation-weighted sum of the components' changes
+    symbols = ['cash' if component['symbol'] == 'xCASHx' else component['symbol']
+               for component in makeup]
+    allocations = np.array([component['allocation'] for component in makeup], dtype=float)
+    new_fund = np.zeros(data_len)
+    if len(symbols) > 0:
+        new_fund = allocations @ np.vstack([deltas[sym] for sym in symbols])
+
+    growth = 1.0 + new_fund
+    growth[0] = START_VALUE
+    new_closes = np.cumprod(growth)
+
+    return new_closes.tolist()
@@ -30,9 +30,11 @@ def bond_composite_index(config: dict, **kwargs):
     Optional Args:
         plot_output {bool} -- True to render plot in realtime (default: {True})
         clock {float} -- time for prog_bar (default: {None})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
     """
     plot_output = kwargs.get('plot_output', True)
     clock = kwargs.get('clock')
+    session = kwargs.get('session')
 
     period = config['period']
     properties = config['properties']
@@ -46,7 +48,7 @@ def bond_composite_index(config: dict, **kwargs):
             if 'Treasury Bond' in props:
                 if props['Treasury Bond'] == True:
                     data, sectors, index_type, m_data = metrics_initializer(
-                        period=period, bond_type='Treasury')
+                        period=period, bond_type='Treasury', session=session)
                     if m_data:
                         _, data, dates = composite_index(data, sectors, m_data,
                                                          plot_output=plot_output,
@@ -59,7 +61,7 @@ def bond_composite_index(config: dict, **kwargs):
             if 'Corporate Bond' in props:
                 if props['Corporate Bond'] == True:
                     data, sectors, index_type, m_data = metrics_initializer(
-                        period=period, bond_type='Corporate')
+                        period=period, bond_type='Corporate', session=session)
                     if m_data:
                         _, data, dates = composite_index(data, sectors, m_data,
                                                          plot_output=plot_output,
@@ -72,7 +74,7 @@ def bond_composite_index(config: dict, **kwargs):
             if 'International Bond' in props:
                 if props['International Bond'] == True:
                     data, sectors, index_type, m_data = metrics_initializer(
-                        period=period, bond_type='International')
+                        period=period, bond_type='International', session=session)
                     if m_data:
                         _, data, dates = composite_index(data, sectors, m_data,
                                                          plot_output=plot_output,
@@ -95,28 +97,60 @@ def bond_composite_index(config: dict, **kwargs):
                         ylabel='Normalized Price')
 
 
-def metrics_initializer(period='2y', bond_type='Treasury'):
+def metrics_initializer(period='2y', bond_type='Treasury', session=None):
     """Metrics Initializer
 
     Keyword Arguments:
         period {str} -- (default: {'2y'})
         bond_type {str} -- (default: {'Treasury'})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     Returns:
         list -- downloaded_data, sector_list, index, metrics_file data
     """
+    tickers, index, m_data = metrics_tickers(bond_type=bond_type)
+    if m_data is None:
+        return {}, [], '', None
+
+    if isinstance(period, (list)):
+        period = period[0]
+
+    sectors = tickers.split(' ')
+    # tickers = index_appender(tickers)
+    print(" ")
+    print(f'Fetching {bond_type} Bond Composite Index funds for {period}...')
+    if session is not None:
+        data = session.get(tickers, indexes=sectors,
+                           period=period, interval='1d')
+    else:
+        data, _ = download_data_indexes(
+            indexes=sectors, tickers=tickers, period=period, interval='1d')
+    print(" ")
+    return data, sectors, index, m_data
+
+
+def metrics_tickers(bond_type='Treasury') -> list:
+    """Metrics Tickers
+
+    Keyword Arguments:
+        bond_type {str} -- (default: {'Treasury'})
+
+    Returns:
+        list -- ticker string, index, metrics_file data (None on failure)
+    """
     metrics_file = os.path.join("resources", "sectors.json")
     if not os.path.exists(metrics_file):
         print(
             f"{WARNING}WARNING: '{metrics_file}' not found for " +
             f"'metrics_initializer'. Failed.{NORMAL}")
-        return {}, [], '', None
+        return '', '', None
 
     with open(metrics_file) as m_file:
         m_data = json.load(m_file)
         m_file.close()
         m_data = m_data.get("Bond_Weight")
 
+    index = ''
     if bond_type == 'Treasury':
         # Treasury (Gov't only - general alternative would be BSV/BIV/BLV)
         data = m_data[bond_type]
@@ -141,17 +175,24 @@ def metrics_initializer(period='2y', bond_type='Treasury'):
     else:
         tickers = 'BND'
 
-    if isinstance(period, (list)):
-        period = period[0]
+    return tickers, index, m_data
 
-    sectors = tickers.split(' ')
-    # tickers = index_appender(tickers)
-    print(" ")
-    print(f'Fetching {bond_type} Bond Composite Index funds for {period}...')
-    data, _ = download_data_indexes(
-        indexes=sectors, tickers=tickers, period=period, interval='1d')
-    print(" ")
-    return data, sectors, index, m_data
+
+def session_request(session, config: dict):
+    """Session Request
+
+    Registers the enabled bond indexes' funds with the run's market data session
+
+    Arguments:
+        session {MarketDataSession} -- run-scoped market data source
+        config {dict} -- controlling config dictionary
+    """
+    props = config.get('properties', {}).get('Indexes', {})
+    for bond_type in ('Treasury', 'Corporate', 'International'):
+        if props.get(f"{bond_type} Bond") == True:
+            tickers, _, m_data = metrics_tickers(bond_type=bond_type)
+            if m_data is not None:
+                session.request(tickers, period=config['period'], interval='1d')
 
 
 def bond_type_index_generator(data: pd.DataFrame, m_data: dict, bond_type='Treasury') -> list:
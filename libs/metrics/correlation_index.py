@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 
 from libs.utils import download_data_indexes, index_appender, ProgressBar
 from libs.utils import dual_plotting
-from libs.tools import beta_comparison_list
+from libs.tools import rolling_beta_rsq
 
 
 def correlation_composite_index(config: dict, **kwargs) -> dict:
@@ -20,6 +20,7 @@ def correlation_composite_index(config: dict, **kwargs) -> dict:
         clock {uint64_t} -- time for prog_bar (default: {None})
         data {pd.DataFrame} -- funds data object (default: {None})
         sectors {list} -- sectors list (default: {None})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     Returns:
         list -- dict contains all correlation items, data, sectors list
@@ -28,6 +29,7 @@ def correlation_composite_index(config: dict, **kwargs) -> dict:
     clock = kwargs.get('clock')
     data = kwargs.get('data')
     sectors = kwargs.get('sectors')
+    session = kwargs.get('session')
 
     corr = dict()
     corr_config = config.get('properties', {}).get(
@@ -37,7 +39,8 @@ def correlation_composite_index(config: dict, **kwargs) -> dict:
         config['duration'] = corr_config.get('type', 'long')
 
         if data is None or sectors is None:
-            data, sectors = metrics_initializer(config['duration'])
+            data, sectors = metrics_initializer(
+                config['duration'], session=session)
         if data:
             corr = get_correlation(
                 data, sectors, plot_output=plot_output, clock=clock)
@@ -45,18 +48,48 @@ def correlation_composite_index(config: dict, **kwargs) -> dict:
     return corr, data, sectors
 
 
-def metrics_initializer(duration: str = 'short') -> list:
+def metrics_initializer(duration: str = 'short', session=None) -> list:
     """Metrics Initializer
 
     Keyword Arguments:
         duration {str} -- duration of view (default: {'short'})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     Returns:
         list -- data downloaded and sector list
     """
+    sectors, tickers, start, date = metrics_tickers(duration=duration)
+    if sectors is None:
+        return None, []
+
+    all_tickers = tickers.split(' ')
+
+    print(" ")
+    print('Fetching Correlation Composite Index funds...')
+
+    if session is not None:
+        data = session.get(tickers, indexes=all_tickers,
+                           start=start, end=date, interval='1d')
+    else:
+        data, _ = download_data_indexes(
+            indexes=all_tickers, tickers=tickers, start=start, end=date, interval='1d')
+    print(" ")
+
+    return data, sectors
+
+
+def metrics_tickers(duration: str = 'short') -> list:
+    """Metrics Tickers
+
+    Keyword Arguments:
+        duration {str} -- duration of view (default: {'short'})
+
+    Returns:
+        list -- sector list, ticker string, start date, end date (None on failure)
+    """
     metrics_file = os.path.join("resources", "sectors.json")
     if not os.path.exists(metrics_file):
-        return None, []
+        return None, '', None, None
 
     with open(metrics_file) as m_file:
         m_data = json.load(m_file)
@@ -68,21 +101,31 @@ def metrics_initializer(duration: str = 'short') -> list:
     START = m_data['start']
 
     tickers = index_appender(tickers)
-    all_tickers = tickers.split(' ')
     date = datetime.now().strftime('%Y-%m-%d')
 
-    print(" ")
-    print('Fetching Correlation Composite Index funds...')
-
     if duration == 'short':
         START = datetime.today() - timedelta(days=900)
         START = START.strftime('%Y-%m-%d')
 
-    data, _ = download_data_indexes(
-        indexes=all_tickers, tickers=tickers, start=START, end=date, interval='1d')
-    print(" ")
+    return sectors, tickers, START, date
 
-    return data, sectors
+
+def session_request(session, config: dict):
+    """Session Request
+
+    Registers the CCI funds with the run's market data session, if the index is enabled
+
+    Arguments:
+        session {MarketDataSession} -- run-scoped market data source
+        config {dict} -- controlling config dictionary
+    """
+    corr_config = config.get('properties', {}).get(
+        'Indexes', {}).get('Correlation', {})
+    if corr_config.get('run', False):
+        sectors, tickers, start, date = metrics_tickers(
+            duration=corr_config.get('type', 'long'))
+        if sectors is not None:
+            session.request(tickers, start=start, end=date, interval='1d')
 
 
 def get_correlation(data: dict, sectors: list, **kwargs) -> dict:
@@ -109,42 +152,27 @@ def get_correlation(data: dict, sectors: list, **kwargs) -> dict:
         tot_len = len(data['^GSPC']['Close'])
         start_pt = max(PERIOD_LENGTH)
 
-        tot_count = (tot_len - start_pt) * 11 * len(PERIOD_LENGTH)
-        if tot_count < 25000:
-            divisor = 50
-        else:
-            divisor = 250
-        pbar_count = np.ceil(tot_count / float(divisor))
-
         progress_bar = ProgressBar(
-            pbar_count, name="Correlation Composite Index", offset=clock)
+            len(PERIOD_LENGTH) + 1, name="Correlation Composite Index", offset=clock)
         progress_bar.start()
 
-        corrs = {}
         dates = data['^GSPC'].index[start_pt:tot_len]
         net_correlation = []
         legend = []
-        counter = 0
 
-        for period in PERIOD_LENGTH:
-            nc = [0.0] * (tot_len-start_pt)
-
-            for sector in sectors:
-                corrs[sector] = []
+        # Rolling beta / r-squared of all sectors at once, per period length
+        panel = np.array([list(data[sector]['Close'][0:tot_len])
+                          for sector in sectors], dtype=np.float64).T
+        _, rsqds = rolling_beta_rsq(
+            panel, data['^GSPC']['Close'][0:tot_len], PERIOD_LENGTH)
+        progress_bar.uptick()
 
-                for i in range(start_pt, tot_len):
-                    _, rsqd = beta_comparison_list(
-                        data[sector]['Close'][i-period:i], data['^GSPC']['Close'][i-period:i])
-                    corrs[sector].append(rsqd)
-                    nc[i-start_pt] += rsqd
-                    counter += 1
-
-                    if counter == divisor:
-                        progress_bar.uptick()
-                        counter = 0
+        for period in PERIOD_LENGTH:
+            nc = np.sum(rsqds[period][start_pt:tot_len], axis=1).tolist()
 
             net_correlation.append(nc.copy())
             legend.append('Corr-' + str(period))
+            progress_bar.uptick()
 
         norm_corr = []
         for nc_period in net_correlation:
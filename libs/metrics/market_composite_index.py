@@ -14,10 +14,10 @@ import json
 import pandas as pd
 import numpy as np
 
-from libs.tools import cluster_oscs, beta_comparison_list
+from libs.tools import cluster_oscs_panel, beta_comparison_list
 from libs.tools import windowed_moving_avg
 from libs.utils import dual_plotting, generic_plotting
-from libs.utils import ProgressBar, index_appender
+from libs.utils import ProgressBar, index_appender, fund_panel
 from libs.utils import download_data_indexes
 from libs.utils import STANDARD_COLORS
 
@@ -35,6 +35,7 @@ def market_composite_index(**kwargs) -> dict:
         period {str / list} -- time period for data (e.g. '2y') (default: {None})
         clock {uint64_t} -- time for prog_bar (default: {None})
         data {pd.DataFrame} -- dataset with sector funds (default: {None})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     returns:
         list -- dict contains all mci information, dict fund content, sector list
@@ -45,6 +46,7 @@ def market_composite_index(**kwargs) -> dict:
     plot_output = kwargs.get('plot_output', True)
     data = kwargs.get('data')
     sectors = kwargs.get('sectors')
+    session = kwargs.get('session')
 
     if config is not None:
         period = config['period']
@@ -72,7 +74,8 @@ def market_composite_index(**kwargs) -> dict:
 
                     mci = dict()
                     if data is None or sectors is None:
-                        data, sectors = metrics_initializer(period=period)
+                        data, sectors = metrics_initializer(
+                            period=period, session=session)
 
                     if data:
                         p = ProgressBar(len(sectors)*2+5,
@@ -92,22 +95,51 @@ def market_composite_index(**kwargs) -> dict:
     return {}, None, None
 
 
-def metrics_initializer(period='5y', name='Market Composite Index'):
+def metrics_initializer(period='5y', name='Market Composite Index', session=None):
     """Metrics Initializer
 
     Keyword Arguments:
         period {str/list} -- duration of view (default: {'5y'})
         name {str} -- (default: {'Market Composite Index'})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     Returns:
         list -- data downloaded, sector list
     """
+    sectors, tickers = metrics_tickers()
+    if sectors is None:
+        return None, []
+
+    all_tickers = tickers.split(' ')
+
+    if isinstance(period, (list)):
+        period = period[0]
+
+    print(" ")
+    print(f'Fetching {name} funds for {period}...')
+    if session is not None:
+        data = session.get(tickers, indexes=all_tickers,
+                           period=period, interval='1d')
+    else:
+        data, _ = download_data_indexes(
+            indexes=all_tickers, tickers=tickers, period=period, interval='1d')
+    print(" ")
+
+    return data, sectors
+
+
+def metrics_tickers() -> list:
+    """Metrics Tickers
+
+    Returns:
+        list -- sector list, ticker string (sectors and benchmarks); None, '' on failure
+    """
     metrics_file = os.path.join("resources", "sectors.json")
     if not os.path.exists(metrics_file):
         print(
             f"{WARNING}WARNING: '{metrics_file}' not found for " +
             f"'metrics_initializer'. Failed.{NORMAL_COLOR}")
-        return None, []
+        return None, ''
 
     with open(metrics_file) as m_file:
         m_data = json.load(m_file)
@@ -116,20 +148,25 @@ def metrics_initializer(period='5y', name='Market Composite Index'):
 
     sectors = m_data['tickers']
     tickers = " ".join(m_data['tickers'])
-
     tickers = index_appender(tickers)
-    all_tickers = tickers.split(' ')
 
-    if isinstance(period, (list)):
-        period = period[0]
+    return sectors, tickers
 
-    print(" ")
-    print(f'Fetching {name} funds for {period}...')
-    data, _ = download_data_indexes(
-        indexes=all_tickers, tickers=tickers, period=period, interval='1d')
-    print(" ")
 
-    return data, sectors
+def session_request(session, config: dict):
+    """Session Request
+
+    Registers the MCI funds with the run's market data session, if the index is enabled
+
+    Arguments:
+        session {MarketDataSession} -- run-scoped market data source
+        config {dict} -- controlling config dictionary
+    """
+    props = config.get('properties', {}).get('Indexes', {})
+    if props.get('Market Sector') == True:
+        sectors, tickers = metrics_tickers()
+        if sectors is not None:
+            session.request(tickers, period=config['period'], interval='1d')
 
 
 def simple_beta_rsq(fund: pd.DataFrame, benchmark: pd.DataFrame, recent_period: list = []) -> list:
@@ -177,25 +214,13 @@ def composite_index(data: dict, sectors: list, progress_bar=None, plot_output=Tr
     Returns:
         list -- correlation vector
     """
-    composite = []
-    for tick in sectors:
-        cluster = cluster_oscs(
-            data[tick],
-            plot_output=False,
-            function='market',
-            wma=False,
-            progress_bar=progress_bar)
-
-        graph = cluster['tabular']
-        composite.append(graph)
-
-    composite2 = []
-    for i in range(len(composite[0])):
-        s = 0.0
-        for j in range(len(composite)):
-            s += float(composite[j][i])
-
-        composite2.append(s)
+    composite = cluster_oscs_panel(
+        fund_panel(data, sectors),
+        function='market',
+        wma=False,
+        progress_bar=progress_bar)
+
+    composite2 = [float(s) for s in np.sum(composite, axis=0)]
 
     progress_bar.uptick()
 
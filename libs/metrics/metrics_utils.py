@@ -2,15 +2,23 @@ import pandas as pd
 import numpy as np
 
 from datetime import datetime
+import importlib.util
 import json
 import os
 import pprint
 
-from libs.utils import ProgressBar, INDICATOR_NAMES
+from libs.utils import ProgressBar, INDICATOR_NAMES, as_fund_frame
+from libs.utils import MetadataReader, metadata_stream_exists
 
 SP_500_NAMES = ['^GSPC', 'S&P500', 'SP500', 'GSPC', 'INDEX']
 ACCEPTED_ATTS = INDICATOR_NAMES
 
+EXPORT_DIR = os.path.join("output", "datasets")
+EXPORT_EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow', 'csv': 'csv'}
+
+# Levels of nested tabular / metrics data flattened below an attribute
+EXPORT_MAX_DEPTH = 3
+
 """ Utilities for creating data metrics for plotting later """
 
 
@@ -36,25 +44,21 @@ def future_returns(fund: pd.DataFrame, **kwargs):
 
     fr_data = {}
 
+    frame = as_fund_frame(fund)
+    closes = frame.close
+
     increment = 1.0 / float(len(futures) + 1)
     for future in futures:
-        f_data = []
-        for i in range(len(fund['Close'])-future):
-            cur = fund['Close'][i]
-            fut = fund['Close'][i+future]
-            val = np.round((fut - cur) / cur * 100.0, 3)
-            f_data.append(val)
-
-        for i in range(future):
-            f_data.append(0.0)
-        fr_data[str(future)] = f_data.copy()
+        cur = closes[:max(len(closes) - future, 0)]
+        fut = closes[future:]
+        f_data = np.round((fut - cur) / cur * 100.0, 3).tolist()
+        f_data.extend([0.0] * future)
+        fr_data[str(future)] = f_data
 
         if progress_bar is not None:
             progress_bar.uptick(increment=increment)
 
-    f_data = []
-    for i in range(len(fund.index)):
-        f_data.append(fund.index[i].strftime("%Y-%m-%d"))
+    f_data = frame.index.strftime("%Y-%m-%d").tolist()
 
     fr_data['index'] = f_data
     if not to_json:
@@ -75,28 +79,68 @@ def future_returns(fund: pd.DataFrame, **kwargs):
 def metadata_to_dataset(config: dict):
     """Metadata to Dataset
 
+    Exports tabular / metrics data of metadata as partitioned columnar tables (see
+    'dataset_tables' and 'export_tables')
+
     Arguments:
-        config {dict} -- configuration obj
+        config {dict} -- configuration obj; config['exports']['format'] is 'parquet' (default),
+                         'arrow' or 'csv'
 
     """
     if config.get('exports', {}).get('run'):
         print(f"Exporting datasets...")
-        metadata_file = os.path.join("output", "metadata.json")
-        if not os.path.exists(metadata_file):
-            print(f"WARNING: {metadata_file} does not exist. Exiting...")
-            return None
+        if metadata_stream_exists():
+            # Only the requested tickers and attributes are read from the indexed stream
+            reader = MetadataReader()
+            job = metadata_key_filter(config['exports']['fields'], reader.skeleton())
+            m_data = metadata_subset(reader, job)
+            reader.close()
+
+        else:
+            metadata_file = os.path.join("output", "metadata.json")
+            if not os.path.exists(metadata_file):
+                print(f"WARNING: {metadata_file} does not exist. Exiting...")
+                return None
+
+            with open(metadata_file) as json_file:
+                m_data = json.load(json_file)
+                json_file.close()
+            job = metadata_key_filter(config['exports']['fields'], m_data)
 
-        with open(metadata_file) as json_file:
-            m_data = json.load(json_file)
-            json_file.close()
+        export_format = export_engine(config['exports'].get('format', 'parquet'))
+        tables = dataset_tables(job, m_data)
+        paths = export_tables(tables, export_format=export_format)
+
+        print(f"Exporting datasets complete ({len(paths)} {export_format} files).")
 
-            job = metadata_key_filter(config['exports']['fields'], m_data)
-            full_data = collate_data(job, m_data)
-            full_data = collate_data_periods(job, m_data, all_data=full_data)
-            groomed_data = groom_data(full_data)
-            export_data(groomed_data)
 
-            print(f"Exporting datasets complete.")
+def metadata_subset(reader, job: dict) -> dict:
+    """Metadata Subset
+
+    Arguments:
+        reader {MetadataReader} -- reader of the run's metadata stream
+        job {dict} -- tickers, attributes and periods of the export (see 'metadata_key_filter')
+
+    Returns:
+        dict -- metadata data object holding only the job's tickers, periods and attributes
+    """
+    fields = job['attributes']
+    subset = dict()
+    for ticker in job['tickers']:
+        subset[ticker] = dict()
+        for key in reader.keys(ticker):
+            if key in job['periods']:
+                subset[ticker][key] = reader.get(ticker, key, fields=fields)
+            elif key in fields:
+                subset[ticker][key] = reader.get(ticker, key)
+
+    if '_METRICS_' in reader.funds():
+        subset['_METRICS_'] = dict()
+        for key in reader.keys('_METRICS_'):
+            if key in fields:
+                subset['_METRICS_'][key] = reader.get('_METRICS_', key)
+
+    return subset
 
 
 def metadata_key_filter(keys: str, metadata: dict) -> dict:
@@ -153,248 +197,146 @@ def metadata_key_filter(keys: str, metadata: dict) -> dict:
     return job_dict
 
 
-def collate_data(job: dict, metadata: dict):
-    all_data = dict()
-    for ticker in job['tickers']:
-        all_data[ticker] = dict()
-        for att in job['attributes']:
-            attr = metadata[ticker].get(att, {}).get('tabular')
-            if attr is None:
-                attr = metadata['_METRICS_'].get(att, {}).get('tabular')
-                if attr is None:
-                    continue
-
-            # Flatten tree, if necessary
-            if type(attr) == dict:
-                keys = attr.keys()
-                for key in keys:
-
-                    if type(attr[key]) == dict:
-                        sub_keys = attr[key].keys()
-
-                        for sub in sub_keys:
-                            if type(attr[key][sub]) == dict:
-                                sub_sub_keys = attr[key].keys()
-
-                                for sub_sub in sub_sub_keys:
-                                    if type(attr[key][sub][sub_sub]) == dict:
-                                        print(
-                                            f"WARNING: depth of dictionary exceeded with " +
-                                            f"attribute {att} -> {attr[key][sub][sub_sub].keys()}")
-
-                                    else:
-                                        new_name = [att, str(key), str(
-                                            sub), str(sub_sub)]
-                                        new_name = '-'.join(new_name)
-                                        all_data[ticker][new_name] = attr[key][sub][sub_sub]
-
-                            else:
-                                new_name = [att, str(key), str(sub)]
-                                new_name = '-'.join(new_name)
-                                all_data[ticker][new_name] = attr[key][sub]
-                    else:
-                        new_name = [att, str(key)]
-                        new_name = '-'.join(new_name)
-                        all_data[ticker][new_name] = attr[key]
-            else:
-                all_data[ticker][att] = attr
+def dataset_tables(job: dict, metadata: dict) -> dict:
+    """Dataset Tables
+
+    Builds one typed columnar table per ticker and period from the 'tabular' and 'metrics'
+    data of the job's attributes. Nested data is flattened into columns named by their path
+    (e.g. 'macd-tabular_key-sub'; '-METRICS' marks metrics); columns are aligned on their last
+    (most recent) values. '_METRICS_' attributes form their own table (period 'all').
 
+    Arguments:
+        job {dict} -- tickers, attributes and periods (see 'metadata_key_filter')
+        metadata {dict} -- metadata data object
+
+    Returns:
+        dict -- {(ticker, period): pd.DataFrame}
+    """
+    sources = [(ticker, period, metadata[ticker].get(period, {}))
+               for ticker in job['tickers'] for period in job['periods']]
+    sources.extend([(ticker, 'all', metadata[ticker]) for ticker in job['tickers']])
+    if '_METRICS_' in metadata:
+        sources.append(('_METRICS_', 'all', metadata['_METRICS_']))
+
+    tables = dict()
+    for ticker, period, source in sources:
+        columns = dict()
         for att in job['attributes']:
-            attr = metadata[ticker].get(att, {}).get('metrics')
-            if attr is None:
-                attr = metadata['_METRICS_'].get(att, {}).get('metrics')
-                if attr is None:
-                    continue
-
-            # Flatten tree, if necessary
-            if type(attr) == dict:
-                keys = attr.keys()
-                for key in keys:
-                    if type(attr[key]) == dict:
-                        sub_keys = attr[key].keys()
-                        for sub in sub_keys:
-                            if type(attr[key][sub]) == dict:
-                                sub_sub_keys = attr[key].keys()
-                                for sub_sub in sub_sub_keys:
-                                    if type(attr[key][sub][sub_sub]) == dict:
-                                        print(
-                                            f"WARNING: depth of dictionary exceeded with attribute {att} -> {attr[key][sub][sub_sub].keys()}")
-                                    else:
-                                        new_name = [att, str(key), str(
-                                            sub), str(sub_sub)]
-                                        new_name = '-'.join(new_name)
-                                        new_name += '-METRICS'
-                                        all_data[ticker][new_name] = attr[key][sub][sub_sub]
-                            else:
-                                new_name = [att, str(key), str(sub)]
-                                new_name = '-'.join(new_name)
-                                new_name += '-METRICS'
-                                all_data[ticker][new_name] = attr[key][sub]
-                    else:
-                        new_name = [att, str(key)]
-                        new_name = '-'.join(new_name)
-                        new_name += '-METRICS'
-                        all_data[ticker][new_name] = attr[key]
-            else:
-                new_name = f'{att}-METRICS'
-                all_data[ticker][new_name] = attr
-
-    return all_data
-
-
-def collate_data_periods(job: dict, metadata: dict, all_data=None):
-    if all_data is None:
-        all_data = dict()
+            attr = source.get(att)
+            if not isinstance(attr, dict):
+                continue
+            for kind, suffix in (('tabular', ''), ('metrics', '-METRICS')):
+                if kind in attr:
+                    flatten_tree([att], attr[kind], columns, suffix=suffix)
+
+        if len(columns) > 0:
+            tables[(ticker, period)] = columnar_table(columns)
+
+    return tables
+
+
+def flatten_tree(name: list, node, columns: dict, suffix: str = ''):
+    """ Adds the leaves of 'node' to 'columns', named by their path """
+    if not isinstance(node, dict):
+        columns['-'.join(name) + suffix] = node
+        return
+
+    if len(name) > EXPORT_MAX_DEPTH:
+        print(f"WARNING: depth of dictionary exceeded with attribute " +
+              f"{'-'.join(name)} -> {list(node.keys())}")
+        return
+
+    for key, item in node.items():
+        flatten_tree(name + [str(key)], item, columns, suffix=suffix)
 
-    for ticker in job['tickers']:
-        all_data[ticker] = dict()
-
-        for period in job['periods']:
-            for att in job['attributes']:
-                attr = metadata[ticker][period].get(att, {}).get('tabular')
-                if attr is None:
-                    continue
-
-                # Flatten tree, if necessary
-                if type(attr) == dict:
-                    keys = attr.keys()
-
-                    for key in keys:
-                        if type(attr[key]) == dict:
-                            sub_keys = attr[key].keys()
-
-                            for sub in sub_keys:
-                                if type(attr[key][sub]) == dict:
-                                    sub_sub_keys = attr[key].keys()
-
-                                    for sub_sub in sub_sub_keys:
-                                        if type(attr[key][sub][sub_sub]) == dict:
-                                            print(
-                                                f"WARNING: depth of dictionary exceeded with " +
-                                                f"attribute {att} -> {attr[key][sub][sub_sub].keys()}")
-                                        else:
-                                            new_name = [period, att, str(key), str(
-                                                sub), str(sub_sub)]
-                                            new_name = '-'.join(new_name)
-                                            all_data[ticker][new_name] = attr[key][sub][sub_sub]
-
-                                else:
-                                    new_name = [period, att,
-                                                str(key), str(sub)]
-                                    new_name = '-'.join(new_name)
-                                    all_data[ticker][new_name] = attr[key][sub]
-
-                        else:
-                            new_name = [period, att, str(key)]
-                            new_name = '-'.join(new_name)
-                            all_data[ticker][new_name] = attr[key]
-
-                else:
-                    new_name = [period, att]
-                    new_name = '_'.join(new_name)
-                    all_data[ticker][new_name] = attr
-
-            for att in job['attributes']:
-                attr = metadata[ticker][period].get(att, {}).get('metrics')
-                if attr is None:
-                    continue
-
-                # Flatten tree, if necessary
-                if type(attr) == dict:
-                    keys = attr.keys()
-
-                    for key in keys:
-                        if type(attr[key]) == dict:
-                            sub_keys = attr[key].keys()
-
-                            for sub in sub_keys:
-                                if type(attr[key][sub]) == dict:
-                                    sub_sub_keys = attr[key].keys()
-
-                                    for sub_sub in sub_sub_keys:
-                                        if type(attr[key][sub][sub_sub]) == dict:
-                                            print(
-                                                f"WARNING: depth of dictionary exceeded with " +
-                                                f"attribute {att} -> {attr[key][sub][sub_sub].keys()}")
-                                        else:
-                                            new_name = [period, att, str(key), str(
-                                                sub), str(sub_sub)]
-                                            new_name = '-'.join(new_name)
-                                            new_name += '-METRICS'
-                                            all_data[ticker][new_name] = attr[key][sub][sub_sub]
-
-                                else:
-                                    new_name = [period, att,
-                                                str(key), str(sub)]
-                                    new_name = '-'.join(new_name)
-                                    new_name += '-METRICS'
-                                    all_data[ticker][new_name] = attr[key][sub]
-
-                        else:
-                            new_name = [period, att, str(key)]
-                            new_name = '-'.join(new_name)
-                            new_name += '-METRICS'
-                            all_data[ticker][new_name] = attr[key]
-
-                else:
-                    new_name = f'{period}-{att}-METRICS'
-                    all_data[ticker][new_name] = attr
-
-    return all_data
-
-
-def groom_data(data: dict) -> dict:
-    """Groom Data
-
-    Find the longest tabular data column, and extend all other columns to match that
-    by adding zeros.
+
+def columnar_table(columns: dict) -> pd.DataFrame:
+    """Columnar Table
 
     Arguments:
-        data {dict} -- data to groom
+        columns {dict} -- {name: list or scalar} of a single table
 
     Returns:
-        dict -- groomed data
+        pd.DataFrame -- float64 (numeric) or string columns, padded at the start with nulls
+                        to the longest column
     """
-    max_len = 0
-    new_data = dict()
-    for fund in data.keys():
-        for key in data[fund].keys():
-            if len(data[fund][key]) > max_len:
-                max_len = len(data[fund][key])
+    arrays = {name: typed_column(values) for name, values in columns.items()}
+    length = max([len(array) for array in arrays.values()])
+
+    for name, array in arrays.items():
+        if len(array) < length:
+            pad = np.full(length - len(array), np.nan if array.dtype.kind == 'f' else None,
+                          dtype=array.dtype)
+            arrays[name] = np.concatenate([pad, array])
+
+    return pd.DataFrame(arrays)
+
+
+def typed_column(values) -> np.ndarray:
+    """ Column of float64 (numbers, None as NaN) or, otherwise, strings (object) """
+    if not isinstance(values, list):
+        values = [values]
 
-    for fund in data.keys():
-        new_data[fund] = dict()
-        for key in data[fund].keys():
-            len_old = len(data[fund][key])
-            temp = [0.0] * (max_len - len_old)
-            temp.extend(data[fund][key])
-            new_data[fund][key] = temp
+    try:
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim == 1:
+            return array
+    except (TypeError, ValueError):
+        pass
 
-    return new_data
+    return np.array([None if value is None else
+                     (value if isinstance(value, str) else json.dumps(value))
+                     for value in values], dtype=object)
 
 
-def export_data(all_data: dict):
-    """Export Data
+def export_tables(tables: dict, **kwargs) -> list:
+    """Export Tables
+
+    Writes each table to a (ticker, period) partition: 'output/datasets/ticker=X/period=Y/'.
 
     Arguments:
-        all_data {dict} -- data object to export
+        tables {dict} -- {(ticker, period): pd.DataFrame} (see 'dataset_tables')
+
+    Optional Args:
+        export_format {str} -- 'parquet' (zstd-compressed), 'arrow' (uncompressed IPC, for
+                               memory-mapping) or 'csv' (default: {'parquet'})
+        export_dir {str} -- (default: {EXPORT_DIR})
+
+    Returns:
+        list -- paths of the written files
     """
-    exports = dict()
-    for fund in all_data.keys():
-        index = all_data[fund].get('futures-index', [])
-        df = pd.DataFrame.from_dict(all_data[fund])
-        if len(index) != 0:
-            df.set_index('futures-index')
-        exports[fund] = df.copy()
-
-    pathname = 'output'
-    if not os.path.exists(pathname):
-        os.mkdir(pathname)
-
-    pathname = os.path.join("output", "datasets")
-    if not os.path.exists(pathname):
-        os.mkdir(pathname)
-
-    for fund in exports.keys():
-        filepath = os.path.join(pathname, f"{fund}.csv")
-        exports[fund].to_csv(filepath)
+    export_format = kwargs.get('export_format', 'parquet')
+    export_dir = kwargs.get('export_dir', EXPORT_DIR)
+
+    paths = []
+    for (ticker, period), table in tables.items():
+        pathname = os.path.join(export_dir, f"ticker={ticker}", f"period={period}")
+        if not os.path.exists(pathname):
+            os.makedirs(pathname)
+
+        filepath = os.path.join(pathname, f"data.{EXPORT_EXTENSIONS[export_format]}")
+        if export_format == 'parquet':
+            # Float columns compress best byte-stream-split; strings (e.g. dates) as dictionaries
+            strings = [name for name in table.columns if table[name].dtype.kind == 'O']
+            table.to_parquet(filepath, compression='zstd', index=False,
+                             use_dictionary=strings, use_byte_stream_split=True)
+        elif export_format == 'arrow':
+            table.to_feather(filepath, compression='uncompressed')
+        else:
+            table.to_csv(filepath, index=False)
+        paths.append(filepath)
+
+    return paths
+
+
+def export_engine(export_format: str) -> str:
+    """ Export format to use: columnar formats need 'pyarrow', else csv is written """
+    if export_format not in EXPORT_EXTENSIONS:
+        print(f"WARNING: unknown export format '{export_format}'; using 'parquet'.")
+        export_format = 'parquet'
+
+    if export_format != 'csv' and importlib.util.find_spec('pyarrow') is None:
+        print(f"WARNING: 'pyarrow' is not installed; exporting csv instead of {export_format}.")
+        export_format = 'csv'
+
+    return export_format
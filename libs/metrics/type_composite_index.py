@@ -3,11 +3,11 @@ import json
 import pandas as pd
 import numpy as np
 
-from libs.tools import cluster_oscs
+from libs.tools import cluster_oscs_panel
 from libs.tools import windowed_moving_avg
 from libs.utils import download_data_indexes
 from libs.utils import dual_plotting, generic_plotting
-from libs.utils import ProgressBar, index_appender
+from libs.utils import ProgressBar, index_appender, fund_panel
 from libs.utils import STANDARD_COLORS
 
 ERROR_COLOR = STANDARD_COLORS["error"]
@@ -27,6 +27,7 @@ def type_composite_index(**kwargs) -> list:
         clock {float} -- time for prog_bar (default: {None})
         data {pd.DataFrame} -- fund datasets (default: {None})
         sectors {list} -- list of sectors (default: {None})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     returns:
         list -- dict contains all tci information, data, sectors
@@ -37,6 +38,7 @@ def type_composite_index(**kwargs) -> list:
     clock = kwargs.get('clock')
     data = kwargs.get('data')
     sectors = kwargs.get('sectors')
+    session = kwargs.get('session')
 
     if config is not None:
         period = config['period']
@@ -65,7 +67,7 @@ def type_composite_index(**kwargs) -> list:
                     m_data = get_metrics_content()
                     if data is None or sectors is None:
                         data, sectors = metrics_initializer(
-                            m_data, period='2y')
+                            m_data, period=period, session=session)
 
                     if data:
                         p = ProgressBar(
@@ -74,18 +76,14 @@ def type_composite_index(**kwargs) -> list:
 
                         tci = dict()
 
-                        composite = {}
-                        for sect in sectors:
-                            cluster = cluster_oscs(
-                                data[sect],
-                                plot_output=False,
-                                function='market',
-                                wma=False,
-                                progress_bar=p
-                            )
-
-                            graph = cluster['tabular']
-                            composite[sect] = graph
+                        clusters = cluster_oscs_panel(
+                            fund_panel(data, sectors),
+                            function='market',
+                            wma=False,
+                            progress_bar=p
+                        )
+                        composite = {sect: clusters[i].tolist()
+                                     for i, sect in enumerate(sectors)}
 
                         defensive = type_composites(
                             composite, m_data, type_type='Defensive')
@@ -155,11 +153,12 @@ def type_composite_index(**kwargs) -> list:
     return {}, None, None
 
 
-def metrics_initializer(m_data: dict, period='2y'):
+def metrics_initializer(m_data: dict, period='2y', session=None):
     """Metrics Initializer
 
     Keyword Arguments:
         period {str} -- (default: {'2y'})
+        session {MarketDataSession} -- run-scoped market data source (default: {None})
 
     Returns:
         list -- downloaded_data, sector_list, index, metrics_file data
@@ -175,13 +174,34 @@ def metrics_initializer(m_data: dict, period='2y'):
     # tickers = index_appender(tickers)
     print(" ")
     print(f'Fetching Type Composite Index funds for {period}...')
-    data, _ = download_data_indexes(
-        indexes=sectors, tickers=all_tickers, period=period, interval='1d')
+    if session is not None:
+        data = session.get(all_tickers, indexes=sectors,
+                           period=period, interval='1d')
+    else:
+        data, _ = download_data_indexes(
+            indexes=sectors, tickers=all_tickers, period=period, interval='1d')
     print(" ")
 
     return data, sectors
 
 
+def session_request(session, config: dict):
+    """Session Request
+
+    Registers the TCI funds with the run's market data session, if the index is enabled
+
+    Arguments:
+        session {MarketDataSession} -- run-scoped market data source
+        config {dict} -- controlling config dictionary
+    """
+    props = config.get('properties', {}).get('Indexes', {})
+    if props.get('Type Sector') == True:
+        m_data = get_metrics_content()
+        if isinstance(m_data, dict):
+            tickers = index_appender(" ".join(m_data['Components']))
+            session.request(tickers, period=config['period'], interval='1d')
+
+
 def get_metrics_content() -> dict:
     """Get Metrics Content
 
@@ -149,6 +149,14 @@ def extract_funds(ledger: pd.DataFrame, start_index: int) -> list:
 def create_fund(content: dict) -> dict:
     """Create Fund
 
+    Replays the ledger as sparse deltas: each row's shares (per fund) and cash are added on the
+    first trading day on or after its date, then holdings and cash are cumulative sums and
+    values are holdings times closes.
+
+    '_cash_' Deposit / Withdraw rows are carried forward like any other cash flow. (The former
+    per-row replay let later trades overwrite them, and never carried a cash row after the last
+    trade forward, so final cash and totals of ledgers with such rows differ from it.)
+
     Arguments:
         content {dict} -- data object with all fund data
 
@@ -167,97 +175,69 @@ def create_fund(content: dict) -> dict:
         i += 1
         temp_tick = ledger['Stock'][i]
 
-    composite = {
-        '_cash_': {
-            'value': [float(content['start_capital'])] * len(data[temp_tick]['Close'])
-        }
-    }
-
     full_dates = data[temp_tick].index
-
-    for i, ticker in enumerate(ledger['Stock']):
-        if '_' in ticker:
-            action = ledger['Action'][i]
-
-            date = date_converter(ledger['Date'][i])
-            idx = 0
-            for a, ind in enumerate(full_dates):
-                if ind == date:
-                    idx = a
-                    break
-
-            if action == 'Deposit':
-                action = 'Sell'
-            if action == 'Withdraw':
-                action = 'Buy'
-
-            if action == 'Buy':
-                composite['_cash_']['value'][idx] -= float(ledger['Shares'][i]) * \
-                    float(ledger['Price of Action'][i])
-            if action == 'Sell':
-                composite['_cash_']['value'][idx] += float(ledger['Shares'][i]) * \
-                    float(ledger['Price of Action'][i])
-            continue
-
-        t_data = data[ticker]
-
-        if ticker not in composite:
-            composite[ticker] = {
-                'value': [0.0] * len(t_data.index),
-                'shares': [0] * len(t_data.index)
-            }
-
-        action = ledger['Action'][i]
-        date = date_converter(ledger['Date'][i])
-
-        for j, close in enumerate(t_data['Close']):
-
-            if t_data.index[j] == date:
-                if action == 'Buy':
-                    composite[ticker]['shares'][j] += int(ledger['Shares'][i])
-                    composite[ticker]['value'][j] += float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-                    composite['_cash_']['value'][j] -= float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-
-                elif action == 'Sell':
-                    composite[ticker]['shares'][j] -= int(ledger['Shares'][i])
-                    composite[ticker]['value'][j] -= float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-                    composite['_cash_']['value'][j] += float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-
-            else:
-                if j > 0:
-                    composite[ticker]['shares'][j] = composite[ticker]['shares'][j-1]
-                    composite[ticker]['value'][j] = composite[ticker]['shares'][j] * close
-                    composite['_cash_']['value'][j] = composite['_cash_']['value'][j-1]
+    length = len(full_dates)
+
+    tickers = ledger['Stock'].astype(str).to_numpy()
+    actions = ledger['Action'].astype(str).to_numpy()
+    shares = ledger['Shares'].astype(float).to_numpy()
+    amounts = shares * ledger['Price of Action'].astype(float).to_numpy()
+
+    dates = pd.to_datetime(ledger['Date'], format="%m/%d/%Y")
+    indexes = dates_to_indexes(full_dates, dates, exact=False)
+    if np.any(indexes < 0):
+        print(f"WARNING: {np.sum(indexes < 0)} ledger entries after the last trading " +
+              f"day ({full_dates[-1]}) are ignored.")
+
+    is_cash = np.array(['_' in ticker for ticker in tickers], dtype=bool)
+    buys = (actions == 'Buy') | (is_cash & (actions == 'Withdraw'))
+    sells = (actions == 'Sell') | (is_cash & (actions == 'Deposit'))
+    valid = indexes >= 0
+
+    # Cash leaves on buys (withdrawals) and arrives on sells (deposits)
+    cash_flow = np.where(sells, amounts, 0.0) - np.where(buys, amounts, 0.0)
+    cash = float(content['start_capital']) + np.cumsum(
+        np.bincount(indexes[valid], weights=cash_flow[valid], minlength=length))
+
+    funds = [ticker for ticker in dict.fromkeys(tickers[~is_cash])]
+    fund_rows = np.array([funds.index(ticker) if not cash_row else -1
+                          for ticker, cash_row in zip(tickers, is_cash)], dtype=int)
+
+    # Holdings are whole shares (each row's shares truncated, as 'int(Shares)' always was)
+    whole_shares = np.trunc(shares).astype(int)
+    share_deltas = np.zeros((len(funds), length), dtype=int)
+    trades = valid & ~is_cash
+    np.add.at(share_deltas, (fund_rows[trades], indexes[trades]),
+              np.where(buys, whole_shares, 0)[trades] - np.where(sells, whole_shares, 0)[trades])
+    holdings = np.cumsum(share_deltas, axis=1)
+
+    closes = np.vstack([data[ticker]['Close'].reindex(full_dates).ffill().to_numpy(
+        dtype=float) for ticker in funds]) if len(funds) > 0 else np.zeros((0, length))
+    values = holdings * closes
+
+    composite = {'_cash_': {'value': cash.tolist()}}
+    for row, ticker in enumerate(funds):
+        composite[ticker] = {
+            'value': values[row].tolist(),
+            'shares': holdings[row].tolist()
+        }
 
     content['details'] = composite
 
-    value = []
-    for i in range(len(data[temp_tick]['Close'])):
-        val = 0.0
-        for ticker in composite:
-            val += composite[ticker]['value'][i]
-        value.append(val)
-
-    content['tabular'] = value
+    total = cash + np.ones(len(funds)) @ values
+    content['tabular'] = total.tolist()
 
     start_price = 25.0
-    price = [start_price]
-    for i in range(1, len(data[temp_tick]['Close'])):
-        prc = start_price * (content['tabular'][i] / content['start_capital'])
-        price.append(prc)
-
-    content['price'] = price
+    price = start_price * (total / content['start_capital'])
+    price[0] = start_price
+    content['price'] = price.tolist()
 
     bench = [start_price]
     if '^GSPC' in data:
-        for i in range(1, len(data['^GSPC'])):
-            prc = start_price * (data['^GSPC']['Close']
-                                 [i] / data['^GSPC']['Close'][0])
-            bench.append(prc)
+        bench_close = data['^GSPC']['Close'].to_numpy(dtype=float)
+        bench = start_price * (bench_close / bench_close[0])
+        bench[0] = start_price
+        bench = bench.tolist()
 
     content['bench'] = bench
 
@@ -266,6 +246,28 @@ def create_fund(content: dict) -> dict:
     return content
 
 
+def dates_to_indexes(dates: pd.DatetimeIndex, targets, exact=True) -> np.ndarray:
+    """Dates to Indexes
+
+    Arguments:
+        dates {pd.DatetimeIndex} -- sorted dates of a dataset
+        targets {list, pd.DatetimeIndex} -- dates to look up
+
+    Keyword Arguments:
+        exact {bool} -- only exact matches; False takes the next later date on a miss
+                        (default: {True})
+
+    Returns:
+        np.ndarray -- index of each target, -1 if there is none
+    """
+    targets = pd.DatetimeIndex(targets)
+    indexes = dates.searchsorted(targets, side='left')
+    found = indexes < len(dates)
+    if exact:
+        found[found] = dates[indexes[found]] == targets[found]
+    return np.where(found, indexes, -1)
+
+
 def date_converter(ledger_date: str, _type='date') -> str:
     """Date Converter
 
@@ -313,17 +315,10 @@ def date_to_index(date, content: dict, try_again=False) -> int:
     temp_tick = list(data.keys())[0]
     date_list = data[temp_tick].index
 
-    idx = None
-    for a, date_x in enumerate(date_list):
-        if date == date_x:
-            idx = a
-            break
-
-        if try_again:
-            if date <= date_x:
-                idx = a
-                break
-    return idx
+    idx = dates_to_indexes(date_list, [date], exact=not try_again)[0]
+    if idx < 0:
+        return None
+    return int(idx)
 
 
 def generate_dividends(content: dict) -> dict:
@@ -346,6 +341,7 @@ def generate_dividends(content: dict) -> dict:
 
     temp_tick = list(data.keys())[0]
     start_date = data[temp_tick].index[0]
+    date_list = data[temp_tick].index
 
     print(f"Fetching Dividends...")
     for ticker in data:
@@ -353,26 +349,17 @@ def generate_dividends(content: dict) -> dict:
             divs['raw'][ticker] = get_dividends(None, symbol=ticker)
 
             if len(divs['raw'][ticker]['dates']) > 0:
-                fund = content['details'][ticker]
-                first_index = None
-
-                for i, date in enumerate(divs['raw'][ticker]['dates']):
-                    date_time = datetime.datetime.strptime(date, "%Y-%m-%d")
-                    if date_time >= start_date:
-                        first_index = i
-                        break
-
-                if first_index is not None:
-                    for i in range(first_index, len(divs['raw'][ticker]['dates'])):
-                        date = datetime.datetime.strptime(
-                            divs['raw'][ticker]['dates'][i], "%Y-%m-%d")
-                        idx = date_to_index(date, content)
-
-                        if fund['shares'][idx] > 0.0:
-                            divs['refined']['dates'].append(date)
-                            amt = fund['shares'][idx] * \
-                                divs['raw'][ticker]['dividends'][i]
-                            divs['refined']['dividends'].append(amt)
+                shares = np.array(content['details'][ticker]['shares'])
+                dates = pd.to_datetime(divs['raw'][ticker]['dates'], format="%Y-%m-%d")
+                amounts = np.array(divs['raw'][ticker]['dividends'], dtype=float)
+
+                indexes = dates_to_indexes(date_list, dates)
+                paid = (dates >= start_date) & (indexes >= 0)
+                paid[paid] = shares[indexes[paid]] > 0.0
+
+                divs['refined']['dates'].extend(dates[paid].to_pydatetime().tolist())
+                divs['refined']['dividends'].extend(
+                    (shares[indexes[paid]] * amounts[paid]).tolist())
 
     QUARTERS = [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]
     divs['actual'] = {}
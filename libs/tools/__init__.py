@@ -1,6 +1,7 @@
 from .math_functions import lower_low, higher_high, bull_bear_th
-from .math_functions import beta_comparison, beta_comparison_list
+from .math_functions import beta_comparison, beta_comparison_list, rolling_beta_rsq
 from .math_functions import risk_comparison
+from .math_functions import rolling_min, rolling_max, rolling_mean, rolling_sum
 
 from .moving_average import exponential_moving_avg, simple_moving_avg
 from .moving_average import weighted_moving_avg, windowed_moving_avg
@@ -11,11 +12,11 @@ from .hull_moving_average import hull_moving_average
 
 from .trends import get_trend, get_trend_analysis
 from .trends import get_trendlines, trend_simple_forecast, autotrend
-from .resistance_support import find_resistance_support_lines
+from .resistance_support import find_resistance_support_lines, find_points_batch
 
 from .true_strength import relative_strength
 
-from .rsi import RSI
+from .rsi import RSI, generate_rsi_signals
 from .ultimate_oscillator import ultimate_oscillator
 from .full_stochastic import full_stochastic
 from .awesome_oscillator import awesome_oscillator
@@ -23,7 +24,7 @@ from .momentum_oscillator import momentum_oscillator
 from .rate_of_change import rate_of_change_oscillator, roc_signal
 from .know_sure_thing import know_sure_thing
 
-from .clusters import cluster_oscs
+from .clusters import cluster_oscs, cluster_oscs_panel
 
 from .macd import mov_avg_convergence_divergence
 from .bear_bull_power import bear_bull_power
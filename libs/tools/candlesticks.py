@@ -4,7 +4,7 @@ from copy import deepcopy
 import pandas as pd
 import numpy as np
 
-from libs.utils import ProgressBar, INDEXES
+from libs.utils import ProgressBar, INDEXES, as_fund_frame
 from libs.utils import candlestick_plot
 from .moving_average import simple_moving_avg, exponential_moving_avg
 from .moving_average import adjust_signals
@@ -40,12 +40,14 @@ def candlesticks(fund: pd.DataFrame, **kwargs) -> dict:
     if pbar is not None:
         pbar.uptick(increment=0.1)
 
-    candle['classification'] = day_classification(fund, candle['thresholds'])
+    columns = candle_columns(fund, candle['thresholds'])
+    candle['classification'] = day_classification(
+        fund, candle['thresholds'], columns=columns)
     if pbar is not None:
         pbar.uptick(increment=0.1)
 
     candle = pattern_detection(
-        fund, candle, plot_output=plot_output, pbar=pbar)
+        fund, candle, plot_output=plot_output, pbar=pbar, columns=columns)
 
     candle['signals'] = get_pattern_signals(candle, fund)
     candle['length_of_data'] = len(fund.index)
@@ -89,40 +91,36 @@ def pattern_detection(fund: pd.DataFrame, candle: dict, **kwargs) -> dict:
     Optional Args:
         plot_output {bool} -- (default: {True})
         pbar {ProgressBar} -- (default: {None})
+        columns {dict} -- candle columns of 'candle_columns' (default: {None}, built from
+                          candle['thresholds'])
 
     Returns:
         dict -- candlestick data object
     """
     plot_output = kwargs.get('plot_output', True)
     pbar = kwargs.get('pbar')
+    columns = kwargs.get('columns')
 
-    if pbar is not None:
-        divisor = 0.7 / float(len(candle['classification']))
-
-    patterns = []
-    for i in range(len(candle['classification'])):
-        value = {'value': 0, 'patterns': []}
-        for patt in PATTERNS:
-            val = pattern_library(patt, candle['classification'], i)
-            if val[0] != 0:
-                value['value'] += val[0]
-                modified_pattern = f"{patt}: {val[1]}"
-                value['patterns'].append(modified_pattern)
+    if columns is None:
+        columns = candle_columns(fund, candle['thresholds'])
 
+    # Every pattern is evaluated over all bars at once; only bars with a match are visited
+    length = len(columns['close'])
+    values = [0] * length
+    names = [[] for _ in range(length)]
+    for body in ('body', 'vol_body'):
         for patt in PATTERNS:
-            val = pattern_library(
-                patt, candle['classification'], i, body='vol_body')
-            if val[0] != 0:
-                value['value'] += val[0]
-                modified_pattern = f"{patt}: {val[1]}"
-                value['patterns'].append(modified_pattern)
+            pattern_values, styles = pattern_library(patt, columns, body=body)
+            for i in np.flatnonzero(pattern_values):
+                values[i] += int(pattern_values[i])
+                names[i].append(f"{patt}: {styles[i]}")
 
-        if pbar is not None:
-            pbar.uptick(increment=divisor)
+    if pbar is not None:
+        pbar.uptick(increment=0.7)
 
-        patterns.append(value)
+    patterns = [{'value': value, 'patterns': name} for value, name in zip(values, names)]
 
-    patterns2 = filtered_reversal_patterns(fund, candle)
+    patterns2 = filtered_reversal_patterns(fund, candle, columns=columns)
     tabular = [0.0] * len(patterns)
 
     for i, patt in enumerate(patterns2):
@@ -144,7 +142,7 @@ def pattern_detection(fund: pd.DataFrame, candle: dict, **kwargs) -> dict:
         plot_obj = {"plot": signal, "color": 'black',
                     "legend": 'candlestick signal'}
         candlestick_plot(fund, additional_plts=[
-            plot_obj], title='Candlestick Signals')
+                         plot_obj], title='Candlestick Signals')
 
     candle['patterns'] = patterns
     candle['tabular'] = tabular
@@ -176,22 +174,15 @@ def thresholding_determination(fund: pd.DataFrame, **kwargs) -> dict:
     DOJI_RATIO = kwargs.get('doji_ratio', 8)
     plot_output = kwargs.get('plot_output', True)
 
-    open_close = []
-    high_low = []
-    for i, op in enumerate(fund['Open']):
-        open_close.append(np.abs(op - fund['Close'][i]))
-        high_low.append(np.abs(fund['High'][i] - fund['Low'][i]))
+    frame = as_fund_frame(fund)
+    open_close = np.abs(frame.open - frame.close)
+    high_low = np.abs(frame.high - frame.low)
 
-    volatility = exponential_moving_avg(high_low, 25, data_type='list')
-    long_price = []
-    short_price = []
+    volatility = exponential_moving_avg(high_low, 25, data_type='ndarray')
     long_thresh = float(LONG) / 100.0
     short_thresh = float(SHORT) * 2.0 / 100.0
-    for i, low in enumerate(fund['Low']):
-        price_l = low + (volatility[i] * long_thresh)
-        price_s = low + (volatility[i] * short_thresh)
-        long_price.append(price_l)
-        short_price.append(price_s)
+    long_price = (frame.low + (volatility * long_thresh)).tolist()
+    short_price = (frame.low + (volatility * short_thresh)).tolist()
 
     thresholds = dict()
     thresholds['short'] = np.percentile(open_close, SHORT)
@@ -212,80 +203,110 @@ def thresholding_determination(fund: pd.DataFrame, **kwargs) -> dict:
     return thresholds
 
 
-def day_classification(fund: pd.DataFrame, thresholds: dict) -> list:
+# Bits of a candle's 'flags' (see 'candle_columns')
+TREND_ABOVE = 1
+TREND_BELOW = 2
+COLOR_WHITE = 4
+DOJI_DAY = 8
+BODY_LONG = 16
+BODY_SHORT = 32
+VOL_BODY_LONG = 64
+VOL_BODY_SHORT = 128
+
+# Long / short bits of each body generation style
+BODY_FLAGS = {
+    'body': (BODY_LONG, BODY_SHORT),
+    'vol_body': (VOL_BODY_LONG, VOL_BODY_SHORT)
+}
+
+
+def candle_columns(fund: pd.DataFrame, thresholds: dict) -> dict:
+    """Candle Columns
+
+    Columnar classification of every trading period: prices, shadow ratio, and a bitfield of
+    trend, color, doji and body sizes (TREND_ABOVE, ..., VOL_BODY_SHORT) per bar.
+
+    Arguments:
+        fund {pd.DataFrame} -- fund dataset
+        thresholds {dict} -- candlestick body sizes
+
+    Returns:
+        dict -- 'open', 'high', 'low', 'close', 'shadow_ratio' {np.ndarray}, 'flags' {np.uint8}
+    """
+    sma = np.array(simple_moving_avg(fund, 10), dtype=float)
+    frame = as_fund_frame(fund)
+    opens = frame.open
+    highs = frame.high
+    lows = frame.low
+    closes = frame.close
+
+    vol_long = np.array(thresholds['volatility']['long'], dtype=float)
+    vol_short = np.array(thresholds['volatility']['short'], dtype=float)
+
+    diff = np.abs(closes - opens)
+    shadow_length = highs - lows
+
+    shadow_ratio = np.zeros(len(closes))
+    np.divide(shadow_length, diff, out=shadow_ratio, where=(diff > 0.0))
+
+    body_long = diff >= thresholds['long']
+    vol_long_day = highs > vol_long
+
+    flags = np.zeros(len(closes), dtype=np.uint8)
+    flags[closes > sma] |= TREND_ABOVE
+    flags[closes < sma] |= TREND_BELOW
+    flags[closes > opens] |= COLOR_WHITE
+    flags[(diff <= thresholds['doji']) &
+          (shadow_ratio >= thresholds['doji_ratio'])] |= DOJI_DAY
+    flags[body_long] |= BODY_LONG
+    flags[~body_long & (diff <= thresholds['short'])] |= BODY_SHORT
+    flags[vol_long_day] |= VOL_BODY_LONG
+    flags[~vol_long_day & (highs < vol_short)] |= VOL_BODY_SHORT
+
+    return {'open': opens, 'high': highs, 'low': lows, 'close': closes,
+            'shadow_ratio': shadow_ratio, 'flags': flags}
+
+
+def day_classification(fund: pd.DataFrame, thresholds: dict, **kwargs) -> list:
     """Day Classification
 
     Arguments:
         fund {pd.DataFrame} -- fund dataset
         thresholds {dict} -- candlestick body sizes
 
+    Optional Args:
+        columns {dict} -- candle columns of 'candle_columns' (default: {None}, built)
+
     Returns:
         list -- each trading period classified by candlesticks
     """
+    columns = kwargs.get('columns')
+    if columns is None:
+        columns = candle_columns(fund, thresholds)
+
+    flags = columns['flags']
+
+    def named(long_bit: int, short_bit: int) -> list:
+        return np.where((flags & long_bit) != 0, 'long',
+                        np.where((flags & short_bit) != 0, 'short', 'normal')).tolist()
+
+    trends = np.where((flags & TREND_ABOVE) != 0, 'above',
+                      np.where((flags & TREND_BELOW) != 0, 'below', 'at')).tolist()
+    bodies = named(BODY_LONG, BODY_SHORT)
+    vol_bodies = named(VOL_BODY_LONG, VOL_BODY_SHORT)
+    colors = np.where((flags & COLOR_WHITE) != 0, 'white', 'black').tolist()
+    dojis = ((flags & DOJI_DAY) != 0).tolist()
+
     days = []
-    sma = simple_moving_avg(fund, 10)
-
-    LONG = thresholds['long']
-    SHORT = thresholds['short']
-    DOJI = thresholds['doji']
-    RATIO = thresholds['doji_ratio']
-
-    vol_long = thresholds['volatility']['long']
-    vol_short = thresholds['volatility']['short']
-
-    # Classification elements:
-    for i, close in enumerate(fund['Close']):
-        stats = dict()
-
-        # Raw, basic values to start
-        stats['basic'] = dict()
-        stats['basic']['Close'] = close
-        stats['basic']['Open'] = fund['Open'][i]
-        stats['basic']['High'] = fund['High'][i]
-        stats['basic']['Low'] = fund['Low'][i]
-
-        # Where close appears vs. Trend (sma-10)
-        if close > sma[i]:
-            stats['trend'] = 'above'
-        elif close < sma[i]:
-            stats['trend'] = 'below'
-        else:
-            stats['trend'] = 'at'
-
-        # Candlestick-esc properties
-        stats['candlestick'] = dict()
-
-        diff = np.abs(close - fund['Open'][i])
-        shadow_length = fund['High'][i] - fund['Low'][i]
-
-        if diff >= LONG:
-            stats['candlestick']['body'] = 'long'
-        elif diff <= SHORT:
-            stats['candlestick']['body'] = 'short'
-        else:
-            stats['candlestick']['body'] = 'normal'
-
-        if fund['High'][i] > vol_long[i]:
-            stats['candlestick']['vol_body'] = 'long'
-        elif fund['High'][i] < vol_short[i]:
-            stats['candlestick']['vol_body'] = 'short'
-        else:
-            stats['candlestick']['vol_body'] = 'normal'
-
-        if close > fund['Open'][i]:
-            stats['candlestick']['color'] = 'white'
-        else:
-            stats['candlestick']['color'] = 'black'
-
-        stats['candlestick']['doji'] = False
-        stats['candlestick']['shadow_ratio'] = 0.0
-        if diff > 0.0:
-            stats['candlestick']['shadow_ratio'] = shadow_length / diff
-        if diff <= DOJI:
-            if stats['candlestick']['shadow_ratio'] >= RATIO:
-                stats['candlestick']['doji'] = True
-
-        days.append(stats)
+    for i, (close, _open, high, low, ratio) in enumerate(zip(
+            columns['close'].tolist(), columns['open'].tolist(), columns['high'].tolist(),
+            columns['low'].tolist(), columns['shadow_ratio'].tolist())):
+        days.append({
+            'basic': {'Close': close, 'Open': _open, 'High': high, 'Low': low},
+            'trend': trends[i],
+            'candlestick': {'body': bodies[i], 'vol_body': vol_bodies[i],
+                            'color': colors[i], 'doji': dojis[i], 'shadow_ratio': ratio}
+        })
     return days
 
 
@@ -330,7 +351,8 @@ def get_pattern_signals(candle: dict, position: pd.DataFrame) -> list:
 
 def filtered_reversal_patterns(fund: pd.DataFrame,
                                candle: dict,
-                               filter_function='stochastic') -> list:
+                               filter_function='stochastic',
+                               **kwargs) -> list:
     """Filtered Reversal Patterns
 
     citing Greg Morris: Pattern must be in oscillator extreme to be valid
@@ -342,1246 +364,666 @@ def filtered_reversal_patterns(fund: pd.DataFrame,
     Keyword Arguments:
         filter_function {str} -- oscillator of choice (default: {'stochastic'})
 
+    Optional Args:
+        columns {dict} -- candle columns of 'candle_columns' (default: {None}, built from
+                          candle['thresholds'])
+
     Returns:
         list -- list of detected pattern objects
     """
-    filter_signal = []
+    columns = kwargs.get('columns')
+
     ZONES = [0.0, 0.0]
     if filter_function == 'stochastic':
-        stoch_signals = generate_full_stoch_signal(fund, plot_output=False)
-        filter_signal = stoch_signals['smooth_k']
         ZONES = [80.0, 20.0]
     else:
         return []
 
-    patterns = []
-    for i in range(len(candle['classification'])):
-        value = {'value': 0, 'patterns': []}
-
-        val = pattern_library("dark_cloud_piercing_line",
-                              candle['classification'], i)
-        if val[0] != 0:
-            value['value'] += val[0]
-            modified_pattern = f"dark_cloud_piercing_line: {val[1]}"
-            value['patterns'].append(modified_pattern)
-
-        val = pattern_library("evening_morning_star",
-                              candle['classification'], i)
-        if val[0] != 0:
-            value['value'] += val[0]
-            modified_pattern = f"evening_morning_star: {val[1]}"
-            value['patterns'].append(modified_pattern)
-
-        val = pattern_library("dark_cloud_piercing_line",
-                              candle['classification'], i, body='vol_body')
-        if val[0] != 0:
-            value['value'] += val[0]
-            modified_pattern = f"dark_cloud_piercing_line: {val[1]}"
-            value['patterns'].append(modified_pattern)
-
-        val = pattern_library("evening_morning_star",
-                              candle['classification'], i, body='vol_body')
-        if val[0] != 0:
-            value['value'] += val[0]
-            modified_pattern = f"evening_morning_star: {val[1]}"
-            value['patterns'].append(modified_pattern)
-
-        patterns.append(value)
-
-    for i in range(1, len(patterns)):
-        if patterns[i]['value'] != 0:
-            if (filter_signal[i] >= ZONES[0]) and (filter_signal[i] <= ZONES[1]):
-                patterns[i]['value'] *= 2
-            elif (filter_signal[i-1] >= ZONES[0]) and (filter_signal[i-1] <= ZONES[1]):
-                patterns[i]['value'] *= 2
+    if columns is None:
+        columns = candle_columns(fund, candle['thresholds'])
+
+    length = len(columns['close'])
+    values = np.zeros(length, dtype=int)
+    names = [[] for _ in range(length)]
+    for body in ('body', 'vol_body'):
+        for patt in ("dark_cloud_piercing_line", "evening_morning_star"):
+            pattern_values, styles = pattern_library(patt, columns, body=body)
+            for i in np.flatnonzero(pattern_values):
+                values[i] += pattern_values[i]
+                names[i].append(f"{patt}: {styles[i]}")
+
+    found = np.flatnonzero(values[1:]) + 1
+    if len(found) > 0:
+        # The oscillator is only needed if a pattern was found
+        stoch_signals = generate_full_stoch_signal(fund, plot_output=False)
+        filter_signal = np.array(stoch_signals['smooth_k'], dtype=float)
+
+        in_zone = (filter_signal >= ZONES[0]) & (filter_signal <= ZONES[1])
+        for i in found:
+            if in_zone[i] or in_zone[i-1]:
+                values[i] *= 2
             else:
-                patterns[i] = {'value': 0, 'patterns': []}
+                values[i] = 0
+                names[i] = []
 
-    return patterns
+    return [{'value': int(value), 'patterns': name} for value, name in zip(values, names)]
 
 
 ###################################
 #   PATTERN DETECTION LIBRARY
 ###################################
 
-def pattern_library(pattern: str, days: list, index: int, body: str = 'body') -> list:
+class CandleDay(object):
+    """CandleDay
+
+    One day of a pattern's window, for every window at once: entry j is the day of the window
+    ending at bar j + (days - 1).
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, columns: dict, offset: int, count: int):
+        self.open = columns['open'][offset:offset+count]
+        self.high = columns['high'][offset:offset+count]
+        self.low = columns['low'][offset:offset+count]
+        self.close = columns['close'][offset:offset+count]
+        self.shadow_ratio = columns['shadow_ratio'][offset:offset+count]
+        self.flags = columns['flags'][offset:offset+count]
+
+    def has(self, bit: int) -> np.ndarray:
+        return (self.flags & bit) != 0
+
+    @property
+    def above(self) -> np.ndarray:
+        return self.has(TREND_ABOVE)
+
+    @property
+    def below(self) -> np.ndarray:
+        return self.has(TREND_BELOW)
+
+    @property
+    def white(self) -> np.ndarray:
+        return self.has(COLOR_WHITE)
+
+    @property
+    def black(self) -> np.ndarray:
+        return ~self.has(COLOR_WHITE)
+
+    @property
+    def doji(self) -> np.ndarray:
+        return self.has(DOJI_DAY)
+
+    def long(self, body: str = 'body') -> np.ndarray:
+        return self.has(BODY_FLAGS[body][0])
+
+    def short(self, body: str = 'body') -> np.ndarray:
+        return self.has(BODY_FLAGS[body][1])
+
+
+def pattern_library(pattern: str, columns: dict, body: str = 'body') -> list:
     """Pattern Library
 
     Command function for properly configuring and running various pattern detections.
 
     Arguments:
         pattern {str} -- key from PATTERNS object
-        days {list} -- candle objects generated from day_classification
-        index {int} -- index of DataFrame or list
+        columns {dict} -- candle columns generated from candle_columns
 
     Keyword Arguments:
         body {str} -- body generation style (quartile vs. volatility); (default: {'body'})
 
     Returns:
-        list -- tuple (value of patterns, named pattern)
+        list -- tuple (value of pattern per bar {np.ndarray}, named pattern per bar {np.ndarray})
     """
     days_needed = PATTERNS.get(pattern, {}).get('days', 1)
     function = PATTERNS.get(pattern, {}).get('function')
     weight = PATTERNS.get(pattern, {}).get('weight', 1)
 
-    if function is None:
-        return 0, ''
-    if index < days_needed - 1:
-        return 0, ''
+    length = len(columns['close'])
+    values = np.zeros(length, dtype=int)
+    styles = np.full(length, '', dtype=object)
 
-    if days_needed == 1:
-        sub_days = days[index].copy()
-    else:
-        start = (index + 1) - days_needed
-        sub_days = days[start:index+1].copy()
+    if function is None:
+        return values, styles
+    if length < days_needed:
+        return values, styles
 
-    if isinstance(sub_days, (dict)):
-        sub_days = [sub_days]
+    count = length - (days_needed - 1)
+    days = [CandleDay(columns, offset, count) for offset in range(days_needed)]
 
-    detection = function(sub_days, body=body)
-    if detection is not None:
-        if detection['type'] == 'bearish':
-            return -1 * weight, detection['style']
-        if detection['type'] == 'bullish':
-            return 1 * weight, detection['style']
+    # A window takes the first detection that matches, as nested checks returned before
+    matched = np.zeros(count, dtype=bool)
+    for mask, signal, style in function(days, body=body):
+        hit = mask & ~matched
+        matched |= hit
+        values[days_needed-1:][hit] = weight if signal == 'bullish' else -1 * weight
+        styles[days_needed-1:][hit] = style
 
-    return 0, ''
+    return values, styles
 
 
 ###################################
+#   Each pattern returns its detections in order of precedence: [(mask, type, style)]
 
-def doji_pattern(day: list, body='body') -> dict:
+def doji_pattern(day: list, body='body') -> list:
     THRESH = 0.05
-    day = day[0]
-    if day.get('candlestick', {}).get('doji'):
-        close = day.get('basic', {}).get('Close')
-        high = day.get('basic', {}).get('High')
-        low = day.get('basic', {}).get('Low')
-
-        clo_low = close - low
-        hi_low = high - low
-        if clo_low >= ((1.0 - THRESH) * hi_low):
-            return {'type': 'bullish', 'style': 'dragonfly'}
-        if clo_low <= (THRESH * hi_low):
-            return {'type': 'bearish', 'style': 'gravestone'}
-    return None
-
-
-def dark_cloud_or_piercing_line(day: list, body='body') -> dict:
+    d0 = day[0]
+    clo_low = d0.close - d0.low
+    hi_low = d0.high - d0.low
+    return [
+        (d0.doji & (clo_low >= ((1.0 - THRESH) * hi_low)), 'bullish', 'dragonfly'),
+        (d0.doji & (clo_low <= (THRESH * hi_low)), 'bearish', 'gravestone')
+    ]
+
+
+def dark_cloud_or_piercing_line(day: list, body='body') -> list:
+    d0, d1 = day
+    mid_pt = ((d0.close - d0.open) / 2.0) + d0.open
+
     # Dark Cloud
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0.get(body) == 'long':
-            if candle_0.get('color') == 'white':
-                basic_0 = day[0].get('basic')
-                high_0 = basic_0.get('High')
-                basic_1 = day[1].get('basic')
-                open_1 = basic_1.get('Open')
-                if open_1 > high_0:
-                    close_1 = basic_1.get('Close')
-                    close_0 = basic_0.get('Close')
-                    open_0 = basic_0.get('Open')
-                    mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                    if close_1 <= mid_pt:
-                        return {'type': 'bearish', 'style': 'darkcloud'}
+    dark_cloud = d0.above & d0.long(body) & d0.white & (d1.open > d0.high) & \
+        (d1.close <= mid_pt)
 
     # Piercing Line
-    elif day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0.get(body) == 'long':
-            if candle_0.get('color') == 'black':
-                basic_0 = day[0].get('basic')
-                low_0 = basic_0.get('Low')
-                basic_1 = day[1].get('basic')
-                open_1 = basic_1.get('Open')
-                if open_1 < low_0:
-                    close_1 = basic_1.get('Close')
-                    close_0 = basic_0.get('Close')
-                    open_0 = basic_0.get('Open')
-                    mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                    if close_1 >= mid_pt:
-                        return {'type': 'bullish', 'style': 'piercing line'}
-
-    return None
-
-
-def evening_morning_star(day: list, body='body') -> dict:
+    piercing = d0.below & d0.long(body) & d0.black & (d1.open < d0.low) & \
+        (d1.close >= mid_pt)
+
+    return [(dark_cloud, 'bearish', 'darkcloud'), (piercing, 'bullish', 'piercing line')]
+
+
+def evening_morning_star(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    mid_pt = ((d0.close - d0.open) / 2.0) + d0.open
+
     # Evening star
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = day[0].get('basic')
-            basic_1 = day[1].get('basic')
-            close_0 = basic_0.get('Close')
-            open_1 = basic_1.get('Open')
-            if open_1 > close_0:
-                candle_1 = day[1].get('candlestick')
-                if candle_1[body] == 'short':
-                    close_1 = basic_1.get('Close')
-                    if close_1 > close_0:
-                        basic_2 = day[2].get('basic')
-                        open_2 = basic_2.get('Open')
-                        if open_2 < min(close_1, open_1):
-                            open_0 = basic_0.get('Open')
-                            mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                            close_2 = basic_2.get('Close')
-                            if close_2 <= mid_pt:
-                                if candle_1['doji']:
-                                    if basic_1['Low'] > max(basic_0['High'], basic_1['High']):
-                                        return {"type": 'bearish', "style": 'abandoned baby -'}
-                                    return {"type": 'bearish', "style": 'evening star DOJI'}
-                                return {'type': 'bearish', 'style': 'evening star'}
+    evening = d0.above & d0.long(body) & d0.white & (d1.open > d0.close) & \
+        d1.short(body) & (d1.close > d0.close) & \
+        (d2.open < np.minimum(d1.close, d1.open)) & (d2.close <= mid_pt)
+    evening_baby = evening & d1.doji & (d1.low > np.maximum(d0.high, d1.high))
 
     # Morning star
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = day[0].get('basic')
-            basic_1 = day[1].get('basic')
-            close_0 = basic_0.get('Close')
-            open_1 = basic_1.get('Open')
-            if open_1 < close_0:
-                candle_1 = day[1].get('candlestick')
-                if candle_1[body] == 'short':
-                    close_1 = basic_1.get('Close')
-                    if close_1 < close_0:
-                        basic_2 = day[2].get('basic')
-                        open_2 = basic_2.get('Open')
-                        if open_2 > max(close_1, open_1):
-                            open_0 = basic_0.get('Open')
-                            mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                            close_2 = basic_2.get('Close')
-                            if close_2 >= mid_pt:
-                                if candle_1['doji']:
-                                    if basic_1['High'] < min(basic_0['Low'], basic_1['Low']):
-                                        return {"type": 'bullish', "style": 'abandoned baby +'}
-                                    return {"type": 'bullish', "style": 'morning star: DOJI'}
-                                return {'type': 'bullish', 'style': 'morning star'}
-    return None
-
-
-def rising_falling_three_methods(day: list, body='body') -> dict:
+    morning = d0.below & d0.long(body) & d0.black & (d1.open < d0.close) & \
+        d1.short(body) & (d1.close < d0.close) & \
+        (d2.open > np.maximum(d1.close, d1.open)) & (d2.close >= mid_pt)
+    morning_baby = morning & d1.doji & (d1.high < np.minimum(d0.low, d1.low))
+
+    return [
+        (evening_baby, 'bearish', 'abandoned baby -'),
+        (evening & d1.doji, 'bearish', 'evening star DOJI'),
+        (evening, 'bearish', 'evening star'),
+        (morning_baby, 'bullish', 'abandoned baby +'),
+        (morning & d1.doji, 'bullish', 'morning star: DOJI'),
+        (morning, 'bullish', 'morning star')
+    ]
+
+
+def rising_falling_three_methods(day: list, body='body') -> list:
+    d0, d1, _, _, d4 = day
+    # Each middle day is checked as day 1, as the original detection did
+    inside = (d0.high >= np.maximum(d1.open, d1.close)) & \
+        (d0.low <= np.minimum(d1.open, d1.close)) & d1.short(body)
+
     # Rising three methods (continuation of bull trend)
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = day[0].get('basic')
-            high_0 = basic_0.get('High')
-            low_0 = basic_0.get('Low')
-            close_0 = basic_0.get('Close')
-            basic_1 = day[1].get('basic')
-            if high_0 >= max(basic_1.get('Open'), basic_1.get('Close')):
-                if low_0 <= min(basic_1.get('Open'), basic_1.get('Close')):
-                    if day[1]['candlestick'][body] == 'short':
-                        basic_2 = day[1].get('basic')
-                        if high_0 >= max(basic_2.get('Open'), basic_2.get('Close')):
-                            if low_0 <= min(basic_2.get('Open'), basic_2.get('Close')):
-                                basic_3 = day[1].get('basic')
-                                if high_0 >= max(basic_3.get('Open'), basic_3.get('Close')):
-                                    if low_0 <= min(basic_3.get('Open'), basic_3.get('Close')):
-                                        candle_4 = day[4].get(
-                                            'candlestick')
-                                        if candle_4[body] == 'long' and \
-                                                candle_4['color'] == 'white':
-                                            if day[4].get('basic', {}).get('Close') > close_0:
-                                                return {"type": 'bullish',
-                                                        "style": 'rising three methods'}
+    rising = d0.above & d0.long(body) & d0.white & inside & \
+        d4.long(body) & d4.white & (d4.close > d0.close)
 
     # Falling three methods (continuation of bear trend)
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = day[0].get('basic')
-            high_0 = basic_0.get('High')
-            low_0 = basic_0.get('Low')
-            close_0 = basic_0.get('Close')
-            basic_1 = day[1].get('basic')
-            if low_0 <= min(basic_1.get('Open'), basic_1.get('Close')):
-                if high_0 >= max(basic_1.get('Open'), basic_1.get('Close')):
-                    if day[1]['candlestick'][body] == 'short':
-                        basic_2 = day[1].get('basic')
-                        if low_0 <= min(basic_2.get('Open'), basic_2.get('Close')):
-                            if high_0 >= max(basic_2.get('Open'), basic_2.get('Close')):
-                                basic_3 = day[1].get('basic')
-                                if low_0 <= min(basic_3.get('Open'), basic_3.get('Close')):
-                                    if high_0 >= max(basic_3.get('Open'), basic_3.get('Close')):
-                                        candle_4 = day[4].get(
-                                            'candlestick')
-                                        if candle_4[body] == 'long' and \
-                                                candle_4['color'] == 'black':
-                                            if day[4].get('basic', {}).get('Close') < close_0:
-                                                return {"type": 'bearish',
-                                                        "style": 'falling three methods'}
-    return None
-
-
-def hammer_positive(day: list, body='body') -> dict:
+    falling = d0.below & d0.long(body) & d0.black & inside & \
+        d4.long(body) & d4.black & (d4.close < d0.close)
+
+    return [(rising, 'bullish', 'rising three methods'),
+            (falling, 'bearish', 'falling three methods')]
+
+
+def hammer_positive(day: list, body='body') -> list:
     RATIO = 2.0
     THRESH = 0.99
-    if day[0].get('trend') == 'below':
-        candle = day[0].get('candlestick')
-        if candle[body] == 'short' and candle['shadow_ratio'] >= RATIO:
-            basic = day[0].get('basic')
-            high = basic.get('High')
-            close = basic.get('Close')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * THRESH
-            cl_low = close - low
-            op_low = _open - low
-            if (cl_low >= hl_thr) or (op_low >= hl_thr):
-                return {"type": 'bullish', "style": '+'}
-    return None
-
-
-def hanging_man(day: list, body='body') -> dict:
+    d0 = day[0]
+    hl_thr = (d0.high - d0.low) * THRESH
+    hammer = d0.below & d0.short(body) & (d0.shadow_ratio >= RATIO) & \
+        (((d0.close - d0.low) >= hl_thr) | ((d0.open - d0.low) >= hl_thr))
+    return [(hammer, 'bullish', '+')]
+
+
+def hanging_man(day: list, body='body') -> list:
     RATIO = 2.0
     THRESH = 0.99
-    if day[0].get('trend') == 'above':
-        candle = day[0].get('candlestick')
-        if candle[body] == 'short' and candle['shadow_ratio'] >= RATIO:
-            basic = day[0].get('basic')
-            high = basic.get('High')
-            close = basic.get('Close')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * THRESH
-            cl_low = close - low
-            op_low = _open - low
-            if (cl_low >= hl_thr) or (op_low >= hl_thr):
-                return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def inverted_hammer(day: list, body='body') -> dict:
+    d0 = day[0]
+    hl_thr = (d0.high - d0.low) * THRESH
+    man = d0.above & d0.short(body) & (d0.shadow_ratio >= RATIO) & \
+        (((d0.close - d0.low) >= hl_thr) | ((d0.open - d0.low) >= hl_thr))
+    return [(man, 'bearish', '-')]
+
+
+def inverted_hammer(day: list, body='body') -> list:
     RATIO = 2.0
     THRESH = 0.01
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = day[1].get('candlestick')
-            if candle_1[body] == 'short' and candle_1['shadow_ratio'] >= RATIO:
-                basic = day[1].get('basic')
-                high = basic.get('High')
-                close = basic.get('Close')
-                _open = basic.get('Open')
-                low = basic.get('Low')
-                hl_thr = (high - low) * THRESH
-                cl_low = close - low
-                op_low = _open - low
-                if (cl_low <= hl_thr) or (op_low <= hl_thr):
-                    return {"type": 'bullish', "style": '+'}
-    return None
-
-
-def shooting_star(day: list, body='body') -> dict:
+    d0, d1 = day
+    hl_thr = (d1.high - d1.low) * THRESH
+    hammer = d0.below & d0.long(body) & d0.black & \
+        d1.short(body) & (d1.shadow_ratio >= RATIO) & \
+        (((d1.close - d1.low) <= hl_thr) | ((d1.open - d1.low) <= hl_thr))
+    return [(hammer, 'bullish', '+')]
+
+
+def shooting_star(day: list, body='body') -> list:
     RATIO = 2.0
     THRESH = 0.01
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = day[0].get('basic')
-            if basic_0.get('Close') < basic_0.get('High'):
-                candle_1 = day[1].get('candlestick')
-                if candle_1[body] == 'short' and candle_1['shadow_ratio'] >= RATIO:
-                    basic_1 = day[1].get('basic')
-                    high = basic_1.get('High')
-                    low = basic_1.get('Low')
-                    close = basic_1.get('Close')
-                    _open = basic_1.get('Open')
-                    if (_open > basic_0.get('Close')) and (close > basic_0.get('Close')):
-                        hl_thr = (high - low) * THRESH
-                        cl_low = close - low
-                        op_low = _open - low
-                        if (cl_low <= hl_thr) or (op_low <= hl_thr):
-                            return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def belt_hold(day: list, body='body') -> dict:
+    d0, d1 = day
+    hl_thr = (d1.high - d1.low) * THRESH
+    star = d0.above & d0.long(body) & d0.white & (d0.close < d0.high) & \
+        d1.short(body) & (d1.shadow_ratio >= RATIO) & \
+        (d1.open > d0.close) & (d1.close > d0.close) & \
+        (((d1.close - d1.low) <= hl_thr) | ((d1.open - d1.low) <= hl_thr))
+    return [(star, 'bearish', '-')]
+
+
+def belt_hold(day: list, body='body') -> list:
     THRESH = 0.005
-    if day[0].get('trend') == 'below':
-        candle = day[0].get('candlestick')
-        if candle.get('color') == 'white':
-            basic = day[0].get('basic')
-            high = basic.get('High')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * THRESH
-            op_low = _open - low
-            if (op_low <= hl_thr) and (high > basic.get('Close')):
-                return {"type": 'bullish', "style": '+'}
-
-    if day[0].get('trend') == 'above':
-        candle = day[0].get('candlestick')
-        if candle.get('color') == 'black':
-            basic = day[0].get('basic')
-            high = basic.get('High')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * (1.0 - THRESH)
-            op_low = _open - low
-            if (op_low >= hl_thr) and (low < basic.get('Close')):
-                return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def engulfing(day: list, body='body') -> dict:
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0.get('color') == 'black':
-            candle_1 = day[1].get('candlestick')
-            if candle_1[body] == 'long' and candle_1['color'] == 'white':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                if basic_0.get('High') <= basic_1.get('Close'):
-                    if basic_0.get('Low') >= basic_1.get('Open'):
-                        return {"type": 'bullish', "style": '+'}
-
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0.get('color') == 'white':
-            candle_1 = day[1].get('candlestick')
-            if candle_1[body] == 'long' and candle_1['color'] == 'black':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                if basic_0.get('High') <= basic_1.get('Open'):
-                    if basic_0.get('Low') >= basic_1.get('Close'):
-                        return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def harami(day: list, body='body') -> dict:
+    d0 = day[0]
+    op_low = d0.open - d0.low
+    bullish = d0.below & d0.white & \
+        (op_low <= ((d0.high - d0.low) * THRESH)) & (d0.high > d0.close)
+    bearish = d0.above & d0.black & \
+        (op_low >= ((d0.high - d0.low) * (1.0 - THRESH))) & (d0.low < d0.close)
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def engulfing(day: list, body='body') -> list:
+    d0, d1 = day
+    bullish = d0.below & d0.black & d1.long(body) & d1.white & \
+        (d0.high <= d1.close) & (d0.low >= d1.open)
+    bearish = d0.above & d0.white & d1.long(body) & d1.black & \
+        (d0.high <= d1.open) & (d0.low >= d1.close)
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def harami(day: list, body='body') -> list:
     THRESH = 0.01
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] == 'long':
-            candle_1 = day[1].get('candlestick')
-            if candle_1.get('color') == 'white':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                if basic_1.get('High') <= basic_0.get('Open'):
-                    if basic_1.get('Low') >= basic_1.get('Close'):
-                        hi_low = basic_1.get('High') - basic_1.get('Low')
-                        op_clo = np.abs(basic_1.get(
-                            'Close') - basic_1.get('Open'))
-                        if op_clo <= (hi_low * THRESH):
-                            return {"type": 'bullish', "style": 'cross-+'}
-                        return {"type": 'bullish', "style": "+"}
-
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] == 'long':
-            candle_1 = day[1].get('candlestick')
-            if candle_1.get('color') == 'black':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                if basic_1.get('High') <= basic_0.get('Close'):
-                    if basic_1.get('Low') >= basic_1.get('Open'):
-                        hi_low = basic_1.get('High') - basic_1.get('Low')
-                        op_clo = np.abs(basic_1.get(
-                            'Open') - basic_1.get('Close'))
-                        if op_clo <= (hi_low * THRESH):
-                            return {"type": 'bearish', "style": 'cross--'}
-                        return {"type": 'bearish', "style": "-"}
-    return None
-
-
-def doji_star(day: list, body='body') -> dict:
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] != 'short':
-            basic_1 = day[1].get('basic')
-            basic_0 = day[0].get('basic')
-            if basic_1.get('High') <= basic_0.get('Close'):
-                candle_1 = day[1].get('candlestick')
-                if candle_1.get('doji'):
-                    return {"type": 'bullish', "style": "+"}
-
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] != 'short':
-            basic_1 = day[1].get('basic')
-            basic_0 = day[0].get('basic')
-            if basic_1.get('Low') >= basic_0.get('Close'):
-                candle_1 = day[1].get('candlestick')
-                if candle_1.get('doji'):
-                    return {"type": 'bearish', "style": "-"}
-    return None
-
-
-def meeting_line(day: list, body='body') -> dict:
+    d0, d1 = day
+    hi_low = d1.high - d1.low
+
+    bullish = d0.below & d0.black & d0.long(body) & d1.white & \
+        (d1.high <= d0.open) & (d1.low >= d1.close)
+    bull_cross = np.abs(d1.close - d1.open) <= (hi_low * THRESH)
+
+    bearish = d0.above & d0.white & d0.long(body) & d1.black & \
+        (d1.high <= d0.close) & (d1.low >= d1.open)
+    bear_cross = np.abs(d1.open - d1.close) <= (hi_low * THRESH)
+
+    return [
+        (bullish & bull_cross, 'bullish', 'cross-+'),
+        (bullish, 'bullish', '+'),
+        (bearish & bear_cross, 'bearish', 'cross--'),
+        (bearish, 'bearish', '-')
+    ]
+
+
+def doji_star(day: list, body='body') -> list:
+    d0, d1 = day
+    bullish = d0.below & d0.black & ~d0.short(body) & (d1.high <= d0.close) & d1.doji
+    bearish = d0.above & d0.white & ~d0.short(body) & (d1.low >= d0.close) & d1.doji
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def meeting_line(day: list, body='body') -> list:
     THRESH = 0.01
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = day[1].get('candlestick')
-            if candle_1['color'] == 'white' and candle_1[body] != 'short':
-                basic_1 = day[1].get('basic')
-                basic_0 = day[0].get('basic')
-                hl_thr = (basic_1.get('High') -
-                          basic_1.get('Low')) * THRESH
-                cl_cl = np.abs(basic_0.get('Close') -
-                               basic_1.get('Close'))
-                if cl_cl <= hl_thr:
-                    return {"type": 'bullish', "style": "+"}
-
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0[body] != 'short' and candle_0['color'] == 'white':
-            candle_1 = day[1].get('candlestick')
-            if candle_1['color'] == 'black' and candle_1[body] != 'short':
-                basic_1 = day[1].get('basic')
-                basic_0 = day[0].get('basic')
-                hl_thr = (basic_1.get('High') -
-                          basic_1.get('Low')) * THRESH
-                cl_cl = np.abs(basic_0.get('Close') -
-                               basic_1.get('Close'))
-                if cl_cl <= hl_thr:
-                    return {"type": 'bearish', "style": "-"}
-    return None
-
-
-def three_white_soldiers_black_crows(day: list, body='body') -> dict:
+    d0, d1 = day
+    close_met = np.abs(d0.close - d1.close) <= ((d1.high - d1.low) * THRESH)
+    bullish = d0.below & ~d0.short(body) & d0.black & \
+        d1.white & ~d1.short(body) & close_met
+    bearish = d0.above & ~d0.short(body) & d0.white & \
+        d1.black & ~d1.short(body) & close_met
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def three_white_soldiers_black_crows(day: list, body='body') -> list:
     THRESH = 0.3
-    if day[0].get('trend') == 'below':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] != 'short':
-            candle_1 = day[1].get('candlestick')
-            if candle_1['color'] == 'white' and candle_1[body] != 'short':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                body_th = ((basic_0.get('Close') - basic_0.get('Open'))
-                           * THRESH) + basic_0.get('Open')
-                if (basic_1.get('Open') > body_th) and (basic_1['Close'] > basic_0['Close']) \
-                        and (basic_1['Open'] < basic_0['Close']):
-                    candle_2 = day[2].get('candlestick')
-                    if candle_2['color'] == 'white' and candle_2[body] != 'short':
-                        basic_2 = day[2].get('basic')
-                        body_th = (
-                            (basic_1['Close'] - basic_1['Open']) * THRESH) + basic_1['Open']
-                        if (basic_2['Open'] > body_th) and (basic_2['Close'] > basic_1['Close']) \
-                                and (basic_2['Open'] < basic_1['Close']):
-                            return {"type": 'bullish', "style": 'white soldiers'}
-
-    if day[0].get('trend') == 'above':
-        candle_0 = day[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] != 'short':
-            candle_1 = day[1].get('candlestick')
-            if candle_1['color'] == 'black' and candle_1[body] != 'short':
-                basic_0 = day[0].get('basic')
-                basic_1 = day[1].get('basic')
-                body_th = ((basic_0.get('Close') - basic_0.get('Open'))
-                           * (1.0 - THRESH)) + basic_0.get('Open')
-                if (basic_1.get('Open') < body_th) and (basic_1['Close'] < basic_0['Close']) \
-                        and (basic_1['Open'] > basic_0['Close']):
-                    candle_2 = day[2].get('candlestick')
-                    if candle_2['color'] == 'black' and candle_2[body] != 'short':
-                        basic_2 = day[2].get('basic')
-                        body_th = (
-                            (basic_1['Close'] - basic_1['Open']) * (1.0 - THRESH)) + basic_1['Open']
-                        if (basic_2['Open'] < body_th) and \
-                            (basic_2['Close'] < basic_1['Close']) and \
-                                (basic_2['Open'] > basic_1['Close']):
-                            return {"type": 'bearish', "style": 'black crows'}
-    return None
-
-
-def tri_star(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        if day[0]['candlestick']['doji'] and \
-            day[1]['candlestick']['doji'] and \
-                day[2]['candlestick']['doji']:
-            if day[1]['basic']['Close'] < day[0]['basic']['Close']:
-                if day[1]['basic']['Close'] < day[2]['basic']['Close']:
-                    return {"type": 'bullish', "style": 'tri star +'}
-
-    if day[0]['trend'] == 'above':
-        if day[0]['candlestick']['doji'] and \
-            day[1]['candlestick']['doji'] and \
-                day[2]['candlestick']['doji']:
-            if day[1]['basic']['Close'] > day[0]['basic']['Close']:
-                if day[1]['basic']['Close'] > day[2]['basic']['Close']:
-                    return {"type": 'bearish', "style": 'tri star -'}
-    return None
-
-
-def breakaway(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        if day[0]['candlestick'][body] == 'long' and day[0]['candlestick']['color'] == 'black':
-            if day[0]['basic']['Low'] > day[1]['basic']['High']:
-                candle_1 = day[1]['candlestick']
-                if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                    basic_2 = day[2]['basic']
-                    basic_1 = day[1]['basic']
-                    if (basic_2['Close'] < basic_1['Open']) and (basic_2['Open'] < basic_1['Open']):
-                        if basic_2['Low'] < basic_1['Low']:
-                            candle_3 = day[3]['candlestick']
-                            if candle_3[body] == 'short' and candle_3['color'] == 'black':
-                                if day[3]['basic']['Low'] < basic_2['Low']:
-                                    candle_4 = day[4]['candlestick']
-                                    if candle_4[body] == 'long' and candle_4['color'] == 'white':
-                                        basic_4 = day[4]['basic']
-                                        if (basic_4['Close'] > basic_1['Open']) and \
-                                                (basic_4['Close'] <= day[0]['basic']['Close']):
-                                            return {"type": 'bullish', "style": 'breakaway +'}
-
-    if day[0]['trend'] == 'above':
-        if day[0]['candlestick'][body] == 'long' and day[0]['candlestick']['color'] == 'white':
-            if day[0]['basic']['High'] < day[1]['basic']['Low']:
-                candle_1 = day[1]['candlestick']
-                if candle_1[body] == 'short' and candle_1['color'] == 'white':
-                    basic_2 = day[2]['basic']
-                    basic_1 = day[1]['basic']
-                    if (basic_2['Close'] > basic_1['Open']) and (basic_2['Open'] > basic_1['Open']):
-                        if basic_2['High'] > basic_1['High']:
-                            candle_3 = day[3]['candlestick']
-                            if candle_3[body] == 'short' and candle_3['color'] == 'white':
-                                if day[3]['basic']['High'] > basic_2['High']:
-                                    candle_4 = day[4]['candlestick']
-                                    if candle_4[body] == 'long' and candle_4['color'] == 'black':
-                                        basic_4 = day[4]['basic']
-                                        if (basic_4['Close'] < basic_1['Open']) and \
-                                                (basic_4['Close'] >= day[0]['basic']['Close']):
-                                            return {"type": 'bearish', "style": 'breakaway -'}
-    return None
-
-
-def three_inside(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if (basic_1['Open'] > basic_0['Close']) and (basic_1['Close'] < basic_0['Open']):
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] > basic_1['Open']) and \
-                                (basic_2['Open'] < basic_1['Close']):
-                            if (basic_2['Close'] > basic_0['Open']):
-                                return {"type": 'bullish', "style": 'up'}
-
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if (basic_1['Open'] < basic_0['Close']) and (basic_1['Close'] > basic_0['Open']):
-                    if day[2]['candlestick']['color'] == 'black':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] > basic_1['Close']) and \
-                                (basic_2['Open'] < basic_1['Open']):
-                            if (basic_2['Close'] < basic_0['Open']):
-                                return {"type": 'bearish', "style": 'down'}
-    return None
-
-
-def three_outside(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0['color'] == 'black' and candle_0[body] != 'long':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'white':
-                basic_1 = day[1]['basic']
-                basic_0 = day[0]['basic']
-                if (basic_0['Low'] > basic_1['Open']) and (basic_0['High'] < basic_1['Close']):
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] > basic_1['Open']) and \
-                            (basic_2['Open'] < basic_1['Close']) and \
-                                (basic_2['Close'] > basic_2['Close']):
-                            return {"type": 'bullish', "style": 'up'}
-
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0['color'] == 'white' and candle_0[body] != 'long':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'black':
-                basic_1 = day[1]['basic']
-                basic_0 = day[0]['basic']
-                if (basic_0['Low'] > basic_1['Close']) and (basic_0['High'] < basic_1['Open']):
-                    if day[2]['candlestick']['color'] == 'black':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] < basic_1['Open']) and \
-                            (basic_2['Open'] > basic_1['Close']) and \
-                                (basic_2['Close'] < basic_2['Close']):
-                            return {"type": 'bearish', "style": 'down'}
-    return None
-
-
-def kicking(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.white & ~d0.short(body) & d1.white & ~d1.short(body) & \
+        (d1.open > (((d0.close - d0.open) * THRESH) + d0.open)) & \
+        (d1.close > d0.close) & (d1.open < d0.close) & \
+        d2.white & ~d2.short(body) & \
+        (d2.open > (((d1.close - d1.open) * THRESH) + d1.open)) & \
+        (d2.close > d1.close) & (d2.open < d1.close)
+
+    bearish = d0.above & d0.black & ~d0.short(body) & d1.black & ~d1.short(body) & \
+        (d1.open < (((d0.close - d0.open) * (1.0 - THRESH)) + d0.open)) & \
+        (d1.close < d0.close) & (d1.open > d0.close) & \
+        d2.black & ~d2.short(body) & \
+        (d2.open < (((d1.close - d1.open) * (1.0 - THRESH)) + d1.open)) & \
+        (d2.close < d1.close) & (d2.open > d1.close)
+
+    return [(bullish, 'bullish', 'white soldiers'), (bearish, 'bearish', 'black crows')]
+
+
+def tri_star(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    dojis = d0.doji & d1.doji & d2.doji
+    bullish = d0.below & dojis & (d1.close < d0.close) & (d1.close < d2.close)
+    bearish = d0.above & dojis & (d1.close > d0.close) & (d1.close > d2.close)
+    return [(bullish, 'bullish', 'tri star +'), (bearish, 'bearish', 'tri star -')]
+
+
+def breakaway(day: list, body='body') -> list:
+    d0, d1, d2, d3, d4 = day
+    bullish = d0.below & d0.long(body) & d0.black & (d0.low > d1.high) & \
+        d1.short(body) & d1.black & (d2.close < d1.open) & (d2.open < d1.open) & \
+        (d2.low < d1.low) & d3.short(body) & d3.black & (d3.low < d2.low) & \
+        d4.long(body) & d4.white & (d4.close > d1.open) & (d4.close <= d0.close)
+
+    bearish = d0.above & d0.long(body) & d0.white & (d0.high < d1.low) & \
+        d1.short(body) & d1.white & (d2.close > d1.open) & (d2.open > d1.open) & \
+        (d2.high > d1.high) & d3.short(body) & d3.white & (d3.high > d2.high) & \
+        d4.long(body) & d4.black & (d4.close < d1.open) & (d4.close >= d0.close)
+
+    return [(bullish, 'bullish', 'breakaway +'), (bearish, 'bearish', 'breakaway -')]
+
+
+def three_inside(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.long(body) & d0.black & d1.short(body) & d1.white & \
+        (d1.open > d0.close) & (d1.close < d0.open) & d2.white & \
+        (d2.open > d1.open) & (d2.open < d1.close) & (d2.close > d0.open)
+
+    bearish = d0.above & d0.long(body) & d0.white & d1.short(body) & d1.black & \
+        (d1.open < d0.close) & (d1.close > d0.open) & d2.black & \
+        (d2.open > d1.close) & (d2.open < d1.open) & (d2.close < d0.open)
+
+    return [(bullish, 'bullish', 'up'), (bearish, 'bearish', 'down')]
+
+
+def three_outside(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.black & ~d0.long(body) & d1.long(body) & d1.white & \
+        (d0.low > d1.open) & (d0.high < d1.close) & d2.white & \
+        (d2.open > d1.open) & (d2.open < d1.close) & (d2.close > d2.close)
+
+    bearish = d0.above & d0.white & ~d0.long(body) & d1.long(body) & d1.black & \
+        (d0.low > d1.close) & (d0.high < d1.open) & d2.black & \
+        (d2.open < d1.open) & (d2.open > d1.close) & (d2.close < d2.close)
+
+    return [(bullish, 'bullish', 'up'), (bearish, 'bearish', 'down')]
+
+
+def kicking(day: list, body='body') -> list:
     THRESH = 0.01
-    candle_0 = day[0]['candlestick']
-    candle_1 = day[1]['candlestick']
-    if candle_0[body] == 'long' and candle_0['color'] == 'black' and candle_1[body] == 'long' and \
-            candle_1['color'] == 'white':
-        basic_0 = day[0]['basic']
-        oc_thr = np.abs(basic_0['Open'] - basic_0['Close']) * THRESH
-        hi_op = basic_0['High'] - basic_0['Open']
-        cl_lo = basic_0['Close'] - basic_0['Low']
-        if (hi_op <= oc_thr) and (cl_lo <= oc_thr):
-            basic_1 = day[1]['basic']
-            oc_thr = np.abs(basic_1['Open'] - basic_1['Close']) * THRESH
-            hi_cl = basic_1['High'] - basic_1['Close']
-            op_lo = basic_1['Open'] - basic_1['Low']
-            if (hi_cl <= oc_thr) and (op_lo <= oc_thr):
-                if (basic_0['High'] < basic_1['Low']):
-                    return {"type": 'bullish', "style": '+'}
-
-    if candle_0[body] == 'long' and candle_0['color'] == 'white' and candle_1[body] == 'long' and \
-            candle_1['color'] == 'black':
-        basic_0 = day[0]['basic']
-        oc_thr = np.abs(basic_0['Close'] - basic_0['Open']) * THRESH
-        hi_op = basic_0['High'] - basic_0['Close']
-        cl_lo = basic_0['Open'] - basic_0['Low']
-        if (hi_op <= oc_thr) and (cl_lo <= oc_thr):
-            basic_1 = day[1]['basic']
-            oc_thr = np.abs(basic_1['Open'] - basic_1['Close']) * THRESH
-            hi_cl = basic_1['High'] - basic_1['Open']
-            op_lo = basic_1['Close'] - basic_1['Low']
-            if (hi_cl <= oc_thr) and (op_lo <= oc_thr):
-                if (basic_0['Low'] > basic_1['High']):
-                    return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def unique_three_river(day: list, body='body') -> dict:
+    d0, d1 = day
+    bullish = d0.long(body) & d0.black & d1.long(body) & d1.white & \
+        ((d0.high - d0.open) <= (np.abs(d0.open - d0.close) * THRESH)) & \
+        ((d0.close - d0.low) <= (np.abs(d0.open - d0.close) * THRESH)) & \
+        ((d1.high - d1.close) <= (np.abs(d1.open - d1.close) * THRESH)) & \
+        ((d1.open - d1.low) <= (np.abs(d1.open - d1.close) * THRESH)) & \
+        (d0.high < d1.low)
+
+    bearish = d0.long(body) & d0.white & d1.long(body) & d1.black & \
+        ((d0.high - d0.close) <= (np.abs(d0.close - d0.open) * THRESH)) & \
+        ((d0.open - d0.low) <= (np.abs(d0.close - d0.open) * THRESH)) & \
+        ((d1.high - d1.open) <= (np.abs(d1.open - d1.close) * THRESH)) & \
+        ((d1.close - d1.low) <= (np.abs(d1.open - d1.close) * THRESH)) & \
+        (d0.low > d1.high)
+
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def unique_three_river(day: list, body='body') -> list:
     THRESH = 0.02
     SHADOW_RATIO = 2.0
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black' and \
-                    candle_1['shadow_ratio'] >= SHADOW_RATIO:
-                basic_1 = day[1]['basic']
-                basic_0 = day[0]['basic']
-                hi_op = basic_1['High'] - basic_1['Open']
-                oc_thr = (basic_1['Open'] - basic_1['Close']) * THRESH
-                if (hi_op <= oc_thr) and (basic_1['Open'] < basic_0['Open']) and \
-                        (basic_1['Low'] < basic_0['Close']):
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] >= basic_0['Close']) and \
-                                (basic_2['Close'] <= basic_1['Close']):
-                            return {"type": 'bullish', "style": '+'}
-    return None
-
-
-def three_stars_in_the_south(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.long(body) & d0.black & \
+        d1.short(body) & d1.black & (d1.shadow_ratio >= SHADOW_RATIO) & \
+        ((d1.high - d1.open) <= ((d1.open - d1.close) * THRESH)) & \
+        (d1.open < d0.open) & (d1.low < d0.close) & \
+        d2.white & (d2.open >= d0.close) & (d2.close <= d1.close)
+    return [(bullish, 'bullish', '+')]
+
+
+def three_stars_in_the_south(day: list, body='body') -> list:
     SHADOW_RATIO = 1.6
     OC_SHADOW_RATIO = 1.03
     THRESH = 0.01
     OP_THR = 0.2
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black' and \
-                candle_0['shadow_ratio'] >= SHADOW_RATIO:
-            basic_0 = day[0]['basic']
-            hi_op = basic_0['High'] - basic_0['Open']
-            oc_thr = np.abs(basic_0['Close'] - basic_0['Open']) * THRESH
-            if (hi_op <= oc_thr):
-                candle_1 = day[1]['candlestick']
-                if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                    basic_1 = day[1]['basic']
-                    op_point = (
-                        (basic_0['Open'] - basic_0['Close']) * OP_THR) + basic_0['Close']
-                    if (basic_1['Open'] < op_point) and \
-                        (basic_1['Open'] > basic_0['Close']) and \
-                            (basic_1['Close'] < basic_0['Close']) and \
-                            (basic_1['Low'] > basic_0['Low']):
-                        candle_2 = day[2]['candlestick']
-                        if candle_2['shadow_ratio'] <= OC_SHADOW_RATIO and \
-                                candle_2['color'] == 'black' and candle_2[body] == 'short':
-                            basic_2 = day[2]['basic']
-                            mid_pt = (
-                                (basic_1['Open'] - basic_1['Close']) * 0.5) + basic_1['Close']
-                            if basic_2['Open'] < mid_pt and basic_2['Close'] < basic_1['Close']:
-                                return {"type": 'bullish', "style": "in the south +"}
-    return None
-
-
-def concealing_baby_swallow(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.long(body) & d0.black & (d0.shadow_ratio >= SHADOW_RATIO) & \
+        ((d0.high - d0.open) <= (np.abs(d0.close - d0.open) * THRESH)) & \
+        d1.short(body) & d1.black & \
+        (d1.open < (((d0.open - d0.close) * OP_THR) + d0.close)) & \
+        (d1.open > d0.close) & (d1.close < d0.close) & (d1.low > d0.low) & \
+        (d2.shadow_ratio <= OC_SHADOW_RATIO) & d2.black & d2.short(body) & \
+        (d2.open < (((d1.open - d1.close) * 0.5) + d1.close)) & (d2.close < d1.close)
+    return [(bullish, 'bullish', 'in the south +')]
+
+
+def concealing_baby_swallow(day: list, body='body') -> list:
     MF_SHADOW_RATIO = 1.03
     SHADOW_RATIO = 1.6
     THRESH = 0.02
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'black' and \
-                candle_0['shadow_ratio'] <= MF_SHADOW_RATIO:
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] != 'short' and candle_1['color'] == 'black' and \
-                    candle_1['shadow_ratio'] <= MF_SHADOW_RATIO:
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                mid_pt = ((basic_0['Open'] - basic_0['Close'])
-                          * 0.5) + basic_0['Close']
-                if (basic_1['Open'] < mid_pt) and (basic_1['Open'] >= basic_0['Close']):
-                    candle_2 = day[2]['candlestick']
-                    if candle_2[body] == 'short' and candle_2['color'] == 'black' and \
-                            candle_2['shadow_ratio'] >= SHADOW_RATIO:
-                        basic_2 = day[2]['basic']
-                        oc_thr = (basic_2['Open'] - basic_2['Close']) * THRESH
-                        cl_low = (basic_2['Close'] - basic_2['Low'])
-                        if (cl_low <= oc_thr) and (basic_2['Open'] < basic_1['Close']) and \
-                                (basic_2['High'] >= basic_1['Close']):
-                            candle_3 = day[3]['candlestick']
-                            if candle_3['color'] == 'black' and \
-                                candle_3[body] != 'short' and \
-                                    candle_3['shadow_ratio'] <= MF_SHADOW_RATIO:
-                                basic_3 = day[3]['basic']
-                                if (basic_3['Close'] <= basic_2['Close']) and \
-                                        (basic_3['Open'] > basic_2['Open']):
-                                    return {"type": 'bullish', "style": 'swallow +'}
-    return None
-
-
-def stick_sandwich(day: list, body='body') -> dict:
+    d0, d1, d2, d3 = day
+    bullish = d0.below & ~d0.short(body) & d0.black & \
+        (d0.shadow_ratio <= MF_SHADOW_RATIO) & \
+        ~d1.short(body) & d1.black & (d1.shadow_ratio <= MF_SHADOW_RATIO) & \
+        (d1.open < (((d0.open - d0.close) * 0.5) + d0.close)) & (d1.open >= d0.close) & \
+        d2.short(body) & d2.black & (d2.shadow_ratio >= SHADOW_RATIO) & \
+        ((d2.close - d2.low) <= ((d2.open - d2.close) * THRESH)) & \
+        (d2.open < d1.close) & (d2.high >= d1.close) & \
+        d3.black & ~d3.short(body) & (d3.shadow_ratio <= MF_SHADOW_RATIO) & \
+        (d3.close <= d2.close) & (d3.open > d2.open)
+    return [(bullish, 'bullish', 'swallow +')]
+
+
+def stick_sandwich(day: list, body='body') -> list:
     THRESH = 0.02
     MF_SHADOW_RATIO = 1.03
     CLOSE_THRESH = 0.05
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = day[0]['basic']
-            oc_thr = (basic_0['Open'] - basic_0['Close']) * THRESH
-            cl_low = basic_0['Close'] - basic_0['Low']
-            if (cl_low <= oc_thr):
-                candle_1 = day[1]['candlestick']
-                if candle_1[body] == 'long' and candle_1['color'] == 'white' and \
-                        candle_1['shadow_ratio'] <= MF_SHADOW_RATIO:
-                    basic_1 = day[1]['basic']
-                    basic_0 = day[0]['basic']
-                    if (basic_1['Open'] > basic_0['Close']) and \
-                            (basic_1['Open'] < basic_0['Open']):
-                        candle_2 = day[2]['candlestick']
-                        if candle_2[body] == 'long' and candle_2['color'] == 'black':
-                            basic_2 = day[2]['basic']
-                            point1 = ((basic_2['Open'] - basic_2['Close']) * CLOSE_THRESH) + \
-                                basic_2['Close']
-                            point2 = basic_2['Close'] - \
-                                ((basic_2['Open'] - basic_2['Close'])
-                                 * CLOSE_THRESH)
-                            if (basic_0['Close'] <= point1) and (basic_0['Close'] >= point2):
-                                if basic_2['Open'] > basic_1['Close']:
-                                    return {"type": 'bullish', "style": '+'}
-
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = day[0]['basic']
-            oc_thr = (basic_0['Close'] - basic_0['Open']) * THRESH
-            cl_low = basic_0['High'] - basic_0['Close']
-            if (cl_low <= oc_thr):
-                candle_1 = day[1]['candlestick']
-                if candle_1[body] == 'long' and candle_1['color'] == 'black' and \
-                        candle_1['shadow_ratio'] <= MF_SHADOW_RATIO:
-                    basic_1 = day[1]['basic']
-                    basic_0 = day[0]['basic']
-                    if (basic_1['Open'] > basic_0['Open']) and \
-                            (basic_1['Open'] < basic_0['Close']):
-                        candle_2 = day[2]['candlestick']
-                        if candle_2[body] == 'long' and candle_2['color'] == 'white':
-                            basic_2 = day[2]['basic']
-                            point1 = ((basic_2['Close'] - basic_2['Open']) * CLOSE_THRESH) + \
-                                basic_2['Close']
-                            point2 = basic_2['Close'] - \
-                                ((basic_2['Close'] - basic_2['Open'])
-                                 * CLOSE_THRESH)
-                            if (basic_0['Close'] <= point1) and (basic_0['Close'] >= point2):
-                                if basic_2['Open'] < basic_1['Close']:
-                                    return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def identical_three_crows(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    bullish = d0.below & d0.long(body) & d0.black & \
+        ((d0.close - d0.low) <= ((d0.open - d0.close) * THRESH)) & \
+        d1.long(body) & d1.white & (d1.shadow_ratio <= MF_SHADOW_RATIO) & \
+        (d1.open > d0.close) & (d1.open < d0.open) & \
+        d2.long(body) & d2.black & \
+        (d0.close <= (((d2.open - d2.close) * CLOSE_THRESH) + d2.close)) & \
+        (d0.close >= (d2.close - ((d2.open - d2.close) * CLOSE_THRESH))) & \
+        (d2.open > d1.close)
+
+    bearish = d0.above & d0.long(body) & d0.white & \
+        ((d0.high - d0.close) <= ((d0.close - d0.open) * THRESH)) & \
+        d1.long(body) & d1.black & (d1.shadow_ratio <= MF_SHADOW_RATIO) & \
+        (d1.open > d0.open) & (d1.open < d0.close) & \
+        d2.long(body) & d2.white & \
+        (d0.close <= (((d2.close - d2.open) * CLOSE_THRESH) + d2.close)) & \
+        (d0.close >= (d2.close - ((d2.close - d2.open) * CLOSE_THRESH))) & \
+        (d2.open < d1.close)
+
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def identical_three_crows(day: list, body='body') -> list:
     THRESH = 0.03
     SIZE_RANGE = 0.05
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] != 'short' and candle_1['color'] == 'black':
-                basic_1 = day[1]['basic']
-                basic_0 = day[0]['basic']
-                point1 = ((basic_0['Open'] - basic_0['Close'])
-                          * THRESH) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Open'] - basic_0['Close']) * THRESH)
-                if (basic_1['Open'] <= point1) and (basic_1['Close'] >= point2):
-                    candle_2 = day[2]['candlestick']
-                    if candle_2[body] != 'short' and candle_2['color'] == 'black':
-                        basic_2 = day[2]['basic']
-                        point1 = (
-                            (basic_1['Open'] - basic_1['Close']) * THRESH) + basic_1['Close']
-                        point2 = basic_1['Close'] - \
-                            ((basic_1['Open'] - basic_1['Close']) * THRESH)
-                        if (basic_2['Open'] <= point1) and (basic_2['Open'] >= point2):
-                            length_0 = basic_0['Open'] - basic_0['Close']
-                            upper_th = length_0 * (1.0 + SIZE_RANGE)
-                            lower_th = length_0 * (1.0 - SIZE_RANGE)
-                            length_1 = basic_1['Open'] - basic_1['Close']
-                            length_2 = basic_2['Open'] - basic_2['Close']
-                            if (length_1 <= upper_th) and (length_1 >= lower_th):
-                                if (length_2 <= upper_th) and (length_2 >= lower_th):
-                                    return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def deliberation(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'long' and candle_0['color'] == 'white':
-                basic_0 = day[0]['basic']
-                mid_pt = (basic_0['Close'] - basic_0['Open']) * 0.5
-                basic_1 = day[1]['basic']
-                if (basic_1['Open'] > mid_pt) and (basic_1['Open'] < basic_0['Close']) and \
-                        (basic_1['Close'] > basic_0['Close']):
-                    candle_2 = day[2]['candlestick']
-                    if candle_2[body] == 'short' or candle_2['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] > basic_1['Close']):
-                            return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def matching_high_low(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    length_0 = d0.open - d0.close
+    length_1 = d1.open - d1.close
+    length_2 = d2.open - d2.close
+    upper_th = length_0 * (1.0 + SIZE_RANGE)
+    lower_th = length_0 * (1.0 - SIZE_RANGE)
+
+    bearish = d0.above & ~d0.short(body) & d0.black & ~d1.short(body) & d1.black & \
+        (d1.open <= ((length_0 * THRESH) + d0.close)) & \
+        (d1.close >= (d0.close - (length_0 * THRESH))) & \
+        ~d2.short(body) & d2.black & \
+        (d2.open <= ((length_1 * THRESH) + d1.close)) & \
+        (d2.open >= (d1.close - (length_1 * THRESH))) & \
+        (length_1 <= upper_th) & (length_1 >= lower_th) & \
+        (length_2 <= upper_th) & (length_2 >= lower_th)
+    return [(bearish, 'bearish', '-')]
+
+
+def deliberation(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    # Day 1's color is not checked (day 0's is checked twice), as before
+    bearish = d0.above & d0.long(body) & d0.white & d1.long(body) & \
+        (d1.open > ((d0.close - d0.open) * 0.5)) & (d1.open < d0.close) & \
+        (d1.close > d0.close) & (d2.short(body) | d2.white) & (d2.open > d1.close)
+    return [(bearish, 'bearish', '-')]
+
+
+def matching_high_low(day: list, body='body') -> list:
     THRESH = 0.03
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if day[1]['candlestick']['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                point1 = ((basic_0['Open'] - basic_0['Close'])
-                          * THRESH) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Open'] - basic_0['Close']) * THRESH)
-                if (basic_1['Open'] < basic_0['Open']) and (basic_1['Close'] <= point1) and \
-                        (basic_1['Close'] >= point2):
-                    return {"type": 'bullish', "style": 'low'}
-
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if day[1]['candlestick']['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                point1 = ((basic_0['Close'] - basic_0['Open'])
-                          * THRESH) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Close'] - basic_0['Open']) * THRESH)
-                if (basic_1['Open'] > basic_0['Open']) and (basic_1['Close'] <= point1) and \
-                        (basic_1['Close'] >= point2):
-                    return {"type": 'bearish', "style": 'high'}
-    return None
-
-
-def upside_gap_two_crows(day: list, body='body') -> dict:
+    d0, d1 = day
+    bullish = d0.below & d0.long(body) & d0.black & d1.black & (d1.open < d0.open) & \
+        (d1.close <= (((d0.open - d0.close) * THRESH) + d0.close)) & \
+        (d1.close >= (d0.close - ((d0.open - d0.close) * THRESH)))
+
+    bearish = d0.above & d0.long(body) & d0.white & d1.white & (d1.open > d0.open) & \
+        (d1.close <= (((d0.close - d0.open) * THRESH) + d0.close)) & \
+        (d1.close >= (d0.close - ((d0.close - d0.open) * THRESH)))
+
+    return [(bullish, 'bullish', 'low'), (bearish, 'bearish', 'high')]
+
+
+def upside_gap_two_crows(day: list, body='body') -> list:
     # Both upside_gap_two_crows and two_crows
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['Close'] > basic_0['Close']:
-                    if day[1]['candlestick']['color'] == 'black':
-                        basic_2 = day[2]['basic']
-                        if (basic_2['Open'] >= basic_1['Open']) and \
-                            (basic_2['Close'] <= basic_1['Close']) and \
-                                (basic_2['Close'] > basic_0['Close']):
-                            return {"type": 'bearish', "style": "upside_gap--"}
-                        if (basic_2['Open'] > basic_1['Close']) and \
-                            (basic_2['Open'] < basic_1['Open']) and \
-                                (basic_2['Close'] < basic_1['Close']) and \
-                                (basic_2['Close'] > basic_1['Open']):
-                            return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def homing_pigeon(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] != 'long' and candle_1['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if (basic_1['Open'] < basic_0['Open']) and (basic_1['Close'] > basic_0['Close']):
-                    return {"type": 'bullish', "style": '+'}
-    return None
-
-
-def ladder(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    crows = d0.above & d0.long(body) & d0.white & d1.short(body) & d1.black & \
+        (d1.close > d0.close)
+    upside_gap = crows & (d2.open >= d1.open) & (d2.close <= d1.close) & \
+        (d2.close > d0.close)
+    two_crows = crows & (d2.open > d1.close) & (d2.open < d1.open) & \
+        (d2.close < d1.close) & (d2.close > d1.open)
+    return [(upside_gap, 'bearish', 'upside_gap--'), (two_crows, 'bearish', '-')]
+
+
+def homing_pigeon(day: list, body='body') -> list:
+    d0, d1 = day
+    bullish = d0.below & d0.long(body) & d0.black & ~d1.long(body) & d1.black & \
+        (d1.open < d0.open) & (d1.close > d0.close)
+    return [(bullish, 'bullish', '+')]
+
+
+def ladder(day: list, body='body') -> list:
     SHADOW_RATIO = 2.0
     THRESH = 0.1
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if candle_1[body] != 'short' and candle_1['color'] == 'black' and \
-                basic_1['Open'] < basic_0['Open'] and basic_1['Open'] > basic_0['Close'] and \
-                    basic_1['Close'] < basic_0['Close']:
-                candle_2 = day[2]['candlestick']
-                basic_2 = day[2]['basic']
-                if candle_2[body] != 'short' and candle_2['color'] == 'black' and \
-                    basic_2['Open'] < basic_1['Open'] and \
-                        basic_2['Open'] > basic_1['Close'] and \
-                        basic_2['Close'] < basic_1['Close']:
-                    candle_3 = day[3]['candlestick']
-                    if candle_3[body] == 'short' and candle_3['color'] == 'black' and \
-                            candle_3['shadow_ratio'] >= SHADOW_RATIO:
-                        basic_3 = day[3]['basic']
-                        oc_thr = (basic_3['Open'] - basic_3['Close']) * THRESH
-                        cl_low = basic_3['Close'] - basic_3['Low']
-                        if (basic_3['Close'] < basic_2['Close']) and (cl_low <= oc_thr):
-                            candle_4 = day[4]['candlestick']
-                            if candle_4[body] == 'long' and candle_4['color'] == 'white' and \
-                                    day[4]['basic']['Open'] > basic_3['Open']:
-                                return {"type": 'bullish', "style": 'bottom +'}
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'white':
-            candle_1 = day[1]['candlestick']
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if candle_1[body] != 'short' and candle_1['color'] == 'white' and \
-                basic_1['Open'] > basic_0['Open'] and basic_1['Open'] < basic_0['Close'] and \
-                    basic_1['Close'] > basic_0['Close']:
-                candle_2 = day[2]['candlestick']
-                basic_2 = day[2]['basic']
-                if candle_2[body] != 'short' and candle_2['color'] == 'white' and \
-                    basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Open'] < basic_1['Close'] and \
-                        basic_2['Close'] > basic_1['Close']:
-                    candle_3 = day[3]['candlestick']
-                    if candle_3[body] == 'short' and candle_3['color'] == 'white' and \
-                            candle_3['shadow_ratio'] >= SHADOW_RATIO:
-                        basic_3 = day[3]['basic']
-                        oc_thr = (basic_3['Open'] - basic_3['Close']) * THRESH
-                        cl_low = basic_3['High'] - basic_3['Close']
-                        if (basic_3['Close'] > basic_2['Close']) and (cl_low <= oc_thr):
-                            candle_4 = day[4]['candlestick']
-                            if candle_4['body'] == 'long' and candle_4['color'] == 'black' and \
-                                    day[4]['basic']['Open'] < basic_3['Open']:
-                                return {"type": 'bearish', "style": 'top -'}
-    return None
-
-
-def advance_block(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'above':
-        if day[0]['candlestick']['color'] == 'white':
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if basic_1['Open'] > basic_0['Open'] and basic_1['Open'] < basic_0['Close'] and \
-                    basic_1['Close'] > basic_0['Close'] and day[1]['candlestick']['color'] == 'white':
-                candle_2 = day[2]['candlestick']
-                if candle_2[body] == 'short' and candle_2['color'] == 'white':
-                    basic_2 = day[2]['basic']
-                    if basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Open'] < basic_1['Close'] and \
-                            basic_2['Close'] > basic_1['Close']:
-                        return {"type": 'bearish', "style": '-'}
-    return None
-
-
-def separating_lines(day: list, body='body') -> dict:
+    d0, d1, d2, d3, d4 = day
+    bullish = d0.below & ~d0.short(body) & d0.black & \
+        ~d1.short(body) & d1.black & (d1.open < d0.open) & (d1.open > d0.close) & \
+        (d1.close < d0.close) & \
+        ~d2.short(body) & d2.black & (d2.open < d1.open) & (d2.open > d1.close) & \
+        (d2.close < d1.close) & \
+        d3.short(body) & d3.black & (d3.shadow_ratio >= SHADOW_RATIO) & \
+        (d3.close < d2.close) & ((d3.close - d3.low) <= ((d3.open - d3.close) * THRESH)) & \
+        d4.long(body) & d4.white & (d4.open > d3.open)
+
+    # The last day of the top is always sized by quartile body, as before
+    bearish = d0.above & ~d0.short(body) & d0.white & \
+        ~d1.short(body) & d1.white & (d1.open > d0.open) & (d1.open < d0.close) & \
+        (d1.close > d0.close) & \
+        ~d2.short(body) & d2.white & (d2.open > d1.open) & (d2.open < d1.close) & \
+        (d2.close > d1.close) & \
+        d3.short(body) & d3.white & (d3.shadow_ratio >= SHADOW_RATIO) & \
+        (d3.close > d2.close) & ((d3.high - d3.close) <= ((d3.open - d3.close) * THRESH)) & \
+        d4.long('body') & d4.black & (d4.open < d3.open)
+
+    return [(bullish, 'bullish', 'bottom +'), (bearish, 'bearish', 'top -')]
+
+
+def advance_block(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    bearish = d0.above & d0.white & (d1.open > d0.open) & (d1.open < d0.close) & \
+        (d1.close > d0.close) & d1.white & d2.short(body) & d2.white & \
+        (d2.open > d1.open) & (d2.open < d1.close) & (d2.close > d1.close)
+    return [(bearish, 'bearish', '-')]
+
+
+def separating_lines(day: list, body='body') -> list:
     THRESH = 0.05
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                oc_thr = np.abs(basic_0['Open'] - basic_0['Close']) * THRESH
-                point1 = basic_0['Open'] - oc_thr
-                point2 = basic_0['Open'] + oc_thr
-                if basic_1['Open'] <= point2 and basic_1['Open'] >= point1:
-                    return {"type": 'bullish', "style": '+'}
-
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = day[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                oc_thr = np.abs(basic_0['Close'] - basic_0['Open']) * THRESH
-                point1 = basic_0['Open'] - oc_thr
-                point2 = basic_0['Open'] + oc_thr
-                if basic_1['Open'] <= point2 and basic_1['Open'] >= point1:
-                    return {"type": 'bearish', "style": '-'}
-
-    return None
-
-
-def tasuki_gap_upside_downside(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if day[1]['candlestick']['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['Low'] > basic_0['High']:
-                    if day[2]['candlestick']['color'] == 'black':
-                        basic_2 = day[2]['basic']
-                        if basic_2['Open'] <= basic_1['Close'] and \
-                                basic_2['Open'] >= basic_1['Open']:
-                            if basic_2['Close'] < basic_1['Open'] and \
-                                    basic_2['Close'] > basic_0['Close']:
-                                return {"type": 'bullish', "style": 'upside +'}
-
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if day[1]['candlestick']['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_0['Low'] > basic_1['High']:
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        if basic_2['Open'] <= basic_1['Open'] and \
-                                basic_2['Open'] >= basic_1['Close']:
-                            if basic_2['Close'] > basic_1['Open'] and \
-                                    basic_2['Close'] < basic_0['Close']:
-                                return {"type": 'bearish', "style": 'downside -'}
-    return None
-
-
-def side_by_side_white_lines(day: list, body='body') -> dict:
+    d0, d1 = day
+    bull_thr = np.abs(d0.open - d0.close) * THRESH
+    bullish = d0.above & d0.long(body) & d0.black & d1.long(body) & d1.white & \
+        (d1.open <= (d0.open + bull_thr)) & (d1.open >= (d0.open - bull_thr))
+
+    bear_thr = np.abs(d0.close - d0.open) * THRESH
+    bearish = d0.below & d0.long(body) & d0.white & d1.long(body) & d1.black & \
+        (d1.open <= (d0.open + bear_thr)) & (d1.open >= (d0.open - bear_thr))
+
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
+
+
+def tasuki_gap_upside_downside(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    bullish = d0.above & d0.long(body) & d0.white & d1.white & (d1.low > d0.high) & \
+        d2.black & (d2.open <= d1.close) & (d2.open >= d1.open) & \
+        (d2.close < d1.open) & (d2.close > d0.close)
+
+    bearish = d0.below & d0.long(body) & d0.black & d1.black & (d0.low > d1.high) & \
+        d2.white & (d2.open <= d1.open) & (d2.open >= d1.close) & \
+        (d2.close > d1.open) & (d2.close < d0.close)
+
+    return [(bullish, 'bullish', 'upside +'), (bearish, 'bearish', 'downside -')]
+
+
+def side_by_side_white_lines(day: list, body='body') -> list:
     THRESH = 0.1
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if day[1]['candlestick']['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['Low'] > basic_0['High']:
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        oc_thr = (basic_1['Close'] - basic_1['Open']) * THRESH
-                        point1 = basic_1['Open'] - oc_thr
-                        point2 = basic_1['Open'] + oc_thr
-                        if basic_2['Low'] > basic_0['High'] and basic_2['Open'] >= point1 and \
-                                basic_2['Open'] <= point2 and basic_2['Close'] <= basic_1['Close']:
-                            return {"type": 'bullish', "style": 'white lines +'}
-
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if day[1]['candlestick']['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['High'] < basic_0['Low']:
-                    if day[2]['candlestick']['color'] == 'white':
-                        basic_2 = day[2]['basic']
-                        oc_thr = (basic_1['Close'] - basic_1['Open']) * THRESH
-                        point1 = basic_1['Open'] - oc_thr
-                        point2 = basic_1['Open'] + oc_thr
-                        if basic_2['High'] < basic_0['Low'] and basic_2['Open'] >= point1 and \
-                                basic_2['Open'] <= point2 and basic_2['Close'] <= basic_1['Close']:
-                            return {"type": 'bearish', "style": 'white lines -'}
-
-    return None
-
-
-def three_line_strike(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        if day[0]['candlestick']['color'] == 'black' and day[1]['candlestick']['color'] == 'black' \
-                and day[2]['candlestick']['color'] == 'black':
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if basic_1['Open'] < basic_0['Open'] and basic_1['Close'] < basic_0['Close']:
-                basic_2 = day[2]['basic']
-                if basic_2['Open'] < basic_1['Open'] and basic_2['Close'] < basic_1['Close']:
-                    if day[3]['candlestick']['color'] == 'white':
-                        basic_3 = day[3]['basic']
-                        if basic_3['Open'] <= basic_2['Close'] and \
-                                basic_3['Close'] >= basic_0['Open']:
-                            return {"type": 'bearish', "style": '-'}
-
-    if day[0]['trend'] == 'above':
-        if day[0]['candlestick']['color'] == 'white' and day[1]['candlestick']['color'] == 'white' \
-                and day[2]['candlestick']['color'] == 'white':
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if basic_1['Open'] > basic_0['Open'] and basic_1['Close'] > basic_0['Close']:
-                basic_2 = day[2]['basic']
-                if basic_2['Open'] > basic_1['Open'] and basic_2['Close'] > basic_1['Close']:
-                    if day[3]['candlestick']['color'] == 'black':
-                        basic_3 = day[3]['basic']
-                        if basic_3['Open'] >= basic_2['Close'] and \
-                                basic_3['Close'] <= basic_0['Open']:
-                            return {"type": 'bullish', "style": '+'}
-    return None
-
-
-def upside_downside_gap_three_methods(day: list, body='body') -> dict:
-    if day[0]['trend'] == 'below':
-        if day[0]['candlestick']['color'] == 'black' and day[1]['candlestick']['color'] == 'black':
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if basic_1['High'] < basic_0['Low'] and day[2]['candlestick']['color'] == 'white':
-                basic_2 = day[2]['basic']
-                if basic_2['Open'] < basic_1['Open'] and basic_2['Open'] > basic_1['Close'] and \
-                        basic_2['Close'] > basic_0['Close'] and basic_2['Close'] < basic_2['Open']:
-                    return {"type": 'bearish', "style": 'downside -'}
-
-    if day[0]['trend'] == 'above':
-        if day[0]['candlestick']['color'] == 'white' and day[1]['candlestick']['color'] == 'white':
-            basic_0 = day[0]['basic']
-            basic_1 = day[1]['basic']
-            if basic_1['Low'] > basic_0['High'] and day[2]['candlestick']['color'] == 'black':
-                basic_2 = day[2]['basic']
-                if basic_2['Open'] < basic_1['Close'] and basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Close'] > basic_0['Open'] and basic_2['Close'] < basic_2['Close']:
-                    return {"type": 'bullish', "style": 'upside +'}
-    return None
-
-
-def on_in_neck_line(day: list, body='body') -> dict:
+    d0, d1, d2 = day
+    oc_thr = (d1.close - d1.open) * THRESH
+    lines = d2.white & (d2.open >= (d1.open - oc_thr)) & (d2.open <= (d1.open + oc_thr)) & \
+        (d2.close <= d1.close)
+
+    bullish = d0.above & d0.long(body) & d0.white & d1.white & (d1.low > d0.high) & \
+        (d2.low > d0.high) & lines
+    bearish = d0.below & d0.long(body) & d0.black & d1.white & (d1.high < d0.low) & \
+        (d2.high < d0.low) & lines
+
+    return [(bullish, 'bullish', 'white lines +'), (bearish, 'bearish', 'white lines -')]
+
+
+def three_line_strike(day: list, body='body') -> list:
+    d0, d1, d2, d3 = day
+    bearish = d0.below & d0.black & d1.black & d2.black & \
+        (d1.open < d0.open) & (d1.close < d0.close) & \
+        (d2.open < d1.open) & (d2.close < d1.close) & \
+        d3.white & (d3.open <= d2.close) & (d3.close >= d0.open)
+
+    bullish = d0.above & d0.white & d1.white & d2.white & \
+        (d1.open > d0.open) & (d1.close > d0.close) & \
+        (d2.open > d1.open) & (d2.close > d1.close) & \
+        d3.black & (d3.open >= d2.close) & (d3.close <= d0.open)
+
+    return [(bearish, 'bearish', '-'), (bullish, 'bullish', '+')]
+
+
+def upside_downside_gap_three_methods(day: list, body='body') -> list:
+    d0, d1, d2 = day
+    bearish = d0.below & d0.black & d1.black & (d1.high < d0.low) & d2.white & \
+        (d2.open < d1.open) & (d2.open > d1.close) & (d2.close > d0.close) & \
+        (d2.close < d2.open)
+
+    bullish = d0.above & d0.white & d1.white & (d1.low > d0.high) & d2.black & \
+        (d2.open < d1.close) & (d2.open > d1.open) & (d2.close > d0.open) & \
+        (d2.close < d2.close)
+
+    return [(bearish, 'bearish', 'downside -'), (bullish, 'bullish', 'upside +')]
+
+
+def on_in_neck_line(day: list, body='body') -> list:
     THRESH = 0.05
-    if day[0]['trend'] == 'below':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if day[1]['candlestick']['color'] == 'white':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['Open'] < basic_0['Low']:
-                    oc_thr = (basic_0['Open'] - basic_0['Close']) * THRESH
-                    point1 = basic_0['Close'] - oc_thr
-                    point2 = basic_0['Close'] + oc_thr
-                    if basic_1['Close'] >= point1 and basic_1['Close'] <= point2:
-                        return {"type": 'bearish', "style": 'in -'}
-                    if basic_1['Close'] <= basic_0['Close'] and basic_1['Close'] >= basic_0['Low']:
-                        return {"type": 'bearish', "style": 'on -'}
-
-    if day[0]['trend'] == 'above':
-        candle_0 = day[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if day[1]['candlestick']['color'] == 'black':
-                basic_0 = day[0]['basic']
-                basic_1 = day[1]['basic']
-                if basic_1['Open'] > basic_0['High']:
-                    oc_thr = (basic_0['Close'] - basic_0['Open']) * THRESH
-                    point1 = basic_0['Close'] - oc_thr
-                    point2 = basic_0['Close'] + oc_thr
-                    if basic_1['Close'] >= point1 and basic_1['Close'] <= point2:
-                        return {"type": 'bullish', "style": 'in +'}
-                    if basic_1['Close'] >= basic_0['Close'] and basic_1['Close'] <= basic_0['High']:
-                        return {"type": 'bullish', "style": 'on +'}
-    return None
+    d0, d1 = day
+    bear_thr = (d0.open - d0.close) * THRESH
+    bearish = d0.below & d0.long(body) & d0.black & d1.white & (d1.open < d0.low)
+    bear_in = (d1.close >= (d0.close - bear_thr)) & (d1.close <= (d0.close + bear_thr))
+    bear_on = (d1.close <= d0.close) & (d1.close >= d0.low)
+
+    bull_thr = (d0.close - d0.open) * THRESH
+    bullish = d0.above & d0.long(body) & d0.white & d1.black & (d1.open > d0.high)
+    bull_in = (d1.close >= (d0.close - bull_thr)) & (d1.close <= (d0.close + bull_thr))
+    bull_on = (d1.close >= d0.close) & (d1.close <= d0.high)
+
+    return [
+        (bearish & bear_in, 'bearish', 'in -'),
+        (bearish & bear_on, 'bearish', 'on -'),
+        (bullish & bull_in, 'bullish', 'in +'),
+        (bullish & bull_on, 'bullish', 'on +')
+    ]
 
 
 PATTERNS = {
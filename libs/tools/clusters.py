@@ -4,11 +4,13 @@ import numpy as np
 
 from libs.utils import dual_plotting, date_extractor
 from libs.utils import ProgressBar, INDEXES, STANDARD_COLORS
+from libs.utils import memoize_indicator, indicator_key, INDICATOR_CACHE
+from libs.utils import panel_frame
 from libs.features import normalize_signals
 
-from .ultimate_oscillator import ultimate_oscillator
-from .rsi import RSI
-from .full_stochastic import full_stochastic
+from .ultimate_oscillator import ultimate_oscillator, ultimate_kernel
+from .rsi import RSI, generate_rsi_signals, rsi_changes, rsi_from_changes
+from .full_stochastic import full_stochastic, stoch_kernel
 
 from .moving_average import exponential_moving_avg
 from .trends import autotrend
@@ -22,6 +24,32 @@ BASE_WEIGHTS = {
     'ultimate': 7
 }
 
+# Oscillators of each cluster function, in 'generate_cluster' clustering order:
+# (oscillator, config, weight type, weight speed); weights only apply to 'all'
+CLUSTER_OSCILLATORS = {
+    'full_stochastic': [('full_stochastic', [10, 3, 3], 'stoch', 'fast'),
+                        ('full_stochastic', [14, 3, 3], 'stoch', 'medium'),
+                        ('full_stochastic', [20, 5, 5], 'stoch', 'slow')],
+    'ultimate': [('ultimate', [4, 8, 16], 'ultimate', 'fast'),
+                 ('ultimate', [7, 14, 28], 'ultimate', 'medium'),
+                 ('ultimate', [10, 20, 40], 'ultimate', 'slow')],
+    'rsi': [('rsi', [8], 'rsi', 'fast'),
+            ('rsi', [14], 'rsi', 'medium'),
+            ('rsi', [20], 'rsi', 'slow')],
+    'all': [('full_stochastic', [10, 3, 3], 'stoch', 'fast'),
+            ('full_stochastic', [14, 3, 3], 'stoch', 'medium'),
+            ('full_stochastic', [20, 5, 5], 'stoch', 'slow'),
+            ('rsi', [8], 'rsi', 'fast'),
+            ('rsi', [14], 'rsi', 'medium'),
+            ('rsi', [20], 'rsi', 'slow'),
+            ('ultimate', [5, 10, 20], 'ultimate', 'fast'),
+            ('ultimate', [7, 14, 28], 'ultimate', 'medium'),
+            ('ultimate', [10, 20, 40], 'ultimate', 'slow')],
+    'market': [('full_stochastic', [14, 3, 3], 'stoch', 'fast'),
+               ('ultimate', [7, 14, 28], 'ultimate', 'medium'),
+               ('rsi', [14], 'rsi', 'slow')]
+}
+
 
 def cluster_oscs(position: pd.DataFrame, **kwargs):
     """
@@ -49,32 +77,18 @@ def cluster_oscs(position: pd.DataFrame, **kwargs):
     prog_bar = kwargs.get('progress_bar', None)
     view = kwargs.get('view', '')
 
-    cluster_oscs = {}
-
-    clusters = generate_cluster(position, function, p_bar=prog_bar)
-    cluster_oscs['tabular'] = clusters
-    cluster_oscs['length_of_data'] = len(clusters)
-
-    #clusters_filtered = cluster_filtering(clusters, filter_thresh)
-    clusters_wma = exponential_moving_avg(
-        clusters, interval=3, data_type='list')
-    if prog_bar is not None:
-        prog_bar.uptick(increment=0.1)
-
-    dates = cluster_dates(clusters_wma, position)
-    if prog_bar is not None:
-        prog_bar.uptick(increment=0.1)
-
-    signals = clustered_signals(dates)
-    if prog_bar is not None:
-        prog_bar.uptick(increment=0.1)
+    cluster_data, cached = memoize_indicator(
+        'cluster_oscs', position,
+        lambda: cluster_oscs_data(position, function, p_bar=prog_bar),
+        params={'function': function}, ticker=name)
+    if cached and (prog_bar is not None):
+        prog_bar.uptick(increment=0.8)
 
-    cluster_oscs['clustered type'] = function
-    cluster_oscs[function] = dates
-    cluster_oscs['signals'] = signals
+    cluster_oscs = cluster_data['cluster_oscs']
+    clusters = cluster_oscs['tabular']
 
-    cluster_oscs = clustered_metrics(
-        position, cluster_oscs, plot_output=plot_output, name=name, view=view)
+    clustered_metrics_plot(position, cluster_oscs['metrics'],
+                           plot_output=plot_output, name=name, view=view)
 
     name3 = INDEXES.get(name, name)
     name2 = name3 + ' - Clustering: ' + function
@@ -93,13 +107,57 @@ def cluster_oscs(position: pd.DataFrame, **kwargs):
         prog_bar.uptick(increment=0.2)
 
     if wma:
-        cluster_oscs['tabular'] = clusters_wma
+        cluster_oscs['tabular'] = cluster_data['wma']
 
     cluster_oscs['type'] = 'oscillator'
 
     return cluster_oscs
 
 
+def cluster_oscs_data(position: pd.DataFrame, function: str, p_bar=None) -> dict:
+    """Cluster Oscillators Data
+
+    Everything 'cluster_oscs' computes (no plotting), memoized per fund dataset and function
+
+    Arguments:
+        position {pd.DataFrame} -- fund dataset
+        function {str} -- type of oscillator
+
+    Keyword Arguments:
+        p_bar {ProgressBar} -- (default: {None})
+
+    Returns:
+        dict -- clustered osc data object ('cluster_oscs'), smoothed cluster signal ('wma')
+    """
+    cluster_oscs = {}
+
+    clusters = generate_cluster(position, function, p_bar=p_bar)
+    cluster_oscs['tabular'] = clusters
+    cluster_oscs['length_of_data'] = len(clusters)
+
+    #clusters_filtered = cluster_filtering(clusters, filter_thresh)
+    clusters_wma = exponential_moving_avg(
+        clusters, interval=3, data_type='list')
+    if p_bar is not None:
+        p_bar.uptick(increment=0.1)
+
+    dates = cluster_dates(clusters_wma, position)
+    if p_bar is not None:
+        p_bar.uptick(increment=0.1)
+
+    signals = clustered_signals(dates)
+    if p_bar is not None:
+        p_bar.uptick(increment=0.1)
+
+    cluster_oscs['clustered type'] = function
+    cluster_oscs[function] = dates
+    cluster_oscs['signals'] = signals
+
+    cluster_oscs = clustered_metrics(position, cluster_oscs)
+
+    return {"cluster_oscs": cluster_oscs, "wma": clusters_wma}
+
+
 def clustering(updatable: list, evaluator: dict, **kwargs) -> list:
     """Clustering
 
@@ -199,49 +257,38 @@ def generate_cluster(position: pd.DataFrame, function: str, name='', p_bar=None)
         clusters.append(0)
 
     if function == 'full_stochastic':
-        fast = full_stochastic(
-            position, config=[10, 3, 3], plot_output=False, name=name)
-        med = full_stochastic(
-            position, config=[14, 3, 3], plot_output=False, name=name)
-        slow = full_stochastic(
-            position, config=[20, 5, 5], plot_output=False, name=name)
+        fast = cluster_oscillator(position, 'full_stochastic', [10, 3, 3], name=name)
+        med = cluster_oscillator(position, 'full_stochastic', [14, 3, 3], name=name)
+        slow = cluster_oscillator(position, 'full_stochastic', [20, 5, 5], name=name)
 
     elif function == 'ultimate':
-        fast = ultimate_oscillator(
-            position, config=[4, 8, 16], plot_output=False, name=name)
-        med = ultimate_oscillator(
-            position, config=[7, 14, 28], plot_output=False, name=name)
-        slow = ultimate_oscillator(
-            position, config=[10, 20, 40], plot_output=False, name=name)
+        fast = cluster_oscillator(position, 'ultimate', [4, 8, 16], name=name)
+        med = cluster_oscillator(position, 'ultimate', [7, 14, 28], name=name)
+        slow = cluster_oscillator(position, 'ultimate', [10, 20, 40], name=name)
 
     elif function == 'rsi':
-        fast = RSI(position, plot_output=False, period=8, name=name)
-        med = RSI(position, plot_output=False, period=14, name=name)
-        slow = RSI(position, plot_output=False, period=20)
+        fast, med, slow = cluster_rsi(position, [8, 14, 20], name=name)
 
     elif function == 'all':
-        fast_stoch = full_stochastic(
-            position, config=[10, 3, 3], plot_output=False, name=name)
-        med_stoch = full_stochastic(
-            position, config=[14, 3, 3], plot_output=False, name=name)
-        slow_stoch = full_stochastic(
-            position, config=[20, 5, 5], plot_output=False, name=name)
-        fast_ult = ultimate_oscillator(
-            position, config=[5, 10, 20], plot_output=False, name=name)
-        med_ult = ultimate_oscillator(
-            position, config=[7, 14, 28], plot_output=False, name=name)
-        slow_ult = ultimate_oscillator(
-            position, config=[10, 20, 40], plot_output=False, name=name)
-        fast_rsi = RSI(position, plot_output=False, period=8, name=name)
-        med_rsi = RSI(position, plot_output=False, period=14, name=name)
-        slow_rsi = RSI(position, plot_output=False, period=20, name=name)
+        fast_stoch = cluster_oscillator(
+            position, 'full_stochastic', [10, 3, 3], name=name)
+        med_stoch = cluster_oscillator(
+            position, 'full_stochastic', [14, 3, 3], name=name)
+        slow_stoch = cluster_oscillator(
+            position, 'full_stochastic', [20, 5, 5], name=name)
+        fast_ult = cluster_oscillator(
+            position, 'ultimate', [5, 10, 20], name=name)
+        med_ult = cluster_oscillator(
+            position, 'ultimate', [7, 14, 28], name=name)
+        slow_ult = cluster_oscillator(
+            position, 'ultimate', [10, 20, 40], name=name)
+        fast_rsi, med_rsi, slow_rsi = cluster_rsi(
+            position, [8, 14, 20], name=name)
 
     elif function == 'market':
-        fast = full_stochastic(
-            position, config=[14, 3, 3], plot_output=False, name=name)
-        med = ultimate_oscillator(
-            position, config=[7, 14, 28], plot_output=False, name=name)
-        slow = RSI(position, plot_output=False, period=14, name=name)
+        fast = cluster_oscillator(position, 'full_stochastic', [14, 3, 3], name=name)
+        med = cluster_oscillator(position, 'ultimate', [7, 14, 28], name=name)
+        slow = cluster_rsi(position, [14], name=name)[0]
 
     else:
         print(
@@ -283,6 +330,256 @@ def generate_cluster(position: pd.DataFrame, function: str, name='', p_bar=None)
     return clusters
 
 
+def cluster_oscillator(position: pd.DataFrame, function: str, config: list, name='') -> dict:
+    """Cluster Oscillator
+
+    Memoized stochastic / ultimate oscillator (no plotting) used to build clusters
+
+    Arguments:
+        position {pd.DataFrame} -- fund dataset
+        function {str} -- 'full_stochastic' or 'ultimate'
+        config {list} -- oscillator periods
+
+    Keyword Arguments:
+        name {str} -- (default: {''})
+
+    Returns:
+        dict -- oscillator data object
+    """
+    oscillator = full_stochastic
+    if function == 'ultimate':
+        oscillator = ultimate_oscillator
+
+    osc, _ = memoize_indicator(
+        function, position,
+        lambda: oscillator(position, config=config, plot_output=False, name=name),
+        params={'config': list(config)}, ticker=name)
+    return osc
+
+
+def cluster_rsi(position: pd.DataFrame, periods: list, name='') -> list:
+    """Cluster RSI
+
+    Memoized RSIs (no plotting) used to build clusters; periods not cached are computed from one
+    batched 'generate_rsi_signals' call
+
+    Arguments:
+        position {pd.DataFrame} -- fund dataset
+        periods {list} -- RSI periods
+
+    Keyword Arguments:
+        name {str} -- (default: {''})
+
+    Returns:
+        list -- rsi data object per period
+    """
+    rsis = []
+    missing = []
+    for period in periods:
+        key = indicator_key('rsi', position, params={'period': period})
+        found, rsi = INDICATOR_CACHE.get(key)
+        rsis.append(rsi)
+        if not found:
+            missing.append((periods.index(period), period, key))
+
+    if len(missing) > 0:
+        rsi_signals = generate_rsi_signals(
+            position, periods=[period for _, period, _ in missing])
+        for j, (i, period, key) in enumerate(missing):
+            rsis[i] = RSI(position, plot_output=False, period=period,
+                          name=name, rsi_signal=rsi_signals[j].tolist())
+            INDICATOR_CACHE.put(key, rsis[i], function='rsi', ticker=name)
+
+    return rsis
+
+
+def cluster_oscs_panel(panel: dict, **kwargs) -> np.ndarray:
+    """Cluster Oscillators Panel
+
+    Clustered oscillator signals of many funds at once. Oscillators are computed over the whole
+    funds x bars panel; each fund's features are found as in 'cluster_oscs', and the clustering of
+    all funds is done together. Rows match the 'tabular' of 'cluster_oscs' for each fund.
+
+    Arguments:
+        panel {dict} -- funds x bars dataset (see 'fund_panel')
+
+    Optional Args:
+        function {str} -- type of oscillator (default: {'market'})
+                                (others: full_stochastic, ultimate, rsi, all)
+        wma {bool} -- rows are filtered by windowed moving average (default: {True})
+        progress_bar {ProgressBar} -- (default: {None})
+
+    Returns:
+        np.ndarray -- clustered osc signal of each fund (row order of panel['funds'])
+    """
+    function = kwargs.get('function', 'market')
+    wma = kwargs.get('wma', True)
+    p_bar = kwargs.get('progress_bar')
+
+    if function not in CLUSTER_OSCILLATORS:
+        print(
+            f'{WARNING}Warning: Unrecognized function input of {function} in cluster_oscs_panel.{NORMAL}')
+        return None
+
+    funds = panel['funds']
+    frames = [panel_frame(panel, row) for row in range(len(funds))]
+    clusters = np.zeros(panel['Close'].shape, dtype=np.int64)
+    smoothed = [None] * len(funds)
+
+    # Funds already clustered by 'cluster_oscs' (e.g. by another index) are reused
+    missing = []
+    for row, frame in enumerate(frames):
+        key = indicator_key('cluster_oscs', frame, params={'function': function})
+        found, cluster_data = INDICATOR_CACHE.get(key)
+        if found:
+            clusters[row] = cluster_data['cluster_oscs']['tabular']
+            smoothed[row] = cluster_data['wma']
+        else:
+            missing.append(row)
+
+    if len(missing) > 0:
+        sub_panel = {key: panel[key][missing] for key in ('Low', 'High', 'Close')}
+        sub_frames = [frames[row] for row in missing]
+        sub_funds = [funds[row] for row in missing]
+
+        evaluators = []
+        for oscillator, config, _, _ in CLUSTER_OSCILLATORS[function]:
+            evaluators.append(panel_oscillator(
+                sub_panel, sub_frames, sub_funds, oscillator, config))
+        if p_bar is not None:
+            p_bar.uptick(increment=0.5 * len(missing))
+
+        weights = None
+        if function == 'all':
+            weights = [generate_weights(frame) for frame in sub_frames]
+
+        sub_clusters = np.zeros(sub_panel['Close'].shape, dtype=np.int64)
+        for j, (_, _, w_type, w_speed) in enumerate(CLUSTER_OSCILLATORS[function]):
+            weight = None
+            if weights is not None:
+                weight = np.array([weight[w_type][w_speed] for weight in weights])
+            sub_clusters = cluster_spread(sub_clusters, evaluators[j], weight=weight)
+
+        clusters[missing] = sub_clusters
+        if p_bar is not None:
+            p_bar.uptick(increment=0.5 * len(missing))
+
+    if not wma:
+        return clusters
+
+    for row in range(len(funds)):
+        if smoothed[row] is None:
+            smoothed[row] = exponential_moving_avg(
+                clusters[row].tolist(), interval=3, data_type='list')
+    return np.array(smoothed)
+
+
+def panel_oscillator(panel: dict, frames: list, funds: list, oscillator: str, config: list) -> list:
+    """Panel Oscillator
+
+    Memoized oscillators of every fund of a panel ('cluster_oscillator' / 'cluster_rsi' entries);
+    funds not cached share one panel-wide kernel computation
+
+    Arguments:
+        panel {dict} -- 'Low', 'High', 'Close' funds x bars arrays
+        frames {list} -- FundFrame of each fund (row)
+        funds {list} -- fund names
+        oscillator {str} -- 'full_stochastic', 'ultimate' or 'rsi'
+        config {list} -- oscillator periods ([period] for 'rsi')
+
+    Returns:
+        list -- oscillator data object of each fund
+    """
+    params = {'config': list(config)}
+    if oscillator == 'rsi':
+        params = {'period': config[0]}
+
+    oscs = []
+    missing = []
+    for row, frame in enumerate(frames):
+        key = indicator_key(oscillator, frame, params=params)
+        found, osc = INDICATOR_CACHE.get(key)
+        oscs.append(osc)
+        if not found:
+            missing.append((row, key))
+
+    if len(missing) == 0:
+        return oscs
+
+    rows = [row for row, _ in missing]
+    if oscillator == 'full_stochastic':
+        fast_k, smooth_k, slow_d = stoch_kernel(
+            panel['Low'][rows], panel['High'][rows], panel['Close'][rows], config)
+    elif oscillator == 'ultimate':
+        ult_osc = ultimate_kernel(
+            panel['Low'][rows], panel['High'][rows], panel['Close'][rows], config)
+    else:
+        rsi_signal, _ = rsi_from_changes(
+            rsi_changes({'Close': panel['Close'][rows]}), config[0])
+
+    for j, (row, key) in enumerate(missing):
+        if oscillator == 'full_stochastic':
+            signal = {"fast_k": fast_k[j].tolist(), "smooth_k": smooth_k[j].tolist(),
+                      "slow_d": slow_d[j].tolist()}
+            oscs[row] = full_stochastic(frames[row], config=config, plot_output=False,
+                                        name=funds[row], stoch_signal=signal)
+        elif oscillator == 'ultimate':
+            oscs[row] = ultimate_oscillator(frames[row], config=config, plot_output=False,
+                                            name=funds[row], ult_signal=ult_osc[j].tolist())
+        else:
+            oscs[row] = RSI(frames[row], plot_output=False, period=config[0],
+                            name=funds[row], rsi_signal=rsi_signal[j].tolist())
+        INDICATOR_CACHE.put(key, oscs[row], function=oscillator, ticker=funds[row])
+
+    return oscs
+
+
+def cluster_spread(clusters: np.ndarray, evaluators: list, weight: np.ndarray = None) -> np.ndarray:
+    """Cluster Spread
+
+    'clustering' of every fund of a panel at once. Events only update already non-zero
+    neighbors, so each fund's events are applied in order; the n-th event of all funds is applied
+    together.
+
+    Arguments:
+        clusters {np.ndarray} -- funds x bars clusters (updated in place)
+        evaluators {list} -- bullish / bearish data object of each fund (row)
+
+    Keyword Arguments:
+        weight {np.ndarray} -- funds x bars weights (default: {None}, all 1)
+
+    Returns:
+        np.ndarray -- clusters
+    """
+    tot_len = clusters.shape[-1]
+    if weight is None:
+        weight = np.ones(clusters.shape, dtype=np.int64)
+
+    for direction, sign in (('bullish', 1), ('bearish', -1)):
+        events = [[item[2] for item in evaluator[direction]]
+                  for evaluator in evaluators]
+        ranks = max([len(event) for event in events] + [0])
+
+        for rank in range(ranks):
+            rows = np.array([row for row, event in enumerate(events)
+                             if len(event) > rank], dtype=np.int64)
+            index = np.array([events[row][rank] for row in rows], dtype=np.int64)
+            wt = weight[rows, index]
+
+            center = clusters[rows, index]
+            clusters[rows, index] = np.where(
+                center != 0, center + (8 * sign * wt), center + sign)
+
+            for offset, factor in ((1, 5), (2, 3), (3, 2)):
+                near = index < tot_len - offset
+                for neighbor in (index[near] - offset, index[near] + offset):
+                    values = clusters[rows[near], neighbor]
+                    clusters[rows[near], neighbor] = np.where(
+                        values != 0, values + (factor * sign * wt[near]), values)
+
+    return clusters
+
+
 def generate_weights(position, **kwargs) -> dict:
     """Generate Weights
 
@@ -329,25 +626,16 @@ def generate_weights(position, **kwargs) -> dict:
     return weights
 
 
-def clustered_metrics(position: pd.DataFrame, cluster_oscs: dict, **kwargs) -> dict:
+def clustered_metrics(position: pd.DataFrame, cluster_oscs: dict) -> dict:
     """Clustered Metrics
 
     Arguments:
         position {pd.DataFrame} -- dataset
         cluster_oscs {dict} -- clustered osc data object
 
-    Optional Args:
-        plot_output {bool} -- (default: {True})
-        name {str} -- (default: {''})
-        view {str} -- file directory of plots (default: {''})
-
     Returns:
         dict -- clustered osc data object
     """
-    plot_output = kwargs.get('plot_output', True)
-    name = kwargs.get('name', '')
-    view = kwargs.get('view')
-
     ults = cluster_oscs['tabular']
 
     # Take indicator set: weight, filter, normalize
@@ -378,6 +666,25 @@ def clustered_metrics(position: pd.DataFrame, cluster_oscs: dict, **kwargs) -> d
 
     cluster_oscs['metrics'] = metrics
 
+    return cluster_oscs
+
+
+def clustered_metrics_plot(position: pd.DataFrame, metrics: list, **kwargs):
+    """Clustered Metrics Plot
+
+    Arguments:
+        position {pd.DataFrame} -- dataset
+        metrics {list} -- clustered osc metrics (see 'clustered_metrics')
+
+    Optional Args:
+        plot_output {bool} -- (default: {True})
+        name {str} -- (default: {''})
+        view {str} -- file directory of plots (default: {''})
+    """
+    plot_output = kwargs.get('plot_output', True)
+    name = kwargs.get('name', '')
+    view = kwargs.get('view')
+
     name3 = INDEXES.get(name, name)
     name2 = name3 + " - Clustered Oscillator Metrics"
     if plot_output:
@@ -389,8 +696,6 @@ def clustered_metrics(position: pd.DataFrame, cluster_oscs: dict, **kwargs) -> d
         dual_plotting(position['Close'], metrics, 'Price',
                       'Metrics', title=name2, filename=filename, saveFig=True)
 
-    return cluster_oscs
-
 
 def clustered_signals(sig_list: list, **kwargs) -> list:
     """clustered_signals
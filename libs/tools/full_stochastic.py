@@ -4,8 +4,10 @@ import numpy as np
 
 from libs.utils import dual_plotting, date_extractor
 from libs.utils import ProgressBar, INDEXES
+from libs.utils import resume_point, start_state, update_state, splice_signal
 from libs.features import normalize_signals
 from .moving_average import exponential_moving_avg
+from .math_functions import rolling_min, rolling_max, rolling_mean
 
 
 def full_stochastic(position: pd.DataFrame, config: list = [14, 3, 3], **kwargs) -> dict:
@@ -24,6 +26,9 @@ def full_stochastic(position: pd.DataFrame, config: list = [14, 3, 3], **kwargs)
         plot_output {bool} -- (default: {True})
         out_suppress {bool} -- suppresses plotting for clusters (default: {True})
         progress_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
+        stoch_signal {dict} -- precomputed {"fast_k", "smooth_k", "slow_d"} signals of 'config',
+                               e.g. from 'stoch_kernel' (default: {None})
 
     Returns:
         dict -- [description]
@@ -33,12 +38,19 @@ def full_stochastic(position: pd.DataFrame, config: list = [14, 3, 3], **kwargs)
     out_suppress = kwargs.get('out_suppress', True)
     progress_bar = kwargs.get('progress_bar')
     view = kwargs.get('view', '')
+    state = kwargs.get('state')
+    stoch_signal = kwargs.get('stoch_signal')
 
     full_stoch = dict()
 
-    signals = generate_full_stoch_signal(
-        position, periods=config, plot_output=plot_output,
-        out_suppress=out_suppress, p_bar=progress_bar, view=view)
+    if stoch_signal is not None:
+        signals = stoch_signal
+        if progress_bar is not None:
+            progress_bar.uptick(increment=0.3)
+    else:
+        signals = generate_full_stoch_signal(
+            position, periods=config, plot_output=plot_output,
+            out_suppress=out_suppress, p_bar=progress_bar, view=view, state=state)
     full_stoch['tabular'] = signals
 
     full_stoch = get_crossover_features(
@@ -76,6 +88,7 @@ def generate_full_stoch_signal(position: pd.DataFrame, periods=[14, 3, 3], **kwa
         plot_output {bool} -- (default: {True})
         out_suppress {bool} -- (default: {True})
         p_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         dict -- tabular object of signals {"fast_k", "smooth_k", "slow_d"}
@@ -83,44 +96,44 @@ def generate_full_stoch_signal(position: pd.DataFrame, periods=[14, 3, 3], **kwa
     plot_output = kwargs.get('plot_output', True)
     out_suppress = kwargs.get('out_suppress', True)
     p_bar = kwargs.get('p_bar')
+    state = kwargs.get('state')
 
     FAST_K = periods[0]
     SLOW_K = periods[1]
     SLOW_D = periods[2]
 
-    k_instant = []
-    k_smooth = []
-    d_sma = []
-
-    for i in range(FAST_K-1):
-        k_instant.append(50.0)
-        k_smooth.append(50.0)
-        d_sma.append(50.0)
+    new_bars = resume_point(position, state)
+    if new_bars is not None and state['kernel'].get('periods') == list(periods):
+        tot_len = len(position['Close'])
+        new_k, new_smooth, new_d = stoch_resume(
+            list(position['Low'][tot_len-new_bars:]),
+            list(position['High'][tot_len-new_bars:]),
+            list(position['Close'][tot_len-new_bars:]),
+            state['kernel'])
 
-    if p_bar is not None:
-        p_bar.uptick(increment=0.1)
+        prev = state['signals']
+        k_instant = splice_signal(prev['fast_k'], new_k, tot_len)
+        k_smooth = splice_signal(prev['smooth_k'], new_smooth, tot_len)
+        d_sma = splice_signal(prev['slow_d'], new_d, tot_len)
+        update_state(state, position, state['kernel'], fast_k=k_instant,
+                     smooth_k=k_smooth, slow_d=d_sma)
 
-    for i in range(FAST_K-1, len(position['Close'])):
+        if p_bar is not None:
+            p_bar.uptick(increment=0.3)
 
-        # Find first lookback of oscillator
-        lows = position['Low'][i-(FAST_K-1):i+1]
-        highs = position['High'][i-(FAST_K-1):i+1]
-        low = np.min(lows)
-        high = np.max(highs)
+        return {"fast_k": k_instant, "smooth_k": k_smooth, "slow_d": d_sma}
 
-        # For very low cost funds with no movement over range, will be NaN
-        if low != high:
-            K = (position['Close'][i] - low) / (high - low) * 100.0
-        else:
-            K = 50.0
+    tot_len = len(position['Close'])
 
-        k_instant.append(K)
+    if p_bar is not None:
+        p_bar.uptick(increment=0.1)
 
-        # Smooth oscillator with config[1]
-        k_smooth.append(np.average(k_instant[i-(SLOW_K-1):i+1]))
+    k_instant, k_smooth, d_sma = stoch_kernel(
+        position['Low'], position['High'], position['Close'], periods)
 
-        # Find 'Simple Moving Average' (SMA) of k2
-        d_sma.append(np.average(k_smooth[i-(SLOW_D-1):i+1]))
+    k_instant = k_instant.tolist()
+    k_smooth = k_smooth.tolist()
+    d_sma = d_sma.tolist()
 
     if p_bar is not None:
         p_bar.uptick(increment=0.2)
@@ -132,9 +145,141 @@ def generate_full_stoch_signal(position: pd.DataFrame, periods=[14, 3, 3], **kwa
 
     signals = {"fast_k": k_instant, "smooth_k": k_smooth, "slow_d": d_sma}
 
+    kernel = {
+        "periods": list(periods),
+        "count": tot_len,
+        "lows": list(position['Low'][max(tot_len-FAST_K, 0):]),
+        "highs": list(position['High'][max(tot_len-FAST_K, 0):]),
+        "k_instant": k_instant[max(tot_len-SLOW_K, 0):],
+        "k_smooth": k_smooth[max(tot_len-SLOW_D, 0):]
+    }
+    start_state(state, position, kernel, **signals)
+
     return signals
 
 
+def stoch_kernel(low, high, close, periods: list) -> list:
+    """Stochastic Kernel
+
+    Arguments:
+        low {list, np.ndarray} -- lows (a 2-D panel of funds x bars is computed row-wise)
+        high {list, np.ndarray} -- highs
+        close {list, np.ndarray} -- closes
+        periods {list} -- %k, slow %k, slow %d
+
+    Returns:
+        list -- fast %k, slow %k, slow %d (np.ndarrays shaped as 'close')
+    """
+    FAST_K = periods[0]
+    SLOW_K = periods[1]
+    SLOW_D = periods[2]
+
+    close = np.asarray(close, dtype=np.float64)
+    tot_len = close.shape[-1]
+
+    k_instant = np.full(close.shape, 50.0)
+    k_smooth = np.full(close.shape, 50.0)
+    d_sma = np.full(close.shape, 50.0)
+
+    if tot_len >= FAST_K:
+        # Find first lookback of oscillator
+        lows = rolling_min(low, FAST_K)
+        highs = rolling_max(high, FAST_K)
+
+        # For very low cost funds with no movement over range, will be NaN
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k_instant[..., FAST_K-1:] = np.where(
+                lows != highs, (close[..., FAST_K-1:] - lows) / (highs - lows) * 100.0, 50.0)
+
+        # Smooth oscillator with config[1], then 'Simple Moving Average' (SMA) of k2
+        k_smooth = stoch_smoothing(k_instant, k_smooth, FAST_K, SLOW_K)
+        d_sma = stoch_smoothing(k_smooth, d_sma, FAST_K, SLOW_D)
+
+    return k_instant, k_smooth, d_sma
+
+
+def stoch_smoothing(signal: np.ndarray, smoothed: np.ndarray, start: int, interval: int) -> np.ndarray:
+    """Stochastic Smoothing
+
+    Arguments:
+        signal {np.ndarray} -- signal to smooth (2-D panels are smoothed along the last axis)
+        smoothed {np.ndarray} -- output array, pre-filled for bars before 'start'
+        start {int} -- first lookback period (first smoothed bar is start-1)
+        interval {int} -- smoothing window
+
+    Returns:
+        np.ndarray -- smoothed signal
+    """
+    tot_len = signal.shape[-1]
+    first = max(start-1, interval-1)
+    for i in range(start-1, min(first, tot_len)):
+        # Window reaches before the first bar: replicate the (negative) slice of the growing list
+        window = range(i+1)[i-(interval-1):i+1]
+        smoothed[..., i] = np.average(signal[..., window], axis=-1)
+
+    if tot_len > first:
+        smoothed[..., first:] = rolling_mean(
+            signal, interval)[..., first-(interval-1):]
+    return smoothed
+
+
+def stoch_resume(new_lows: list, new_highs: list, new_closes: list, kernel: dict) -> list:
+    """Full Stochastic Resume
+
+    Advances the stochastic lookback windows over newly arrived bars only, continuing from the
+    kernel state filled by 'generate_full_stoch_signal'.
+
+    Arguments:
+        new_lows {list} -- newly arrived lows
+        new_highs {list} -- newly arrived highs
+        new_closes {list} -- newly arrived closes
+        kernel {dict} -- resumable stochastic kernel state (updated in place)
+
+    Returns:
+        list -- fast %k, slow %k, slow %d values of the new bars
+    """
+    FAST_K = kernel['periods'][0]
+    SLOW_K = kernel['periods'][1]
+    SLOW_D = kernel['periods'][2]
+
+    k_instant = []
+    k_smooth = []
+    d_sma = []
+
+    for i, close in enumerate(new_closes):
+        kernel['lows'] = (kernel['lows'] + [new_lows[i]])[-FAST_K:]
+        kernel['highs'] = (kernel['highs'] + [new_highs[i]])[-FAST_K:]
+
+        if kernel['count'] < FAST_K-1:
+            K = 50.0
+            smooth = 50.0
+            d_val = 50.0
+
+        else:
+            low = np.min(kernel['lows'])
+            high = np.max(kernel['highs'])
+            if low != high:
+                K = (close - low) / (high - low) * 100.0
+            else:
+                K = 50.0
+
+            kernel['k_instant'] = (kernel['k_instant'] + [K])[-SLOW_K:]
+            smooth = np.average(kernel['k_instant'])
+            kernel['k_smooth'] = (kernel['k_smooth'] + [smooth])[-SLOW_D:]
+            d_val = np.average(kernel['k_smooth'])
+
+        if kernel['count'] < FAST_K-1:
+            kernel['k_instant'] = (kernel['k_instant'] + [K])[-SLOW_K:]
+            kernel['k_smooth'] = (kernel['k_smooth'] + [smooth])[-SLOW_D:]
+
+        k_instant.append(K)
+        k_smooth.append(smooth)
+        d_sma.append(d_val)
+        kernel['count'] += 1
+
+    return k_instant, k_smooth, d_sma
+
+
 def get_crossover_features(position: pd.DataFrame, full_stoch: dict, **kwargs) -> dict:
     """Get Crossover Features
 
@@ -4,6 +4,7 @@ import numpy as np
 
 from libs.utils import dual_plotting, ProgressBar
 from libs.utils import INDEXES
+from libs.utils import resume_point, start_state, update_state, splice_signal
 from libs.features import normalize_signals
 from .rate_of_change import roc_signal
 from .moving_average import simple_moving_avg, exponential_moving_avg
@@ -22,6 +23,7 @@ def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
         name {str} -- (default: {''})
         views {str} -- (default: {''})
         progress_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         dict -- kst data object
@@ -30,11 +32,12 @@ def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
     name = kwargs.get('name', '')
     views = kwargs.get('views', '')
     p_bar = kwargs.get('progress_bar')
+    state = kwargs.get('state')
 
     kst = dict()
 
     signal, signal_line = kst_signal(
-        fund, plot_output=plot_output, name=name, views=views, p_bar=p_bar)
+        fund, plot_output=plot_output, name=name, views=views, p_bar=p_bar, state=state)
 
     kst['tabular'] = {'signal': signal, 'signal_line': signal_line}
 
@@ -69,6 +72,7 @@ def kst_signal(fund: pd.DataFrame, **kwargs) -> list:
         name {str} -- (default: {''})
         views {str} -- (default: {''})
         p_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         list -- kst signal and its 9d sma signal line
@@ -79,27 +83,59 @@ def kst_signal(fund: pd.DataFrame, **kwargs) -> list:
     name = kwargs.get('name', '')
     views = kwargs.get('views', '')
     p_bar = kwargs.get('p_bar')
-
-    increment = 0.7 / float(len(periods) * 3)
-    signal = [0.0] * len(fund['Close'])
-
-    for i, period in enumerate(periods):
-        roc = roc_signal(fund, period)
+    state = kwargs.get('state')
+
+    new_bars = resume_point(fund, state)
+    if new_bars is not None and state['kernel'].get('periods') == periods and \
+            state['kernel'].get('sma_intervals') == sma_intervals:
+        tot_len = len(fund['Close'])
+        new_signal, new_line = kst_resume(
+            list(fund['Close'][tot_len-new_bars:]), state['kernel'])
+
+        signal = splice_signal(
+            state['signals']['signal'], new_signal, tot_len)
+        signal_line = splice_signal(
+            state['signals']['signal_line'], new_line, tot_len)
+        update_state(state, fund, state['kernel'],
+                     signal=signal, signal_line=signal_line)
         if p_bar:
-            p_bar.uptick(increment=increment)
+            p_bar.uptick(increment=0.8)
 
-        sma = simple_moving_avg(roc, sma_intervals[i], data_type='list')
-        if p_bar:
-            p_bar.uptick(increment=increment)
-
-        for j in range(len(signal)):
-            signal[j] += float(i + 1) * sma[j]
+    else:
+        increment = 0.7 / float(len(periods) * 3)
+        signal = [0.0] * len(fund['Close'])
+        rocs = []
+
+        for i, period in enumerate(periods):
+            roc = roc_signal(fund, period)
+            rocs.append(roc[max(len(roc)-sma_intervals[i], 0):])
+            if p_bar:
+                p_bar.uptick(increment=increment)
+
+            sma = simple_moving_avg(roc, sma_intervals[i], data_type='list')
+            if p_bar:
+                p_bar.uptick(increment=increment)
+
+            for j in range(len(signal)):
+                signal[j] += float(i + 1) * sma[j]
+            if p_bar:
+                p_bar.uptick(increment=increment)
+
+        signal_line = simple_moving_avg(signal, 9, data_type='list')
         if p_bar:
-            p_bar.uptick(increment=increment)
-
-    signal_line = simple_moving_avg(signal, 9, data_type='list')
-    if p_bar:
-        p_bar.uptick(increment=0.1)
+            p_bar.uptick(increment=0.1)
+
+        tot_len = len(fund['Close'])
+        kernel = {
+            "periods": periods,
+            "sma_intervals": sma_intervals,
+            "count": tot_len,
+            "closes": list(fund['Close'][max(tot_len-max(periods), 0):]),
+            "rocs": rocs,
+            "signal": signal[max(tot_len-9, 0):]
+        }
+        start_state(state, fund, kernel, signal=signal,
+                    signal_line=signal_line)
 
     name2 = INDEXES.get(name, name)
     title = f"{name2} - Know Sure Thing"
@@ -115,6 +151,54 @@ def kst_signal(fund: pd.DataFrame, **kwargs) -> list:
     return signal, signal_line
 
 
+def kst_resume(new_closes: list, kernel: dict) -> list:
+    """Know Sure Thing - Resume
+
+    Advances the ROC, SMA, and signal line windows over newly arrived bars only, continuing from
+    the kernel state filled by 'kst_signal'.
+
+    Arguments:
+        new_closes {list} -- newly arrived closes
+        kernel {dict} -- resumable kst kernel state (updated in place)
+
+    Returns:
+        list -- kst signal and signal line values of the new bars
+    """
+    periods = kernel['periods']
+    sma_intervals = kernel['sma_intervals']
+    lookback = max(periods)
+
+    signal = []
+    signal_line = []
+    for close in new_closes:
+        count = kernel['count']
+        sig = 0.0
+
+        for i, period in enumerate(periods):
+            roc = 0.0
+            if count >= period:
+                roc = ((close / kernel['closes'][-period]) - 1.0) * 100.0
+
+            kernel['rocs'][i] = (kernel['rocs'][i] + [roc])[-sma_intervals[i]:]
+            sma = roc
+            if count >= sma_intervals[i] - 1:
+                sma = np.mean(kernel['rocs'][i])
+            sig += float(i + 1) * sma
+
+        kernel['closes'] = (kernel['closes'] + [close])[-lookback:]
+        kernel['signal'] = (kernel['signal'] + [sig])[-9:]
+
+        line = sig
+        if count >= 8:
+            line = np.mean(kernel['signal'])
+
+        signal.append(sig)
+        signal_line.append(line)
+        kernel['count'] += 1
+
+    return signal, signal_line
+
+
 def kst_indicators(fund: pd.DataFrame, kst_dict: dict, **kwargs) -> dict:
     """KST Indicators
 
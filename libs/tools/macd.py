@@ -6,8 +6,9 @@ from libs.utils import generic_plotting, bar_chart, dual_plotting, dates_extract
 from libs.features import normalize_signals
 from libs.utils import ProgressBar, INDEXES
 from libs.utils import TREND_COLORS, STANDARD_COLORS
+from libs.utils import resume_point, start_state, update_state, splice_signal
 
-from .moving_average import exponential_moving_avg
+from .moving_average import exponential_moving_avg, ema_resume
 
 
 RED = TREND_COLORS.get('bad')
@@ -29,6 +30,7 @@ def mov_avg_convergence_divergence(fund: pd.DataFrame, **kwargs) -> dict:
         plot_output {bool} -- True to render plot in realtime (default: {True})
         progress_bar {ProgressBar} -- (default: {None})
         view {str} -- directory of plots (default: {''})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         dict -- contains all macd information in regarding macd
@@ -37,9 +39,10 @@ def mov_avg_convergence_divergence(fund: pd.DataFrame, **kwargs) -> dict:
     plot_output = kwargs.get('plot_output', True)
     progress_bar = kwargs.get('progress_bar', None)
     view = kwargs.get('view', '')
+    state = kwargs.get('state')
 
     macd = generate_macd_signal(
-        fund, plot_output=plot_output, name=name, view=view)
+        fund, plot_output=plot_output, name=name, view=view, state=state)
     if progress_bar is not None:
         progress_bar.uptick(increment=0.3)
 
@@ -86,6 +89,7 @@ def generate_macd_signal(fund: pd.DataFrame, **kwargs) -> dict:
         plotting {bool} -- (default: {True})
         name {str} -- (default: {''})
         view {str} -- directory of plots (default: {''})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         dict -- macd data object
@@ -93,20 +97,38 @@ def generate_macd_signal(fund: pd.DataFrame, **kwargs) -> dict:
     plotting = kwargs.get('plot_output', True)
     name = kwargs.get('name', '')
     view = kwargs.get('view')
+    state = kwargs.get('state')
 
     macd = dict()
 
-    emaTw = exponential_moving_avg(fund, interval=12)
-    emaTs = exponential_moving_avg(fund, interval=26)
-    macd_val = []
+    new_bars = resume_point(fund, state)
+    if new_bars is not None:
+        tot_len = len(fund['Close'])
+        new_macd, new_sig = macd_resume(
+            list(fund['Close'][tot_len-new_bars:]), state['kernel'])
+        macd_val = splice_signal(state['signals']['macd'], new_macd, tot_len)
+        macd_sig = splice_signal(
+            state['signals']['signal_line'], new_sig, tot_len)
+        update_state(state, fund, state['kernel'],
+                     macd=macd_val, signal_line=macd_sig)
 
-    for i in range(len(emaTw)):
-        if i < 26:
-            macd_val.append(0.0)
-        else:
-            macd_val.append(emaTw[i] - emaTs[i])
+    else:
+        kernel = {"ema12": {}, "ema26": {}, "signal": {}}
+        emaTw = exponential_moving_avg(
+            fund, interval=12, state=kernel['ema12'])
+        emaTs = exponential_moving_avg(
+            fund, interval=26, state=kernel['ema26'])
+        macd_val = []
+
+        for i in range(len(emaTw)):
+            if i < 26:
+                macd_val.append(0.0)
+            else:
+                macd_val.append(emaTw[i] - emaTs[i])
 
-    macd_sig = exponential_moving_avg(macd_val, interval=9, data_type='list')
+        macd_sig = exponential_moving_avg(
+            macd_val, interval=9, data_type='list', state=kernel['signal'])
+        start_state(state, fund, kernel, macd=macd_val, signal_line=macd_sig)
 
     # Actual MACD vs. its signal line
     m_bar = []
@@ -129,6 +151,34 @@ def generate_macd_signal(fund: pd.DataFrame, **kwargs) -> dict:
     return macd
 
 
+def macd_resume(new_closes: list, kernel: dict) -> list:
+    """MACD Resume
+
+    Advances the 12d, 26d, and signal line EMAs over newly arrived bars only, continuing from the
+    kernel state filled by 'generate_macd_signal'.
+
+    Arguments:
+        new_closes {list} -- newly arrived closes
+        kernel {dict} -- resumable macd kernel state (updated in place)
+
+    Returns:
+        list -- macd and signal line values of the new bars
+    """
+    emaTw = ema_resume(new_closes, kernel['ema12'])
+    emaTs = ema_resume(new_closes, kernel['ema26'])
+
+    macd_val = []
+    for i in range(len(new_closes)):
+        # Bar position in the full series is the 26d EMA count before the new bars
+        if kernel['ema26']['count'] - len(new_closes) + i < 26:
+            macd_val.append(0.0)
+        else:
+            macd_val.append(emaTw[i] - emaTs[i])
+
+    macd_sig = ema_resume(macd_val, kernel['signal'])
+    return macd_val, macd_sig
+
+
 def macd_metrics(position: pd.DataFrame, macd: dict, **kwargs) -> dict:
     """MACD Metrics
 
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.stats import linregress
 
 
@@ -183,6 +184,90 @@ def beta_comparison_list(fund: list, benchmark: list) -> list:
     return beta_figures[0], rsqd
 
 
+def rolling_beta_rsq(panel, benchmark, windows: list) -> list:
+    """Rolling Beta R-Squared
+
+    Batched rolling version of 'beta_comparison_list': beta and r-squared of every fund in 'panel'
+    vs. 'benchmark' for each window of prices[i-window:i], from cumulative sums of the returns
+    (one matrix operation per window length).
+
+    Arguments:
+        panel {pd.DataFrame, np.ndarray} -- prices, one column per fund (T x S)
+        benchmark {list, pd.Series, np.ndarray} -- prices of the benchmark, such as S&P500 (T)
+        windows {list} -- window lengths (in prices)
+
+    Returns:
+        list -- beta {dict}, r-squared {dict}; keyed by window, each a (T x S) np.ndarray where
+                row i covers prices[i-window:i] (rows i < window are 0.0)
+    """
+    prices = np.array(panel, dtype=np.float64)
+    if prices.ndim == 1:
+        prices = prices.reshape(-1, 1)
+    bench = np.array(benchmark, dtype=np.float64)
+    tot_len, num_funds = prices.shape
+
+    # Percent returns; as in 'beta_comparison_list', each window also holds a (0.0, 0.0) point
+    fund_return = np.zeros((tot_len, num_funds))
+    bench_return = np.zeros(tot_len)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fund_return[1:] = (prices[1:] - prices[:-1]) / prices[:-1] * 100.0
+        bench_return[1:] = (bench[1:] - bench[:-1]) / bench[:-1] * 100.0
+
+    def cumulative(values):
+        return np.concatenate((np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)))
+
+    cum_x = cumulative(bench_return)[:, np.newaxis]
+    cum_xx = cumulative(bench_return * bench_return)[:, np.newaxis]
+    cum_y = cumulative(fund_return)
+    cum_yy = cumulative(fund_return * fund_return)
+    cum_xy = cumulative(fund_return * bench_return[:, np.newaxis])
+
+    finite = np.all(np.isfinite(fund_return), axis=0) & np.all(
+        np.isfinite(bench_return))
+
+    betas = {}
+    rsqds = {}
+    for window in windows:
+        beta = np.zeros((tot_len, num_funds))
+        rsqd = np.zeros((tot_len, num_funds))
+        if window < 2 or tot_len <= window:
+            betas[window] = beta
+            rsqds[window] = rsqd
+            continue
+
+        # Returns of window prices[i-window:i] are returns[i-window+1:i]
+        end = np.arange(window, tot_len)
+        start = end - window + 1
+        n = float(window)
+        sum_x = cum_x[end] - cum_x[start]
+        sum_xx = cum_xx[end] - cum_xx[start]
+        sum_y = cum_y[end] - cum_y[start]
+        sum_yy = cum_yy[end] - cum_yy[start]
+        sum_xy = cum_xy[end] - cum_xy[start]
+
+        ss_xy = n * sum_xy - sum_x * sum_y
+        ss_xx = np.maximum(n * sum_xx - sum_x * sum_x, 0.0)
+        ss_yy = np.maximum(n * sum_yy - sum_y * sum_y, 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            beta[window:] = ss_xy / ss_xx
+            r_den = np.sqrt(ss_xx * ss_yy)
+            r_value = np.clip(np.where(r_den == 0.0, 0.0,
+                                       ss_xy / r_den), -1.0, 1.0)
+        rsqd[window:] = r_value ** 2
+
+        # Funds with missing data are regressed window by window
+        for j in np.where(~finite)[0]:
+            for i in range(window, tot_len):
+                beta[i][j], rsqd[i][j] = beta_comparison_list(
+                    prices[i-window:i, j], bench[i-window:i])
+
+        betas[window] = beta
+        rsqds[window] = rsqd
+
+    return betas, rsqds
+
+
 def risk_comparison(fund: pd.DataFrame,
                     benchmark: pd.DataFrame,
                     treasury: pd.DataFrame,
@@ -348,3 +433,77 @@ def get_returns(data: pd.DataFrame, output='annual') -> list:
         returns /= 4.0
 
     return returns, stdevs
+
+
+def rolling_min(values, window: int) -> np.ndarray:
+    """Rolling Min
+
+    Arguments:
+        values {list, np.ndarray} -- data (2-D arrays are windowed along the last axis)
+        window {int} -- lookback window (inclusive of the current point)
+
+    Returns:
+        np.ndarray -- min of values[i-(window-1):i+1] for each i >= window-1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.zeros(values.shape[:-1] + (0,), dtype=np.float64)
+    return sliding_window_view(values, window, axis=-1).min(axis=-1)
+
+
+def rolling_max(values, window: int) -> np.ndarray:
+    """Rolling Max
+
+    Arguments:
+        values {list, np.ndarray} -- data (2-D arrays are windowed along the last axis)
+        window {int} -- lookback window (inclusive of the current point)
+
+    Returns:
+        np.ndarray -- max of values[i-(window-1):i+1] for each i >= window-1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.zeros(values.shape[:-1] + (0,), dtype=np.float64)
+    return sliding_window_view(values, window, axis=-1).max(axis=-1)
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """Rolling Mean
+
+    Each row is reduced with numpy's own summation, so results match 'np.mean' of every slice.
+
+    Arguments:
+        values {list, np.ndarray} -- data (2-D arrays are windowed along the last axis)
+        window {int} -- lookback window (inclusive of the current point)
+
+    Returns:
+        np.ndarray -- mean of values[i-(window-1):i+1] for each i >= window-1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.zeros(values.shape[:-1] + (0,), dtype=np.float64)
+    return np.mean(sliding_window_view(values, window, axis=-1), axis=-1)
+
+
+def rolling_sum(values, window: int) -> np.ndarray:
+    """Rolling Sum
+
+    Windows are summed left to right (as the builtin 'sum' does), one window position at a time
+    across all windows, so results match summing every slice in python.
+
+    Arguments:
+        values {list, np.ndarray} -- data (2-D arrays are windowed along the last axis)
+        window {int} -- lookback window (inclusive of the current point)
+
+    Returns:
+        np.ndarray -- sum of values[i-(window-1):i+1] for each i >= window-1
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[-1] < window:
+        return np.zeros(values.shape[:-1] + (0,), dtype=np.float64)
+
+    windows = sliding_window_view(values, window, axis=-1)
+    summed = np.zeros(windows.shape[:-1], dtype=np.float64)
+    for j in range(window):
+        summed = summed + windows[..., j]
+    return summed
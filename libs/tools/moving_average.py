@@ -2,42 +2,87 @@ import os
 import math
 import pandas as pd
 import numpy as np
+from scipy.signal import lfilter
 
 from libs.utils import generic_plotting, specialty_plotting
 from libs.utils import candlestick_plot
 from libs.utils import INDEXES
+from libs.utils import resume_point, start_state, update_state, splice_signal
 
 
 def exponential_moving_avg(dataset, interval: int, **kwargs) -> list:
     """Exponential Moving Average
 
     Arguments:
-        dataset -- tabular data, either list or pd.DataFrame
+        dataset -- tabular data, either list, np.ndarray, or pd.DataFrame
         interval {int} -- window to exponential moving average
 
     Optional Args:
-        data_type {str} -- either 'DataFrame' or 'list' (default: {'DataFrame'})
+        data_type {str} -- either 'DataFrame', 'list', or 'ndarray' (default: {'DataFrame'})
         key {str} -- column key (if type 'DataFrame'); (default: {'Close'})
+        state {dict} -- if provided, filled with a resumable state (see 'ema_resume')
+                        (default: {None})
 
     Returns:
-        list -- filtered data
+        list -- filtered data (np.ndarray if given an np.ndarray or data_type 'ndarray')
     """
     data_type = kwargs.get('data_type', 'DataFrame')
     key = kwargs.get('key', 'Close')
+    state = kwargs.get('state')
 
-    if data_type == 'DataFrame':
-        data = list(dataset[key])
-    else:
-        data = dataset
+    data, as_array = moving_avg_input(dataset, data_type, key)
 
-    ema = []
+    # First (interval-1) points pass through, seeded by the mean of the first window, then
+    # the recursive filter ema[i] = k * data[i] + (1 - k) * ema[i-1]
+    ema = data.copy()
     k = 2.0 / (float(interval) + 1.0)
-    for i in range(interval-1):
-        ema.append(data[i])
-    for i in range(interval-1, len(data)):
-        ema.append(np.mean(data[i-(interval-1):i+1]))
-        if i != interval-1:
-            ema[i] = ema[i-1] * (1.0 - k) + data[i] * k
+    if len(data) >= interval:
+        seed = np.mean(data[0:interval])
+        ema[interval-1] = seed
+        ema[interval:], _ = lfilter([k], [1.0, -(1.0 - k)], data[interval:],
+                                    zi=[(1.0 - k) * seed])
+
+    if state is not None:
+        state['interval'] = interval
+        state['count'] = len(data)
+        state['seed'] = data[0:interval].tolist()
+        state['last'] = float(ema[-1]) if len(ema) > 0 else 0.0
+
+    return moving_avg_output(ema, as_array)
+
+
+def ema_resume(new_data: list, state: dict) -> list:
+    """Exponential Moving Average Resume
+
+    Advances an exponential moving average by 'new_data' only, continuing from a state filled by
+    'exponential_moving_avg' (or a previous resume). Values are identical to a full recompute of
+    the concatenated series.
+
+    Arguments:
+        new_data {list} -- newly arrived data points
+        state {dict} -- resumable ema state (updated in place)
+
+    Returns:
+        list -- ema values of the new data points
+    """
+    interval = state['interval']
+    k = 2.0 / (float(interval) + 1.0)
+
+    ema = []
+    for value in new_data:
+        i = state['count']
+        if i < interval:
+            state['seed'].append(value)
+
+        if i < interval-1:
+            state['last'] = value
+        elif i == interval-1:
+            state['last'] = np.mean(state['seed'])
+        else:
+            state['last'] = state['last'] * (1.0 - k) + value * k
+
+        ema.append(state['last'])
+        state['count'] += 1
 
     return ema
 
@@ -46,131 +91,128 @@ def windowed_moving_avg(dataset, interval: int, **kwargs) -> list:
     """Windowed Moving Average
 
     Arguments:
-        dataset -- tabular data, either list or pd.DataFrame
+        dataset -- tabular data, either list, np.ndarray, or pd.DataFrame
         interval {int} -- window to windowed moving average
 
     Optional Args:
-        data_type {str} -- either 'DataFrame' or 'list' (default: {'DataFrame'})
+        data_type {str} -- either 'DataFrame', 'list', or 'ndarray' (default: {'DataFrame'})
         key {str} -- column key (if type 'DataFrame'); (default: {'Close'})
         filter_type {str} -- either 'simple' or 'exponential' (default: {'simple'})
         weight_strength {float} -- numerator for ema weight (default: {2.0})
 
     Returns:
-        list -- filtered data
+        list -- filtered data (np.ndarray if given an np.ndarray or data_type 'ndarray')
     """
     data_type = kwargs.get('data_type', 'DataFrame')
     key = kwargs.get('key', 'Close')
     filter_type = kwargs.get('filter_type', 'simple')
     weight_strength = kwargs.get('weight_strength', 2.0)
 
-    if data_type == 'DataFrame':
-        data = list(dataset[key])
-    else:
-        data = dataset
+    data, as_array = moving_avg_input(dataset, data_type, key)
+
+    wma = data.copy()
+    left = int(np.floor(float(interval) / 2))
+    if left == 0 or len(data) <= 2 * left:
+        return moving_avg_output(wma, as_array)
 
-    wma = []
+    # Centered window [i-left, i+left) for left <= i < len-left; edges pass through
+    cumsum = np.concatenate(([0.0], np.cumsum(data)))
+    window_sums = cumsum[2*left:len(data)] - cumsum[0:len(data)-2*left]
+    centers = data[left:len(data)-left]
 
     if filter_type == 'simple':
-        left = int(np.floor(float(interval) / 2))
-        if left == 0:
-            return data
-        for i in range(left):
-            wma.append(data[i])
-        for i in range(left, len(data)-left):
-            wma.append(np.mean(data[i-(left):i+(left)]))
-        for i in range(len(data)-left, len(data)):
-            wma.append(data[i])
+        wma[left:len(data)-left] = window_sums / float(2 * left)
 
     elif filter_type == 'exponential':
-        left = int(np.floor(float(interval) / 2))
         weight = weight_strength / (float(interval) + 1.0)
         if weight > 1.0:
             weight = 1.0
-        for i in range(left):
-            wma.append(data[i])
-        for i in range(left, len(data)-left):
-            sum_len = len(data[i-(left):i+(left)]) - 1
-            sum_vals = np.sum(data[i-(left):i+(left)])
-            sum_vals -= data[i]
-            sum_vals = sum_vals / float(sum_len)
-            sum_vals = data[i] * weight + sum_vals * (1.0 - weight)
-            wma.append(sum_vals)
-        for i in range(len(data)-left, len(data)):
-            wma.append(data[i])
+        neighbors = (window_sums - centers) / float(2 * left - 1)
+        wma[left:len(data)-left] = centers * weight + neighbors * (1.0 - weight)
 
-    return wma
+    return moving_avg_output(wma, as_array)
 
 
 def simple_moving_avg(dataset, interval: int, **kwargs) -> list:
     """Simple Moving Average
 
     Arguments:
-        dataset -- tabular data, either list or pd.DataFrame
+        dataset -- tabular data, either list, np.ndarray, or pd.DataFrame
         interval {int} -- window to windowed moving average
 
     Optional Args:
-        data_type {str} -- either 'DataFrame' or 'list' (default: {'DataFrame'})
+        data_type {str} -- either 'DataFrame', 'list', or 'ndarray' (default: {'DataFrame'})
         key {str} -- column key (if type 'DataFrame'); (default: {'Close'})
 
     Returns:
-        list -- filtered data
+        list -- filtered data (np.ndarray if given an np.ndarray or data_type 'ndarray')
     """
     data_type = kwargs.get('data_type', 'DataFrame')
     key = kwargs.get('key', 'Close')
 
-    if data_type == 'DataFrame':
-        data = list(dataset[key])
-    else:
-        data = dataset
+    data, as_array = moving_avg_input(dataset, data_type, key)
 
-    ma = []
-    for i in range(interval-1):
-        ma.append(data[i])
-    for i in range(interval-1, len(data)):
-        av = np.mean(data[i-(interval-1):i+1])
-        ma.append(av)
+    # First (interval-1) points pass through
+    ma = data.copy()
+    if len(data) >= interval:
+        cumsum = np.concatenate(([0.0], np.cumsum(data)))
+        ma[interval-1:] = (cumsum[interval:] -
+                           cumsum[0:len(data)-interval+1]) / float(interval)
 
-    return ma
+    return moving_avg_output(ma, as_array)
 
 
 def weighted_moving_avg(dataset, interval: int, **kwargs) -> list:
     """Weighted Moving Average
 
     Arguments:
-        dataset -- tabular data, either list or pd.DataFrame
+        dataset -- tabular data, either list, np.ndarray, or pd.DataFrame
         interval {int} -- window to windowed moving average
 
     Optional Args:
-        data_type {str} -- either 'DataFrame' or 'list' (default: {'DataFrame'})
+        data_type {str} -- either 'DataFrame', 'list', or 'ndarray' (default: {'DataFrame'})
         key {str} -- column key (if type 'DataFrame'); (default: {'Close'})
 
     Returns:
-        list -- filtered data
+        list -- filtered data (np.ndarray if given an np.ndarray or data_type 'ndarray')
     """
     data_type = kwargs.get('data_type', 'DataFrame')
     key = kwargs.get('key', 'Close')
 
-    if data_type == 'DataFrame':
-        data = list(dataset[key])
-    else:
-        data = dataset
+    data, as_array = moving_avg_input(dataset, data_type, key)
+
+    # First 'interval' points pass through; newest point of each window weighted heaviest
+    wma = data.copy()
+    if len(data) > interval:
+        divisor = float(interval * (interval + 1) / 2)
+        weights = np.arange(interval, 0, -1, dtype=np.float64)
+        wma[interval:] = np.convolve(data, weights, mode='valid')[1:] / divisor
 
-    wma = []
-    for i in range(interval):
-        wma.append(data[i])
+    return moving_avg_output(wma, as_array)
 
-    divisor = 0
-    for i in range(interval):
-        divisor += i+1
 
-    for i in range(interval, len(data)):
-        av = 0.0
-        for j in range(interval):
-            av += float(j+1) * data[i - (interval-1-j)]
-        av = av / float(divisor)
-        wma.append(av)
+def moving_avg_input(dataset, data_type: str, key: str) -> list:
+    """Moving Average Input
+
+    Arguments:
+        dataset -- tabular data, either list, np.ndarray, or pd.DataFrame
+        data_type {str} -- either 'DataFrame', 'list', or 'ndarray'
+        key {str} -- column key (if type 'DataFrame')
+
+    Returns:
+        list -- float64 np.ndarray of the data, True if the output should stay an np.ndarray
+    """
+    as_array = isinstance(dataset, np.ndarray) or (data_type == 'ndarray')
+    if data_type == 'DataFrame':
+        dataset = dataset[key]
+    return np.array(dataset, dtype=np.float64), as_array
+
 
-    return wma
+def moving_avg_output(values: np.ndarray, as_array: bool) -> list:
+    """ List compatibility shim: callers passing lists / DataFrames receive lists """
+    if as_array:
+        return values
+    return values.tolist()
 
 
 def typical_price_signal(data: pd.DataFrame) -> list:
@@ -309,6 +351,7 @@ def triple_exp_mov_average(fund: pd.DataFrame, config=[9, 20, 50], **kwargs) ->
         name {str} -- (default: {str})
         view {str} -- file directory of plots (default: {''})
         p_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Keyword Arguments:
         config {list} -- look back period (default: {[9, 13, 50]})
@@ -321,20 +364,45 @@ def triple_exp_mov_average(fund: pd.DataFrame, config=[9, 20, 50], **kwargs) ->
     view = kwargs.get('view', '')
     p_bar = kwargs.get('progress_bar')
     out_suppress = kwargs.get('out_suppress', False)
+    state = kwargs.get('state')
 
     tema = dict()
 
-    tshort = exponential_moving_avg(fund, config[0])
-    if p_bar is not None:
-        p_bar.uptick(increment=0.2)
-
-    tmed = exponential_moving_avg(fund, config[1])
-    if p_bar is not None:
-        p_bar.uptick(increment=0.2)
+    new_bars = resume_point(fund, state)
+    if new_bars is not None:
+        kernels = state['kernel']
+        new_data = list(fund['Close'][len(fund['Close'])-new_bars:])
+        prev = state['signals']
+        tshort = splice_signal(prev['short'], ema_resume(
+            new_data, kernels['short']), len(fund['Close']))
+        tmed = splice_signal(prev['medium'], ema_resume(
+            new_data, kernels['medium']), len(fund['Close']))
+        tlong = splice_signal(prev['long'], ema_resume(
+            new_data, kernels['long']), len(fund['Close']))
+        update_state(state, fund, kernels, short=tshort,
+                     medium=tmed, long=tlong)
+        if p_bar is not None:
+            p_bar.uptick(increment=0.6)
 
-    tlong = exponential_moving_avg(fund, config[2])
-    if p_bar is not None:
-        p_bar.uptick(increment=0.2)
+    else:
+        kernels = {'short': {}, 'medium': {}, 'long': {}}
+        tshort = exponential_moving_avg(
+            fund, config[0], state=kernels['short'])
+        if p_bar is not None:
+            p_bar.uptick(increment=0.2)
+
+        tmed = exponential_moving_avg(
+            fund, config[1], state=kernels['medium'])
+        if p_bar is not None:
+            p_bar.uptick(increment=0.2)
+
+        tlong = exponential_moving_avg(
+            fund, config[2], state=kernels['long'])
+        if p_bar is not None:
+            p_bar.uptick(increment=0.2)
+
+        start_state(state, fund, kernels, short=tshort,
+                    medium=tmed, long=tlong)
 
     tema['tabular'] = {'short': tshort, 'medium': tmed, 'long': tlong}
     tema['short'] = {"period": config[0]}
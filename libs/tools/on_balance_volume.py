@@ -6,6 +6,7 @@ import numpy as np
 from .moving_average import simple_moving_avg, exponential_moving_avg
 from libs.utils import generic_plotting, dual_plotting, bar_chart
 from libs.utils import dates_extractor_list, ProgressBar, INDEXES
+from libs.utils import resume_point, start_state, update_state, splice_signal
 from .trends import get_trendlines, get_trendlines_regression
 
 
@@ -26,6 +27,7 @@ def on_balance_volume(fund: pd.DataFrame, **kwargs) -> dict:
         progress_bar {ProgressBar} -- (default: {None})
         view {str} -- (default: {''})
         trendlines {bool} -- run trendline algorithm (default: {False})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         obv_dict {dict} -- contains all obv information
@@ -36,6 +38,7 @@ def on_balance_volume(fund: pd.DataFrame, **kwargs) -> dict:
     progress_bar = kwargs.get('progress_bar', None)
     view = kwargs.get('view', '')
     trendlines = kwargs.get('trendlines', False)
+    state = kwargs.get('state')
 
     obv_dict = generate_obv_content(
         fund,
@@ -43,7 +46,8 @@ def on_balance_volume(fund: pd.DataFrame, **kwargs) -> dict:
         filter_factor=filter_factor,
         name=name,
         progress_bar=progress_bar,
-        view=view)
+        view=view,
+        state=state)
 
     dates = [index.strftime('%Y-%m-%d') for index in fund.index]
     obv_dict['dates'] = dates
@@ -106,6 +110,7 @@ def generate_obv_content(fund: pd.DataFrame, **kwargs) -> dict:
         name {str} -- (default: {''})
         progress_bar {ProgressBar} -- (default: {None})
         view {'str'} -- period (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         dict -- obv data object
@@ -116,10 +121,11 @@ def generate_obv_content(fund: pd.DataFrame, **kwargs) -> dict:
     name = kwargs.get('name', '')
     progress_bar = kwargs.get('progress_bar')
     view = kwargs.get('view')
+    state = kwargs.get('state')
 
     obv_dict = dict()
 
-    obv = generate_obv_signal(fund)
+    obv = generate_obv_signal(fund, state=state)
     obv_dict['obv'] = obv
 
     if progress_bar is not None:
@@ -179,15 +185,30 @@ def generate_obv_content(fund: pd.DataFrame, **kwargs) -> dict:
     return obv_dict
 
 
-def generate_obv_signal(fund: pd.DataFrame) -> list:
+def generate_obv_signal(fund: pd.DataFrame, state: dict = None) -> list:
     """Generate On Balance Value Signal
 
     Arguments:
         fund {pd.DataFrame} -- fund dataset
 
+    Keyword Arguments:
+        state {dict} -- resumable run state, advanced in place (default: {None})
+
     Returns:
         list -- on balance volume signal for period of fund
     """
+    new_bars = resume_point(fund, state)
+    if new_bars is not None:
+        tot_len = len(fund['Close'])
+        new_obv = obv_resume(list(fund['Close'][tot_len-new_bars:]),
+                             list(fund['Volume'][tot_len-new_bars:]),
+                             state['kernel'])
+
+        # Resumed values are cumulative from the first run; rebase to this window's first bar
+        anchored = splice_signal(state['signals']['obv'], new_obv, tot_len)
+        update_state(state, fund, state['kernel'], obv=anchored)
+        return [val - anchored[0] for val in anchored]
+
     obv = []
     obv.append(0.0)
     for i in range(1, len(fund['Close'])):
@@ -198,6 +219,33 @@ def generate_obv_signal(fund: pd.DataFrame) -> list:
         else:
             obv.append(obv[i-1] - fund['Volume'][i])
 
+    kernel = {"prev_close": fund['Close'][-1], "obv": obv[-1]}
+    start_state(state, fund, kernel, obv=obv)
+
+    return obv
+
+
+def obv_resume(new_closes: list, new_volumes: list, kernel: dict) -> list:
+    """On Balance Volume Resume
+
+    Arguments:
+        new_closes {list} -- newly arrived closing prices
+        new_volumes {list} -- newly arrived volumes
+        kernel {dict} -- resumable obv kernel state (updated in place)
+
+    Returns:
+        list -- cumulative on balance volume of the new bars
+    """
+    obv = []
+    for i, close in enumerate(new_closes):
+        if close > kernel['prev_close']:
+            kernel['obv'] += new_volumes[i]
+        elif close < kernel['prev_close']:
+            kernel['obv'] -= new_volumes[i]
+
+        kernel['prev_close'] = close
+        obv.append(kernel['obv'])
+
     return obv
 
 
@@ -48,22 +48,17 @@ def find_resistance_support_lines(data: pd.DataFrame, **kwargs) -> dict:
 
     increment = 0.5 / (float(len(timeframes)))
 
+    points = find_points_batch(data, timeframes, filter_type='windowed')
+
     support = {}
     resistance = {}
     for time in timeframes:
-        support[str(time)] = {}
-        x, y = find_points(data, line_type='support',
-                           timeframe=time, filter_type='windowed')
-        support[str(time)]['x'] = x
-        support[str(time)]['y'] = y
+        support[str(time)] = points['support'][str(time)]
         sorted_support = sort_and_group(support)
         resist_support_lines['support'][str(
             time)] = cluster_notables(sorted_support, data)
 
-        resistance[str(time)] = {}
-        x2, y2 = find_points(data, line_type='resistance', timeframe=time)
-        resistance[str(time)]['x'] = x2
-        resistance[str(time)]['y'] = y2
+        resistance[str(time)] = points['resistance'][str(time)]
         sorted_resistance = sort_and_group(resistance)
         resist_support_lines['resistance'][str(
             time)] = cluster_notables(sorted_resistance, data)
@@ -129,8 +124,10 @@ def truncate_points(X: list, Y: list) -> list:
     """
     new_X = []
     new_Y = []
+    seen = set()
     for i, x in enumerate(X):
-        if x not in new_X:
+        if x not in seen:
+            seen.add(x)
             new_X.append(x)
             new_Y.append(Y[i])
     return new_X, new_Y
@@ -153,56 +150,100 @@ def find_points(data: pd.DataFrame, timeframe: int, **kwargs) -> list:
     line_type = kwargs.get('line_type', 'support')
     filter_type = kwargs.get('filter_type', 'windowed')
 
-    total_entries = len(data['Close'])
-    if pd.isna(data['Close'][total_entries-1]):
-        total_entries -= 1
+    close = close_for_points(data)
+    return window_points(close, timeframe, line_type, filter_type)
+
+
+def find_points_batch(data: pd.DataFrame, timeframes: list, **kwargs) -> dict:
+    """Find Points - Batch
+
+    'find_points' of every timeframe, for support and resistance at once.
+
+    Arguments:
+        data {pd.DataFrame} -- fund dataset
+        timeframes {list} -- time windows (number of periods)
+
+    Optional Args:
+        line_types {list} -- (default: {['support', 'resistance']})
+        filter_type {str} -- signal filter (default: {'windowed'})
+
+    Returns:
+        dict -- {line_type: {str(timeframe): {'x': list, 'y': list}}}
+    """
+    line_types = kwargs.get('line_types', ['support', 'resistance'])
+    filter_type = kwargs.get('filter_type', 'windowed')
+
+    close = close_for_points(data)
+
+    points = {}
+    for line_type in line_types:
+        points[line_type] = {}
+        for time in timeframes:
+            x, y = window_points(close, time, line_type, filter_type)
+            points[line_type][str(time)] = {'x': x, 'y': y}
+    return points
+
+
+def close_for_points(data: pd.DataFrame) -> np.ndarray:
+    """ Close prices searched for points; a not-yet-updated (NaN) last close is left out """
+    close = data['Close'].to_numpy(dtype=float)
+    if len(close) > 0 and np.isnan(close[-1]):
+        close = close[:-1]
+    return close
 
-    sect_count = 0
-    X = []
-    Y = []
+
+def window_points(close: np.ndarray, timeframe: int, line_type: str, filter_type: str) -> list:
+    """Window Points
+
+    Minimum (support) or maximum (resistance) of each window of 'close': consecutive windows of
+    'timeframe' periods ('windowed', last one partial) or one starting at every period
+    ('convolution', a point kept once). Windows are strided views; missing values are skipped and
+    the first of equal extremes is taken.
+
+    Arguments:
+        close {np.ndarray} -- close prices (see 'close_for_points')
+        timeframe {int} -- time window (number of periods)
+        line_type {str} -- 'support' or 'resistance'
+        filter_type {str} -- 'windowed' or 'convolution'
+
+    Returns:
+        list -- x (positions), y (prices) lists
+    """
+    total_entries = len(close)
 
     if filter_type == 'windowed':
         sections = int(np.ceil(float(total_entries) / float(timeframe)))
-        while (sect_count < sections):
-            left = sect_count * timeframe
-            right = left + timeframe
-            # print(f"tot: {total_entries}, left: {left}, right: {right}")
-            if total_entries < (left + timeframe + 1):
-                right = total_entries
-
-            if line_type == 'support':
-                val = np.min(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-            else:
-                val = np.max(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
+        if sections == 0:
+            return [], []
+        padded = np.full(sections * timeframe, np.nan)
+        padded[:total_entries] = close
+        windows = padded.reshape(sections, timeframe)
+        starts = np.arange(sections) * timeframe
+
+    elif filter_type == 'convolution':
+        if total_entries <= timeframe:
+            return [], []
+        windows = np.lib.stride_tricks.sliding_window_view(
+            close, timeframe)[:total_entries - timeframe]
+        starts = np.arange(total_entries - timeframe)
 
-            X.append(point)
-            Y.append(val)
+    else:
+        return [], []
 
-            sect_count += 1
+    if line_type == 'support':
+        X = np.nanargmin(windows, axis=1) + starts
+    else:
+        X = np.nanargmax(windows, axis=1) + starts
+    Y = close[X]
 
     if filter_type == 'convolution':
-        while (sect_count + timeframe < total_entries):
-            left = sect_count
-            right = left + timeframe
-            if total_entries < (left + timeframe + 1):
-                right = total_entries
-
-            if line_type == 'support':
-                val = np.min(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-            else:
-                val = np.max(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-
-            X.append(point)
-            Y.append(val)
-
-            sect_count += 1
-        X, Y = truncate_points(X, Y)
+        # First occurrence of each point, in order (as 'truncate_points')
+        _, first = np.unique(X, return_index=True)
+        first.sort()
+        X = X[first]
+        Y = Y[first]
 
-    return X, Y
+    return list(X), list(Y)
 
 
 def sort_and_group(points: dict) -> list:
@@ -221,29 +262,39 @@ def sort_and_group(points: dict) -> list:
     for key in points.keys():
         x.extend(points[key]['x'])
         y.extend(points[key]['y'])
-    zipped = list(zip(x, y))
-    zipped.sort(key=lambda x: x[1])
+
+    order = np.argsort(np.array(y, dtype=float), kind='stable')
+    x = [x[i] for i in order]
+    y = np.array(y, dtype=float)[order]
+
+    # Percent change of each sorted point from the one below it
+    near = np.zeros(len(y), dtype=bool)
+    if len(y) > 1:
+        val = (y[1:] - y[:-1]) / y[:-1] * 100.0
+        near[1:] = (val < CLUSTER_THRESHOLD) & (val > -1 * CLUSTER_THRESHOLD)
+
     notables = []
+    noted = set()
     t_note = 0
-    for i in range(1, len(zipped)-1):
-        val = (zipped[i][1] - zipped[i-1][1]) / zipped[i-1][1]
-        val *= 100.0
-        if (val < CLUSTER_THRESHOLD) and (val > -1 * CLUSTER_THRESHOLD):
-            if zipped[i-1][0] not in notables:
-                notables.append(zipped[i-1][0])
+    for i in range(1, len(x)-1):
+        if near[i]:
+            if x[i-1] not in noted:
+                notables.append(x[i-1])
+                noted.add(x[i-1])
                 t_note += 1
-            if zipped[i][0] not in notables:
-                notables.append(zipped[i][0])
+            if x[i] not in noted:
+                notables.append(x[i])
+                noted.add(x[i])
                 t_note += 1
         else:
             if t_note < 2:
                 if len(notables) != 0:
-                    notables.pop(len(notables)-1)
+                    noted.discard(notables.pop(len(notables)-1))
             t_note = 0
 
     if t_note == 1:
         # Not reset to 0 but not 2+ either... case for last entry
-        notables.pop(len(notables)-1)
+        noted.discard(notables.pop(len(notables)-1))
 
     return notables
 
@@ -265,26 +316,24 @@ def cluster_notables(sorted_x: list, data: pd.DataFrame) -> list:
     if len(sorted_x) == 0:
         return []
 
-    sub.append(sorted_x[0])
+    prices = data['Close'].to_numpy()[np.array(sorted_x, dtype=int)]
+
+    sub.append(0)
     for i in range(1, len(sorted_x)):
-        val = (data['Close'][sorted_x[i]] - data['Close']
-               [sub[len(sub)-1]]) / data['Close'][sub[len(sub)-1]] * 100.0
+        val = (prices[i] - prices[sub[len(sub)-1]]) / prices[sub[len(sub)-1]] * 100.0
         if (val > -1*CLUSTER_THRESHOLD) and (val < CLUSTER_THRESHOLD):
-            sub.append(sorted_x[i])
+            sub.append(i)
         else:
             clusters.append(sub)
             sub = []
-            sub.append(sorted_x[i])
+            sub.append(i)
 
     lines = []
     for chunk in clusters:
         content = {}
-        ys = []
-        for x in chunk:
-            ys.append(data['Close'][x])
-        content['price'] = np.round(np.mean(ys), 2)
-        content['x'] = chunk
-        content['start'] = int(np.min(chunk))
+        content['price'] = np.round(np.mean(prices[chunk]), 2)
+        content['x'] = [sorted_x[i] for i in chunk]
+        content['start'] = int(np.min(content['x']))
         lines.append(content)
 
     return lines
@@ -576,10 +625,7 @@ def remove_dates_from_close(df: pd.DataFrame) -> list:
     Returns:
         list -- fund dataset without dates
     """
-    fixed_list = []
-    for i in range(len(df)):
-        fixed_list.append(df['Close'][i])
-    return fixed_list
+    return list(df['Close'].to_numpy())
 
 
 def colorize_plots(len_of_plots: int, primary_plot_index: int = None) -> list:
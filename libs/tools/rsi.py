@@ -4,11 +4,13 @@ import pandas as pd
 import numpy as np
 
 from libs.utils import dual_plotting, generic_plotting, date_extractor
-from libs.utils import INDEXES
+from libs.utils import INDEXES, as_fund_frame
+from libs.utils import resume_point, start_state, update_state, splice_signal
 from libs.features import normalize_signals
 from .trends import autotrend
 from .moving_average import exponential_moving_avg
 from .trends import get_trendlines_regression
+from .math_functions import rolling_sum
 
 
 def RSI(position: pd.DataFrame, **kwargs) -> dict:
@@ -28,6 +30,9 @@ def RSI(position: pd.DataFrame, **kwargs) -> dict:
         auto_trend {bool} -- True calculates basic trend, applies to thresholds (default: {True})
         view {str} -- (default: {''})
         trendlines {bool} -- (default: {False})
+        state {dict} -- resumable run state, advanced in place (default: {None})
+        rsi_signal {list} -- precomputed RSI signal of 'period', e.g. from 'generate_rsi_signals'
+                             (default: {None})
 
     Returns:
         dict -- contains all rsi information
@@ -42,10 +47,18 @@ def RSI(position: pd.DataFrame, **kwargs) -> dict:
     auto_trend = kwargs.get('auto_trend', True)
     view = kwargs.get('view', '')
     trendlines = kwargs.get('trendlines', False)
+    state = kwargs.get('state')
+    rsi_signal = kwargs.get('rsi_signal')
 
     rsi_data = dict()
 
-    rsi = generate_rsi_signal(position, period=period, p_bar=progress_bar)
+    if rsi_signal is not None:
+        rsi = rsi_signal
+        if progress_bar is not None:
+            progress_bar.uptick(increment=0.3)
+    else:
+        rsi = generate_rsi_signal(
+            position, period=period, p_bar=progress_bar, state=state)
     rsi_data['tabular'] = rsi
 
     slope_trend = []
@@ -125,72 +138,201 @@ def generate_rsi_signal(position: pd.DataFrame, **kwargs) -> list:
     Keyword Arguments:
         period {int} -- (default: {14})
         p_bar {ProgressBar} -- (default: {None})
+        state {dict} -- resumable run state, advanced in place (default: {None})
 
     Returns:
         list -- RSI signal
     """
     period = kwargs.get('period', 14)
     p_bar = kwargs.get('p_bar')
+    state = kwargs.get('state')
 
-    PERIOD = period
-    change = []
-    change.append(0.0)
-    for i in range(1, len(position['Close'])):
-        per = (position['Close'][i] - position['Close']
-               [i-1]) / position['Close'][i-1] * 100.0
-        change.append(np.round(per, 6))
+    new_bars = resume_point(position, state)
+    if new_bars is not None and state['kernel'].get('period') == period:
+        tot_len = len(position['Close'])
+        new_closes = list(position['Close'][tot_len-new_bars:])
+        new_rsi = rsi_resume(new_closes, state['kernel'])
+        RSI = splice_signal(state['signals']['rsi'], new_rsi, tot_len)
+        update_state(state, position, state['kernel'], rsi=RSI)
 
+        if p_bar is not None:
+            p_bar.uptick(increment=0.3)
+        return RSI
+
+    change = rsi_changes(position)
     if p_bar is not None:
         p_bar.uptick(increment=0.15)
 
+    RSI, prev_rs = rsi_from_changes(change, period)
+    RSI = RSI.tolist()
+    if p_bar is not None:
+        p_bar.uptick(increment=0.15)
+
+    kernel = {
+        "period": period,
+        "count": len(change),
+        "prev_close": float(position['Close'][-1]) if len(change) > 0 else None,
+        "changes": change[len(change)-period:].tolist() if len(change) >= period else
+        change.tolist(),
+        "prev_rs": [float(avg) for avg in prev_rs]
+    }
+    start_state(state, position, kernel, rsi=RSI)
+
+    return RSI
+
+
+def generate_rsi_signals(position: pd.DataFrame, periods: list = [7, 14, 21, 28], **kwargs) -> np.ndarray:
+    """Generate RSI Signals
+
+    Batch RSI of several periods, computed over a single shared percent-change array
+
+    Arguments:
+        position {pd.DataFrame} -- fund dataset
+
+    Keyword Arguments:
+        periods {list} -- RSI periods (default: {[7, 14, 21, 28]})
+
+    Optional Args:
+        p_bar {ProgressBar} -- (default: {None})
+
+    Returns:
+        np.ndarray -- RSI signals, shape (len(periods), len(position))
+    """
+    p_bar = kwargs.get('p_bar')
+
+    change = rsi_changes(position)
+    signals = np.zeros((len(periods), len(change)))
+    for i, period in enumerate(periods):
+        signals[i], _ = rsi_from_changes(change, period)
+
+    if p_bar is not None:
+        p_bar.uptick(increment=0.3)
+
+    return signals
+
+
+def rsi_changes(position: pd.DataFrame) -> np.ndarray:
+    """ Percent change of each close from the previous close (rounded), first change 0.0 """
+    closes = np.asarray(position['Close'], dtype=np.float64)
+    change = np.zeros(closes.shape)
+    change[..., 1:] = np.round(
+        (closes[..., 1:] - closes[..., :-1]) / closes[..., :-1] * 100.0, 6)
+    return change
+
+
+def rsi_from_changes(change: np.ndarray, period: int) -> list:
+    """RSI from Changes
+
+    Closed form of the RSI: the average gain / loss of each bar only depends on the summed
+    gains / losses of the 'period' changes before it, so every bar is computed at once.
+
+    Arguments:
+        change {np.ndarray} -- percent changes (see 'rsi_changes'; 2-D panels row-wise)
+        period {int} -- RSI period
+
+    Returns:
+        list -- RSI signal (np.ndarray), [average gain, average loss] of the last bar
+    """
+    PERIOD = period
+    tot_len = change.shape[-1]
+    RSI = np.full(change.shape, 50.0)
+    if tot_len <= PERIOD:
+        return RSI, [0.0, 0.0]
+
+    # Summed gains / losses of change[i-PERIOD:i] for i >= PERIOD
+    gains = np.where(change > 0.0, change, 0.0)
+    losses = np.where(change > 0.0, 0.0, np.abs(change))
+    pos = rolling_sum(gains, PERIOD)[..., 0:tot_len-PERIOD]
+    neg = rolling_sum(losses, PERIOD)[..., 0:tot_len-PERIOD]
+
+    avg_gain = np.round(pos / float(PERIOD), 6)
+    avg_loss = np.round(neg / float(PERIOD), 6)
+
+    rs = np.zeros(change.shape[:-1] + (tot_len-PERIOD,))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs[..., 0] = np.where(neg[..., 0] != 0.0, np.round(
+            pos[..., 0] / neg[..., 0], 6), float('inf'))
+
+        # Smoothed with the previous bar's averages and the current change
+        prev_gain = avg_gain[..., 0:-1]
+        prev_loss = avg_loss[..., 0:-1]
+        current = change[..., PERIOD+1:]
+        up = (((prev_gain * float(PERIOD-1)) + current) / float(PERIOD)
+              ) / (((prev_loss * float(PERIOD-1)) + 0.0) / float(PERIOD))
+        down = (((prev_gain * float(PERIOD-1)) + 0.00) / float(PERIOD)) / \
+            (((prev_loss * float(PERIOD-1)) + np.abs(current)) / float(PERIOD))
+        rs[..., 1:] = np.where(current > 0.0, up, down)
+        rs[..., 1:] = np.where(prev_loss == 0.0, float('inf'), rs[..., 1:])
+
+        RSI[..., PERIOD:] = np.round(100.0 - (100.0 / (1.0 + rs)), 6)
+
+    return RSI, [avg_gain[..., -1], avg_loss[..., -1]]
+
+
+def rsi_resume(new_closes: list, kernel: dict) -> list:
+    """RSI Resume
+
+    Advances the RSI over newly arrived closes only, continuing from the kernel state filled by
+    'generate_rsi_signal'. Values are identical to a full recompute of the concatenated series.
+
+    Arguments:
+        new_closes {list} -- newly arrived closing prices
+        kernel {dict} -- resumable rsi kernel state (updated in place)
+
+    Returns:
+        list -- RSI values of the new closes
+    """
+    PERIOD = kernel['period']
+
     RSI = []
-    # gains, losses, rs
-    RS = []
-
-    for i in range(0, PERIOD):
-        RSI.append(50.0)
-        RS.append([0.0, 0.0, 1.0])
-
-    # Calculate RS for all future points
-    for i in range(PERIOD, len(change)):
-        pos = 0.0
-        neg = 0.0
-        for j in range(i-PERIOD, i):
-            if change[j] > 0.0:
-                pos += change[j]
-            else:
-                neg += np.abs(change[j])
+    for close in new_closes:
+        i = kernel['count']
+        if kernel['prev_close'] is None:
+            change = 0.0
+        else:
+            prev = kernel['prev_close']
+            change = np.round((close - prev) / prev * 100.0, 6)
+
+        if i < PERIOD:
+            RSI.append(50.0)
+            rs_figures = [0.0, 0.0]
 
-        if i == PERIOD:
-            if neg == 0.0:
-                rs = float('inf')
-            else:
-                rs = np.round(pos / neg, 6)
-            RS.append([np.round(pos/float(PERIOD), 6),
-                       np.round(neg/float(PERIOD), 6), rs])
         else:
-            if change[i] > 0.0:
-                if RS[i-1][1] == 0.0:
-                    rs = float('inf')
+            pos = 0.0
+            neg = 0.0
+            for chg in kernel['changes']:
+                if chg > 0.0:
+                    pos += chg
                 else:
-                    rs = (((RS[i-1][0] * float(PERIOD-1)) + change[i]) / float(PERIOD)
-                          ) / (((RS[i-1][1] * float(PERIOD-1)) + 0.0) / float(PERIOD))
-            else:
-                if RS[i-1][1] == 0.0:
+                    neg += np.abs(chg)
+
+            prev_rs = kernel['prev_rs']
+            if i == PERIOD:
+                if neg == 0.0:
                     rs = float('inf')
                 else:
-                    rs = (((RS[i-1][0] * float(PERIOD-1)) + 0.00) / float(PERIOD)) / \
-                        (((RS[i-1][1] * float(PERIOD-1)) +
-                          np.abs(change[i])) / float(PERIOD))
-
-            RS.append([np.round(pos/float(PERIOD), 6),
-                       np.round(neg/float(PERIOD), 6), rs])
-
-        rsi = 100.0 - (100.0 / (1.0 + RS[i][2]))
-        RSI.append(np.round(rsi, 6))
-
-    if p_bar is not None:
-        p_bar.uptick(increment=0.15)
+                    rs = np.round(pos / neg, 6)
+            elif prev_rs[1] == 0.0:
+                rs = float('inf')
+            elif change > 0.0:
+                rs = (((prev_rs[0] * float(PERIOD-1)) + change) / float(PERIOD)
+                      ) / (((prev_rs[1] * float(PERIOD-1)) + 0.0) / float(PERIOD))
+            else:
+                rs = (((prev_rs[0] * float(PERIOD-1)) + 0.00) / float(PERIOD)) / \
+                    (((prev_rs[1] * float(PERIOD-1)) +
+                      np.abs(change)) / float(PERIOD))
+
+            rs_figures = [np.round(pos/float(PERIOD), 6),
+                          np.round(neg/float(PERIOD), 6)]
+            rsi = 100.0 - (100.0 / (1.0 + rs))
+            RSI.append(np.round(rsi, 6))
+
+        kernel['changes'].append(change)
+        if len(kernel['changes']) > PERIOD:
+            kernel['changes'].pop(0)
+        kernel['prev_rs'] = rs_figures
+        kernel['prev_close'] = close
+        kernel['count'] += 1
 
     return RSI
 
@@ -417,6 +559,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
     ovs_th = rsi_data['thresholds']['oversold']
 
     divs = [0.0] * len(signal)
+    closes = as_fund_frame(position).close
 
     state = 'n'
     maxima = 0.0
@@ -433,7 +576,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
         elif state == 'u1':
             if sig <= rsi_vals[0]:
                 rsi_vals[0] = sig
-                prices[0] = position['Close'][i]
+                prices[0] = closes[i]
             else:
                 state = 'u2'
                 maxima = sig
@@ -451,7 +594,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
 
         elif state == 'u3':
             if sig <= rsi_vals[1]:
-                prices[1] = position['Close'][i]
+                prices[1] = closes[i]
                 rsi_vals[1] = sig
             else:
                 if rsi_vals[1] <= ovs_th[i]:
@@ -460,7 +603,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
                         divs[i] = 1.0
                         rsi_data['bullish'].append([
                             date_extractor(position.index[i], _format='str'),
-                            position['Close'][i],
+                            closes[i],
                             i,
                             "divergence"
                         ])
@@ -478,7 +621,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
         elif state == 'e1':
             if sig >= rsi_vals[0]:
                 rsi_vals[0] = sig
-                prices[0] = position['Close'][i]
+                prices[0] = closes[i]
             else:
                 state = 'e2'
                 minima = sig
@@ -496,7 +639,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
 
         elif state == 'e3':
             if sig >= rsi_vals[1]:
-                prices[1] = position['Close'][i]
+                prices[1] = closes[i]
                 rsi_vals[1] = sig
             else:
                 if rsi_vals[1] >= ovb_th[i]:
@@ -505,7 +648,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
                         divs[i] = -1.0
                         rsi_data['bearish'].append([
                             date_extractor(position.index[i], _format='str'),
-                            position['Close'][i],
+                            closes[i],
                             i,
                             "divergence"
                         ])
@@ -872,7 +872,8 @@ def autotrend(data, **kwargs) -> list:
     Optional Args:
         periods {list} -- look-back periods for trend analysis (default: {[]})
         weights {list -- weighting for look-back periods (default: {[]})
-        return_type {str} -- type of item to return in list (default: {'slope'})
+        return_type {str} -- type of item to return in list, 'slope', 'intercept', 'r_value', or
+                             'r_squared' (default: {'slope'})
         normalize {bool} -- True normalizes to max/min slopes (default: {False})
 
     Returns:
@@ -883,41 +884,108 @@ def autotrend(data, **kwargs) -> list:
     return_type = kwargs.get('return_type', 'slope')
     normalize = kwargs.get('normalize', False)
 
-    trend = []
-    for _ in range(len(data)):
-        trend.append(0.0)
-
     periods = [int(period) for period in periods]
-    for j, period in enumerate(periods):
-        trends = []
-        for _ in range(period):
-            trends.append(0.0)
-
-        # X range will always be the same for any given period
-        x = list(range(period))
-        for i in range(period, len(data)):
-            y = data[i-period:i].copy()
-            reg = linregress(x, y)
-
-            if return_type == 'slope':
-                trends.append(reg[0])
+    regressions = rolling_regression(data, periods, return_type=return_type)
 
+    trend = np.zeros(len(data))
+    for j, regression in enumerate(regressions):
         wt = 1.0
         if j < len(weights):
             wt = weights[j]
-        for k, t in enumerate(trends):
-            trend[k] = trend[k] + (wt * t)
+        trend = trend + (wt * regression)
 
     if normalize:
-        max_factor = max(trend)
-        min_factor = min(trend)
-        for i in range(len(trend)):
-            if trend[i] < 0.0:
-                trend[i] = (trend[i] / min_factor) * -0.35
-            else:
-                trend[i] = (trend[i] / max_factor) * 0.35
+        max_factor = np.max(trend) if len(trend) > 0 else 0.0
+        min_factor = np.min(trend) if len(trend) > 0 else 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend = np.where(trend < 0.0, (trend / min_factor) * -0.35,
+                             (trend / max_factor) * 0.35)
 
-    return trend
+    return trend.tolist()
+
+
+def rolling_regression(data, periods: list, **kwargs) -> np.ndarray:
+    """Rolling Regression
+
+    Rolling ordinary least squares of 'data' against x = 0..period-1 for every look-back window,
+    computed for all windows (and all periods) at once from cumulative sums of y, x*y, and y*y.
+
+    Arguments:
+        data {list, pd.DataFrame} -- data to regress
+        periods {list} -- look-back periods (ints)
+
+    Optional Args:
+        return_type {str} -- 'slope', 'intercept', 'r_value', or 'r_squared' (default: {'slope'})
+
+    Returns:
+        np.ndarray -- shape (len(periods), len(data)); entry i of a period is the regression of
+                      data[i-period:i], and 0.0 for i < period
+    """
+    return_type = kwargs.get('return_type', 'slope')
+
+    y = np.array(data, dtype=np.float64)
+    regressions = np.zeros((len(periods), len(y)))
+
+    if not np.all(np.isfinite(y)):
+        # Missing data: regress each window individually (as linregress would)
+        for j, period in enumerate(periods):
+            x = list(range(period))
+            for i in range(period, len(y)):
+                reg = linregress(x, y[i-period:i])
+                regressions[j][i] = regression_item(
+                    reg[0], reg[1], reg[2], return_type)
+        return regressions
+
+    # Removing the mean keeps the cumulative sums small (slope and r are unaffected)
+    offset = np.mean(y) if len(y) > 0 else 0.0
+    y = y - offset
+    index = np.arange(len(y), dtype=np.float64)
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    cum_xy = np.concatenate(([0.0], np.cumsum(index * y)))
+    cum_yy = np.concatenate(([0.0], np.cumsum(y * y)))
+
+    for j, period in enumerate(periods):
+        if period < 2 or len(y) <= period:
+            continue
+
+        # Window data[s:s+period] for s = i - period, i = period..len-1
+        start = np.arange(0, len(y) - period, dtype=np.float64)
+        s = np.arange(0, len(y) - period)
+        sum_y = cum_y[s+period] - cum_y[s]
+        sum_xy = (cum_xy[s+period] - cum_xy[s]) - start * sum_y
+        sum_yy = cum_yy[s+period] - cum_yy[s]
+
+        n = float(period)
+        sum_x = n * (n - 1.0) / 2.0
+        sum_xx = (n - 1.0) * n * (2.0 * n - 1.0) / 6.0
+
+        ss_xy = n * sum_xy - sum_x * sum_y
+        ss_xx = n * sum_xx - sum_x * sum_x
+        ss_yy = np.maximum(n * sum_yy - sum_y * sum_y, 0.0)
+
+        slope = ss_xy / ss_xx
+        intercept = (sum_y - slope * sum_x) / n + offset
+
+        r_den = np.sqrt(ss_xx * ss_yy)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_value = np.where(r_den == 0.0, 0.0, ss_xy / r_den)
+        r_value = np.clip(r_value, -1.0, 1.0)
+
+        regressions[j][period:] = regression_item(
+            slope, intercept, r_value, return_type)
+
+    return regressions
+
+
+def regression_item(slope, intercept, r_value, return_type: str):
+    """ Item of a regression desired by 'return_type' (see 'rolling_regression') """
+    if return_type == 'intercept':
+        return intercept
+    if return_type == 'r_value':
+        return r_value
+    if return_type == 'r_squared':
+        return r_value ** 2
+    return slope
 
 
 ######################################################
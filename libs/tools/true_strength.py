@@ -5,7 +5,7 @@ import numpy as np
 from libs.utils import generic_plotting, shape_plotting
 from libs.utils import index_extractor, fund_list_extractor, dates_extractor_list, date_extractor
 from libs.utils import ProgressBar, INDEXES
-from libs.utils import api_sector_match, api_sector_funds
+from libs.utils import api_sector_data
 
 
 def normalized_ratio(fundA, fundB, data_type: str = 'dataframe', key: str = 'Adj Close') -> list:
@@ -160,6 +160,8 @@ def relative_strength(primary_name: str, full_data_dict: dict, **kwargs) -> list
         plot_output {bool} -- True to render plot in realtime (default: {True})
         progress_bar {ProgressBar} -- (default: {None})
         view {str} -- Directory of plots (default: {''})
+        sector_match {list} -- sector match data already fetched, see 'api_sector_data'
+                               (default: {None})
 
     Returns:
         list -- dict containing all relative strength information, sector match data
@@ -172,6 +174,7 @@ def relative_strength(primary_name: str, full_data_dict: dict, **kwargs) -> list
     meta = kwargs.get('meta', None)
     sector_data = kwargs.get('sector_data', {})
     view = kwargs.get('view', '')
+    sector_match = kwargs.get('sector_match')
 
     period = kwargs.get('period', '2y')
     interval = kwargs.get('interval', '1d')
@@ -180,29 +183,18 @@ def relative_strength(primary_name: str, full_data_dict: dict, **kwargs) -> list
     comp_funds = []
     comp_data = {}
     if meta is not None:
-        match = meta.get('info', {}).get('sector')
-
-        if match is not None:
-            fund_len = {
-                'length': len(full_data_dict[primary_name]['Close']),
-                'start': full_data_dict[primary_name].index[0],
-                'end': full_data_dict[primary_name].index[
-                    len(full_data_dict[primary_name]['Close'])-1],
-                'dates': full_data_dict[primary_name].index
-            }
-
-            match_fund, match_data = api_sector_match(
-                match, config, fund_len=fund_len, period=period, interval=interval)
-
-            if match_fund is not None:
-                comp_funds, comp_data = api_sector_funds(
-                    match_fund, config, fund_len=fund_len, period=period, interval=interval)
-
-                if match_data is None:
-                    match_data = full_data_dict
-                sector = match_fund
-                sector_data = match_data
-                sector_bench = match_data[match_fund]
+        if sector_match is None:
+            sector_match = api_sector_data(
+                meta.get('info', {}).get('sector'), primary_name, full_data_dict, config,
+                period=period, interval=interval)
+        match_fund, match_data, comp_funds, comp_data = sector_match
+
+        if match_fund is not None:
+            if match_data is None:
+                match_data = full_data_dict
+            sector = match_fund
+            sector_data = match_data
+            sector_bench = match_data[match_fund]
 
     if progress_bar is not None:
         progress_bar.uptick(increment=0.3)
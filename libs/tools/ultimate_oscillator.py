@@ -5,7 +5,7 @@ import numpy as np
 from libs.utils import dual_plotting, date_extractor
 from libs.utils import ProgressBar, INDEXES
 from libs.features import normalize_signals
-from .math_functions import lower_low, higher_high, bull_bear_th
+from .math_functions import lower_low, higher_high, bull_bear_th, rolling_sum
 from .moving_average import exponential_moving_avg
 
 
@@ -23,6 +23,8 @@ def ultimate_oscillator(position: pd.DataFrame, config: list = [7, 14, 28], **kw
         out_suppress {bool} -- (default: {True})
         name {str} -- (default: {''})
         p_bar {ProgressBar} -- (default: {None})
+        ult_signal {list} -- precomputed ultimate oscillator of 'config', e.g. from
+                             'ultimate_kernel' (default: {None})
 
     Returns:
         dict -- ultimate oscillator object
@@ -32,11 +34,17 @@ def ultimate_oscillator(position: pd.DataFrame, config: list = [7, 14, 28], **kw
     name = kwargs.get('name', '')
     p_bar = kwargs.get('progress_bar')
     view = kwargs.get('view', '')
+    ult_signal = kwargs.get('ult_signal')
 
     ultimate = dict()
 
-    ult_osc = generate_ultimate_osc_signal(
-        position, config=config, p_bar=p_bar)
+    if ult_signal is not None:
+        ult_osc = ult_signal
+        if p_bar is not None:
+            p_bar.uptick(increment=0.2)
+    else:
+        ult_osc = generate_ultimate_osc_signal(
+            position, config=config, p_bar=p_bar)
     ultimate['tabular'] = ult_osc
 
     ultimate = find_ult_osc_features(position, ultimate, p_bar=p_bar)
@@ -99,52 +107,85 @@ def generate_ultimate_osc_signal(position: pd.DataFrame, config: list = [7, 14,
     """
     p_bar = kwargs.get('p_bar')
 
-    tot_len = len(position['Close'])
+    ult_osc = ultimate_kernel(
+        position['Low'], position['High'], position['Close'], config)
+
+    if p_bar is not None:
+        p_bar.uptick(increment=0.2)
+
+    return ult_osc.tolist()
+
+
+def ultimate_kernel(low, high, close, config: list) -> np.ndarray:
+    """Ultimate Kernel
+
+    Arguments:
+        low {list, np.ndarray} -- lows (a 2-D panel of funds x bars is computed row-wise)
+        high {list, np.ndarray} -- highs
+        close {list, np.ndarray} -- closes
+        config {list} -- short, medium, long periods
+
+    Returns:
+        np.ndarray -- ultimate oscillator, shaped as 'close'
+    """
     SHORT = config[0]
     MED = config[1]
     LONG = config[2]
 
-    bp = [0.0] * tot_len
-    tr = [0.0] * tot_len
-    ushort = [0.0] * tot_len
-    umed = [0.0] * tot_len
-    ulong = [0.0] * tot_len
-
-    ult_osc = [50.0] * tot_len
-
-    # Generate the ultimate oscillator values
-    for i in range(1, tot_len):
-
-        low = np.min([position['Low'][i], position['Close'][i-1]])
-        high = np.max([position['High'][i], position['Close'][i-1]])
-        bp[i] = np.round(position['Close'][i] - low, 6)
-        tr[i] = np.round(high - low, 6)
-
-        if i >= SHORT-1:
-            shbp = sum(bp[i-SHORT: i+1])
-            shtr = sum(tr[i-SHORT: i+1])
-            if shtr != 0.0:
-                ushort[i] = np.round(shbp / shtr, 6)
-
-        if i >= MED-1:
-            shbp = sum(bp[i-MED: i+1])
-            shtr = sum(tr[i-MED: i+1])
-            if shtr != 0.0:
-                umed[i] = np.round(shbp / shtr, 6)
-
-        if i >= LONG-1:
-            shbp = sum(bp[i-LONG: i+1])
-            shtr = sum(tr[i-LONG: i+1])
-            if shtr != 0.0:
-                ulong[i] = np.round(shbp / shtr, 6)
-            ult_osc[i] = \
-                np.round(
-                    100.0 * ((4.0 * ushort[i]) + (2.0 * umed[i]) + ulong[i]) / 7.0, 6)
+    close = np.asarray(close, dtype=np.float64)
+    tot_len = close.shape[-1]
+    bp = np.zeros(close.shape)
+    tr = np.zeros(close.shape)
+
+    # Buying pressure and true range of each bar (vs. the previous close)
+    if tot_len > 1:
+        low = np.minimum(np.asarray(low, dtype=np.float64)[..., 1:], close[..., :-1])
+        high = np.maximum(np.asarray(high, dtype=np.float64)[..., 1:], close[..., :-1])
+        bp[..., 1:] = np.round(close[..., 1:] - low, 6)
+        tr[..., 1:] = np.round(high - low, 6)
+
+    ushort = ultimate_ratio(bp, tr, SHORT)
+    umed = ultimate_ratio(bp, tr, MED)
+    ulong = ultimate_ratio(bp, tr, LONG)
+
+    ult_osc = np.full(close.shape, 50.0)
+    start = max(LONG-1, 1)
+    ult_osc[..., start:] = np.round(
+        100.0 * ((4.0 * ushort[..., start:]) + (2.0 * umed[..., start:]) + ulong[..., start:]) / 7.0, 6)
+    return ult_osc
 
-    if p_bar is not None:
-        p_bar.uptick(increment=0.2)
 
-    return ult_osc
+def ultimate_ratio(bp: np.ndarray, tr: np.ndarray, interval: int) -> np.ndarray:
+    """Ultimate Ratio
+
+    Summed buying pressure over summed true range, using a window of 'interval' + 1 bars (current
+    bar and 'interval' bars back).
+
+    Arguments:
+        bp {np.ndarray} -- buying pressure (2-D panels are summed along the last axis)
+        tr {np.ndarray} -- true range
+        interval {int} -- lookback period
+
+    Returns:
+        np.ndarray -- ratio for each bar (0.0 before 'interval' or where true range sums to 0)
+    """
+    tot_len = bp.shape[-1]
+    shbp = np.zeros(bp.shape)
+    shtr = np.zeros(bp.shape)
+
+    if tot_len > interval:
+        shbp[..., interval:] = rolling_sum(bp, interval+1)
+        shtr[..., interval:] = rolling_sum(tr, interval+1)
+
+    elif (tot_len == interval) and (interval > 1):
+        # Window of the first full bar only holds the current bar
+        shbp[..., interval-1] = bp[..., interval-1]
+        shtr[..., interval-1] = tr[..., interval-1]
+
+    ratio = np.zeros(bp.shape)
+    valid = shtr != 0.0
+    ratio[valid] = np.round(shbp[valid] / shtr[valid], 6)
+    return ratio
 
 
 def find_ult_osc_features(position: pd.DataFrame, ultimate: dict, **kwargs) -> list:
@@ -1,3 +1,4 @@
 from .pptx_generator import slide_creator
+from .pptx_resources import FUND_FRAGMENTS, configure_fund_fragments
 from .json_generator import output_to_json
 from .pdf_generator import PDF_creator
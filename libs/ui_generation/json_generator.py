@@ -1,8 +1,9 @@
 """
 json_generator.py
 
-Outputs a json file with entire 'analysis' data. Currently, file is relatively unused
-in saved form. Can be used later with more complex ML or analytical tools.
+Outputs a json file with entire 'analysis' data, assembled from the run's metadata stream (see
+'libs.utils.metadata_stream'). Currently, file is relatively unused in saved form. Can be used
+later with more complex ML or analytical tools.
 """
 
 import json
@@ -10,56 +11,74 @@ import os
 import pandas as pd
 import numpy as np
 
+from libs.utils import METADATA_STREAM, MetadataReader
 
-def metadata_copy(data: dict) -> dict:
-    """Metadata Copy
 
-    Speciality copy function to remove tabulars, etc. Pops selected tabular keys/data
-
-    Arguments:
-        data {dict} -- data object
-
-    Returns:
-        dict - copied metadata
-    """
-    meta = data.copy()
-    for key in meta.keys():
-        if 'clustered_osc' in meta[key]:
-            meta[key].pop('clustered_osc')
-            #  Additional grooming / popping follows
-
-            # if 'features' in meta[key].keys():
-            #     for feature in meta[key]['features']:
-            #         for feat in range(len(meta[key]['features'][feature]['features'])):
-            # Array of 'feature' features
-            # meta[key]['features'][feature]['features'][feat].pop('indexes')
-
-    return meta
+# Top-level keys of a fund left out of metadata.json when tabular data is excluded
+TABULAR_KEYS = ['clustered_osc']
 
 
-def output_to_json(data: dict, exclude_tabular=True):
+def output_to_json(data: dict, exclude_tabular=True, **kwargs):
     """Output to JSON
 
-    Simple function that outputs dictionary to JSON file
+    Completes the run's metadata stream (records 'run_prod' did not stream, e.g. '_METRICS_')
+    and writes metadata.json from it, one record at a time
 
     Arguments:
         data {dict} -- metadata to output to json file
 
     Keyword Arguments:
-        exclude_tabular {bool} -- pop tabular data if True (default: {True})    
+        exclude_tabular {bool} -- pop tabular data if True (default: {True})
+
+    Optional Args:
+        stream {MetadataStream} -- (default: {METADATA_STREAM})
     """
+    stream = kwargs.get('stream', METADATA_STREAM)
+
     filename = os.path.join("output", "metadata.json")
     if not os.path.exists('output'):
         os.mkdir('output')
     if os.path.exists(filename):
         os.remove(filename)
 
-    meta = data
+    exclude = []
     if exclude_tabular:
-        meta = metadata_copy(data)
+        exclude = TABULAR_KEYS
+
+    stream.write_missing(data, exclude=exclude)
+    stream.close()
 
+    reader = MetadataReader(stream.path, stream.index_path)
     with open(filename, 'w') as f:
-        json.dump(meta, f)
+        f.write('{')
+        for i, fund in enumerate(data):
+            if i > 0:
+                f.write(', ')
+            f.write(f"{json.dumps(fund)}: {{")
+            keys = [key for key in data[fund] if key not in exclude]
+            for j, key in enumerate(keys):
+                if j > 0:
+                    f.write(', ')
+                f.write(f"{json.dumps(key)}: ")
+                write_record(f, reader, fund, key)
+            f.write('}')
+        f.write('}')
         f.close()
+    reader.close()
 
     print('\r\nJSON output complete.')
+
+
+def write_record(j_file, reader, fund: str, key: str):
+    """ Writes a fund's key from the stream, field by field (as 'json.dump' formats it) """
+    fields = reader.fields(fund, key)
+    if fields is None:
+        j_file.write(json.dumps(reader.get(fund, key)))
+        return
+
+    j_file.write('{')
+    for i, (field, value) in enumerate(reader.items(fund, key)):
+        if i > 0:
+            j_file.write(', ')
+        j_file.write(f"{json.dumps(field)}: {json.dumps(value)}")
+    j_file.write('}')
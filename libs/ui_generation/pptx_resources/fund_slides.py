@@ -2,6 +2,7 @@ import os
 import glob
 import json
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 
@@ -10,10 +11,13 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN  # pylint: disable=no-name-in-module
 
 from libs.utils import fund_list_extractor, INDEXES
+from libs.utils import RENDER_POOL
+from libs.utils.render_pool import render_workers, pool_context
 from libs.tools import trend_simple_forecast
 
 from .slide_utils import slide_title_header, color_to_RGB, pptx_ui_errors
 from .synopsis_slide import generate_synopsis_slide
+from .slide_fragments import FragmentImages, merge_fragment, new_fragment, fragment_slides
 
 # Slide Layouts
 PRES_TITLE_SLIDE = 0
@@ -26,6 +30,10 @@ BLANK_SLIDE = 6
 CONTENT_W_CAPTION_SLIDE = 7
 PICTURE_W_CAPTION_SLIDE = 8
 
+# Slide size of the presentation 'slide_creator' makes (default template, 10 x 7.5 in)
+FRAGMENT_WIDTH = Inches(10)
+FRAGMENT_HEIGHT = Inches(7.5)
+
 TEMP_DIR = os.path.join("output", "temp")
 
 
@@ -38,19 +46,166 @@ def make_fund_slides(prs, analysis: dict, **kwargs):
 
     Optional Args:
         views {str} -- (default: {''})
+        workers {int} -- processes building per-fund slide fragments; 1 builds every fund's
+                         slides in this process (default: {os.cpu_count()})
 
     Returns:
         prs -- pptx presentation object
     """
     views = kwargs.get('views', '')
-    funds = analysis.keys()
+    workers = kwargs.get('workers', os.cpu_count() or 1)
+    funds = [fund for fund in analysis.keys() if fund != '_METRICS_']
+
+    workers = max(min(workers, len(funds)), 1)
+    if views is not None and (workers > 1 or FUND_FRAGMENTS.queued()):
+        return make_fund_slides_parallel(prs, analysis, funds, views, workers)
+
     for fund in funds:
-        if fund != '_METRICS_':
-            prs = add_fund_content(prs, fund, analysis, views=views)
+        prs = add_fund_content(prs, fund, analysis, views=views)
+
+    return prs
+
+
+def make_fund_slides_parallel(prs, analysis: dict, funds: list, views: str, workers: int):
+    """Make Fund Slides - Parallel
+
+    Each fund's slides are built as a fragment in a worker process; fragments are merged into
+    the presentation in fund order as they complete, so the deck is the same as a serial build.
+
+    Arguments:
+        prs {pptx obj} -- presentation
+        analysis {dict} -- full data
+        funds {list} -- funds to add, in order
+        views {str} -- period of the fund slides
+        workers {int} -- worker processes
+
+    Returns:
+        prs -- pptx presentation object
+    """
+    images = FragmentImages(prs)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as executor:
+        futures = []
+        for fund in funds:
+            # Built during the analysis as soon as the fund's charts were written, if queued
+            future = FUND_FRAGMENTS.take(fund, views, prs.slide_width, prs.slide_height)
+            if future is None:
+                future = executor.submit(fund_fragment, fund, {fund: analysis[fund]}, views,
+                                         prs.slide_width, prs.slide_height)
+            futures.append(future)
+
+        for future in futures:
+            prs = merge_fragment(prs, future.result(), images=images)
 
     return prs
 
 
+def fund_fragment(fund: str, analysis: dict, views: str, width: int, height: int) -> list:
+    """ Worker process task: a fund's slides as fragment data (see 'merge_fragment') """
+    fragment = new_fragment(width, height)
+    fragment = add_fund_content(fragment, fund, analysis, views=views)
+    return fragment_slides(fragment)
+
+
+class FundFragments(object):
+    """FundFragments
+
+    Fund slide fragments queued by the analysis ('run_prod') as each fund completes: once a
+    fund's charts are written, its fragment is built in a worker process while the next funds
+    are analyzed. 'make_fund_slides' merges the queued fragments instead of building them.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.views = None
+        self.workers = 1
+        self.pid = None
+        self.executor = None
+        self.futures = {}
+
+    def configure(self, **kwargs):
+        """Configure
+
+        Optional Args:
+            enabled {bool} -- queue fragments during the analysis (default: {False})
+            views {str} -- period of the fund slides (default: {'2y'})
+            workers {int} -- fragment processes (default: {render_workers()})
+        """
+        self.close()
+        self.enabled = kwargs.get('enabled', False)
+        self.views = kwargs.get('views', '2y')
+        self.workers = kwargs.get('workers', render_workers())
+        self.pid = os.getpid()
+
+    def submit(self, fund: str, fund_analysis: dict) -> bool:
+        """Submit
+
+        Arguments:
+            fund {str} -- fund name
+            fund_analysis {dict} -- the fund's complete analysis (all periods and synopsis)
+
+        Returns:
+            bool -- True if the fragment was queued
+        """
+        if not self.enabled or self.pid != os.getpid():
+            return False
+
+        # The fragment's slides read the fund's charts
+        RENDER_POOL.wait_for(fund)
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=pool_context())
+        self.futures[fund] = self.executor.submit(
+            fund_fragment, fund, {fund: fund_analysis}, self.views,
+            FRAGMENT_WIDTH, FRAGMENT_HEIGHT)
+        return True
+
+    def queued(self) -> bool:
+        """ True if fragments were queued and not taken yet """
+        return len(self.futures) > 0
+
+    def take(self, fund: str, views: str, width: int, height: int):
+        """ Queued fragment future of a fund, None if not queued for this view and slide size """
+        future = self.futures.pop(fund, None)
+        if future is None or \
+                (views, width, height) != (self.views, FRAGMENT_WIDTH, FRAGMENT_HEIGHT):
+            return None
+        return future
+
+    def close(self):
+        """ Drops fragments not taken and shuts down the worker processes """
+        if self.pid is not None and self.pid != os.getpid():
+            # Forked copy: the executor belongs to the parent
+            self.executor = None
+            self.futures = {}
+            return
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+FUND_FRAGMENTS = FundFragments()
+
+
+def configure_fund_fragments(config: dict):
+    """Configure Fund Fragments
+
+    Fragments are queued when a presentation is made and there is a spare cpu to build them on.
+
+    Arguments:
+        config {dict} -- controlling config dictionary
+    """
+    enabled = ('suppress_pptx' not in config['state']) and ((os.cpu_count() or 1) > 1)
+    FUND_FRAGMENTS.configure(
+        enabled=enabled, views=config.get('views', {}).get('pptx', '2y'))
+
+
 def add_fund_content(prs, fund: str, analysis: dict, **kwargs):
     """Add Fund Content
 
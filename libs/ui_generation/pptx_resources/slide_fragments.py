@@ -0,0 +1,116 @@
+"""
+Slide Fragments
+
+Per-fund slides are built as small stand-alone presentations ('fragments') in worker processes,
+handed back as plain data (shape tree xml and picture blobs) and merged in fund order into the
+main presentation: slide shapes are copied as-is and their pictures re-related to image parts of
+the main package (deduplicated by SHA1). Building in a small package also keeps python-pptx's
+image lookups, which walk every part of the package, from growing with the length of the deck.
+"""
+from lxml import etree
+
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.parts.image import ImagePart
+
+BLANK_SLIDE = 6
+
+# Attributes of slide xml that hold relationship ids (pictures: 'r:embed')
+REL_ATTRIBUTES = [qn('r:embed'), qn('r:link'), qn('r:id')]
+TREE_PROPERTIES = [qn('p:nvGrpSpPr'), qn('p:grpSpPr')]
+
+
+def new_fragment(width: int, height: int):
+    """ Empty presentation of the given slide size, to build a fragment in """
+    fragment = Presentation()
+    fragment.slide_width = width
+    fragment.slide_height = height
+    return fragment
+
+
+def fragment_slides(fragment) -> list:
+    """Fragment Slides
+
+    Arguments:
+        fragment {pptx-object} -- presentation a fund's slides were built in
+
+    Returns:
+        list -- per slide: shape tree xml {bytes}, pictures {dict} of rId: [sha1, content type,
+                extension, blob]; plain data, as handed back from a worker process
+    """
+    slides = []
+    for slide in fragment.slides:
+        pictures = {}
+        for rel_id, rel in slide.part.rels.items():
+            if rel.reltype == RT.IMAGE and not rel.is_external:
+                part = rel.target_part
+                pictures[rel_id] = [part.sha1, part.content_type, part.partname.ext, part.blob]
+        slides.append([etree.tostring(slide.shapes.element), pictures])
+    return slides
+
+
+class FragmentImages(object):
+    """FragmentImages
+
+    Image parts of the main presentation, by SHA1, with the next free media partname index.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, prs):
+        self.package = prs.part.package
+        self.parts = {}
+        self.index = 0
+        for part in self.package.iter_parts():
+            if isinstance(part, ImagePart):
+                self.parts[part.sha1] = part
+                self.index = max(self.index, part.partname.idx or 0)
+
+    def get_or_add(self, sha1: str, content_type: str, ext: str, blob: bytes) -> ImagePart:
+        """ Image part of the main package with this content, added if new """
+        if sha1 not in self.parts:
+            self.index += 1
+            partname = PackURI(f"/ppt/media/image{self.index}.{ext}")
+            self.parts[sha1] = ImagePart(partname, content_type, self.package, blob)
+        return self.parts[sha1]
+
+
+def merge_fragment(prs, slides: list, images: FragmentImages = None):
+    """Merge Fragment
+
+    Arguments:
+        prs {pptx-object} -- main presentation, slides are appended
+        slides {list} -- slides of a fragment (see 'fragment_slides')
+
+    Keyword Arguments:
+        images {FragmentImages} -- image parts of 'prs', shared across merges (default: {None})
+
+    Returns:
+        pptx-object -- main presentation
+    """
+    if images is None:
+        images = FragmentImages(prs)
+
+    for shape_tree, pictures in slides:
+        slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
+
+        rel_ids = {}
+        for rel_id, picture in pictures.items():
+            image_part = images.get_or_add(*picture)
+            rel_ids[rel_id] = slide.part.relate_to(image_part, RT.IMAGE)
+
+        tree = slide.shapes.element
+        for element in parse_xml(shape_tree).iterchildren():
+            if element.tag in TREE_PROPERTIES:
+                continue
+            for node in element.iter():
+                for attribute in REL_ATTRIBUTES:
+                    if node.get(attribute) in rel_ids:
+                        node.set(attribute, rel_ids[node.get(attribute)])
+            tree.insert_element_before(element, 'p:extLst')
+
+    return prs
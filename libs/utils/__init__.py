@@ -2,8 +2,11 @@ from .startup import start_header, logo_renderer
 from .file_io import configure_temp_dir, remove_temp_dir, create_sub_temp_dir
 
 from .data import download_data, download_data_indexes, download_single_fund, download_data_all
+from .price_store import set_price_provider, set_price_store_dir, FixtureProvider
+from .fund_frame import FundFrame, as_fund_frame, fund_panel, panel_frame
 
 from .api import get_api_metadata, api_sector_match, api_sector_funds
+from .api import fetch_api_metadata, MetadataFetcher, MetadataRequestError, api_sector_data
 from .api import get_volatility, vq_status_print
 from .api import get_dividends
 
@@ -14,8 +17,25 @@ from .formatting import dates_extractor_list, date_extractor, dates_convert_from
 
 from .plotting import dual_plotting, generic_plotting, bar_chart, specialty_plotting
 from .plotting import candlestick_plot, shape_plotting
+from .render_pool import RENDER_POOL, RenderPool, configure_render_pool
+from .figure_templates import FIGURE_TEMPLATES, FigureTemplates
 
-from .progress_bar import ProgressBar, start_clock
+from .progress_bar import ProgressBar, ProgressQueue, start_clock
+from .shared_dataset import share_dataset, attach_dataset, release_dataset
+from .market_session import MarketDataSession
+from .prefetch import FundPrefetcher, PREFETCH_LOOKAHEAD
+
+from .run_state import load_run_state, save_run_state
+from .run_state import resume_point, start_state, update_state, splice_signal
+
+from .indicator_cache import INDICATOR_CACHE, memoize_indicator, indicator_key
+from .indicator_cache import configure_indicator_cache, indicator_cache_print
+
+from .metadata_cache import METADATA_CACHE, configure_metadata_cache
+from .metadata_cache import metadata_cache_print, metadata_cache_stats_print
+
+from .metadata_stream import METADATA_STREAM, MetadataStream, MetadataReader
+from .metadata_stream import metadata_stream_exists
 
 from .constants import TEXT_COLOR_MAP, STANDARD_COLORS, LOGO_COLORS, TREND_COLORS
 from .constants import EXEMPT_METRICS, PRINT_CONSTANTS, INDICATOR_NAMES
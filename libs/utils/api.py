@@ -1,8 +1,12 @@
 import os
 import json
+import time
 import pprint
 import requests
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -16,6 +20,7 @@ from .progress_bar import ProgressBar
 from .data import download_single_fund, download_data_indexes
 from .constants import STANDARD_COLORS, INDEXES, PRINT_CONSTANTS
 from .plotting import generic_plotting
+from .metadata_cache import METADATA_CACHE
 
 """
     Utilizes advanced api calls of 'yfinance==0.1.50' as of 2019-11-21
@@ -29,6 +34,65 @@ VQ_DEEP_ANALYSIS_PARAM = "get-tmc-data/"
 
 TRADESTOPS_URL = "https://tradestops.com/investment-calculator/"
 
+# Seconds allowed for each metadata endpoint ('fundamentals' is the one yfinance page scrape
+# behind info, financials, balance sheet, cashflow, earnings and recommendations)
+METADATA_TIMEOUTS = {
+    "fundamentals": 30.0,
+    "dividends": 15.0,
+    "vq_values": 5.0,
+    "vq_lookup": 5.0,
+    "vq_analysis": 10.0
+}
+METADATA_WORKERS = 8
+
+
+
+class MetadataRequestError(Exception):
+    """MetadataRequestError
+
+    Raised by the metadata getters when called with 'strict': a request failed, so the result
+    must not be cached. 'value' is what the getter returns without 'strict' (a partial result or
+    the empty fallback) and 'failed' the metadata keys it holds no genuine data for.
+
+    Arguments:
+        Exception {} -- n/a
+    """
+
+    def __init__(self, message: str, value, failed: list):
+        super().__init__(message)
+        self.value = value
+        self.failed = failed
+
+
+def request_failed(message: str, value, failed: list, strict: bool = False):
+    """Request Failed
+
+    Arguments:
+        message {str} -- failure description
+        value {any} -- the getter's result without 'strict'
+        failed {list} -- metadata keys without genuine data
+
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError instead of returning 'value' (default: {False})
+
+    Returns:
+        any -- 'value'
+    """
+    if strict:
+        raise MetadataRequestError(message, value, failed)
+    return value
+
+
+# Metadata keys filled by the 'fundamentals' endpoint, per 'function' of 'get_api_metadata'
+FUNDAMENTALS_KEYS = {
+    "all": ['info', 'financials', 'balance_sheet', 'cashflow', 'earnings', 'recommendations'],
+    "info": ['info'],
+    "financials": ['financials'],
+    "balance": ['balance_sheet'],
+    "recommendations": ['recommendations'],
+    "volatility": []
+}
+
 WARNING = STANDARD_COLORS["warning"]
 FUND = STANDARD_COLORS["ticker"]
 NORMAL = STANDARD_COLORS["normal"]
@@ -48,6 +112,9 @@ def get_api_metadata(fund_ticker: str, **kwargs) -> dict:
         data {pd.DataFrame} -- dataset, primarily for VQ (default: {None})
         plot_output {bool} -- 'Ratings by Firms' (default: {False})
         function {str} -- specific metadata functions (default: {'all'})
+        fetcher {MetadataFetcher} -- fetcher the fund was submitted to, e.g. by
+                                     'fetch_api_metadata' (default: {None}, fetched here)
+        fetched {dict} -- metadata already fetched, e.g. by 'FundPrefetcher' (default: {None})
 
     Returns:
         dict -- contains all financial metadata available
@@ -57,49 +124,38 @@ def get_api_metadata(fund_ticker: str, **kwargs) -> dict:
     dataset = kwargs.get('data')
     plot_output = kwargs.get('plot_output', False)
     function = kwargs.get('function', 'all')
+    fetcher = kwargs.get('fetcher')
+    fetched = kwargs.get('fetched')
 
     fund_ticker_cleansed = INDEXES.get(fund_ticker, fund_ticker)
     api_print = f"\r\nFetching API metadata for {FUND}{fund_ticker_cleansed}{NORMAL}..."
     print(api_print)
 
-    metadata = {}
-    ticker = yf.Ticker(fund_ticker)
-    if pb is not None:
-        pb.uptick(increment=0.2)
-
-    st_tick = styf.Ticker(fund_ticker)
-    if pb is not None:
-        pb.uptick(increment=0.3)
-
-    if function == 'all':
-        metadata['dividends'] = AVAILABLE_KEYS.get('dividends')(ticker)
+    if fetched is None:
+        # All endpoints of the fund are requested at once
+        own_fetcher = fetcher is None or not fetcher.submitted(fund_ticker)
+        if own_fetcher:
+            fetcher = MetadataFetcher()
+            fetcher.submit(fund_ticker, function=function,
+                           max_close=max_close, data=dataset)
 
-    if function == 'all' or function == 'info':
-        metadata['info'] = AVAILABLE_KEYS.get('info')(
-            ticker, st_tick, force_holdings=False)
+        fetched = fetcher.result(fund_ticker)
+        if own_fetcher:
+            fetcher.close()
 
     if pb is not None:
-        pb.uptick(increment=0.2)
+        pb.uptick(increment=0.5)
 
-    if function == 'all' or function == 'financials':
-        metadata['financials'] = AVAILABLE_KEYS.get(
-            'financials')(ticker, st_tick)
-
-    if function == 'all' or function == 'balance':
-        metadata['balance_sheet'] = AVAILABLE_KEYS.get(
-            'balance')(ticker, st_tick)
+    metadata = {}
+    for key in ('dividends', 'info', 'financials', 'balance_sheet', 'cashflow', 'earnings',
+                'recommendations'):
+        if key in fetched:
+            metadata[key] = fetched[key]
 
     if pb is not None:
-        pb.uptick(increment=0.1)
-
-    if function == 'all':
-        metadata['cashflow'] = AVAILABLE_KEYS.get('cashflow')(ticker, st_tick)
-        metadata['earnings'] = AVAILABLE_KEYS.get('earnings')(ticker, st_tick)
-
-    if function == 'all' or function == 'recommendations':
-        metadata['recommendations'] = AVAILABLE_KEYS.get(
-            'recommendations')(ticker, st_tick)
+        pb.uptick(increment=0.3)
 
+    if 'recommendations' in metadata:
         metadata['recommendations']['tabular'] = calculate_recommendation_curve(
             metadata['recommendations'], plot_output=plot_output, name=fund_ticker)
 
@@ -109,9 +165,8 @@ def get_api_metadata(fund_ticker: str, **kwargs) -> dict:
         if pb is not None:
             pb.uptick(increment=0.1)
 
-    if function == 'all' or function == 'volatility':
-        metadata['volatility'] = get_volatility(
-            fund_ticker, max_close=max_close, data=dataset)
+    if 'volatility' in fetched:
+        metadata['volatility'] = fetched['volatility']
         if pb is not None:
             pb.uptick(increment=0.1)
 
@@ -124,7 +179,296 @@ def get_api_metadata(fund_ticker: str, **kwargs) -> dict:
     return metadata
 
 
-def get_dividends(ticker, symbol=None):
+def fetch_api_metadata(funds: list, **kwargs):
+    """Fetch API Metadata
+
+    Submits the metadata requests of many funds to one fetcher, so they are fetched in
+    parallel. Pass the returned fetcher to 'get_api_metadata' (as 'fetcher') for each fund.
+
+    Arguments:
+        funds {list} -- fund tickers
+
+    Optional Args:
+        dataset {dict} -- {ticker: pd.DataFrame}, for VQ (default: {None})
+        function {str} -- specific metadata functions (default: {'all'})
+        workers {int} -- concurrent requests (default: {METADATA_WORKERS})
+        timeouts {dict} -- per-endpoint timeouts, see METADATA_TIMEOUTS (default: {None})
+
+    Returns:
+        MetadataFetcher -- fetcher holding the in-flight requests
+    """
+    dataset = kwargs.get('dataset')
+    function = kwargs.get('function', 'all')
+
+    fetcher = MetadataFetcher(workers=kwargs.get('workers', METADATA_WORKERS),
+                              timeouts=kwargs.get('timeouts'))
+    for fund in funds:
+        data = None
+        max_close = None
+        if dataset is not None and fund in dataset:
+            data = dataset[fund]
+            max_close = max(data['Close'])
+        fetcher.submit(fund, function=function, max_close=max_close, data=data)
+    return fetcher
+
+
+class MetadataFetcher(object):
+    """MetadataFetcher
+
+    Thread pool for the metadata endpoints of funds (yfinance fundamentals, dividends, Volatility
+    Quotient). Every endpoint of every submitted fund is in flight at once; each endpoint has its
+    own timeout, after which its empty result is used. VQ requests share a pooled HTTP session.
+    Endpoints fresh in the metadata cache are not requested; stale ones are served from the cache
+    while they are refreshed in the background.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Optional Args:
+            workers {int} -- concurrent requests (default: {METADATA_WORKERS})
+            timeouts {dict} -- per-endpoint timeouts, merged into METADATA_TIMEOUTS
+                               (default: {None})
+            session {requests.Session} -- HTTP session for VQ (default: {pooled 'http_session'})
+            vq_url {str} -- VQ API base url, e.g. a local stub server (default: {VQ_API_BASE_URL})
+            cache {MetadataCache} -- None to always request (default: {METADATA_CACHE})
+        """
+        self.workers = kwargs.get('workers', METADATA_WORKERS)
+        self.timeouts = dict(METADATA_TIMEOUTS)
+        self.timeouts.update(kwargs.get('timeouts') or {})
+        self.session = kwargs.get('session')
+        if self.session is None:
+            self.session = http_session(self.workers)
+        self.vq_url = kwargs.get('vq_url', VQ_API_BASE_URL)
+        self.cache = kwargs.get('cache', METADATA_CACHE)
+
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        # fund: {endpoint: {'future', 'started', 'timeout', 'keys', 'cached'}}
+        self.pending = {}
+
+    def submit(self, fund_ticker: str, **kwargs):
+        """Submit
+
+        Arguments:
+            fund_ticker {str} -- fund name
+
+        Optional Args:
+            function {str} -- specific metadata functions (default: {'all'})
+            max_close {float} -- max close for a period, for VQ (default: {None})
+            data {pd.DataFrame} -- dataset, for VQ (default: {None})
+        """
+        function = kwargs.get('function', 'all')
+        max_close = kwargs.get('max_close')
+        dataset = kwargs.get('data')
+
+        endpoints = {}
+
+        keys = FUNDAMENTALS_KEYS.get(function, [])
+        if len(keys) > 0:
+            endpoints['fundamentals'] = self.submit_endpoint(
+                fund_ticker, 'fundamentals', keys, get_fundamentals, fund_ticker, keys,
+                strict=True)
+
+        if function == 'all':
+            endpoints['dividends'] = self.submit_endpoint(
+                fund_ticker, 'dividends', ['dividends'], get_dividends, None,
+                symbol=fund_ticker, strict=True)
+
+        if function in ('all', 'volatility'):
+            endpoints['volatility'] = self.submit_endpoint(
+                fund_ticker, 'volatility', ['volatility'], get_volatility, fund_ticker,
+                max_close=max_close,
+                data=dataset, session=self.session, timeouts=self.timeouts,
+                base_url=self.vq_url, strict=True)
+
+        self.pending[fund_ticker] = endpoints
+
+    def submit_endpoint(self, fund_ticker: str, endpoint: str, keys: list, function, *args,
+                        **kwargs) -> dict:
+        """ Queues one endpoint unless cached; its timeout runs from when a worker starts it """
+        state, cached = 'missing', None
+        if self.cache is not None:
+            state, cached = self.cache.lookup(fund_ticker, keys)
+
+        timeout = self.timeouts.get(endpoint)
+        if endpoint == 'volatility':
+            timeout = self.timeouts['vq_values'] + self.timeouts['vq_lookup'] + \
+                self.timeouts['vq_analysis']
+
+        started = {}
+        item = {"future": None, "started": started, "timeout": timeout, "keys": keys,
+                "cached": cached}
+        if state == 'fresh':
+            return item
+
+        def timed_call():
+            started['time'] = time.time()
+            return function(*args, **kwargs)
+
+        item['future'] = self.executor.submit(timed_call)
+        if state == 'stale':
+            # Served from the cache now; the cache is updated when the refresh completes
+            item['future'].add_done_callback(
+                lambda future: self.refreshed(fund_ticker, endpoint, keys, future))
+        return item
+
+    def refreshed(self, fund_ticker: str, endpoint: str, keys: list, future):
+        """ Stores a completed background refresh in the cache """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if isinstance(error, MetadataRequestError):
+            self.store(fund_ticker, endpoint, keys, error.value, failed=error.failed)
+        elif error is None:
+            self.store(fund_ticker, endpoint, keys, future.result())
+
+    def store(self, fund_ticker: str, endpoint: str, keys: list, value, failed: list = None):
+        """ Caches an endpoint's genuine results: keys of a failed request ('failed', from
+        MetadataRequestError) are skipped, while an empty result (e.g. a fund without dividends)
+        is cached like any other """
+        if self.cache is None or value is None:
+            return
+        if endpoint != 'fundamentals':
+            value = {endpoint: value}
+        value = {key: key_value for key, key_value in value.items()
+                 if key not in (failed or [])}
+        if len(value) > 0:
+            self.cache.put(fund_ticker, value)
+
+    def submitted(self, fund_ticker: str) -> bool:
+        """ True if the fund's requests were submitted and not yet collected """
+        return fund_ticker in self.pending
+
+    def result(self, fund_ticker: str) -> dict:
+        """Result
+
+        Waits for the fund's endpoints (each up to its timeout, once started).
+
+        Arguments:
+            fund_ticker {str} -- fund name
+
+        Returns:
+            dict -- fetched metadata by key (empty results for failed or timed out endpoints)
+        """
+        fetched = {}
+        for endpoint, item in self.pending.pop(fund_ticker, {}).items():
+            if item['cached'] is not None:
+                fetched.update(item['cached'])
+                continue
+
+            failed = []
+            try:
+                value = wait_endpoint(item['future'], item['started'], item['timeout'])
+            except MetadataRequestError as exc:
+                print(f"{WARNING}Warning: '{endpoint}' metadata of {fund_ticker} failed: " +
+                      f"{exc}{NORMAL}")
+                value, failed = exc.value, exc.failed
+            except FutureTimeoutError:
+                print(f"{WARNING}Warning: '{endpoint}' metadata of {fund_ticker} timed out." +
+                      f"{NORMAL}")
+                item['future'].cancel()
+                value = None
+            except Exception as exc:
+                print(f"{WARNING}Warning: '{endpoint}' metadata of {fund_ticker} failed: " +
+                      f"{exc}{NORMAL}")
+                value = None
+
+            if value is None:
+                value = {key: EMPTY_METADATA[key]() for key in item['keys']}
+            else:
+                self.store(fund_ticker, endpoint, item['keys'], value, failed=failed)
+                if endpoint != 'fundamentals':
+                    value = {endpoint: value}
+            fetched.update(value)
+
+        return fetched
+
+    def close(self):
+        """ Shuts down the pool without waiting for requests that timed out """
+        self.executor.shutdown(wait=False)
+
+
+def wait_endpoint(future, started: dict, timeout: float):
+    """ Result of a queued endpoint, raising FutureTimeoutError 'timeout' seconds after it started """
+    while True:
+        start = started.get('time')
+        remaining = 0.1
+        if start is not None:
+            remaining = max(start + timeout - time.time(), 0.0)
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            if start is not None:
+                raise
+
+
+def get_fundamentals(fund_ticker: str, keys: list, strict: bool = False) -> dict:
+    """Get Fundamentals
+
+    Metadata served by yfinance's one page scrape per ticker, read in sequence from the same
+    Ticker objects so the page is only requested once
+
+    Arguments:
+        fund_ticker {str} -- fund name
+        keys {list} -- metadata keys (see FUNDAMENTALS_KEYS)
+
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError, holding all keys, if any key failed
+                         (default: {False})
+
+    Returns:
+        dict -- metadata by key
+    """
+    ticker = yf.Ticker(fund_ticker)
+    st_tick = styf.Ticker(fund_ticker)
+
+    fundamentals = {}
+    errors = []
+    for key in keys:
+        try:
+            if key == 'info':
+                fundamentals[key] = get_info(
+                    ticker, st_tick, force_holdings=False, strict=strict)
+            elif key == 'balance_sheet':
+                fundamentals[key] = get_balance_sheet(ticker, st_tick, strict=strict)
+            else:
+                fundamentals[key] = AVAILABLE_KEYS.get(key)(ticker, st_tick, strict=strict)
+        except MetadataRequestError as exc:
+            fundamentals[key] = exc.value
+            errors.append(exc)
+
+    if len(errors) > 0:
+        raise MetadataRequestError("; ".join([str(exc) for exc in errors]), fundamentals,
+                                   [key for exc in errors for key in exc.failed])
+    return fundamentals
+
+
+def http_session(pool_size: int = METADATA_WORKERS) -> requests.Session:
+    """HTTP Session
+
+    Arguments:
+        pool_size {int} -- connections kept per host (default: {METADATA_WORKERS})
+
+    Returns:
+        requests.Session -- shared session with a connection pool of at least 'pool_size'
+    """
+    if HTTP_SESSION.get('pool_size', 0) < pool_size:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        HTTP_SESSION['session'] = session
+        HTTP_SESSION['pool_size'] = pool_size
+    return HTTP_SESSION['session']
+
+
+HTTP_SESSION = {}
+
+
+def get_dividends(ticker, symbol=None, strict=False):
     """Get Dividends
 
     Will run yfinance API if ticker is None and symbol is not None 
@@ -134,6 +478,7 @@ def get_dividends(ticker, symbol=None):
 
     Keyword Arguments:
         symbol {str} -- ticker symbol (default: {None})
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
 
     Returns:
         dict -- dividend data object
@@ -146,13 +491,13 @@ def get_dividends(ticker, symbol=None):
         t = ticker.dividends
         div['dates'] = [date.strftime("%Y-%m-%d") for date in t.keys()]
         div['dividends'] = [t[date] for date in t.keys()]
-    except:
-        div['dividends'] = []
-        div['dates'] = []
+    except Exception as exc:
+        div = request_failed(f"dividends: {exc}", {'dividends': [], 'dates': []},
+                             ['dividends'], strict=strict)
     return div
 
 
-def get_info(ticker, st, force_holdings=False):
+def get_info(ticker, st, force_holdings=False, strict=False):
     """Get Info
 
     Arguments:
@@ -161,6 +506,7 @@ def get_info(ticker, st, force_holdings=False):
 
     Keyword Arguments:
         force_holdings {bool} -- only try old version (default: {False})
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
 
     Returns:
         dict -- fund info data object
@@ -168,26 +514,29 @@ def get_info(ticker, st, force_holdings=False):
     if force_holdings:
         try:
             info = st.info
-        except:
-            info = dict()
+        except Exception as exc:
+            info = request_failed(f"info: {exc}", dict(), ['info'], strict=strict)
     else:
         try:
             info = ticker.info
         except:
             try:
                 info = st.info
-            except:
-                info = dict()
+            except Exception as exc:
+                info = request_failed(f"info: {exc}", dict(), ['info'], strict=strict)
     return info
 
 
-def get_financials(ticker, st):
+def get_financials(ticker, st, strict=False):
     """Get Financials
 
     Arguments:
         ticker {yf-object} -- yfinance data object
         st {yf-object} -- ticker object from yfinance (0.1.50)
 
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
+
     Returns:
         dict -- finance data object
     """
@@ -201,19 +550,22 @@ def get_financials(ticker, st):
             t = st.financials
             fin = {index: list(row) for index, row in t.iterrows()}
             fin['dates'] = [col.strftime('%Y-%m-%d') for col in t.columns]
-        except:
-            fin = dict()
+        except Exception as exc:
+            fin = request_failed(f"financials: {exc}", dict(), ['financials'], strict=strict)
 
     return fin
 
 
-def get_balance_sheet(ticker, st):
+def get_balance_sheet(ticker, st, strict=False):
     """Get Balance Sheet
 
     Arguments:
         ticker {yf-object} -- yfinance data object
         st {yf-object} -- ticker object from yfinance (0.1.50)
 
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
+
     Returns:
         dict -- Balance Sheet data object
     """
@@ -227,19 +579,22 @@ def get_balance_sheet(ticker, st):
             t = st.balance_sheet
             bal = {index: list(row) for index, row in t.iterrows()}
             bal['dates'] = [col.strftime('%Y-%m-%d') for col in t.columns]
-        except:
-            bal = dict()
+        except Exception as exc:
+            bal = request_failed(f"balance_sheet: {exc}", dict(), ['balance_sheet'], strict=strict)
 
     return bal
 
 
-def get_cashflow(ticker, st):
+def get_cashflow(ticker, st, strict=False):
     """Get Cashflow
 
     Arguments:
         ticker {yf-object} -- yfinance data object
         st {yf-object} -- ticker object from yfinance (0.1.50)
 
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
+
     Returns:
         dict -- Cashflow data object
     """
@@ -253,19 +608,22 @@ def get_cashflow(ticker, st):
             t = st.balance_sheet
             cash = {index: list(row) for index, row in t.iterrows()}
             cash['dates'] = [col.strftime('%Y-%m-%d') for col in t.columns]
-        except:
-            cash = dict()
+        except Exception as exc:
+            cash = request_failed(f"cashflow: {exc}", dict(), ['cashflow'], strict=strict)
 
     return cash
 
 
-def get_earnings(ticker, st):
+def get_earnings(ticker, st, strict=False):
     """Get Earnings
 
     Arguments:
         ticker {yf-object} -- yfinance data object
         st {yf-object} -- ticker object from yfinance (0.1.50)
 
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
+
     Returns:
         dict -- Earnings data object
     """
@@ -299,20 +657,23 @@ def get_earnings(ticker, st):
             eq['revenue'] = [r for r in q['Revenue']]
             eq['earnings'] = [e for e in t['Earnings']]
             earn['quarterly'] = eq
-        except:
-            earn['yearly'] = {}
-            earn['quarterly'] = {}
+        except Exception as exc:
+            earn = request_failed(f"earnings: {exc}", {'yearly': {}, 'quarterly': {}},
+                                  ['earnings'], strict=strict)
 
     return earn
 
 
-def get_recommendations(ticker, st) -> dict:
+def get_recommendations(ticker, st, strict=False) -> dict:
     """Get Recommendations
 
     Arguments:
         ticker {yf-object} -- current yf Ticker object
         st {yf-object} -- ticker object from yfinance (0.1.50)
 
+    Keyword Arguments:
+        strict {bool} -- raise MetadataRequestError if the request fails (default: {False})
+
     Returns:
         dict -- Recommendations data object
     """
@@ -332,8 +693,10 @@ def get_recommendations(ticker, st) -> dict:
             recom['firms'] = [f for f in t['Firm']]
             recom['grades'] = [g for g in t['To Grade']]
             recom['actions'] = [a for a in t['Action']]
-        except:
-            recom = {'dates': [], 'firms': [], 'grades': [], 'actions': []}
+        except Exception as exc:
+            recom = request_failed(
+                f"recommendations: {exc}", {'dates': [], 'firms': [], 'grades': [], 'actions': []},
+                ['recommendations'], strict=strict)
 
     return recom
 
@@ -441,6 +804,18 @@ AVAILABLE_KEYS = {
     "altman_z": get_altman_z_score
 }
 
+# Result of each metadata key when its endpoint fails or times out (as the getters' fallbacks)
+EMPTY_METADATA = {
+    "dividends": lambda: {'dividends': [], 'dates': []},
+    "info": dict,
+    "financials": dict,
+    "balance_sheet": dict,
+    "cashflow": dict,
+    "earnings": lambda: {'yearly': {}, 'quarterly': {}},
+    "recommendations": lambda: {'dates': [], 'firms': [], 'grades': [], 'actions': []},
+    "volatility": dict
+}
+
 
 def calculate_recommendation_curve(recoms: dict, **kwargs) -> dict:
     """Calculate Recommendation Curve
@@ -586,12 +961,14 @@ def api_sector_match(sector: str, config: dict, fund_len=None, **kwargs) -> list
     Optional Args:
         period {str} -- different period than in config (default: {config['period']})
         interval {str} -- different interval than in config (default: {config['interval']})
+        out_suppress {bool} -- no fetching message (default: {False})
 
     Returns:
         list -- matched list of sector funds, data for matched list
     """
     period = kwargs.get('period', config['period'])
     interval = kwargs.get('interval', config['interval'])
+    out_suppress = kwargs.get('out_suppress', False)
 
     sector_match_file = os.path.join("resources", "sectors.json")
     if not os.path.exists(sector_match_file):
@@ -610,7 +987,8 @@ def api_sector_match(sector: str, config: dict, fund_len=None, **kwargs) -> list
             return matched, None
 
         fund_data = download_single_fund(
-            matched, config, period=period, interval=interval, fund_len=fund_len)
+            matched, config, period=period, interval=interval, fund_len=fund_len,
+            out_suppress=out_suppress)
         return matched, fund_data
 
 
@@ -655,6 +1033,53 @@ def api_sector_funds(sector_fund: str, config: dict, fund_len=None, **kwargs) ->
             indexes=matched, tickers=tickers, fund_len=fund_len, period=period, interval=interval)
         return matched, fund_data
 
+
+def api_sector_data(sector: str, fund: str, data: dict, config: dict, **kwargs) -> list:
+    """API Sector Data
+
+    Sector fund of a fund's 'info' sector and its comparison funds, with their data
+
+    Arguments:
+        sector {str} -- sector from the fund's api 'info' (None if not available)
+        fund {str} -- fund name
+        data {dict} -- data of the period's funds (for the fund's dates)
+        config {dict} -- controlling configuration dictionary
+
+    Optional Args:
+        period {str} -- (default: {config['period']})
+        interval {str} -- (default: {config['interval']})
+        out_suppress {bool} -- no fetching messages, e.g. from a background thread
+                               (default: {False})
+
+    Returns:
+        list -- matched sector fund, its data (None if already in 'data'), comparison funds,
+                their data
+    """
+    period = kwargs.get('period', config['period'])
+    interval = kwargs.get('interval', config['interval'])
+    out_suppress = kwargs.get('out_suppress', False)
+
+    if sector is None:
+        return None, None, [], {}
+
+    fund_len = {
+        'length': len(data[fund]['Close']),
+        'start': data[fund].index[0],
+        'end': data[fund].index[len(data[fund]['Close'])-1],
+        'dates': data[fund].index
+    }
+
+    match_fund, match_data = api_sector_match(
+        sector, config, fund_len=fund_len, period=period, interval=interval,
+        out_suppress=out_suppress)
+    if match_fund is None:
+        return None, None, [], {}
+
+    comp_funds, comp_data = api_sector_funds(
+        match_fund, config, fund_len=fund_len, period=period, interval=interval)
+    return match_fund, match_data, comp_funds, comp_data
+
+
 #####################################################
 
 
@@ -667,14 +1092,25 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
     Optional Args:
         max_close {float} -- highest close of a fund recently (default: {None})
         data {pd.DataFrame} -- fund dataset (default: {None})
+        session {requests.Session} -- HTTP session (default: {pooled 'http_session'})
+        timeouts {dict} -- 'vq_values', 'vq_lookup', 'vq_analysis' request timeouts
+                           (default: {METADATA_TIMEOUTS})
+        base_url {str} -- VQ API base url (default: {VQ_API_BASE_URL})
+        strict {bool} -- raise MetadataRequestError, holding the partial result, if a request
+                         fails (default: {False})
 
     Returns:
         dict -- volatility quotient data object
     """
     max_close = kwargs.get('max_close', None)
     dataset = kwargs.get('data')
+    session = kwargs.get('session')
+    timeouts = kwargs.get('timeouts', METADATA_TIMEOUTS)
+    base_url = kwargs.get('base_url', VQ_API_BASE_URL)
+    strict = kwargs.get('strict', False)
 
-    TIMEOUT = 5
+    if session is None:
+        session = http_session()
     is_SP500 = False
     vq = {}
 
@@ -694,15 +1130,13 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
                 ticker_str = 'SPY'
                 is_SP500 = True
 
-            url = f"{VQ_API_BASE_URL}{VQ_VALUES_PARAM}{key}/{ticker_str}"
+            url = f"{base_url}{VQ_VALUES_PARAM}{key}/{ticker_str}"
 
             try:
-                response = requests.get(url, timeout=TIMEOUT)
+                response = session.get(url, timeout=timeouts['vq_values'])
             except:
-                print(
-                    f"{WARNING}Exception: VQ Server failed to respond on initial VQ inquiry. " +
-                    f"No data returned.{NORMAL}\r\n")
-                return vq
+                return vq_failed("VQ Server failed to respond on initial VQ inquiry.", vq,
+                                 strict=strict)
 
             try:
                 r = response.json()
@@ -710,9 +1144,12 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
                 r = {}
 
             if response.status_code != 200:
+                message = f"Volatility Quotient failed on {ticker_str} request: " + \
+                    f"'{r.get('ErrorMessage', 'Failure.')}'. Check valid key."
+                if strict:
+                    raise MetadataRequestError(message, vq, ['volatility'])
                 print("")
-                print(f"{WARNING}Volatility Quotient failed on {ticker_str} request: " +
-                      f"'{r.get('ErrorMessage', 'Failure.')}'. Check valid key.{NORMAL}\r\n")
+                print(f"{WARNING}{message}{NORMAL}\r\n")
                 print("")
                 return vq
 
@@ -730,16 +1167,17 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
                 ratio = (100.0 - vq['VQ']) / 100.0
                 vq['stop_loss'] = np.round(ratio * vq['last_max']['Price'], 2)
 
-            url = f"{VQ_API_BASE_URL}{VQ_LOOKUP_PARAM}{key}/{ticker_str}/20"
+            url = f"{base_url}{VQ_LOOKUP_PARAM}{key}/{ticker_str}/20"
             try:
-                response = requests.get(url, timeout=TIMEOUT)
+                response = session.get(url, timeout=timeouts['vq_lookup'])
             except:
-                print(
-                    f"{WARNING}Exception: VQ Server failed to respond for ticker lookup. " +
-                    f"No data returned.{NORMAL}\r\n")
-                return vq
+                return vq_failed("VQ Server failed to respond for ticker lookup.", vq,
+                                 strict=strict)
 
             r = response.json()
+            if response.status_code != 200 and strict:
+                raise MetadataRequestError(
+                    f"VQ ticker lookup returned {response.status_code}.", vq, ['volatility'])
             if response.status_code == 200:
                 val = None
                 for tick in r.get('Symbols', []):
@@ -754,18 +1192,20 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
                     now_str = now.strftime('%Y-%m-%d')
 
                     url = \
-                        f"{VQ_API_BASE_URL}{VQ_DEEP_ANALYSIS_PARAM}{key}/{val}/{start_str}/{now_str}"
+                        f"{base_url}{VQ_DEEP_ANALYSIS_PARAM}{key}/{val}/{start_str}/{now_str}"
                     try:
-                        response = requests.get(url, timeout=TIMEOUT)
+                        response = session.get(url, timeout=timeouts['vq_analysis'])
                     except:
-                        print(
-                            f"{WARNING}Exception: VQ Server failed to respond for deep analysis. " +
-                            f"No data returned.{NORMAL}\r\n")
-                        return vq
+                        return vq_failed("VQ Server failed to respond for deep analysis.", vq,
+                                         strict=strict)
 
                     r = response.json()
                     if response.status_code == 200:
                         vq['analysis'] = r
+                    elif strict:
+                        raise MetadataRequestError(
+                            f"VQ deep analysis returned {response.status_code}.", vq,
+                            ['volatility'])
 
                     vq['stopped_out'] = vq_stop_out_check(dataset, vq)
                     status, color, _ = vq_status_print(vq, ticker_str)
@@ -776,6 +1216,14 @@ def get_volatility(ticker_str: str, **kwargs) -> dict:
     return vq
 
 
+def vq_failed(message: str, vq: dict, strict: bool = False) -> dict:
+    """ Partial VQ result of a failed request (printed, or raised with 'strict') """
+    if strict:
+        raise MetadataRequestError(message, vq, ['volatility'])
+    print(f"{WARNING}Exception: {message} No data returned.{NORMAL}\r\n")
+    return vq
+
+
 def vq_stop_out_check(dataset: pd.DataFrame, vq_obj: dict) -> str:
     """VQ Stop Out Check
 
@@ -1,9 +1,9 @@
-import math
 import pandas as pd
 import numpy as np
-import yfinance as yf
 
 from .formatting import fund_list_extractor
+from .price_store import store_download
+from .fund_frame import as_fund_frame
 from .constants import STANDARD_COLORS
 
 TICKER = STANDARD_COLORS["ticker"]
@@ -11,6 +11,8 @@ NORMAL = STANDARD_COLORS["normal"]
 ERROR = STANDARD_COLORS["error"]
 NOTE = STANDARD_COLORS["warning"]
 
+FUND_COLUMNS = ['Open', 'Close', 'High', 'Low', 'Adj Close', 'Volume']
+
 """
 period : str
     Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
@@ -51,14 +53,14 @@ def download_data_all(config: dict, **kwargs) -> list:
         if (start is not None) and (end is not None):
             print(
                 f'Fetching data for {TICKER}{ticker_print}{NORMAL} from dates {start} to {end}...')
-            data = yf.download(tickers=tickers, period=per, interval=inter,
-                               group_by='ticker', start=start, end=end)
+            data = store_download(tickers=tickers, period=per, interval=inter,
+                                  start=start, end=end)
 
         else:
             print(
                 f'Fetching data for {TICKER}{ticker_print}{NORMAL} for {per} at {inter} intervals...')
-            data = yf.download(tickers=tickers, period=per,
-                               interval=inter, group_by='ticker')
+            data = store_download(tickers=tickers, period=per,
+                                  interval=inter)
         print(" ")
 
         funds = fund_list_extractor(data, config=config)
@@ -93,12 +95,12 @@ def download_data_indexes(indexes: list, tickers: str, **kwargs) -> list:
     fund_len = kwargs.get('fund_len')
 
     if (start is not None) and (end is not None):
-        data1 = yf.download(tickers=tickers, start=start,
-                            end=end, interval=interval, group_by='ticker')
+        data1 = store_download(tickers=tickers, start=start,
+                               end=end, interval=interval)
 
     else:
-        data1 = yf.download(tickers=tickers, period=period,
-                            interval=interval, group_by='ticker')
+        data1 = store_download(tickers=tickers, period=period,
+                               interval=interval)
 
     data = data_format(data1, config=None,
                        list_of_funds=indexes, fund_len=fund_len)
@@ -135,14 +137,14 @@ def download_data(config: dict, **kwargs) -> list:
     if (start is not None) and (end is not None):
         print(
             f'Fetching data for {TICKER}{ticker_print}{NORMAL} from dates {start} to {end}...')
-        data = yf.download(tickers=tickers, period=period, interval=interval,
-                           group_by='ticker', start=start, end=end)
+        data = store_download(tickers=tickers, period=period, interval=interval,
+                              start=start, end=end)
 
     else:
         print(
             f'Fetching data for {TICKER}{ticker_print}{NORMAL} for {period} at {interval} intervals...')
-        data = yf.download(tickers=tickers, period=period,
-                           interval=interval, group_by='ticker')
+        data = store_download(tickers=tickers, period=period,
+                              interval=interval)
 
     print(" ")
 
@@ -165,6 +167,8 @@ def download_single_fund(fund: str, config: dict, fund_len=None, **kwargs) -> di
     Optional Arguments:
         start {str} -- date of starting (default: {None})
         end {str} -- date of ending (default: {None})
+        out_suppress {bool} -- no fetching message, e.g. while progress bars run
+                               (default: {False})
 
     Returns:
         dict -- [description]
@@ -174,22 +178,23 @@ def download_single_fund(fund: str, config: dict, fund_len=None, **kwargs) -> di
     ticker = fund
     start = kwargs.get('start')
     end = kwargs.get('end')
+    out_suppress = kwargs.get('out_suppress', False)
 
-    if (start is not None) and (end is not None):
+    if not out_suppress:
         print("")
         print(
             f'Fetching sector data for {TICKER}{ticker}{NORMAL}...')
-        data = yf.download(tickers=ticker, period=period, interval=interval,
-                           group_by='ticker', start=start, end=end)
+
+    if (start is not None) and (end is not None):
+        data = store_download(tickers=ticker, period=period, interval=interval,
+                              start=start, end=end)
 
     else:
-        print("")
-        print(
-            f'Fetching sector data for {TICKER}{ticker}{NORMAL}...')
-        data = yf.download(tickers=ticker, period=period,
-                           interval=interval, group_by='ticker')
+        data = store_download(tickers=ticker, period=period,
+                              interval=interval)
 
-    print(" ")
+    if not out_suppress:
+        print(" ")
 
     data = data_format(data, config=config,
                        single_fund_name=ticker, fund_len=fund_len)
@@ -197,66 +202,12 @@ def download_single_fund(fund: str, config: dict, fund_len=None, **kwargs) -> di
     return data
 
 
-def add_status_message(status: list, new_message: str, message_index: int = None, key: str = None) -> list:
-    """Add Status Message
-
-    Adds 'new_message' to status if it isn't added already
-
-    Arguments:
-        status {list} -- list of statuses to add to
-        new_message {str} -- new message to add to status list
-
-    Keyword Arguments
-        message_index {int} -- fund index the status occurred (default: {None})
-        key {str} -- a particular key added to 'info' (default: {None})
-
-    Returns:
-        list -- status lists
-    """
-    need_to_add = True
-    for i, message in enumerate(status):
-        if new_message == message['message']:
-            status[i]['count'] += 1
-            if key is not None:
-                status[i]['info'].append({key: message_index})
-            need_to_add = False
-
-    if need_to_add:
-        if key is not None:
-            status.append({'message': new_message, 'count': 1,
-                           'info': [{key: message_index}]})
-        else:
-            status.append({'message': new_message, 'count': 1, 'info': []})
-
-    return status
-
-
-def get_status_message(status: list) -> str:
-    """Get Status Message
-
-    Arguments:
-        status {list} -- status list
-
-    Returns:
-        str -- concatenated message and info
-    """
-    message = ''
-    info = ''
-    for i, item in enumerate(status):
-        message += f"{item['message']} ({item['count']})"
-        info += f"{item['info']}"
-
-        if i < len(status)-1:
-            message += ', '
-            info += ', '
-
-    return message, info
-
-
 def data_format(data: pd.DataFrame, config: dict, **kwargs) -> dict:
     """Data Format
 
-    Aligns data in a more accessible way (dict of pd.DataFrames)
+    Aligns data in a more accessible way (dict of pd.DataFrames). All funds are reindexed onto one
+    trading calendar and their NaNs repaired in a single pass; the repair report is stored in
+    config['nan_report'] (by fund), when a config is given.
 
     Arguments:
         data {pd.DataFrame} -- entire historical data of all funds
@@ -274,242 +225,173 @@ def data_format(data: pd.DataFrame, config: dict, **kwargs) -> dict:
     single_fund_name = kwargs.get('single_fund_name')
     fund_len = kwargs.get('fund_len')
 
-    data_dict = {}
     fund_keys = list_of_funds
     if list_of_funds is None:
         if single_fund_name is None:
             fund_keys = fund_list_extractor(data, config=config)
         else:
             fund_keys = [single_fund_name]
-    dates = data.index
+
+    calendar = trading_calendar(data.index, fund_len=fund_len)
 
     if 'Open' in data.keys():
         # Singular fund case
-        df_dict = {}
-        df_dict['Date'] = filter_date(dates.copy(), fund_len=fund_len)
-        df_dict['Open'] = filter_nan(data['Open'].copy(
-        ), column_key='Open', fund_len=fund_len)
-        df_dict['Close'] = filter_nan(
-            data['Close'].copy(), column_key='Close', fund_len=fund_len)
-        df_dict['High'] = filter_nan(
-            data['High'].copy(), column_key='High', fund_len=fund_len)
-        df_dict['Low'] = filter_nan(
-            data['Low'].copy(), column_key='Low', fund_len=fund_len)
-        df_dict['Adj Close'] = filter_nan(
-            data['Adj Close'].copy(), column_key='Adj Close', fund_len=fund_len)
-        df_dict['Volume'] = filter_nan(
-            data['Volume'].copy(), fund_name=fund_keys[0], column_key='Volume', fund_len=fund_len)
-
-        df = pd.DataFrame.from_dict(df_dict)
-        df = df.set_index('Date')
-
-        data_dict[fund_keys[0]] = df.copy()
-
+        fund_keys = fund_keys[:1]
+        columns = FUND_COLUMNS
     else:
-        for fund in fund_keys:
-            df_dict = {}
-            df_dict['Date'] = filter_date(dates.copy(), fund_len=fund_len)
-            df_dict['Open'] = filter_nan(data[fund]['Open'].copy(
-            ), fund_name=fund, column_key='Open', fund_len=fund_len)
-            df_dict['Close'] = filter_nan(
-                data[fund]['Close'].copy(), column_key='Close', fund_len=fund_len)
-            df_dict['High'] = filter_nan(
-                data[fund]['High'].copy(), column_key='High', fund_len=fund_len)
-            df_dict['Low'] = filter_nan(
-                data[fund]['Low'].copy(), column_key='Low', fund_len=fund_len)
-            df_dict['Adj Close'] = filter_nan(
-                data[fund]['Adj Close'].copy(), column_key='Adj Close', fund_len=fund_len)
-            df_dict['Volume'] = filter_nan(
-                data[fund]['Volume'].copy(), column_key='Volume', fund_len=fund_len)
-
-            df = pd.DataFrame.from_dict(df_dict)
-            df = df.set_index('Date')
-
-            data_dict[fund] = df.copy()
+        columns = pd.MultiIndex.from_product([fund_keys, FUND_COLUMNS])
 
-    return data_dict
+    # One reindex for every fund and column; missing dates / columns come back as NaN
+    values = data.reindex(index=calendar, columns=columns).to_numpy(
+        dtype=np.float64)
+    values, repairs = filter_nan(values)
+
+    data_dict = {}
+    report = {}
+    width = len(FUND_COLUMNS)
+    for i, fund in enumerate(fund_keys):
+        df = pd.DataFrame(values[:, i * width:(i + 1) * width],
+                          index=calendar, columns=FUND_COLUMNS)
+        data_dict[fund] = df
+        as_fund_frame(df)
+
+        fund_repairs = {FUND_COLUMNS[j - i * width]: repairs[j]
+                        for j in range(i * width, (i + 1) * width) if j in repairs}
+        if len(fund_repairs) > 0:
+            report[fund] = nan_report_entry(fund_repairs)
+
+    if len(report) > 0:
+        if config is not None:
+            config.setdefault('nan_report', {}).update(report)
+        nan_report_summary(report)
 
+    return data_dict
 
-def filter_nan(frame_list: pd.DataFrame, **kwargs) -> list:
-    """Filter NaN
 
-    Removes "not a number" (NaN) values from fund if possible, usually due to a yfinance error.
+def trading_calendar(dates: pd.DatetimeIndex, fund_len: dict = None) -> pd.DatetimeIndex:
+    """Trading Calendar
 
     Arguments:
-        frame_list {pd.DataFrame} -- fund dataset to cleanse, if needed
+        dates {pd.DatetimeIndex} -- dates of the downloaded dataset
 
-    Optional Args:
-        fund_name {str} -- name of fund (default: {None})
-        column_key {str} -- name of column (default: {None})
-        fund_len {dict} -- length of desired list (default: {None})
+    Keyword Arguments:
+        fund_len {dict} -- 'length' and 'dates' of a reference fund to align to (default: {None})
 
     Returns:
-        list -- newly, cleansed dataframe column
+        pd.DatetimeIndex -- sorted union of 'dates' and the reference dates, if lengths differ
     """
-    fund_name = kwargs.get('fund_name')
-    column_key = kwargs.get('column_key')
-    fund_len = kwargs.get('fund_len')
+    dates = pd.DatetimeIndex(dates)
+    if (fund_len is not None) and (len(dates) != fund_len['length']):
+        dates = dates.union(pd.DatetimeIndex(fund_len['dates']))
+    dates.name = 'Date'
+    return dates
 
-    new_list = list(frame_list.copy())
-    nans = list(np.where(pd.isna(frame_list) == True))[0]
-
-    corrected = False
-    status = []
-
-    if fund_len is not None:
-        if len(new_list) != fund_len['length']:
-            if frame_list.index[0] != fund_len['start']:
-                newer_list = [float('NaN')]
-                newer_list.extend(new_list)
-                new_list = newer_list.copy()
-                nans = insert_into_sorted_nans(nans, 0)
-
-            elif frame_list.index[len(frame_list)-1] != fund_len['end']:
-                new_list.append(float('NaN'))
-                nans = insert_into_sorted_nans(nans, len(frame_list)-1)
-
-            else:
-                newer_list = []
-                f_count = 0
-                d_count = 0
-
-                while (d_count < len(fund_len['dates'])) and (f_count < len(frame_list.index)):
-                    if fund_len['dates'][d_count] == frame_list.index[f_count]:
-                        newer_list.append(frame_list[f_count])
-                        f_count += 1
-                        d_count += 1
-
-                    elif fund_len['dates'][d_count] < frame_list.index[f_count]:
-                        newer_list.append(float('NaN'))
-                        nans = insert_into_sorted_nans(nans, d_count)
-                        d_count += 1
-
-                    else:
-                        newer_list.append(frame_list[f_count])
-                        f_count += 1
-
-                new_list = newer_list.copy()
-
-    if len(nans) > 0:
-        corrected = True
-        for na in nans:
-
-            if (na == 0) and (not math.isnan(new_list[na+1])):
-                status = add_status_message(status, 'Row-0 nan')
-                new_list[na] = new_list[na+1]
-
-            elif (na != 0) and (na != len(new_list)-1) and (not math.isnan(new_list[na-1]) and
-                                                            (not math.isnan(new_list[na+1]))):
-                status = add_status_message(status, 'Row-inner nan')
-                new_list[na] = np.round(
-                    np.mean([new_list[na-1], new_list[na+1]]), 2)
-
-            elif (na == len(new_list)-1) and (not math.isnan(new_list[na-1])):
-                status = add_status_message(status, 'Mutual Fund nan')
-                new_list[na] = new_list[na-1]
-
-            elif not math.isnan(new_list[na-1]):
-                # More general case than above, different error.
-                status = add_status_message(
-                    status, 'Generic progression nan', na, column_key)
-                new_list[na] = new_list[na-1]
-
-            elif (na < len(new_list)-2) and (not math.isnan(new_list[na+1])):
-                status = add_status_message(
-                    status, 'Generic progression nan', na, column_key)
-                new_list[na] = new_list[na+1]
-
-            else:
-                status = add_status_message(
-                    status, 'Unknown/unfixable nan', na, column_key)
-
-    if corrected and (fund_name is not None):
-        message, info = get_status_message(status)
-        if 'Unknown/unfixable nan' in message:
-            print(
-                f"{ERROR}WARNING: 'NaN' found on {fund_name}. Type: '{message}': " +
-                f"Correction FAILED.")
-            print(f"----> Content: {info}{NORMAL}")
 
-        elif 'Generic progression nan' in message:
-            print(
-                f"{NOTE}Note: 'NaN' found on {fund_name}. Type: '{message}': Corrected OK.")
-            print(f"----> Content: {info}{NORMAL}")
-
-        else:
-            print(
-                f"{NOTE}Note: 'NaN' found on {fund_name} data. Type: '{message}': " +
-                f"Corrected OK.{NORMAL}")
-
-    return new_list
+def filter_nan(values: np.ndarray, **kwargs) -> list:
+    """Filter NaN
 
+    Removes "not a number" (NaN) values from fund columns if possible, usually due to a yfinance
+    error. Each column is repaired independently:
 
-def filter_date(dates, fund_len: dict = None):
-    """Filter Date
+        'Row-0 nan' -- first row, copied from the next row
+        'Row-inner nan' -- single gap, neighbor average (rounded to 2 places)
+        'Mutual Fund nan' -- last row, copied from the previous row
+        'Generic progression nan' -- runs of gaps, forward-filled (back-filled when leading)
+        'Unknown/unfixable nan' -- column has no valid values, left as NaN
 
     Arguments:
-        dates {list, pd.DataFrame} -- dates of a dataframe or list
+        values {np.ndarray} -- column (1-D) or columns (2-D, rows are dates) to cleanse
 
-    Keyword Arguments:
-        fund_len {dict} -- desired length of date (default: {None})
+    Optional Args:
+        column_keys {list} -- names used as keys of the report (default: {column numbers})
 
     Returns:
-        list -- list of cleansed dates
+        list -- cleansed copy of 'values', report {column: {repair type: [row indexes]}}
     """
-    if fund_len is not None:
-        if len(dates) != fund_len['length']:
-            if dates[0] != fund_len['start']:
-                newer_list = [fund_len['start']]
-                newer_list.extend(dates)
-                dates = newer_list.copy()
-
-            elif dates[len(dates)-1] != fund_len['end']:
-                dates.append(fund_len['end'])
-
-            else:
-                newer_list = []
-                f_count = 0
-                d_count = 0
-
-                while (d_count < len(fund_len['dates'])) and (f_count < len(dates)):
-                    if fund_len['dates'][d_count] == dates[f_count]:
-                        newer_list.append(dates[f_count])
-                        f_count += 1
-                        d_count += 1
+    column_keys = kwargs.get('column_keys')
+
+    values = np.array(values, dtype=np.float64)
+    is_1d = (values.ndim == 1)
+    if is_1d:
+        values = values.reshape(-1, 1)
+    if column_keys is None:
+        column_keys = list(range(values.shape[1]))
+
+    nans = np.isnan(values)
+    if not nans.any():
+        return (values[:, 0] if is_1d else values), {}
+
+    length = len(values)
+    rows = np.arange(length).reshape(-1, 1)
+    cols = np.arange(values.shape[1]).reshape(1, -1)
+
+    # Nearest valid row at or before / at or after each row (-1 / length if none)
+    prev_valid = np.maximum.accumulate(np.where(nans, -1, rows), axis=0)
+    next_valid = np.minimum.accumulate(
+        np.where(nans, length, rows)[::-1], axis=0)[::-1]
+    forward = values[np.clip(prev_valid, 0, None), cols]
+    backward = values[np.clip(next_valid, None, length - 1), cols]
+
+    has_prev = nans & (prev_valid >= 0)
+    has_next = nans & (next_valid < length)
+    next_ok = np.zeros(nans.shape, dtype=bool)
+    next_ok[:-1] = ~nans[1:]
+
+    row_0 = nans & (rows == 0) & next_ok
+    inner = has_prev & next_ok & (rows > 0) & (rows < length - 1)
+    last_row = has_prev & (rows == length - 1)
+    generic = (has_prev | has_next) & ~(row_0 | inner | last_row)
+    unfixable = nans & ~(has_prev | has_next)
+
+    repaired = values.copy()
+    repaired = np.where(has_next, backward, repaired)
+    repaired = np.where(has_prev, forward, repaired)
+
+    # Single gap: average with the next row ('forward' is the previous valid row here)
+    following = np.zeros(values.shape)
+    following[:-1] = values[1:]
+    repaired = np.where(inner, np.round(
+        (forward + following) / 2.0, 2), repaired)
+
+    report = {}
+    for repair, mask in (('Row-0 nan', row_0), ('Row-inner nan', inner),
+                         ('Mutual Fund nan', last_row),
+                         ('Generic progression nan', generic),
+                         ('Unknown/unfixable nan', unfixable)):
+        for row, col in zip(*np.nonzero(mask)):
+            report.setdefault(column_keys[col], {}).setdefault(
+                repair, []).append(int(row))
+
+    return (repaired[:, 0] if is_1d else repaired), report
+
+
+def nan_report_entry(repairs: dict) -> dict:
+    """NaN Report Entry
 
-                    elif fund_len['dates'][d_count] < dates[f_count]:
-                        newer_list.append(fund_len['dates'][d_count])
-                        d_count += 1
+    Arguments:
+        repairs {dict} -- {column: {repair type: [row indexes]}} for one fund
 
-                    else:
-                        newer_list.append(dates[f_count])
-                        f_count += 1
+    Returns:
+        dict -- fund report: 'status' ('corrected' or 'failed'), 'counts', 'repairs'
+    """
+    counts = {}
+    for column in repairs:
+        for repair, rows in repairs[column].items():
+            counts[repair] = counts.get(repair, 0) + len(rows)
 
-                dates = newer_list.copy()
-    return dates.copy()
+    status = 'corrected'
+    if 'Unknown/unfixable nan' in counts:
+        status = 'failed'
 
+    return {"status": status, "counts": counts, "repairs": repairs}
 
-def insert_into_sorted_nans(nans: list, element: int) -> list:
-    """Insert into Sorted NaNs
 
-    Utilized when a missing length of fund is inserted
+def nan_report_summary(report: dict):
+    """ One line per data_format call instead of per-column prints; details stay in the report """
+    failed = [fund for fund in report if report[fund]['status'] == 'failed']
+    corrected = [fund for fund in report if report[fund]['status'] != 'failed']
 
-    Arguments:
-        nans {list} -- list of not a numbers
-        element {int} -- specific index
-
-    Returns:
-        list -- new NaN list
-    """
-    counter = 0
-    new_nans = []
-    while (counter < len(nans)) and (nans[counter] < element):
-        new_nans.append(nans[counter])
-        counter += 1
-
-    new_nans.append(element)
-    if counter != len(nans):
-        for i in range(counter, len(nans)):
-            new_nans.append(nans[i])
-
-    return new_nans
+    if len(corrected) > 0:
+        print(f"{NOTE}Note: 'NaN' values repaired on {', '.join(corrected)}.{NORMAL}")
+    if len(failed) > 0:
+        print(f"{ERROR}WARNING: 'NaN' correction FAILED on {', '.join(failed)}.{NORMAL}")
@@ -0,0 +1,143 @@
+"""
+Figure Templates
+
+Pre-built figure / axes skeletons of the saved charts ('dual_plotting', 'generic_plotting'). A
+template is built once per chart type and x-axis kind and reused between renders: its lines,
+legends, labels and titles are swapped out while the figure, Agg canvas, axes, twin axes and
+tick artists stay, so a saved chart costs its data rather than figure construction. Templates
+are not managed by pyplot; shown (not saved) charts keep using fresh pyplot figures.
+"""
+from collections import OrderedDict
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import matplotlib as mpl
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from pandas.plotting import register_matplotlib_converters
+
+TEMPLATE_MAX_ENTRIES = 8
+
+CONVERTERS = {"registered": False}
+
+
+def register_converters():
+    """ Registers the pandas date converters with matplotlib (once per process) """
+    if not CONVERTERS['registered']:
+        register_matplotlib_converters()
+        CONVERTERS['registered'] = True
+
+
+def x_units(x) -> str:
+    """X Units
+
+    Arguments:
+        x {list} -- x-value data of a chart, or a list of them
+
+    Returns:
+        str -- 'date' or 'value', None if a template cannot be shared (e.g. category strings)
+    """
+    if isinstance(x, pd.DatetimeIndex):
+        return 'date'
+    if len(x) == 0:
+        return None
+
+    first = next(iter(x))
+    if isinstance(first, (list, tuple, pd.Index, np.ndarray)):
+        units = set([x_units(sub_x) for sub_x in x])
+        if len(units) == 1:
+            return units.pop()
+        return None
+
+    if isinstance(first, (date, np.datetime64)):
+        return 'date'
+    if isinstance(first, (int, float, np.number)) and not isinstance(first, bool):
+        return 'value'
+    return None
+
+
+class FigureTemplates(object):
+    """FigureTemplates
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, max_entries: int = TEMPLATE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.templates = OrderedDict()
+        self.stats = {"built": 0, "reused": 0}
+
+    def acquire(self, kind: str, units: str) -> list:
+        """Acquire
+
+        Arguments:
+            kind {str} -- 'dual' (axes and twin y-axes) or 'generic' (single axes)
+            units {str} -- x-axis kind (see 'x_units'); the axis keeps its converter
+
+        Returns:
+            list -- fig, list of axes; cleared of the previous chart
+        """
+        key = (kind, units)
+        if key in self.templates:
+            self.templates.move_to_end(key)
+            fig, axes = self.templates[key]
+            self.reset(fig, axes)
+            self.stats['reused'] += 1
+            return fig, axes
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        axes = [fig.add_subplot()]
+        if kind == 'dual':
+            axes.append(axes[0].twinx())
+
+        self.templates[key] = [fig, axes]
+        while len(self.templates) > self.max_entries:
+            self.templates.popitem(last=False)
+        self.stats['built'] += 1
+        return fig, axes
+
+    def reset(self, fig: Figure, axes: list):
+        """ Returns a template to its freshly built state, keeping figure, axes and ticks """
+        fig.subplots_adjust(**{name: mpl.rcParams[f"figure.subplot.{name}"]
+                               for name in ['left', 'right', 'bottom', 'top']})
+
+        label_color = mpl.rcParams['axes.labelcolor']
+        tick_color = mpl.rcParams['ytick.labelcolor']
+        if tick_color == 'inherit':
+            tick_color = mpl.rcParams['ytick.color']
+
+        for ax in axes:
+            for line in list(ax.lines):
+                line.remove()
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+
+            ax.set_title('')
+            ax.set_xlabel('')
+            ax.set_ylabel('')
+            ax.yaxis.label.set_color(label_color)
+            ax.tick_params(axis='y', labelcolor=tick_color)
+            ax.grid(False)
+            # Fresh x ticks: 'plot_xaxis_disperse' hides labels of the previous chart's ticks
+            ax.xaxis.reset_ticks()
+            ax.set_prop_cycle(None)
+            ax.relim()
+            ax.autoscale(True)
+
+    def clear(self):
+        """ Drops all templates and resets the statistics """
+        self.templates = OrderedDict()
+        self.stats = {"built": 0, "reused": 0}
+
+    def summary(self) -> dict:
+        """ Built / reused counts and current size """
+        summary = dict(self.stats)
+        summary['entries'] = len(self.templates)
+        return summary
+
+
+FIGURE_TEMPLATES = FigureTemplates()
@@ -1,6 +1,7 @@
 import os
 import shutil
 import glob
+import tempfile
 
 
 def configure_temp_dir():
@@ -20,6 +21,32 @@ def remove_temp_dir():
         shutil.rmtree(out_path)
 
 
+def write_replace(path: str, write, mode: str = 'wb'):
+    """Write Replace
+
+    Writes through a temporary file of its own next to 'path', then renames it over 'path': an
+    interrupted run never leaves a truncated file, and concurrent writers of the same path
+    (e.g. worker processes) never share a temporary file.
+
+    Arguments:
+        path {str} -- file to write
+        write {function} -- f(file object), writes the contents
+
+    Keyword Arguments:
+        mode {str} -- file mode, 'wb' or 'w' (default: {'wb'})
+    """
+    handle, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, mode) as t_file:
+            write(t_file)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def create_sub_temp_dir(name: str, sub_periods=[]):
     """Create Sub Temporary Directory
 
@@ -69,6 +69,13 @@ def dates_extractor_list(df: pd.DataFrame) -> list:
         for i in range(len(df)):
             dates.append(i)
 
+    elif isinstance(df.index, pd.DatetimeIndex):
+        # Calendar day of each date (wall time, no timezone), as 'datetime' objects
+        index = df.index
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        dates = list(index.normalize().to_pydatetime())
+
     else:
         for i in range(len(df.index)):
             date = str(df.index[i])
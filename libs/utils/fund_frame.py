@@ -0,0 +1,167 @@
+"""
+FundFrame
+
+Lightweight columnar view of a fund dataset: contiguous float64 arrays for OHLCV and an int64
+(nanosecond) date index. Indexing an array element is far cheaper than a pandas Series
+'__getitem__', so per-bar loops in tools use a FundFrame instead of the DataFrame.
+"""
+import pandas as pd
+import numpy as np
+
+FRAME_COLUMNS = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Adj Close': 'adj_close',
+    'Volume': 'volume'
+}
+
+
+class FundFrame(object):
+    """FundFrame
+
+    Columns are read like a DataFrame's (frame['Close'][i]); 'index' is a pd.DatetimeIndex built
+    on first use.
+
+    Arguments:
+        object {} -- n/a
+    """
+    __slots__ = ('open', 'high', 'low', 'close',
+                 'adj_close', 'volume', 'dates', '_index', '_source')
+
+    def __init__(self, columns: dict, dates: np.ndarray):
+        length = len(dates)
+        for key, attr in FRAME_COLUMNS.items():
+            values = columns.get(key)
+            if values is None:
+                values = np.full(length, np.nan)
+            setattr(self, attr, np.ascontiguousarray(values, dtype=np.float64))
+        self.dates = np.ascontiguousarray(dates, dtype=np.int64)
+        self._index = None
+        self._source = None
+
+    @classmethod
+    def from_dataframe(cls, fund: pd.DataFrame):
+        """ Build a FundFrame from a single-fund DataFrame (DatetimeIndex) """
+        columns = {key: fund[key].to_numpy(dtype=np.float64)
+                   for key in FRAME_COLUMNS if key in fund.keys()}
+        dates = pd.DatetimeIndex(fund.index).values.astype(
+            'datetime64[ns]').astype(np.int64)
+        return cls(columns, dates)
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in FRAME_COLUMNS:
+            raise KeyError(key)
+        return getattr(self, FRAME_COLUMNS[key])
+
+    def __contains__(self, key: str) -> bool:
+        return key in FRAME_COLUMNS
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def keys(self) -> list:
+        """ Column keys, as in a DataFrame """
+        return list(FRAME_COLUMNS.keys())
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """ Dates as a pd.DatetimeIndex (built once) """
+        if self._index is None:
+            self._index = pd.DatetimeIndex(
+                self.dates.astype('datetime64[ns]'), name='Date')
+        return self._index
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """ Convert back to a DataFrame """
+        return pd.DataFrame({key: self[key] for key in FRAME_COLUMNS}, index=self.index)
+
+
+def as_fund_frame(fund) -> FundFrame:
+    """As Fund Frame
+
+    Arguments:
+        fund {pd.DataFrame, FundFrame} -- fund dataset
+
+    Returns:
+        FundFrame -- 'fund' itself, the FundFrame attached by 'data_format', or a new one
+    """
+    if isinstance(fund, FundFrame):
+        return fund
+
+    buffers = column_buffers(fund)
+    frame = fund.attrs.get('fund_frame')
+    if isinstance(frame, FundFrame) and frame_matches(frame, buffers):
+        return frame
+
+    frame = FundFrame.from_dataframe(fund)
+    frame._source = buffers
+    fund.attrs['fund_frame'] = frame
+    return frame
+
+
+def column_buffers(fund: pd.DataFrame) -> tuple:
+    """ The dataframe's own date and OHLCV arrays (views of its data, not copies) """
+    buffers = [fund.index.values]
+    buffers.extend([fund[key].to_numpy() for key in FRAME_COLUMNS if key in fund.keys()])
+    return tuple(buffers)
+
+
+def frame_matches(frame: FundFrame, buffers: tuple) -> bool:
+    """Frame Matches
+
+    An attached FundFrame is bound to the column buffers it was built from. Attrs follow copies
+    and slices (e.g. an edited 'df.copy()'), whose columns live in new buffers, so those rebuild.
+    The frame keeps its buffers alive, so their addresses cannot be reused by another dataframe.
+
+    Arguments:
+        frame {FundFrame} -- FundFrame found in a dataframe's attrs
+        buffers {tuple} -- 'column_buffers' of that dataframe
+
+    Returns:
+        bool -- True if 'frame' was built from these very buffers
+    """
+    source = frame._source
+    if source is None or len(source) != len(buffers):
+        return False
+
+    for built, current in zip(source, buffers):
+        if built.__array_interface__ != current.__array_interface__:
+            return False
+    return True
+
+
+def fund_panel(data: dict, funds: list) -> dict:
+    """Fund Panel
+
+    Stacks funds sharing one date index (e.g. the funds of a single 'data_format' call) into
+    funds x bars arrays, for indicators computed across all funds at once.
+
+    Arguments:
+        data {dict} -- {ticker: pd.DataFrame / FundFrame} of fund datasets
+        funds {list} -- tickers to stack, in row order
+
+    Returns:
+        dict -- {column: np.ndarray (funds x bars)} for each OHLCV column, plus 'dates'
+                (int64 ns) and 'funds'
+    """
+    frames = [as_fund_frame(data[fund]) for fund in funds]
+    if len(frames) == 0:
+        raise ValueError("fund_panel: no funds to stack")
+
+    dates = frames[0].dates
+    for fund, frame in zip(funds, frames):
+        if not np.array_equal(frame.dates, dates):
+            raise ValueError(
+                f"fund_panel: dates of '{fund}' differ from those of '{funds[0]}'")
+
+    panel = {key: np.vstack([frame[key] for frame in frames]) for key in FRAME_COLUMNS}
+    panel['dates'] = dates
+    panel['funds'] = list(funds)
+    return panel
+
+
+def panel_frame(panel: dict, row: int) -> FundFrame:
+    """ FundFrame of one fund (row) of a 'fund_panel' """
+    return FundFrame({key: panel[key][row] for key in FRAME_COLUMNS}, panel['dates'])
@@ -0,0 +1,227 @@
+"""
+Indicator Cache
+
+Content-addressed memoization of indicator results. Entries are keyed by a fingerprint of the
+fund's data (dates and OHLCV arrays), the indicator function and its parameters, so the same work
+on the same series (e.g. sector ETFs clustered by MCI, TCI and the per-fund run) is done once.
+Results are held in an in-memory LRU for the run and, optionally ('--cache'), in a directory of
+pickles reused across runs.
+"""
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+from copy import deepcopy
+
+from .fund_frame import as_fund_frame
+from .file_io import write_replace
+from .constants import STANDARD_COLORS
+
+NOTE = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+INDICATOR_CACHE_DIR = os.path.join("output", "indicator_cache")
+CACHE_MAX_ENTRIES = 512
+
+# Bump when an indicator's output changes so stale disk entries are not reused
+CACHE_VERSION = 1
+
+
+class IndicatorCache(object):
+    """IndicatorCache
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, cache_dir: str = None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def configure(self, **kwargs):
+        """Configure
+
+        Optional Args:
+            cache_dir {str} -- directory of persisted entries, None for memory only (default: {None})
+            max_entries {int} -- in-memory LRU size (default: {current})
+        """
+        self.cache_dir = kwargs.get('cache_dir')
+        self.max_entries = kwargs.get('max_entries', self.max_entries)
+        if self.cache_dir is not None and not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        self.evict()
+
+    def get(self, key: str) -> list:
+        """Get
+
+        Arguments:
+            key {str} -- entry key (see 'indicator_key')
+
+        Returns:
+            list -- found {bool}, copy of the cached value (None if not found)
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return True, deepcopy(self.entries[key]['value'])
+
+        path = self.entry_path(key)
+        if (path is not None) and os.path.exists(path):
+            try:
+                with open(path, 'rb') as c_file:
+                    entry = pickle.load(c_file)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                entry = None
+
+            if entry is not None:
+                self.entries[key] = entry
+                self.evict()
+                self.stats['hits'] += 1
+                self.stats['disk_hits'] += 1
+                return True, deepcopy(entry['value'])
+
+        self.stats['misses'] += 1
+        return False, None
+
+    def put(self, key: str, value, **kwargs):
+        """Put
+
+        Arguments:
+            key {str} -- entry key (see 'indicator_key')
+            value {} -- indicator result (stored as a copy)
+
+        Optional Args:
+            function {str} -- indicator function, for inspection (default: {''})
+            ticker {str} -- fund name, for inspection (default: {''})
+        """
+        entry = {
+            "value": deepcopy(value),
+            "function": kwargs.get('function', ''),
+            "ticker": kwargs.get('ticker', '')
+        }
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.evict()
+
+        path = self.entry_path(key)
+        if path is not None:
+            write_replace(path, lambda c_file: pickle.dump(
+                entry, c_file, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def evict(self):
+        """ Drops least recently used in-memory entries beyond 'max_entries' """
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def entry_path(self, key: str) -> str:
+        """ Disk path of an entry, None when the cache is memory only """
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def clear(self):
+        """ Empties the in-memory entries and resets the statistics """
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def summary(self) -> dict:
+        """ Hit / miss statistics and current size """
+        summary = dict(self.stats)
+        lookups = summary['hits'] + summary['misses']
+        summary['entries'] = len(self.entries)
+        summary['hit_rate'] = 0.0
+        if lookups > 0:
+            summary['hit_rate'] = round(float(summary['hits']) / float(lookups), 3)
+        return summary
+
+
+INDICATOR_CACHE = IndicatorCache()
+
+
+def configure_indicator_cache(config: dict):
+    """Configure Indicator Cache
+
+    Arguments:
+        config {dict} -- controlling config dictionary; '--cache' persists entries to disk
+    """
+    if 'indicator_cache' in config.get('state', ''):
+        INDICATOR_CACHE.configure(cache_dir=INDICATOR_CACHE_DIR)
+
+
+def data_fingerprint(position) -> str:
+    """Data Fingerprint
+
+    Arguments:
+        position {pd.DataFrame, FundFrame} -- fund dataset
+
+    Returns:
+        str -- hash of the fund's dates and OHLCV values
+    """
+    frame = as_fund_frame(position)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(frame.dates.tobytes())
+    for values in (frame.open, frame.high, frame.low, frame.close,
+                   frame.adj_close, frame.volume):
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def indicator_key(function: str, position, params: dict = None) -> str:
+    """Indicator Key
+
+    Arguments:
+        function {str} -- indicator function name
+        position {pd.DataFrame, FundFrame} -- fund dataset
+
+    Keyword Arguments:
+        params {dict} -- parameters that change the result (default: {None})
+
+    Returns:
+        str -- content-addressed key
+    """
+    if params is None:
+        params = {}
+    content = f"{CACHE_VERSION}|{data_fingerprint(position)}|{function}|" + \
+        repr(sorted(params.items()))
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=20).hexdigest()
+
+
+def memoize_indicator(function: str, position, compute, **kwargs) -> list:
+    """Memoize Indicator
+
+    Arguments:
+        function {str} -- indicator function name
+        position {pd.DataFrame, FundFrame} -- fund dataset
+        compute {function} -- f() -> result, called on a cache miss
+
+    Optional Args:
+        params {dict} -- parameters that change the result (default: {None})
+        ticker {str} -- fund name, kept with the entry for inspection (default: {''})
+
+    Returns:
+        list -- result, True if it was served from the cache
+    """
+    params = kwargs.get('params')
+    ticker = kwargs.get('ticker', '')
+
+    key = indicator_key(function, position, params=params)
+    found, value = INDICATOR_CACHE.get(key)
+    if found:
+        return value, True
+
+    value = compute()
+    INDICATOR_CACHE.put(key, value, function=function, ticker=ticker)
+    return value, False
+
+
+def indicator_cache_print():
+    """ One-line summary of the run's indicator cache statistics """
+    summary = INDICATOR_CACHE.summary()
+    if summary['hits'] + summary['misses'] == 0:
+        return
+    print(
+        f"{NOTE}Indicator cache: {summary['hits']} hits ({summary['disk_hits']} from disk), " +
+        f"{summary['misses']} misses, {summary['evictions']} evictions.{NORMAL}")
@@ -0,0 +1,127 @@
+"""
+Market Data Session
+
+Run-scoped source of index / sector fund data for the composite indexes (MCI, BCI, CCI, TCI).
+Each index registers the tickers and date range it needs; the session then issues one batched
+download per interval covering every ticker over the widest range, and hands each index a slice
+of it (formatted like 'download_data_indexes').
+"""
+import pandas as pd
+
+from .data import data_format
+from .price_store import store_download, get_date_range
+
+
+class MarketDataSession(object):
+    """MarketDataSession
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self):
+        # interval: {'tickers': [], 'start': datetime, 'end': datetime}
+        self.requests = {}
+        # interval: {'data': pd.DataFrame, 'tickers': [], 'start': datetime, 'end': datetime}
+        self.fetched = {}
+        self.fetch_count = 0
+
+    def request(self, tickers, **kwargs):
+        """Request
+
+        Registers tickers and a date range for the next batched fetch.
+
+        Arguments:
+            tickers {str, list} -- ticker string (e.g. "MMM VTI") or list of tickers
+
+        Optional Args:
+            period {str} -- (default: {'2y'})
+            interval {str} -- (default: {'1d'})
+            start {str} -- date, overrides period (default: {None})
+            end {str} -- date (default: {None})
+        """
+        interval = kwargs.get('interval', '1d')
+        tickers = split_tickers(tickers)
+        req_start, req_end = get_date_range(period=kwargs.get('period', '2y'),
+                                            start=kwargs.get('start'),
+                                            end=kwargs.get('end'))
+
+        if interval not in self.requests:
+            self.requests[interval] = {
+                "tickers": [], "start": req_start, "end": req_end}
+
+        plan = self.requests[interval]
+        plan['tickers'].extend(
+            [tick for tick in tickers if tick not in plan['tickers']])
+        plan['start'] = min(plan['start'], req_start)
+        plan['end'] = max(plan['end'], req_end)
+
+    def get(self, tickers, **kwargs) -> dict:
+        """Get
+
+        Arguments:
+            tickers {str, list} -- ticker string (e.g. "MMM VTI") or list of tickers
+
+        Optional Args:
+            indexes {list} -- funds to format (default: {all 'tickers'})
+            period {str} -- (default: {'2y'})
+            interval {str} -- (default: {'1d'})
+            start {str} -- date, overrides period (default: {None})
+            end {str} -- date (default: {None})
+
+        Returns:
+            dict -- data of funds, as 'download_data_indexes' returns
+        """
+        interval = kwargs.get('interval', '1d')
+        tickers = split_tickers(tickers)
+        indexes = kwargs.get('indexes', tickers)
+
+        self.request(tickers, **kwargs)
+        req_start, req_end = get_date_range(period=kwargs.get('period', '2y'),
+                                            start=kwargs.get('start'),
+                                            end=kwargs.get('end'))
+
+        if not self.covers(interval, tickers, req_start, req_end):
+            self.fetch(interval)
+
+        data = self.fetched[interval]['data']
+        data = data[(data.index >= req_start) & (data.index < req_end)]
+
+        if len(tickers) == 1:
+            data = data[tickers[0]]
+        else:
+            data = data[[tick for tick in tickers
+                         if tick in data.columns.get_level_values(0)]]
+        data = data.dropna(how='all')
+
+        return data_format(data, config=None, list_of_funds=indexes)
+
+    def covers(self, interval: str, tickers: list, req_start, req_end) -> bool:
+        """ True if the data already fetched for 'interval' holds the tickers and range """
+        fetched = self.fetched.get(interval)
+        if fetched is None:
+            return False
+        if any([tick not in fetched['tickers'] for tick in tickers]):
+            return False
+        return (fetched['start'] <= req_start) and (fetched['end'] >= req_end)
+
+    def fetch(self, interval: str):
+        """ One batched download of every requested ticker over the widest requested range """
+        plan = self.requests[interval]
+        tickers = list(plan['tickers'])
+
+        data = store_download(tickers=tickers, interval=interval,
+                              start=plan['start'], end=plan['end'])
+        if len(tickers) == 1:
+            data = pd.concat({tickers[0]: data}, axis=1)
+
+        self.fetched[interval] = {"data": data, "tickers": tickers,
+                                  "start": plan['start'], "end": plan['end']}
+        self.fetch_count += 1
+
+
+def split_tickers(tickers) -> list:
+    """ Ticker string or list to a de-duplicated list """
+    if isinstance(tickers, (str)):
+        tickers = tickers.split(' ')
+    return list(dict.fromkeys([tick for tick in tickers if tick != '']))
@@ -0,0 +1,262 @@
+"""
+Metadata Cache
+
+Persistent cache of API metadata (yfinance fundamentals, dividends, Volatility Quotient) with a
+time-to-live per field. Fresh fields are served without a request; fields past their TTL but
+within their stale limit are served immediately while a background request refreshes them
+(stale-while-revalidate); older or missing fields are fetched before they are served. Entries
+are kept per ticker in a directory of pickles reused across runs.
+"""
+import os
+import time
+import pickle
+import threading
+from copy import deepcopy
+
+import pandas as pd
+
+from .constants import STANDARD_COLORS, INDEXES
+from .file_io import write_replace
+
+NOTE = STANDARD_COLORS["warning"]
+FUND = STANDARD_COLORS["ticker"]
+NORMAL = STANDARD_COLORS["normal"]
+
+METADATA_CACHE_DIR = os.path.join("output", "metadata_cache")
+
+DAY = 86400.0
+
+# Seconds a field is fresh ('ttl') and may still be served while refreshed ('stale');
+# 'market_close' is fresh until the next US market close after it was fetched
+METADATA_TTLS = {
+    "info": {"ttl": DAY, "stale": 7.0 * DAY},
+    "dividends": {"ttl": DAY, "stale": 7.0 * DAY},
+    "recommendations": {"ttl": 7.0 * DAY, "stale": 30.0 * DAY},
+    "financials": {"ttl": 30.0 * DAY, "stale": 120.0 * DAY},
+    "balance_sheet": {"ttl": 30.0 * DAY, "stale": 120.0 * DAY},
+    "cashflow": {"ttl": 30.0 * DAY, "stale": 120.0 * DAY},
+    "earnings": {"ttl": 30.0 * DAY, "stale": 120.0 * DAY},
+    "volatility": {"ttl": "market_close", "stale": 3.0 * DAY}
+}
+
+MARKET_TIMEZONE = "America/New_York"
+MARKET_CLOSE_HOUR = 16
+
+
+class MetadataCache(object):
+    """MetadataCache
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, cache_dir: str = METADATA_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.enabled = True
+        self.refresh = False
+        # ticker: {key: {'fetched': float, 'value': object}}
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.stats = {"fresh": 0, "stale": 0, "misses": 0, "stores": 0}
+
+    def configure(self, **kwargs):
+        """Configure
+
+        Optional Args:
+            enabled {bool} -- False neither reads nor stores entries (default: {True})
+            refresh {bool} -- ignore cached entries, but store new ones (default: {False})
+            cache_dir {str} -- directory of persisted entries (default: {current})
+        """
+        self.enabled = kwargs.get('enabled', True)
+        self.refresh = kwargs.get('refresh', False)
+        self.cache_dir = kwargs.get('cache_dir', self.cache_dir)
+        self.entries = {}
+
+    def lookup(self, ticker: str, keys: list, now: float = None) -> list:
+        """Lookup
+
+        Arguments:
+            ticker {str} -- fund name
+            keys {list} -- metadata keys fetched together (one endpoint)
+
+        Keyword Arguments:
+            now {float} -- epoch time (default: {None}, current time)
+
+        Returns:
+            list -- state ('fresh', 'stale' or 'missing'), {key: cached value} (None if missing)
+        """
+        if not self.enabled or self.refresh:
+            return 'missing', None
+        if now is None:
+            now = time.time()
+
+        with self.lock:
+            fund = self.load(ticker)
+            values = {}
+            state = 'fresh'
+            for key in keys:
+                entry = fund.get(key)
+                key_state = entry_state(key, entry, now)
+                if key_state == 'missing':
+                    self.stats['misses'] += 1
+                    return 'missing', None
+                if key_state == 'stale':
+                    state = 'stale'
+                values[key] = deepcopy(entry['value'])
+
+            self.stats[state] += 1
+            return state, values
+
+    def put(self, ticker: str, values: dict, now: float = None):
+        """Put
+
+        Arguments:
+            ticker {str} -- fund name
+            values {dict} -- {key: metadata value} fetched together
+
+        Keyword Arguments:
+            now {float} -- fetch time (default: {None}, current time)
+        """
+        if not self.enabled:
+            return
+        if now is None:
+            now = time.time()
+
+        with self.lock:
+            fund = self.load(ticker)
+            for key, value in values.items():
+                fund[key] = {"fetched": now, "value": deepcopy(value)}
+            self.stats['stores'] += 1
+
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            path = self.entry_path(ticker)
+            write_replace(path, lambda c_file: pickle.dump(
+                fund, c_file, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def load(self, ticker: str) -> dict:
+        """ Entries of a ticker, read from disk once per run """
+        if ticker not in self.entries:
+            fund = {}
+            path = self.entry_path(ticker)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as c_file:
+                        fund = pickle.load(c_file)
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    fund = {}
+            self.entries[ticker] = fund
+        return self.entries[ticker]
+
+    def entry_path(self, ticker: str) -> str:
+        """ Disk path of a ticker's entries """
+        return os.path.join(self.cache_dir, f"{ticker}.pkl")
+
+    def tickers(self) -> list:
+        """ Tickers with entries on disk """
+        if not os.path.exists(self.cache_dir):
+            return []
+        return sorted([name[:-4] for name in os.listdir(self.cache_dir)
+                       if name.endswith('.pkl')])
+
+    def summary(self) -> dict:
+        """ Lookup statistics of the run """
+        return dict(self.stats)
+
+
+METADATA_CACHE = MetadataCache()
+
+
+def configure_metadata_cache(config: dict):
+    """Configure Metadata Cache
+
+    Arguments:
+        config {dict} -- controlling config dictionary; '--metadata_refresh' ignores cached
+                         entries (new ones are still stored)
+    """
+    METADATA_CACHE.configure(
+        refresh=('metadata_refresh' in config.get('state', '')))
+
+
+def entry_state(key: str, entry: dict, now: float) -> str:
+    """Entry State
+
+    Arguments:
+        key {str} -- metadata key
+        entry {dict} -- cached entry ({'fetched', 'value'}), or None
+        now {float} -- epoch time
+
+    Returns:
+        str -- 'fresh', 'stale' or 'missing' (not cached, or older than its stale limit)
+    """
+    if entry is None:
+        return 'missing'
+
+    ttl = METADATA_TTLS.get(key, {"ttl": 0.0, "stale": 0.0})
+    age = now - entry['fetched']
+    if age > ttl['stale']:
+        return 'missing'
+
+    if ttl['ttl'] == 'market_close':
+        if now < next_market_close(entry['fetched']):
+            return 'fresh'
+        return 'stale'
+
+    if age <= ttl['ttl']:
+        return 'fresh'
+    return 'stale'
+
+
+def next_market_close(fetched: float) -> float:
+    """Next Market Close
+
+    Arguments:
+        fetched {float} -- epoch time
+
+    Returns:
+        float -- epoch time of the first weekday market close after 'fetched' (holidays are
+                 treated as trading days)
+    """
+    moment = pd.Timestamp(fetched, unit='s', tz='UTC').tz_convert(MARKET_TIMEZONE)
+    close = moment.normalize() + pd.Timedelta(hours=MARKET_CLOSE_HOUR)
+    if moment >= close:
+        close = close + pd.Timedelta(days=1)
+    while close.weekday() >= 5:
+        close = close + pd.Timedelta(days=1)
+    return close.timestamp()
+
+
+def metadata_cache_print(**kwargs):
+    """Metadata Cache Print
+
+    Lists cached fields of every ticker with their age and state ('--metadata_cache')
+
+    Optional Args:
+        cache {MetadataCache} -- (default: {METADATA_CACHE})
+    """
+    cache = kwargs.get('cache', METADATA_CACHE)
+    now = time.time()
+
+    tickers = cache.tickers()
+    print(" ")
+    print(f"Metadata cache: {len(tickers)} tickers in '{cache.cache_dir}'")
+    for ticker in tickers:
+        fund = cache.load(ticker)
+        print(f"{FUND}{INDEXES.get(ticker, ticker)}{NORMAL}")
+        for key in sorted(fund):
+            state = entry_state(key, fund[key], now)
+            if state == 'missing':
+                state = 'expired'
+            age = (now - fund[key]['fetched']) / 3600.0
+            print(f"    {key:<16}{age:>10.1f} h    {state}")
+    print(" ")
+
+
+def metadata_cache_stats_print():
+    """ One-line summary of the run's metadata cache lookups """
+    summary = METADATA_CACHE.summary()
+    if summary['fresh'] + summary['stale'] + summary['misses'] == 0:
+        return
+    print(
+        f"{NOTE}Metadata cache: {summary['fresh']} fresh, {summary['stale']} stale " +
+        f"(refreshed), {summary['misses']} fetched.{NORMAL}")
@@ -0,0 +1,199 @@
+"""
+Metadata Stream
+
+Streaming writer and indexed reader of the run's analysis metadata. A fund's records (each
+period's analysis, its api metadata, its synopsis) are appended to 'output/metadata.ndjson' as
+soon as they are finished, one line per top-level field, so no single document of every fund is
+built or parsed at once. An index of byte offsets ('output/metadata_index.json', written when the
+stream is closed) lets readers load only the funds and fields they need.
+"""
+import os
+import json
+
+METADATA_STREAM_FILE = os.path.join("output", "metadata.ndjson")
+METADATA_INDEX_FILE = os.path.join("output", "metadata_index.json")
+
+# Bump when the record or index layout changes
+STREAM_VERSION = 1
+
+
+class MetadataStream(object):
+    """MetadataStream
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, path: str = METADATA_STREAM_FILE, index_path: str = METADATA_INDEX_FILE):
+        self.path = path
+        self.index_path = index_path
+        self.file = None
+        # fund: {key: [offset, length] or {field: [offset, length]}}
+        self.index = {}
+
+    def open(self):
+        """ Starts a new stream; the previous run's index is removed until this one closes """
+        directory = os.path.dirname(self.path)
+        if directory != '' and not os.path.exists(directory):
+            os.makedirs(directory)
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+
+        self.file = open(self.path, 'wb')
+        self.index = {}
+
+    def write(self, fund: str, key: str, value):
+        """Write
+
+        Arguments:
+            fund {str} -- fund name (or '_METRICS_')
+            key {str} -- top-level key of the fund (e.g. period, 'metadata', 'synopsis')
+            value {} -- json-serializable value; a dict is written one line per field
+        """
+        if self.file is None:
+            self.open()
+
+        if isinstance(value, dict):
+            entry = {}
+            for field, item in value.items():
+                entry[str(field)] = self.append(fund, key, str(field), item)
+        else:
+            entry = self.append(fund, key, None, value)
+
+        if fund not in self.index:
+            self.index[fund] = {}
+        self.index[fund][key] = entry
+
+    def append(self, fund: str, key: str, field: str, value) -> list:
+        """ Appends one record line, returning its [offset, length] """
+        line = json.dumps({"fund": fund, "key": key, "field": field, "value": value})
+        line = (line + '\n').encode('utf-8')
+        offset = self.file.tell()
+        self.file.write(line)
+        return [offset, len(line)]
+
+    def written(self, fund: str, key: str) -> bool:
+        """ True if the fund's key is already in the stream """
+        return key in self.index.get(fund, {})
+
+    def write_missing(self, data: dict, **kwargs):
+        """Write Missing
+
+        Writes every key of 'data' not streamed yet (e.g. '_METRICS_', or a whole 'dev' run).
+
+        Arguments:
+            data {dict} -- analysis data object
+
+        Optional Args:
+            exclude {list} -- top-level keys of a fund not written (default: {[]})
+        """
+        exclude = kwargs.get('exclude', [])
+        for fund in data:
+            for key in data[fund]:
+                if key not in exclude and not self.written(fund, key):
+                    self.write(fund, key, data[fund][key])
+
+    def close(self):
+        """ Closes the stream and writes its index """
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+
+        index = {
+            "version": STREAM_VERSION,
+            "stream": os.path.basename(self.path),
+            "records": self.index
+        }
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w') as i_file:
+            json.dump(index, i_file)
+        os.replace(temp_path, self.index_path)
+
+
+METADATA_STREAM = MetadataStream()
+
+
+class MetadataReader(object):
+    """MetadataReader
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, path: str = METADATA_STREAM_FILE, index_path: str = METADATA_INDEX_FILE):
+        with open(index_path) as i_file:
+            index = json.load(i_file)
+        if index.get('version') != STREAM_VERSION:
+            raise ValueError(
+                f"MetadataReader: '{index_path}' is version {index.get('version')}, " +
+                f"expected {STREAM_VERSION}")
+
+        self.records = index['records']
+        self.file = open(path, 'rb')
+
+    def funds(self) -> list:
+        """ Funds in the stream, in the order they were written """
+        return list(self.records.keys())
+
+    def keys(self, fund: str) -> list:
+        """ Top-level keys of a fund """
+        return list(self.records.get(fund, {}).keys())
+
+    def fields(self, fund: str, key: str) -> list:
+        """ Fields of a fund's key, None if its value is not a dict """
+        entry = self.records[fund][key]
+        if isinstance(entry, dict):
+            return list(entry.keys())
+        return None
+
+    def get(self, fund: str, key: str, **kwargs):
+        """Get
+
+        Arguments:
+            fund {str} -- fund name (or '_METRICS_')
+            key {str} -- top-level key of the fund
+
+        Optional Args:
+            fields {list} -- fields of a dict value to read (default: {None}, all)
+
+        Returns:
+            {} -- value of the fund's key
+        """
+        fields = kwargs.get('fields')
+        entry = self.records[fund][key]
+        if not isinstance(entry, dict):
+            return self.read(entry)
+
+        return {field: self.read(location) for field, location in entry.items()
+                if (fields is None) or (field in fields)}
+
+    def items(self, fund: str, key: str):
+        """ (field, value) pairs of a fund's dict key, read one record at a time """
+        for field, location in self.records[fund][key].items():
+            yield field, self.read(location)
+
+    def read(self, location: list):
+        """ Value of the record at [offset, length] """
+        self.file.seek(location[0])
+        return json.loads(self.file.read(location[1]).decode('utf-8'))['value']
+
+    def skeleton(self) -> dict:
+        """ Keys (and fields) of every fund, with None values: structure without data """
+        skeleton = {}
+        for fund, keys in self.records.items():
+            skeleton[fund] = {}
+            for key, entry in keys.items():
+                skeleton[fund][key] = None
+                if isinstance(entry, dict):
+                    skeleton[fund][key] = {field: None for field in entry}
+        return skeleton
+
+    def close(self):
+        """ Closes the stream file """
+        self.file.close()
+
+
+def metadata_stream_exists(index_path: str = METADATA_INDEX_FILE) -> bool:
+    """ True if a complete (closed) metadata stream is available """
+    return os.path.exists(index_path)
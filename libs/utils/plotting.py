@@ -5,10 +5,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
-from pandas.plotting import register_matplotlib_converters
-
 from .formatting import dates_extractor_list
 from .progress_bar import ProgressBar
+from .render_pool import RENDER_POOL
+from .figure_templates import FIGURE_TEMPLATES, register_converters, x_units
 from .constants import STANDARD_COLORS
 
 WARNING = STANDARD_COLORS["warning"]
@@ -76,7 +76,7 @@ def dual_plotting(y1: list, y2: list, y1_label: str, y2_label: str, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     x_label = kwargs.get('x_label', 'Trading Days')
     x = kwargs.get('x', [])
@@ -85,13 +85,26 @@ def dual_plotting(y1: list, y2: list, y1_label: str, y2_label: str, **kwargs):
     saveFig = kwargs.get('saveFig', False)
     filename = kwargs.get('filename', 'temp_dual_plot.png')
 
+    if saveFig and RENDER_POOL.defer('dual_plotting', (y1, y2, y1_label, y2_label), kwargs):
+        return
+
+    temp_path = os.path.join("output", "temp")
+    if saveFig and not os.path.exists(temp_path):
+        # For functions, this directory may not exist.
+        return
+
     if len(x) < 1:
         if is_data_list(y1):
             x = dates_extractor_list(y1[0])
         else:
             x = dates_extractor_list(y1)
 
-    fig, ax1 = plt.subplots()
+    units = x_units(x)
+    if saveFig and units is not None:
+        fig, (ax1, ax2) = FIGURE_TEMPLATES.acquire('dual', units)
+    else:
+        fig, ax1 = plt.subplots()
+        ax2 = None
 
     if is_data_list(y2):
         color = 'k'
@@ -109,16 +122,17 @@ def dual_plotting(y1: list, y2: list, y1_label: str, y2_label: str, **kwargs):
             ax1.tick_params(axis='y')
             ax1.grid(linestyle=':')
 
-        plt.legend(y1_label)
+        ax1.legend(y1_label)
 
     else:
         ax1.set_ylabel(y1_label, color=color)
         ax1.plot(x, y1, color=color)
         ax1.tick_params(axis='y', labelcolor=color)
         ax1.grid(linestyle=':')
-        plt.legend([y1_label])
+        ax1.legend([y1_label])
 
-    ax2 = ax1.twinx()
+    if ax2 is None:
+        ax2 = ax1.twinx()
 
     if list_setting:
         color = 'k'
@@ -134,39 +148,31 @@ def dual_plotting(y1: list, y2: list, y1_label: str, y2_label: str, **kwargs):
             ax2.grid()
 
         if len(legend) > 0:
-            plt.legend(legend)
+            ax2.legend(legend)
         elif isinstance(y2_label, list):
-            plt.legend(y2_label)
+            ax2.legend(y2_label)
         else:
-            plt.legend([y2_label])
+            ax2.legend([y2_label])
 
     else:
         ax2.set_ylabel(y2_label, color=color)
         ax2.plot(x, y2, color=color)
         ax2.tick_params(axis='y', labelcolor=color)
         ax2.grid()
-        plt.legend([y2_label])
+        ax2.legend([y2_label])
 
-    plt.tight_layout()
+    fig.tight_layout()
     plot_xaxis_disperse(ax1)
 
     if len(title) > 0:
-        plt.title(title)
+        ax2.set_title(title)
 
     try:
         if saveFig:
-            temp_path = os.path.join("output", "temp")
             filename = os.path.join(temp_path, filename)
-
-            if not os.path.exists(temp_path):
-                # For functions, this directory may not exist.
-                plt.close(fig)
-                plt.clf()
-                return
-
             if os.path.exists(filename):
                 os.remove(filename)
-            plt.savefig(filename, bbox_inches="tight")
+            fig.savefig(filename, bbox_inches="tight")
 
         else:
             # Case of functions, show the plot and not save it.
@@ -177,8 +183,9 @@ def dual_plotting(y1: list, y2: list, y1_label: str, y2_label: str, **kwargs):
             f"{WARNING} Warning: plot failed to render in 'dual_plotting' of title: " +
             f"{title}{NORMAL}")
 
-    plt.close('all')
-    plt.clf()
+    if fig.canvas.manager is not None:
+        plt.close('all')
+        plt.clf()
 
 
 def generic_plotting(list_of_plots: list, **kwargs):
@@ -207,7 +214,7 @@ def generic_plotting(list_of_plots: list, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     x = kwargs.get('x', [])
     colors = kwargs.get('colors', [])
@@ -217,6 +224,9 @@ def generic_plotting(list_of_plots: list, **kwargs):
     filename = kwargs.get('filename', 'temp_generic_plot')
     ylabel = kwargs.get('ylabel', '')
 
+    if saveFig and RENDER_POOL.defer('generic_plotting', (list_of_plots,), kwargs):
+        return
+
     if len(colors) > 0:
         if len(colors) != len(list_of_plots):
             print(
@@ -233,59 +243,48 @@ def generic_plotting(list_of_plots: list, **kwargs):
                         f"do not match in generic_plotting.{NORMAL}")
                     return None
 
-    fig, ax = plt.subplots()
+    temp_path = os.path.join("output", "temp")
+    if saveFig and not os.path.exists(temp_path):
+        # For functions, this directory may not exist.
+        return
 
     if len(x) < 1:
         x = dates_extractor_list(list_of_plots[0])
-        for i, fig in enumerate(list_of_plots):
-            if len(colors) > 0:
-                plt.plot(x, fig, colors[i])
-            else:
-                plt.plot(x, fig)
+        x_list = [x] * len(list_of_plots)
+
+    elif isinstance(x[0], (list, pd.core.indexes.datetimes.DatetimeIndex)):
+        x_list = x
 
     else:
-        if isinstance(x[0], (list, pd.core.indexes.datetimes.DatetimeIndex)):
-            x = x
-            for i in range(len(list_of_plots)):
-                if len(colors) > 0:
-                    plt.plot(x[i], list_of_plots[i], colors[i])
-                else:
-                    plt.plot(x[i], list_of_plots[i])
+        x_list = [x] * len(list_of_plots)
 
-        else:
-            x = x
-            for i, figy in enumerate(list_of_plots):
-                if len(colors) > 0:
-                    plt.plot(x, figy, colors[i])
-                else:
-                    plt.plot(x, figy)
+    units = x_units(x_list)
+    if saveFig and units is not None:
+        fig, (ax,) = FIGURE_TEMPLATES.acquire('generic', units)
+    else:
+        fig, ax = plt.subplots()
 
-    # coords = plt.ginput(10)
-    # print(f"coords: {coords}")
-    # plt.waitforbuttonpress()
+    for i, figy in enumerate(list_of_plots):
+        if len(colors) > 0:
+            ax.plot(x_list[i], figy, colors[i])
+        else:
+            ax.plot(x_list[i], figy)
 
-    plt.title(title)
+    ax.set_title(title)
     if len(legend) > 0:
-        plt.legend(legend)
+        ax.legend(legend)
     if ylabel != '':
-        plt.ylabel(ylabel)
+        ax.set_ylabel(ylabel)
 
     plot_xaxis_disperse(ax)
 
     try:
         if saveFig:
-            temp_path = os.path.join("output", "temp")
-            if not os.path.exists(temp_path):
-                # For functions, this directory may not exist.
-                plt.close(fig)
-                plt.clf()
-                return
-
             filename = os.path.join(temp_path, filename)
             if os.path.exists(filename):
                 os.remove(filename)
 
-            plt.savefig(filename)
+            fig.savefig(filename)
 
         else:
             plt.show()
@@ -295,8 +294,9 @@ def generic_plotting(list_of_plots: list, **kwargs):
             f"{WARNING}Warning: plot failed to render in 'generic_plotting' of title: " +
             f"{title}{NORMAL}")
 
-    plt.close('all')
-    plt.clf()
+    if fig.canvas.manager is not None:
+        plt.close('all')
+        plt.clf()
 
 
 def bar_chart(data: list, **kwargs):
@@ -319,7 +319,7 @@ def bar_chart(data: list, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     x = kwargs.get('x', [])
     position = kwargs.get('position', [])
@@ -329,6 +329,9 @@ def bar_chart(data: list, **kwargs):
     all_positive = kwargs.get('all_positive', False)
     bar_delta = kwargs.get('bar_delta', False)
 
+    if saveFig and RENDER_POOL.defer('bar_chart', (data,), kwargs):
+        return
+
     if len(x) < 1:
         x = list(range(len(data)))
     else:
@@ -430,7 +433,7 @@ def specialty_plotting(list_of_plots: list, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     x = kwargs.get('x', [])
     alt_ax_index = kwargs.get('alt_ax_index', [])
@@ -439,6 +442,9 @@ def specialty_plotting(list_of_plots: list, **kwargs):
     saveFig = kwargs.get('saveFig', False)
     filename = kwargs.get('filename', 'temp_specialty_plot.png')
 
+    if saveFig and RENDER_POOL.defer('specialty_plotting', (list_of_plots,), kwargs):
+        return
+
     x = x
     if len(x) < 1:
         x = dates_extractor_list(list_of_plots[0])
@@ -507,7 +513,7 @@ def shape_plotting(main_plot: pd.DataFrame, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     shapeXY = kwargs.get('shapeXY', [])
     feature = kwargs.get('feature', 'default')
@@ -516,6 +522,9 @@ def shape_plotting(main_plot: pd.DataFrame, **kwargs):
     saveFig = kwargs.get('saveFig', False)
     filename = kwargs.get('filename', 'temp_shape_plot.png')
 
+    if saveFig and RENDER_POOL.defer('shape_plotting', (main_plot,), kwargs):
+        return
+
     _, ax = plt.subplots()
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
 
@@ -630,7 +639,7 @@ def candlestick_plot(data: pd.DataFrame, **kwargs):
     Returns:
         None
     """
-    register_matplotlib_converters()
+    register_converters()
 
     title = kwargs.get('title', '')
     saveFig = kwargs.get('saveFig', False)
@@ -639,6 +648,15 @@ def candlestick_plot(data: pd.DataFrame, **kwargs):
     additional_plts = kwargs.get('additional_plts', [])
     threshold_candles = kwargs.get('threshold_candles', None)
 
+    if saveFig:
+        # The progress bar stays with the caller; its share is credited on hand-off
+        spec = {key: value for key, value in kwargs.items() if key != 'progress_bar'}
+        if RENDER_POOL.defer('candlestick_plot', (data,), spec):
+            if p_bar is not None:
+                bars = float(len(data['Close']))
+                p_bar.uptick(increment=0.5 * bars / (bars + 1.0) + 0.5)
+            return
+
     _, ax = plt.subplots()
     plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
 
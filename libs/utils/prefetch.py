@@ -0,0 +1,115 @@
+"""
+Fund Prefetcher
+
+Overlaps the network work of upcoming funds with the analysis of the current one. A background
+producer fetches each fund's API metadata and its sector-match data (sector fund and comparison
+funds, per period) while the main thread computes indicators; at most 'lookahead' funds are
+fetched ahead of the one being analyzed, so memory and request load stay bounded.
+"""
+import threading
+
+from .api import MetadataFetcher, api_sector_data
+from .constants import STANDARD_COLORS
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+PREFETCH_LOOKAHEAD = 2
+
+
+class FundPrefetcher(object):
+    """FundPrefetcher
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, funds: list, dataset: dict, periods: list, config: dict, **kwargs):
+        """
+        Arguments:
+            funds {list} -- funds in the order they are analyzed
+            dataset {dict} -- {period: {ticker: pd.DataFrame}} dataset
+            periods {list} -- period keys of dataset
+            config {dict} -- controlling configuration dictionary
+
+        Optional Args:
+            lookahead {int} -- funds fetched ahead of the one analyzed
+                               (default: {PREFETCH_LOOKAHEAD})
+            fetcher {MetadataFetcher} -- (default: {None}, a new one)
+        """
+        self.funds = list(funds)
+        self.dataset = dataset
+        self.periods = periods
+        self.config = config
+        self.lookahead = max(kwargs.get('lookahead', PREFETCH_LOOKAHEAD), 1)
+        self.fetcher = kwargs.get('fetcher')
+        if self.fetcher is None:
+            self.fetcher = MetadataFetcher()
+
+        self.slots = threading.Semaphore(self.lookahead)
+        self.ready = {fund: threading.Event() for fund in self.funds}
+        self.results = {}
+        self.stopped = False
+        self.thread = threading.Thread(target=self.produce, daemon=True)
+
+    def start(self):
+        """ Starts the background producer """
+        self.thread.start()
+
+    def produce(self):
+        """ Fetches funds in order, waiting for a free lookahead slot before each """
+        for fund in self.funds:
+            self.slots.acquire()
+            if self.stopped:
+                return
+            try:
+                self.results[fund] = self.prefetch(fund)
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"{WARNING}Prefetch of {fund} failed: {exc}; fetching with the " +
+                      f"analysis.{NORMAL}")
+                self.results[fund] = {'metadata': None, 'sector_match': {}}
+            self.ready[fund].set()
+
+    def prefetch(self, fund: str) -> dict:
+        """Prefetch
+
+        Arguments:
+            fund {str} -- fund name
+
+        Returns:
+            dict -- raw 'metadata' (see 'get_api_metadata'), 'sector_match' {period: data}
+        """
+        data = self.dataset[self.periods[0]][fund]
+        self.fetcher.submit(fund, max_close=max(data['Close']), data=data)
+        metadata = self.fetcher.result(fund)
+
+        sector_match = {}
+        if 'no_index' not in self.config['state']:
+            sector = metadata.get('info', {}).get('sector')
+            for i, period in enumerate(self.periods):
+                sector_match[period] = api_sector_data(
+                    sector, fund, self.dataset[period], self.config,
+                    period=period, interval=self.config['interval'][i], out_suppress=True)
+
+        return {'metadata': metadata, 'sector_match': sector_match}
+
+    def get(self, fund: str) -> dict:
+        """Get
+
+        Blocks until the fund is fetched, then frees its lookahead slot.
+
+        Arguments:
+            fund {str} -- fund name (in 'funds')
+
+        Returns:
+            dict -- 'metadata', 'sector_match' (see 'prefetch')
+        """
+        self.ready[fund].wait()
+        self.slots.release()
+        return self.results.pop(fund)
+
+    def close(self):
+        """ Stops the producer and releases the metadata fetcher """
+        self.stopped = True
+        self.slots.release()
+        self.fetcher.close()
@@ -0,0 +1,453 @@
+"""
+Price Store
+
+Persistent, columnar on-disk store of OHLCV history keyed by (ticker, interval). The download
+functions in 'data.py' read from the store first and only fetch the missing date range from the
+price provider (yfinance by default), appending it before handing back a frame that is shaped
+exactly like a 'yf.download(..., group_by='ticker')' result. Refreshes re-fetch the last complete
+stored bar too: if the provider has since re-adjusted it (split, dividend), the whole stored
+range is fetched again rather than extended on a mixed basis.
+
+Each (ticker, interval) pair is saved as a single '.npz' file of column arrays ('Date' as int64
+nanoseconds plus one float64 array per OHLCV column), along with the earliest date the store has
+been asked to cover and the time of the last provider fetch.
+"""
+import os
+import re
+import time
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+import numpy as np
+import yfinance as yf
+from dateutil.relativedelta import relativedelta
+
+from .file_io import write_replace
+from .constants import STANDARD_COLORS
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+PRICE_STORE_DIR = os.path.join("output", "price_store")
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+# Seconds before a stored series is considered stale and the latest bars are re-fetched
+STORE_REFRESH_SECONDS = 15 * 60
+
+# Earliest date used to represent a 'max' period request
+MAX_PERIOD_START = datetime(1900, 1, 1)
+
+# yfinance-style periods: '<n>d', '<n>wk', '<n>mo', '<n>y' (e.g. '60d', '3mo', '10y')
+PERIOD_PATTERN = re.compile(r'^(\d+)(d|wk|mo|y)$')
+PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+
+# Relative difference of a re-fetched, complete bar to its stored value that marks the stored
+# history as on an old adjustment basis (split or dividend since it was stored)
+REBASE_TOLERANCE = 1e-4
+
+
+def yfinance_provider(tickers: list, start: datetime, end: datetime, interval: str = '1d'):
+    """yfinance Provider
+
+    Default price provider of the store
+
+    Arguments:
+        tickers {list} -- ticker symbols to fetch
+        start {datetime} -- first date to fetch (inclusive)
+        end {datetime} -- last date to fetch (exclusive)
+
+    Keyword Arguments:
+        interval {str} -- data interval (default: {'1d'})
+
+    Returns:
+        pd.DataFrame -- 'yf.download' styled dataframe
+    """
+    return yf.download(tickers=' '.join(tickers), start=start.strftime('%Y-%m-%d'),
+                       end=end.strftime('%Y-%m-%d'), interval=interval, group_by='ticker')
+
+
+class FixtureProvider(object):
+    """FixtureProvider
+
+    Offline stand-in price provider that serves '<ticker>.csv' files (as written by
+    'pd.DataFrame.to_csv' on a single-fund yfinance frame) from a fixture directory.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, fixture_dir: str):
+        self.fixture_dir = fixture_dir
+        self.requests = []
+
+    def __call__(self, tickers: list, start: datetime, end: datetime, interval: str = '1d'):
+        self.requests.append({"tickers": list(tickers), "start": start,
+                              "end": end, "interval": interval})
+        frames = {}
+        for ticker in tickers:
+            path = os.path.join(self.fixture_dir, f"{ticker}.csv")
+            if not os.path.exists(path):
+                continue
+            frame = pd.read_csv(path, index_col=0, parse_dates=True)
+            frames[ticker] = frame[(frame.index >= start) & (frame.index < end)]
+
+        if len(frames) == 0:
+            return pd.DataFrame()
+        if len(tickers) == 1:
+            return frames.get(tickers[0], pd.DataFrame())
+        return pd.concat(frames, axis=1)
+
+
+_PROVIDER = {"fetch": yfinance_provider}
+_STORE = {"dir": PRICE_STORE_DIR}
+
+# yfinance keeps the results of a download in module globals it resets on every call, so provider
+# calls of concurrent threads (e.g. the sector prefetcher and the main thread) are serialized
+_PROVIDER_LOCK = threading.Lock()
+
+
+def set_price_provider(provider=None):
+    """Set Price Provider
+
+    Keyword Arguments:
+        provider {callable} -- f(tickers, start, end, interval) -> yf.download-styled
+                               dataframe; None restores yfinance (default: {None})
+    """
+    if provider is None:
+        provider = yfinance_provider
+    _PROVIDER['fetch'] = provider
+
+
+def set_price_store_dir(store_dir: str = None):
+    """Set Price Store Dir
+
+    Keyword Arguments:
+        store_dir {str} -- directory of the store files, e.g. a scratch directory for
+                           synthetic data; None restores PRICE_STORE_DIR (default: {None})
+    """
+    if store_dir is None:
+        store_dir = PRICE_STORE_DIR
+    _STORE['dir'] = store_dir
+
+
+def provider_fetch(tickers: list, start: datetime, end: datetime, interval: str = '1d'):
+    """ Calls the price provider, one call at a time across threads """
+    with _PROVIDER_LOCK:
+        return _PROVIDER['fetch'](tickers, start, end, interval=interval)
+
+
+def store_download(tickers, **kwargs) -> pd.DataFrame:
+    """Store Download
+
+    Drop-in replacement for 'yf.download(..., group_by='ticker')' that is served from the price
+    store, fetching only missing date ranges from the price provider.
+
+    Arguments:
+        tickers {str, list} -- ticker string (e.g. "MMM VTI") or list of tickers
+
+    Optional Args:
+        period {str} -- (default: {'2y'})
+        interval {str} -- (default: {'1d'})
+        start {str} -- date (default: {None})
+        end {str} -- date (default: {None})
+
+    Returns:
+        pd.DataFrame -- single-level columns for one ticker, (ticker, column) otherwise
+    """
+    period = kwargs.get('period', '2y')
+    interval = kwargs.get('interval', '1d')
+    start = kwargs.get('start')
+    end = kwargs.get('end')
+
+    if isinstance(tickers, (str)):
+        tickers = tickers.split(' ')
+    tickers = [tick for tick in tickers if tick != '']
+    tickers = list(dict.fromkeys(tickers))
+
+    req_start, req_end = get_date_range(period=period, start=start, end=end)
+    fetch_end = datetime.today().replace(
+        hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    stored = {}
+    fetches = {}
+    for ticker in tickers:
+        stored[ticker] = load_stored_fund(ticker, interval)
+        fetch_start = missing_range_start(stored[ticker], req_start)
+        if fetch_start is not None:
+            fetches.setdefault(fetch_start, []).append(ticker)
+
+    # One provider call per distinct missing range, tickers batched together
+    rebases = {}
+    short_tickers = []
+    for fetch_start, fetch_tickers in fetches.items():
+        fetched = provider_fetch(
+            fetch_tickers, fetch_start, fetch_end, interval=interval)
+        fetched = split_provider_frame(fetched, fetch_tickers)
+
+        for ticker in fetch_tickers:
+            # A backfill re-fetches the whole stored range anyway; tail refreshes are checked
+            if not missing_backfill(stored[ticker], req_start) and \
+                    history_rebased(stored[ticker], fetched.get(ticker)):
+                rebases.setdefault(stored[ticker]['covered_from'], []).append(ticker)
+                continue
+            merged = merge_stored_fund(
+                stored[ticker], fetched.get(ticker), fetch_start)
+            if merged is not stored[ticker]:
+                stored[ticker] = merged
+                save_stored_fund(ticker, interval, merged)
+            elif missing_backfill(stored[ticker], req_start):
+                short_tickers.append(ticker)
+
+    # Re-adjusted history (split, dividend): the whole covered range is fetched again
+    for covered_from, rebase_tickers in rebases.items():
+        fetched = provider_fetch(
+            rebase_tickers, covered_from, fetch_end, interval=interval)
+        fetched = split_provider_frame(fetched, rebase_tickers)
+
+        for ticker in rebase_tickers:
+            if fetched.get(ticker) is None or len(fetched[ticker].index) == 0:
+                print(f"{WARNING}Warning: {ticker} history was re-adjusted but could not be " +
+                      f"fetched again; serving stored prices.{NORMAL}")
+                continue
+            stored[ticker] = merge_stored_fund(
+                empty_stored_fund(), fetched[ticker], covered_from)
+            save_stored_fund(ticker, interval, stored[ticker])
+
+    frames = {}
+    for ticker in tickers:
+        frame = stored[ticker]['frame']
+        frame = frame[(frame.index >= req_start) & (frame.index < req_end)]
+        frames[ticker] = frame
+
+        if ticker in short_tickers:
+            served = 'no data'
+            if len(frame.index) > 0:
+                served = f"data from {frame.index[0].strftime('%Y-%m-%d')}"
+            print(f"{WARNING}Warning: {ticker} prices from {req_start.strftime('%Y-%m-%d')} " +
+                  f"could not be fetched; serving {served}.{NORMAL}")
+
+    if len(tickers) == 1:
+        return frames[tickers[0]].copy()
+
+    data = pd.concat(frames, axis=1)
+    data.index.name = 'Date'
+    return data
+
+
+def get_date_range(period='2y', start=None, end=None) -> list:
+    """Get Date Range
+
+    Keyword Arguments:
+        period {str} -- yfinance-style period, 'max', 'ytd' or '<n>d', '<n>wk', '<n>mo',
+                        '<n>y'; others raise ValueError (default: {'2y'})
+        start {str} -- date, overrides period (default: {None})
+        end {str} -- date, exclusive (default: {None})
+
+    Returns:
+        list -- start datetime, end datetime (exclusive)
+    """
+    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+    req_end = today + timedelta(days=1)
+    if end is not None:
+        req_end = pd.Timestamp(end).to_pydatetime()
+
+    if start is not None:
+        return pd.Timestamp(start).to_pydatetime(), req_end
+
+    if isinstance(period, (list)):
+        period = period[0]
+
+    if period == 'max':
+        return MAX_PERIOD_START, req_end
+    if period == 'ytd':
+        return datetime(today.year, 1, 1), req_end
+
+    match = PERIOD_PATTERN.match(str(period))
+    if match is None:
+        raise ValueError(f"Unknown price period '{period}'.")
+    delta = relativedelta(**{PERIOD_UNITS[match.group(2)]: int(match.group(1))})
+    return today - delta, req_end
+
+
+def missing_range_start(stored: dict, req_start: datetime):
+    """Missing Range Start
+
+    Arguments:
+        stored {dict} -- stored fund object (see 'load_stored_fund')
+        req_start {datetime} -- first date requested
+
+    Returns:
+        datetime -- date to fetch from, None if the store is up to date
+    """
+    if missing_backfill(stored, req_start):
+        return req_start
+
+    if len(stored['frame'].index) == 0:
+        return req_start
+
+    if time.time() - stored['fetched'] < STORE_REFRESH_SECONDS:
+        return None
+
+    # Re-fetch the last stored bar as well, it may have been an intraday (partial) bar, and the
+    # complete one before it, to check the stored history against (see 'history_rebased')
+    return stored['frame'].index[max(len(stored['frame'].index) - 2, 0)].to_pydatetime()
+
+
+def missing_backfill(stored: dict, req_start: datetime) -> bool:
+    """ True if the store does not cover 'req_start' (its backfill fetch returned nothing) """
+    return (stored['covered_from'] is None) or (req_start < stored['covered_from'])
+
+
+def history_rebased(stored: dict, fetched: pd.DataFrame) -> bool:
+    """History Rebased
+
+    Compares re-fetched bars with the stored bars of the same dates. The provider re-adjusts
+    past prices after a split ('Close') or a dividend ('Adj Close'), so a difference means the
+    stored history is on an old basis and must not be extended with newly adjusted bars. The
+    last stored bar is skipped, as it may have been a partial intraday bar.
+
+    Arguments:
+        stored {dict} -- stored fund object
+        fetched {pd.DataFrame} -- newly fetched single-fund data (can be None)
+
+    Returns:
+        bool -- True if the stored history needs to be fetched again
+    """
+    if fetched is None or len(stored['frame'].index) < 2:
+        return False
+
+    complete = stored['frame'].iloc[:-1]
+    dates = complete.index.intersection(fetched.index)
+    if len(dates) == 0:
+        return False
+
+    for col in ['Close', 'Adj Close']:
+        if col not in fetched.keys():
+            continue
+        old = complete.loc[dates, col].to_numpy(dtype=np.float64)
+        new = fetched.loc[dates, col].to_numpy(dtype=np.float64)
+        valid = np.isfinite(old) & np.isfinite(new) & (old != 0.0)
+        if np.any(np.abs(new[valid] - old[valid]) / np.abs(old[valid]) > REBASE_TOLERANCE):
+            return True
+    return False
+
+
+def split_provider_frame(data: pd.DataFrame, tickers: list) -> dict:
+    """Split Provider Frame
+
+    Arguments:
+        data {pd.DataFrame} -- 'yf.download' styled dataframe
+        tickers {list} -- tickers requested
+
+    Returns:
+        dict -- ticker keys of single-fund dataframes (empty rows removed)
+    """
+    frames = {}
+    if data is None or len(data.index) == 0:
+        return frames
+
+    for ticker in tickers:
+        if 'Open' in data.keys():
+            frame = data
+        elif ticker in data.columns.get_level_values(0):
+            frame = data[ticker]
+        else:
+            continue
+
+        frame = frame[[col for col in PRICE_COLUMNS if col in frame.keys()]]
+        frame = frame.dropna(how='all')
+        frames[ticker] = frame
+
+    return frames
+
+
+def merge_stored_fund(stored: dict, fetched: pd.DataFrame, fetch_start: datetime) -> dict:
+    """Merge Stored Fund
+
+    Arguments:
+        stored {dict} -- stored fund object
+        fetched {pd.DataFrame} -- newly fetched single-fund data (can be None)
+        fetch_start {datetime} -- date the fetch started from
+
+    Returns:
+        dict -- updated stored fund object ('stored' itself if the fetch returned no bars, so a
+                failed fetch is retried rather than recorded as covered)
+    """
+    if fetched is None or len(fetched.index) == 0:
+        return stored
+
+    # Fetched bars replace stored bars of the same dates (e.g. partial intraday bars)
+    frame = stored['frame']
+    frame = frame[~frame.index.isin(fetched.index)]
+    frame = pd.concat([frame, fetched.reindex(columns=PRICE_COLUMNS)])
+    frame = frame.sort_index()
+
+    covered_from = stored['covered_from']
+    if (covered_from is None) or (fetch_start < covered_from):
+        covered_from = fetch_start
+
+    return {"frame": frame, "covered_from": covered_from, "fetched": time.time()}
+
+
+def stored_fund_path(ticker: str, interval: str) -> str:
+    """ Path of the '.npz' store file for a (ticker, interval) pair """
+    return os.path.join(_STORE['dir'], f"{ticker}_{interval}.npz")
+
+
+def empty_stored_fund() -> dict:
+    """ Stored fund object of a (ticker, interval) pair that was never fetched """
+    empty = pd.DataFrame(columns=PRICE_COLUMNS, dtype=np.float64,
+                         index=pd.DatetimeIndex([], name='Date'))
+    return {"frame": empty, "covered_from": None, "fetched": 0.0}
+
+
+def load_stored_fund(ticker: str, interval: str) -> dict:
+    """Load Stored Fund
+
+    Arguments:
+        ticker {str} -- ticker symbol
+        interval {str} -- data interval
+
+    Returns:
+        dict -- {"frame": pd.DataFrame, "covered_from": datetime, "fetched": float}
+    """
+    path = stored_fund_path(ticker, interval)
+    if not os.path.exists(path):
+        return empty_stored_fund()
+
+    with np.load(path) as store:
+        dates = pd.DatetimeIndex(store['Date'].astype(
+            'datetime64[ns]'), name='Date')
+        columns = {col: store[col] for col in PRICE_COLUMNS}
+        covered_from = pd.Timestamp(
+            int(store['covered_from'])).to_pydatetime()
+        fetched = float(store['fetched'])
+
+    frame = pd.DataFrame(columns, index=dates)
+    return {"frame": frame, "covered_from": covered_from, "fetched": fetched}
+
+
+def save_stored_fund(ticker: str, interval: str, stored: dict):
+    """Save Stored Fund
+
+    Arguments:
+        ticker {str} -- ticker symbol
+        interval {str} -- data interval
+        stored {dict} -- stored fund object
+    """
+    if not os.path.exists(_STORE['dir']):
+        os.makedirs(_STORE['dir'])
+
+    frame = stored['frame']
+    columns = {col: frame[col].to_numpy(
+        dtype=np.float64) for col in PRICE_COLUMNS}
+    dates = frame.index.values.astype('datetime64[ns]').astype(np.int64)
+    covered_from = np.int64(pd.Timestamp(stored['covered_from']).value)
+
+    # Write-then-rename so an interrupted run never leaves a truncated store file
+    path = stored_fund_path(ticker, interval)
+    write_replace(path, lambda s_file: np.savez(
+        s_file, Date=dates, covered_from=covered_from,
+        fetched=np.float64(stored['fetched']), **columns))
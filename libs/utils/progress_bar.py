@@ -125,6 +125,47 @@ class ProgressBar(object):
             print('')
 
 
+class ProgressQueue(object):
+    """ProgressQueue
+
+    Stand-in for a ProgressBar inside a worker process. Increments are forwarded through a queue to
+    the single aggregated ProgressBar owned by the parent process.
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, total_items: int, queue, name: str = ''):
+        self.total = float(total_items)
+        self.name = name
+        self.iteration = 0.0
+        self.queue = queue
+
+    def start(self):
+        """ No-op; the parent process owns the displayed bar """
+        return
+
+    def update(self, iteration: int):
+        """ Manual changing of the progress (forwarded as an increment) """
+        self.uptick(increment=float(iteration) - self.iteration)
+
+    def uptick(self, increment=1.0):
+        """ Forward an increment to the parent's progress bar """
+        self.iteration += increment
+        self.queue.put(increment)
+
+    def end(self):
+        """ Forwards any remaining progress of this item and returns time of completion """
+        remaining = self.total - self.iteration
+        if remaining > 0.0:
+            self.uptick(increment=remaining)
+        return time.time()
+
+    def interrupt(self, message: str = ''):
+        """ Print the message; the parent's bar keeps running """
+        print(message)
+
+
 def start_clock():
     """ Wrapper function for time keeping """
     return time.time()
@@ -0,0 +1,194 @@
+"""
+Render Pool
+
+Saved charts ('saveFig=True') are handed off the analysis path: each plotting call is submitted
+as a plot spec (plotting function name, data arrays, styling kwargs) to a pool of worker
+processes that draw and encode the PNGs with the 'Agg' backend. 'wait' is the barrier the
+exporters (slide_creator, PDF_creator) cross before they need the images.
+
+Modes ('--render=MODE'): 'async' (default) renders in the pool, 'sync' renders inline as before,
+'off' drops saved charts for headless, metric-only runs.
+"""
+import os
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .constants import STANDARD_COLORS
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+RENDER_MODES = ['async', 'sync', 'off']
+RENDER_MAX_WORKERS = 4
+
+
+def render_workers() -> int:
+    """ Default pool size: spare cpus (the analysis keeps one), at most RENDER_MAX_WORKERS """
+    cpus = os.cpu_count() or 1
+    return max(1, min(RENDER_MAX_WORKERS, cpus - 1))
+
+
+def pool_context():
+    """Pool Context
+
+    Start method of worker pools created mid-run. By then the prefetch and metadata threads are
+    running, and forking them could leave a lock (yfinance, requests, logging) held in the child,
+    so workers are started from a clean server process ('spawn' where there is no forkserver).
+
+    Returns:
+        multiprocessing context -- for 'ProcessPoolExecutor(mp_context=...)'
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def init_render_worker():
+    """ Pool initializer: headless backend; the worker renders its specs inline """
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+    RENDER_POOL.mode = 'sync'
+
+
+def render_spec(spec: bytes):
+    """Render Spec
+
+    Arguments:
+        spec {bytes} -- pickled [function name, args, kwargs] of a 'libs.utils.plotting' function
+    """
+    from . import plotting
+    function, args, kwargs = pickle.loads(spec)
+    getattr(plotting, function)(*args, **kwargs)
+
+
+class RenderPool(object):
+    """RenderPool
+
+    Arguments:
+        object {} -- n/a
+    """
+
+    def __init__(self, mode: str = 'sync', workers: int = None):
+        self.mode = mode
+        self.workers = workers
+        self.pid = None
+        self.executor = None
+        self.pending = {}
+        self.stats = {"submitted": 0, "inline": 0, "dropped": 0, "failed": 0}
+
+    def configure(self, **kwargs):
+        """Configure
+
+        Optional Args:
+            mode {str} -- 'async', 'sync' or 'off' (default: {'async'})
+            workers {int} -- render processes (default: {render_workers()})
+        """
+        self.close()
+        self.mode = kwargs.get('mode', 'async')
+        if self.mode not in RENDER_MODES:
+            print(f"{WARNING}Warning: unknown render mode '{self.mode}', rendering " +
+                  f"'async'.{NORMAL}")
+            self.mode = 'async'
+        self.workers = kwargs.get('workers', render_workers())
+        self.pid = os.getpid()
+        self.stats = {"submitted": 0, "inline": 0, "dropped": 0, "failed": 0}
+
+    def defer(self, function: str, args: tuple, kwargs: dict) -> bool:
+        """Defer
+
+        Called by a plotting function that is about to save a chart.
+
+        Arguments:
+            function {str} -- plotting function name (in 'libs.utils.plotting')
+            args {tuple} -- positional arguments of the call
+            kwargs {dict} -- keyword arguments of the call
+
+        Returns:
+            bool -- True if the chart was queued (or dropped, 'off'); False to render inline
+        """
+        if self.mode == 'sync' or self.pid != os.getpid():
+            # Unconfigured, or a forked (prod / render) worker: draw in this process
+            return False
+
+        if self.mode == 'off':
+            self.stats['dropped'] += 1
+            return True
+
+        if not os.path.exists(os.path.join("output", "temp")):
+            return False
+
+        try:
+            spec = pickle.dumps([function, args, kwargs], protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.stats['inline'] += 1
+            return False
+
+        # Same file queued twice: let the earlier render land first
+        filename = kwargs.get('filename', function)
+        if filename in self.pending:
+            self.collect(filename, self.pending.pop(filename))
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=pool_context(),
+                                                initializer=init_render_worker)
+
+        self.pending[filename] = [function, kwargs.get('title', ''),
+                                  self.executor.submit(render_spec, spec)]
+        self.stats['submitted'] += 1
+        return True
+
+    def collect(self, filename: str, entry: list):
+        """ Waits on one queued chart, warning if it failed to render """
+        function, title, future = entry
+        try:
+            future.result()
+        except Exception as exc:
+            self.stats['failed'] += 1
+            print(f"{WARNING}Warning: plot failed to render in '{function}' of title: " +
+                  f"{title} ('{filename}': {exc}){NORMAL}")
+
+    def wait(self):
+        """ Barrier: returns once every queued chart is written (or has failed) """
+        pending = self.pending
+        self.pending = {}
+        for filename, entry in pending.items():
+            self.collect(filename, entry)
+
+    def wait_for(self, directory: str):
+        """ Barrier for one fund: returns once its queued charts ('directory/...') are written """
+        prefix = directory + os.sep
+        for filename in [name for name in self.pending if name.startswith(prefix)]:
+            self.collect(filename, self.pending.pop(filename))
+
+    def close(self):
+        """ Waits on queued charts and shuts down the worker processes """
+        if self.pid is not None and self.pid != os.getpid():
+            # Forked copy: the executor belongs to the parent
+            self.executor = None
+            self.pending = {}
+            return
+        self.wait()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def summary(self) -> dict:
+        """ Submitted / inline / dropped / failed chart counts """
+        summary = dict(self.stats)
+        summary['mode'] = self.mode
+        summary['workers'] = self.workers
+        return summary
+
+
+RENDER_POOL = RenderPool()
+
+
+def configure_render_pool(config: dict):
+    """Configure Render Pool
+
+    Arguments:
+        config {dict} -- controlling config dictionary; 'render' is 'async', 'sync' or 'off'
+    """
+    RENDER_POOL.configure(mode=config.get('render', 'async'))
@@ -0,0 +1,205 @@
+"""
+Run State
+
+Per-fund, per-period analysis state saved between runs for '--incremental' mode. Resumable
+indicators (EMA, RSI, OBV, Full Stochastic, KST, MACD) store their kernel state and last
+computed signal here, so the next run only advances them over newly arrived bars.
+
+Each indicator's state is anchored to an absolute date: the first bar of the window it was
+fully computed on. Later runs advance the kernels from there instead of re-seeding them at the
+first bar of their (sliding) window, so a resumed signal is exactly the signal of a full
+computation over the bars since the anchor date, whichever day it is resumed on. The anchor only
+moves when the state is discarded: restated history (e.g. split-adjusted closes) or a window
+reaching back before the stored signal.
+"""
+import os
+import json
+import pandas as pd
+
+from .file_io import write_replace
+
+RUN_STATE_DIR = os.path.join("output", "run_state")
+
+# Number of trailing bars compared to confirm history was not restated (e.g. split-adjusted)
+TAIL_BARS = 5
+
+
+def run_state_path(fund_name: str, period: str) -> str:
+    """ Path of the saved run state for a fund and period """
+    return os.path.join(RUN_STATE_DIR, f"{fund_name}_{period}.json")
+
+
+def load_run_state(fund_name: str, period: str, fund: pd.DataFrame = None) -> dict:
+    """Load Run State
+
+    Arguments:
+        fund_name {str} -- ticker symbol
+        period {str} -- period of the dataset (e.g. '2y')
+
+    Keyword Arguments:
+        fund {pd.DataFrame} -- current dataset; if given, state is discarded when the trailing
+                               bars of the previous run do not match (default: {None})
+
+    Returns:
+        dict -- run state (empty dict if none or invalid)
+    """
+    path = run_state_path(fund_name, period)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as state_file:
+        try:
+            state = json.load(state_file)
+        except ValueError:
+            return {}
+
+    if fund is not None and not tail_matches(state.get('tail'), fund):
+        return {}
+
+    return state
+
+
+def save_run_state(fund_name: str, period: str, state: dict, fund: pd.DataFrame):
+    """Save Run State
+
+    Arguments:
+        fund_name {str} -- ticker symbol
+        period {str} -- period of the dataset (e.g. '2y')
+        state {dict} -- run state of resumable indicators
+        fund {pd.DataFrame} -- dataset the state was computed on
+    """
+    if not os.path.exists(RUN_STATE_DIR):
+        os.makedirs(RUN_STATE_DIR)
+
+    state['tail'] = get_tail(fund)
+    write_replace(run_state_path(fund_name, period),
+                  lambda state_file: json.dump(state, state_file), mode='w')
+
+
+def get_tail(fund: pd.DataFrame) -> dict:
+    """ Trailing dates, closes, and volumes used to validate a saved state """
+    length = min(TAIL_BARS, len(fund.index))
+    return {
+        "dates": [str(date) for date in fund.index[-length:]],
+        "close": [float(close) for close in fund['Close'][-length:]],
+        "volume": [float(vol) for vol in fund['Volume'][-length:]]
+    }
+
+
+def tail_matches(tail: dict, fund: pd.DataFrame) -> bool:
+    """Tail Matches
+
+    Arguments:
+        tail {dict} -- trailing bars of a saved state
+        fund {pd.DataFrame} -- current dataset
+
+    Returns:
+        bool -- True if the trailing bars exist, unchanged, in the current dataset
+    """
+    if tail is None or len(tail['dates']) == 0:
+        return False
+
+    index = bar_index(fund, tail['dates'][-1])
+    if index is None:
+        return False
+
+    start = index - len(tail['dates']) + 1
+    if start < 0:
+        return False
+
+    for i, date in enumerate(tail['dates']):
+        if str(fund.index[start + i]) != date:
+            return False
+        if float(fund['Close'][start + i]) != tail['close'][i]:
+            return False
+        if float(fund['Volume'][start + i]) != tail['volume'][i]:
+            return False
+
+    return True
+
+
+def bar_index(fund: pd.DataFrame, date: str):
+    """ Index of the bar with date string 'date', searching back from the newest bar """
+    for i in range(len(fund.index)-1, -1, -1):
+        if str(fund.index[i]) == date:
+            return i
+    return None
+
+
+def resume_point(fund: pd.DataFrame, state: dict):
+    """Resume Point
+
+    Arguments:
+        fund {pd.DataFrame} -- current dataset
+        state {dict} -- indicator state (see 'start_state')
+
+    Returns:
+        int -- number of new bars to advance, None if the indicator must be fully computed
+    """
+    if not state or 'kernel' not in state or 'last_date' not in state or 'anchor' not in state:
+        return None
+
+    index = bar_index(fund, state['last_date'])
+    if index is None:
+        return None
+
+    if pd.Timestamp(fund.index[0]) < pd.Timestamp(state['first_date']):
+        # Window reaches back before the stored signal (e.g. a longer period); cannot splice
+        return None
+
+    return len(fund.index) - 1 - index
+
+
+def start_state(state: dict, fund: pd.DataFrame, kernel: dict, **signals):
+    """Start State
+
+    Records the kernel state and signals of a fully computed indicator, anchoring it at the first
+    bar of 'fund'
+
+    Arguments:
+        state {dict} -- indicator state to reset in place (ignored if None)
+        fund {pd.DataFrame} -- dataset the signals were computed on
+        kernel {dict} -- resumable kernel state
+        signals {list} -- named signals to splice into on the next run
+    """
+    if state is None:
+        return
+    state.clear()
+    state['anchor'] = str(fund.index[0])
+    update_state(state, fund, kernel, **signals)
+
+
+def update_state(state: dict, fund: pd.DataFrame, kernel: dict, **signals):
+    """Update State
+
+    Records the kernel state and signals of a resumed indicator (its anchor is kept)
+
+    Arguments:
+        state {dict} -- indicator state to update in place (ignored if None)
+        fund {pd.DataFrame} -- dataset the signals were computed on
+        kernel {dict} -- resumable kernel state
+        signals {list} -- named signals to splice into on the next run
+    """
+    if state is None:
+        return
+    state['kernel'] = kernel
+    state['first_date'] = str(fund.index[0])
+    state['last_date'] = str(fund.index[-1])
+    state['signals'] = signals
+
+
+def splice_signal(previous: list, new_values: list, length: int) -> list:
+    """Splice Signal
+
+    Appends newly computed values to a previous signal, dropping bars no longer in the window
+
+    Arguments:
+        previous {list} -- signal of the previous run
+        new_values {list} -- values of the newly arrived bars
+        length {int} -- length of the current dataset
+
+    Returns:
+        list -- signal aligned to the current dataset
+    """
+    signal = list(previous) + list(new_values)
+    return signal[len(signal)-length:]
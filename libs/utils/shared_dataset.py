@@ -0,0 +1,84 @@
+"""
+Shared Dataset
+
+Places the downloaded dataset ({period: {ticker: pd.DataFrame}}) into shared memory blocks so
+worker processes can rebuild it from a small manifest instead of receiving a pickled copy of the
+whole dataset with every task.
+"""
+from multiprocessing import shared_memory
+
+import pandas as pd
+import numpy as np
+
+
+def share_dataset(dataset: dict) -> list:
+    """Share Dataset
+
+    Arguments:
+        dataset {dict} -- {period: {ticker: pd.DataFrame}} dataset
+
+    Returns:
+        list -- manifest (picklable) of the shared dataset, list of owned shared memory blocks
+    """
+    manifest = {}
+    blocks = []
+    for period in dataset:
+        manifest[period] = {}
+        for ticker, fund in dataset[period].items():
+            values = fund.to_numpy(dtype=np.float64)
+            dates = fund.index.values.astype('datetime64[ns]').astype(np.int64)
+
+            # Dates are stored as the first column (int64 bits) of the float64 block
+            size = max((values.size + len(dates)) * 8, 1)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            shared = np.ndarray((len(dates), values.shape[1] + 1),
+                                dtype=np.float64, buffer=block.buf)
+            shared[:, 0] = dates.view(np.float64)
+            shared[:, 1:] = values
+            blocks.append(block)
+
+            manifest[period][ticker] = {
+                "block": block.name,
+                "shape": shared.shape,
+                "columns": list(fund.columns),
+                "index_name": fund.index.name
+            }
+
+    return manifest, blocks
+
+
+def attach_dataset(manifest: dict) -> dict:
+    """Attach Dataset
+
+    Rebuilds the dataset once per worker process; the shared blocks are closed afterwards.
+
+    Arguments:
+        manifest {dict} -- manifest returned by 'share_dataset'
+
+    Returns:
+        dict -- {period: {ticker: pd.DataFrame}} dataset
+    """
+    dataset = {}
+    for period in manifest:
+        dataset[period] = {}
+        for ticker, item in manifest[period].items():
+            block = shared_memory.SharedMemory(name=item['block'])
+            shared = np.ndarray(item['shape'], dtype=np.float64,
+                                buffer=block.buf)
+
+            dates = pd.DatetimeIndex(shared[:, 0].copy().view(
+                np.int64).astype('datetime64[ns]'), name=item['index_name'])
+            dataset[period][ticker] = pd.DataFrame(
+                shared[:, 1:].copy(), index=dates, columns=item['columns'])
+
+            del shared
+            block.close()
+
+    return dataset
+
+
+def release_dataset(blocks: list):
+    """ Closes and frees the shared memory blocks created by 'share_dataset' """
+    for block in blocks:
+        block.close()
+        block.unlink()
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from .constants import TEXT_COLOR_MAP, STANDARD_COLORS, LOGO_COLORS
+from .metadata_cache import metadata_cache_print
 
 OUTLINE_COLOR = TEXT_COLOR_MAP["blue"]
 NORMAL = STANDARD_COLORS["normal"]
@@ -65,6 +66,7 @@ def start_header(**kwargs) -> dict:
     config['tickers'] = ''
     config['exports'] = {"run": False, "fields": []}
     config['views'] = {"pptx": '2y'}
+    config['workers'] = 1
 
     config, list_of_tickers = header_options_parse(input_str, config)
 
@@ -283,6 +285,11 @@ def header_options_parse(input_str: str, config: dict) -> list:
         config['state'] = 'halt'
         return config, ticker_keys
 
+    if '--metadata_cache' in i_keys:
+        metadata_cache_print()
+        config['state'] = 'halt'
+        return config, ticker_keys
+
     # Configuration flags that append to states but do not return / force them
     if '--core' in i_keys:
         core = header_json_parse('--core')
@@ -323,6 +330,37 @@ def header_options_parse(input_str: str, config: dict) -> list:
     if '--suppress' in i_keys:
         config = add_str_to_dict_key(config, 'state', 'suppress_pptx')
 
+    if '--incremental' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'incremental')
+
+    if '--cache' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'indicator_cache')
+
+    if '--metadata_refresh' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'metadata_refresh')
+
+    # Parallel (fund, period) analysis in worker processes, e.g. '--parallel' or '--workers=8'
+    if '--parallel' in i_keys:
+        config['workers'] = os.cpu_count()
+
+    for key in i_keys:
+        if key.startswith('--workers='):
+            workers = key.split('=')[1]
+            if workers.isdigit() and int(workers) > 0:
+                config['workers'] = int(workers)
+
+    # Funds whose metadata / sector data are fetched ahead of the analysis, e.g. '--lookahead=4'
+    for key in i_keys:
+        if key.startswith('--lookahead='):
+            lookahead = key.split('=')[1]
+            if lookahead.isdigit() and int(lookahead) > 0:
+                config['lookahead'] = int(lookahead)
+
+    # Saved charts rendered in a worker pool ('async'), inline ('sync') or not at all ('off')
+    for key in i_keys:
+        if key.startswith('--render='):
+            config['render'] = key.split('=')[1].lower()
+
     # Exporting of data from metadata.json to dataframe-like file
     if '--export' in i_keys:
         config = add_str_to_dict_key(config, 'state', 'function run')
@@ -332,6 +370,11 @@ def header_options_parse(input_str: str, config: dict) -> list:
         config['exports'] = {"run": True,
                              "fields": ' '.join(ticker_keys)}
 
+    # Export file format, e.g. '--export_format=arrow' ('parquet', 'arrow' or 'csv')
+    for key in i_keys:
+        if key.startswith('--export_format=') and isinstance(config.get('exports'), dict):
+            config['exports']['format'] = key.split('=')[1].lower()
+
     # Only creating a pptx from existing metadata file
     if ('--pptx' in i_keys):
         config = add_str_to_dict_key(
@@ -1,9 +1,10 @@
 from libs.ui_generation import slide_creator
 from libs.ui_generation import output_to_json
 from libs.ui_generation import PDF_creator
+from libs.ui_generation import FUND_FRAGMENTS
 
 from libs.metrics import metadata_to_dataset
-from libs.utils import remove_temp_dir
+from libs.utils import remove_temp_dir, RENDER_POOL
 
 
 def run_exports(analysis: dict, script: list):
@@ -17,10 +18,15 @@ def run_exports(analysis: dict, script: list):
     """
     config = script[3]
 
+    # Charts still rendering in the pool must be written before the exporters read them
+    RENDER_POOL.wait()
+
     slide_creator(analysis, config=config)
     output_to_json(analysis)
     PDF_creator(analysis, config=config)
 
     metadata_to_dataset(config=config)
 
+    RENDER_POOL.close()
+    FUND_FRAGMENTS.close()
     remove_temp_dir()
@@ -3,6 +3,13 @@ from libs.metrics import bond_composite_index
 from libs.metrics import correlation_composite_index
 from libs.metrics import type_composite_index
 
+from libs.metrics.market_composite_index import session_request as mci_session_request
+from libs.metrics.bond_composite_index import session_request as bci_session_request
+from libs.metrics.correlation_index import session_request as cci_session_request
+from libs.metrics.type_composite_index import session_request as tci_session_request
+
+from libs.utils import MarketDataSession
+
 
 def run_indexes(analysis: dict, script: list, clock=None) -> dict:
     """Run Indexes
@@ -20,17 +27,36 @@ def run_indexes(analysis: dict, script: list, clock=None) -> dict:
         [dict] -- app funds data object
     """
     config = script[3]
+    session = index_data_session(config)
 
     analysis['_METRICS_'] = {}
-    analysis['_METRICS_']['mci'], data, sectors = market_composite_index(
-        config=config, plot_output=False, clock=clock)
+    analysis['_METRICS_']['mci'], _, _ = market_composite_index(
+        config=config, plot_output=False, clock=clock, session=session)
 
-    bond_composite_index(config=config, plot_output=False, clock=clock)
+    bond_composite_index(config=config, plot_output=False,
+                         clock=clock, session=session)
 
-    analysis['_METRICS_']['correlation'], data, sectors = correlation_composite_index(
-        config=config, plot_output=False, clock=clock, data=data, sectors=sectors)
+    analysis['_METRICS_']['correlation'], _, _ = correlation_composite_index(
+        config=config, plot_output=False, clock=clock, session=session)
 
-    analysis['_METRICS_']['tci'], data, sectors = type_composite_index(
-        config=config, plot_output=False, clock=clock, data=data, sectors=sectors)
+    analysis['_METRICS_']['tci'], _, _ = type_composite_index(
+        config=config, plot_output=False, clock=clock, session=session)
 
     return analysis, clock
+
+
+def index_data_session(config: dict) -> MarketDataSession:
+    """Index Data Session
+
+    Arguments:
+        config {dict} -- controlling config dictionary
+
+    Returns:
+        MarketDataSession -- session with every enabled index's funds registered, so the index
+                             phase fetches its data in one batch
+    """
+    session = MarketDataSession()
+    for session_request in (mci_session_request, bci_session_request,
+                            cci_session_request, tci_session_request):
+        session_request(session, config)
+    return session
@@ -3,6 +3,9 @@ from libs.utils import download_data_all
 from libs.utils import has_critical_error
 from libs.utils import index_appender
 from libs.utils import remove_temp_dir, configure_temp_dir
+from libs.utils import configure_indicator_cache, configure_metadata_cache
+from libs.utils import configure_render_pool
+from libs.ui_generation import configure_fund_fragments
 from libs.functions import only_functions_handler
 from libs.utils import TEXT_COLOR_MAP
 
@@ -59,6 +62,8 @@ def init_script(config: dict, **kwargs) -> list:
     if config['state'] == 'halt':
         return
 
+    configure_metadata_cache(config)
+
     if 'function' in config['state']:
         # If only simple functions are desired, they go into this handler
         only_functions_handler(config)
@@ -71,6 +76,9 @@ def init_script(config: dict, **kwargs) -> list:
     # Temporary directories to save graphs as images, etc.
     remove_temp_dir()
     configure_temp_dir()
+    configure_indicator_cache(config)
+    configure_render_pool(config)
+    configure_fund_fragments(config)
 
     dataset, funds, periods, config = download_data_all(config=config)
 
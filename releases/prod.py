@@ -13,6 +13,9 @@
 #   
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+
 # Imports that are custom tools that are the crux of this program
 from libs.tools import full_stochastic, ultimate_oscillator, cluster_oscs, RSI
 from libs.tools import awesome_oscillator, momentum_oscillator
@@ -41,8 +44,13 @@ from libs.features import analyze_price_gaps
 # Imports that are generic file/string/object/date utility functions
 from libs.utils import date_extractor
 from libs.utils import create_sub_temp_dir
-from libs.utils import get_api_metadata
+from libs.utils import get_api_metadata, fetch_api_metadata, api_sector_data
+from libs.utils import FundPrefetcher, PREFETCH_LOOKAHEAD
 from libs.utils import INDEXES, SKIP_INDEXES
+from libs.utils import load_run_state, save_run_state
+from libs.utils import METADATA_STREAM
+
+from libs.ui_generation import FUND_FRAGMENTS
 
 # Imports that drive custom metrics for market analysis
 from libs.metrics import future_returns
@@ -50,7 +58,9 @@ from libs.metrics import generate_synopsis
 from libs.metrics import assemble_last_signals
 
 # Imports that start process and show progress doing so
-from libs.utils import ProgressBar, start_clock
+from libs.utils import ProgressBar, ProgressQueue, start_clock
+from libs.utils import share_dataset, attach_dataset, release_dataset
+from libs.utils import configure_indicator_cache
 
 # Imports in development / non-final "public" calls
 from test import test_competitive
@@ -78,6 +88,16 @@ def run_prod(script: list):
     analysis = {}
     clock = start_clock()
 
+    if config.get('workers', 1) > 1:
+        analysis = run_prod_parallel(dataset, funds, periods, config, clock)
+        return analysis, clock
+
+    # Metadata and sector data of upcoming funds are fetched in the background of the analysis
+    prefetcher = FundPrefetcher(
+        [fund for fund in funds if fund not in SKIP_INDEXES], dataset, periods, config,
+        lookahead=config.get('lookahead', PREFETCH_LOOKAHEAD))
+    prefetcher.start()
+
     for fund_name in funds:
 
         if fund_name in SKIP_INDEXES:
@@ -89,150 +109,350 @@ def run_prod(script: list):
         create_sub_temp_dir(fund_name, sub_periods=config['period'])
 
         analysis[fund_name] = {}
+        prefetched = prefetcher.get(fund_name)
 
         analysis[fund_name]['metadata'] = get_api_metadata(
             fund_name,
             max_close=max(dataset[periods[0]][fund_name]['Close']),
-            data=dataset[periods[0]][fund_name])
+            data=dataset[periods[0]][fund_name],
+            fetched=prefetched['metadata'])
 
         ###################### START OF PERIOD LOOPING #############################
         for i, period in enumerate(periods):
-            fund_data = {}
-
-            fund = dataset[period][fund_name]
-
-            start = date_extractor(fund.index[0], _format='str')
-            end = date_extractor(fund.index[-1], _format='str')
-            fund_data['dates_covered'] = {
-                'start': str(start), 'end': str(end)}
-            fund_data['name'] = fund_name
-
             fund_print2 = fund_print + f" ({period}) "
             p = ProgressBar(config['process_steps'],
                             name=fund_print2, offset=clock)
             p.start()
 
-            fund_data['statistics'] = get_high_level_stats(fund)
+            fund_data = analyze_fund_period(
+                fund_name, period, i, dataset, config,
+                analysis[fund_name]['metadata'], p,
+                sector_match=prefetched['sector_match'].get(period))
 
-            fund_data['clustered_osc'] = cluster_oscs(
-                fund,
-                function='all',
-                filter_thresh=3,
-                name=fund_name,
-                plot_output=False,
-                progress_bar=p,
-                view=period)
+            p.end()
 
-            fund_data['full_stochastic'] = full_stochastic(
-                fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period)
+            analysis[fund_name][period] = fund_data
+            METADATA_STREAM.write(fund_name, period, fund_data)
 
-            fund_data['rsi'] = RSI(
-                fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period)
+        analysis[fund_name]['synopsis'] = generate_synopsis(
+            analysis, name=fund_name)
+        METADATA_STREAM.write(fund_name, 'metadata', analysis[fund_name]['metadata'])
+        METADATA_STREAM.write(fund_name, 'synopsis', analysis[fund_name]['synopsis'])
 
-            fund_data['ultimate'] = ultimate_oscillator(
-                fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period)
+        # The fund is complete: its slides are built while the next funds are analyzed
+        FUND_FRAGMENTS.submit(fund_name, analysis[fund_name])
 
-            fund_data['awesome'] = awesome_oscillator(
-                fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+    prefetcher.close()
+    return analysis, clock
 
-            fund_data['momentum_oscillator'] = momentum_oscillator(
-                fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
 
-            fund_data['on_balance_volume'] = on_balance_volume(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+def analyze_fund_period(fund_name: str, period: str, i: int, dataset: dict, config: dict,
+                        metadata: dict, p, sector_match: list = None) -> dict:
+    """Analyze Fund Period
 
-            fund_data['simple_moving_average'] = triple_moving_average(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    Runs all production indicators for a single fund over a single period
 
-            fund_data['exp_moving_average'] = triple_exp_mov_average(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    Arguments:
+        fund_name {str} -- ticker symbol
+        period {str} -- period key of dataset (e.g. '2y')
+        i {int} -- index of the period (matching config['interval'])
+        dataset {dict} -- {period: {ticker: pd.DataFrame}} dataset
+        config {dict} -- app control object
+        metadata {dict} -- api metadata of the fund
+        p {ProgressBar} -- progress bar (or ProgressQueue in a worker process)
+
+    Keyword Arguments:
+        sector_match {list} -- prefetched sector match data of the period (default: {None},
+                               fetched by 'relative_strength')
 
-            fund_data['sma_swing_trade'] = moving_average_swing_trade(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    Returns:
+        dict -- analysis object of the fund's period
+    """
+    fund_data = {}
 
-            fund_data['ema_swing_trade'] = moving_average_swing_trade(
-                fund, function='ema', plot_output=False,
-                name=fund_name, progress_bar=p, view=period)
+    fund = dataset[period][fund_name]
 
-            fund_data['hull_moving_average'] = hull_moving_average(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    run_state = None
+    if 'incremental' in config['state']:
+        run_state = load_run_state(fund_name, period, fund=fund)
 
-            fund_data['macd'] = mov_avg_convergence_divergence(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    start = date_extractor(fund.index[0], _format='str')
+    end = date_extractor(fund.index[-1], _format='str')
+    fund_data['dates_covered'] = {
+        'start': str(start), 'end': str(end)}
+    fund_data['name'] = fund_name
 
-            fund_data['bear_bull_power'] = bear_bull_power(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['statistics'] = get_high_level_stats(fund)
 
-            fund_data['total_power'] = total_power(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['clustered_osc'] = cluster_oscs(
+        fund,
+        function='all',
+        filter_thresh=3,
+        name=fund_name,
+        plot_output=False,
+        progress_bar=p,
+        view=period)
 
-            fund_data['bollinger_bands'] = bollinger_bands(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['full_stochastic'] = full_stochastic(
+        fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'full_stochastic'))
 
-            fund_data['commodity_channels'] = commodity_channel_index(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['rsi'] = RSI(
+        fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'rsi'))
 
-            fund_data['rate_of_change'] = rate_of_change_oscillator(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['ultimate'] = ultimate_oscillator(
+        fund, name=fund_name, plot_output=False, out_suppress=False, progress_bar=p, view=period)
 
-            fund_data['know_sure_thing'] = know_sure_thing(
-                fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+    fund_data['awesome'] = awesome_oscillator(
+        fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
 
-            if 'no_index' not in config['state']:
-                strength, match_data = relative_strength(
-                    fund_name,
-                    full_data_dict=dataset[period],
-                    config=config,
-                    plot_output=False,
-                    meta=analysis[fund_name]['metadata'],
-                    progress_bar=p,
-                    period=period,
-                    interval=config['interval'][i],
-                    view=period
-                )
-                fund_data['relative_strength'] = strength
+    fund_data['momentum_oscillator'] = momentum_oscillator(
+        fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
 
-                fund_data['statistics']['risk_ratios'] = risk_comparison(
-                    fund, dataset[period]['^GSPC'], dataset[period]['^IRX'],
-                    sector_data=match_data)
-                p.uptick()
+    fund_data['on_balance_volume'] = on_balance_volume(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'on_balance_volume'))
 
-            # Support and Resistance Analysis
-            fund_data['support_resistance'] = find_resistance_support_lines(
-                fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+    fund_data['simple_moving_average'] = triple_moving_average(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
 
-            # Feature Detection Block
-            fund_data['features'] = {}
-            fund_data['features']['head_shoulders'] = feature_detection_head_and_shoulders(
-                fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+    fund_data['exp_moving_average'] = triple_exp_mov_average(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'exp_moving_average'))
 
-            fund_data['candlesticks'] = candlesticks(
-                fund, name=fund_name, plot_output=False, view=period, progress_bar=p)
+    fund_data['sma_swing_trade'] = moving_average_swing_trade(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
 
-            fund_data['price_gaps'] = analyze_price_gaps(
-                fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+    fund_data['ema_swing_trade'] = moving_average_swing_trade(
+        fund, function='ema', plot_output=False,
+        name=fund_name, progress_bar=p, view=period)
 
-            # Get Trendlines
-            fund_data['trendlines'] = get_trendlines(
-                fund,
-                name=fund_name,
-                plot_output=False,
-                progress_bar=p,
-                view=period,
-                meta=analysis[fund_name]['metadata'])
+    fund_data['hull_moving_average'] = hull_moving_average(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
 
-            # Various Fund-specific Metrics
-            fund_data['futures'] = future_returns(fund, progress_bar=p)
+    fund_data['macd'] = mov_avg_convergence_divergence(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'macd'))
 
-            # Parse through indicators and pull out latest signals (must be last)
-            fund_data['last_signals'] = assemble_last_signals(
-                fund_data, progress_bar=p)
+    fund_data['bear_bull_power'] = bear_bull_power(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
 
-            p.end()
+    fund_data['total_power'] = total_power(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
 
-            analysis[fund_name][period] = fund_data
+    fund_data['bollinger_bands'] = bollinger_bands(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+
+    fund_data['commodity_channels'] = commodity_channel_index(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+
+    fund_data['rate_of_change'] = rate_of_change_oscillator(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period)
+
+    fund_data['know_sure_thing'] = know_sure_thing(
+        fund, plot_output=False, name=fund_name, progress_bar=p, view=period,
+        state=indicator_state(run_state, 'know_sure_thing'))
+
+    if 'no_index' not in config['state']:
+        strength, match_data = relative_strength(
+            fund_name,
+            full_data_dict=dataset[period],
+            config=config,
+            plot_output=False,
+            meta=metadata,
+            progress_bar=p,
+            period=period,
+            interval=config['interval'][i],
+            view=period,
+            sector_match=sector_match
+        )
+        fund_data['relative_strength'] = strength
+
+        fund_data['statistics']['risk_ratios'] = risk_comparison(
+            fund, dataset[period]['^GSPC'], dataset[period]['^IRX'],
+            sector_data=match_data)
+        p.uptick()
+
+    # Support and Resistance Analysis
+    fund_data['support_resistance'] = find_resistance_support_lines(
+        fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+
+    # Feature Detection Block
+    fund_data['features'] = {}
+    fund_data['features']['head_shoulders'] = feature_detection_head_and_shoulders(
+        fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+
+    fund_data['candlesticks'] = candlesticks(
+        fund, name=fund_name, plot_output=False, view=period, progress_bar=p)
+
+    fund_data['price_gaps'] = analyze_price_gaps(
+        fund, name=fund_name, plot_output=False, progress_bar=p, view=period)
+
+    # Get Trendlines
+    fund_data['trendlines'] = get_trendlines(
+        fund,
+        name=fund_name,
+        plot_output=False,
+        progress_bar=p,
+        view=period,
+        meta=metadata)
+
+    # Various Fund-specific Metrics
+    fund_data['futures'] = future_returns(fund, progress_bar=p)
+
+    # Parse through indicators and pull out latest signals (must be last)
+    fund_data['last_signals'] = assemble_last_signals(
+        fund_data, progress_bar=p)
+
+    if run_state is not None:
+        save_run_state(fund_name, period, run_state, fund)
+
+    return fund_data
+
+
+def run_prod_parallel(dataset: dict, funds: list, periods: list, config: dict, clock) -> dict:
+    """Run Production Script - Parallel
+
+    Each (fund, period) analysis runs in a worker process. The dataset is handed to the workers
+    through shared memory, worker progress is aggregated into a single ProgressBar, and results
+    are merged back in fund and period order.
+
+    Arguments:
+        dataset {dict} -- {period: {ticker: pd.DataFrame}} dataset
+        funds {list} -- ticker symbols
+        periods {list} -- period keys of dataset
+        config {dict} -- app control object
+        clock {float} -- start time of the analysis
+
+    Returns:
+        dict -- analysis object of fund data
+    """
+    workers = config.get('workers', 1)
+    analysis = {}
+    tasks = []
+
+    fetcher = fetch_api_metadata(
+        [fund for fund in funds if fund not in SKIP_INDEXES], dataset=dataset[periods[0]])
+
+    for fund_name in funds:
+        if fund_name in SKIP_INDEXES:
+            continue
+
+        fund_print = INDEXES.get(fund_name, fund_name)
+        print("")
+        print(f"~~{fund_print}~~")
+        create_sub_temp_dir(fund_name, sub_periods=config['period'])
 
+        analysis[fund_name] = {}
+        analysis[fund_name]['metadata'] = get_api_metadata(
+            fund_name,
+            max_close=max(dataset[periods[0]][fund_name]['Close']),
+            data=dataset[periods[0]][fund_name],
+            fetcher=fetcher)
+
+        # Sector data is fetched here, not by each worker: workers refreshing the same sector
+        # funds would race on their price store files
+        sector_match = {}
+        if 'no_index' not in config['state']:
+            sector = analysis[fund_name]['metadata'].get('info', {}).get('sector')
+            for i, period in enumerate(periods):
+                sector_match[period] = api_sector_data(
+                    sector, fund_name, dataset[period], config,
+                    period=period, interval=config['interval'][i])
+
+        for i, period in enumerate(periods):
+            tasks.append((fund_name, period, i, sector_match.get(period)))
+
+    fetcher.close()
+    if len(tasks) == 0:
+        return analysis
+
+    print("")
+    p = ProgressBar(config['process_steps'] * len(tasks),
+                    name=f"{len(tasks)} analyses ({workers} workers)", offset=clock)
+    p.start()
+
+    manifest, blocks = share_dataset(dataset)
+    manager = multiprocessing.Manager()
+    queue = manager.Queue()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_prod_worker,
+                                 initargs=(manifest, queue)) as executor:
+            futures = [executor.submit(prod_worker_task, fund_name, period, i, config,
+                                       analysis[fund_name]['metadata'], sector_match)
+                       for fund_name, period, i, sector_match in tasks]
+
+            pending = set(futures)
+            while len(pending) > 0:
+                _, pending = wait(pending, timeout=0.2)
+                drain_progress(queue, p)
+            drain_progress(queue, p)
+
+            # Merge in submission order so the analysis object is deterministic
+            for (fund_name, period, _, _), future in zip(tasks, futures):
+                analysis[fund_name][period] = future.result()
+                METADATA_STREAM.write(fund_name, period, analysis[fund_name][period])
+
+    finally:
+        release_dataset(blocks)
+        manager.shutdown()
+
+    p.end()
+
+    for fund_name in analysis:
         analysis[fund_name]['synopsis'] = generate_synopsis(
             analysis, name=fund_name)
+        METADATA_STREAM.write(fund_name, 'metadata', analysis[fund_name]['metadata'])
+        METADATA_STREAM.write(fund_name, 'synopsis', analysis[fund_name]['synopsis'])
 
-    return analysis, clock
+        # The fund is complete: its slides are built while the index metrics run
+        FUND_FRAGMENTS.submit(fund_name, analysis[fund_name])
+
+    return analysis
+
+
+_WORKER = {}
+
+
+def init_prod_worker(manifest: dict, queue):
+    """ Worker process initializer: rebuilds the shared dataset once per process """
+    _WORKER['dataset'] = attach_dataset(manifest)
+    _WORKER['queue'] = queue
+
+
+def prod_worker_task(fund_name: str, period: str, i: int, config: dict, metadata: dict,
+                     sector_match: list = None) -> dict:
+    """ Worker process task: analysis of a single (fund, period) """
+    configure_indicator_cache(config)
+    p = ProgressQueue(config['process_steps'], _WORKER['queue'])
+    fund_data = analyze_fund_period(
+        fund_name, period, i, _WORKER['dataset'], config, metadata, p,
+        sector_match=sector_match)
+    p.end()
+    return fund_data
+
+
+def drain_progress(queue, p: ProgressBar):
+    """ Applies all queued worker progress increments to the aggregated progress bar """
+    increment = 0.0
+    while not queue.empty():
+        increment += queue.get()
+    if increment > 0.0:
+        p.uptick(increment=increment)
+
+
+def indicator_state(run_state: dict, key: str) -> dict:
+    """Indicator State
+
+    Arguments:
+        run_state {dict} -- run state of a fund's period (None if not an incremental run)
+        key {str} -- indicator key
+
+    Returns:
+        dict -- resumable state of the indicator, None if not an incremental run
+    """
+    if run_state is None:
+        return None
+    return run_state.setdefault(key, {})
@@ -14,7 +14,7 @@
 """
 
 # Imports from libraries
-from libs.utils import start_clock
+from libs.utils import start_clock, indicator_cache_print, metadata_cache_stats_print
 
 # Imports from releases
 from .load_start import init_script
@@ -52,6 +52,8 @@ def technical_analysis(config: dict, release='prod'):
 
     analysis, clock = run_indexes(analysis, script, clock=clock)
     run_exports(analysis, script)
+    indicator_cache_print()
+    metadata_cache_stats_print()
 
     return clock
 
@@ -0,0 +1,97 @@
+""" Benchmark suite: baseline regression gates, and an offline run of every case """
+import json
+
+import pytest
+
+from libs.benchmark import __main__ as benchmark_main
+from libs.benchmark.benchmark import run_benchmark, fund_cases, INDEX_CASES
+from libs.benchmark.benchmark import compare_baseline, save_baseline, load_baseline
+from libs.benchmark.benchmark import REGRESSION_MIN_SECONDS
+from libs.utils import RENDER_POOL, price_store
+
+
+def result(seconds: float, peak_mb: float = None) -> dict:
+    return {'group': 'fund', 'case': 'rsi', 'length': '1y', 'funds': 1,
+            'seconds': seconds, 'peak_mb': peak_mb}
+
+
+def baseline_of(results: dict) -> dict:
+    return {'version': 1, 'results': results}
+
+
+@pytest.mark.parametrize('current, flagged', [
+    (0.100, False),     # unchanged
+    (0.120, False),     # within the relative tolerance
+    (0.200, True),      # twice as slow
+])
+def test_slowdown_is_flagged(current, flagged):
+    regressions = compare_baseline({'fund:rsi:1y:1': result(current)},
+                                   baseline_of({'fund:rsi:1y:1': result(0.100)}))
+    assert (len(regressions) == 1) == flagged
+
+
+def test_small_absolute_change_is_not_flagged():
+    # Relatively much slower, but below the absolute floor (timer noise of tiny cases)
+    previous = REGRESSION_MIN_SECONDS / 10.0
+    regressions = compare_baseline({'fund:rsi:1y:1': result(previous * 5.0)},
+                                   baseline_of({'fund:rsi:1y:1': result(previous)}))
+    assert regressions == []
+
+
+def test_memory_growth_is_flagged():
+    regressions = compare_baseline({'fund:rsi:1y:1': result(0.1, peak_mb=40.0)},
+                                   baseline_of({'fund:rsi:1y:1': result(0.1, peak_mb=10.0)}))
+    assert [(regression['key'], regression['metric']) for regression in regressions] == \
+        [('fund:rsi:1y:1', 'peak_mb')]
+
+
+def test_tolerance_and_new_cases():
+    results = {'fund:rsi:1y:1': result(0.2), 'fund:macd:1y:1': result(9.0)}
+    baseline = baseline_of({'fund:rsi:1y:1': result(0.1)})
+    assert len(compare_baseline(results, baseline)) == 1
+    assert compare_baseline(results, baseline, tolerance=1.5) == []
+    assert compare_baseline(results, None) == []
+
+
+def test_baseline_of_another_version_is_not_compared(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    save_baseline({'fund:rsi:1y:1': result(0.1)}, path)
+    assert load_baseline(path)['results'] == {'fund:rsi:1y:1': result(0.1)}
+
+    with open(path) as b_file:
+        baseline = json.load(b_file)
+    baseline['version'] = 0
+    with open(path, 'w') as b_file:
+        json.dump(baseline, b_file)
+    assert load_baseline(path) is None
+    assert load_baseline(str(tmp_path / 'missing.json')) is None
+
+
+def test_runner_exits_non_zero_on_regression(tmp_path):
+    path = str(tmp_path / 'baseline.json')
+    args = ['--lengths', '1y', '--funds', '1', '--groups', 'prod', '--cases', 'analyze_fund',
+            '--repeat', '1', '--no_memory', '--baseline', path]
+    assert benchmark_main.main(args + ['--save']) == 0
+
+    with open(path) as b_file:
+        baseline = json.load(b_file)
+    for key in baseline['results']:
+        baseline['results'][key]['seconds'] = 0.0
+    with open(path, 'w') as b_file:
+        json.dump(baseline, b_file)
+    assert benchmark_main.main(args) == 1
+
+
+def test_every_case_runs_offline():
+    render_mode = RENDER_POOL.summary()['mode']
+    results = run_benchmark(lengths=['1y'], fund_counts=[1], repeat=1, memory=False)
+
+    expected = [f"fund:{case}:1y:1" for case, _, _ in fund_cases()] + \
+        ['prod:analyze_fund:1y:1'] + [f"index:{case}:1y:1" for case, _ in INDEX_CASES]
+    assert sorted(results) == sorted(expected)
+    assert all(case['seconds'] >= 0.0 and case['peak_mb'] is None for case in results.values())
+
+    # Charts were dropped, and the index session's scratch store and provider restored
+    assert RENDER_POOL.summary()['mode'] == render_mode
+    assert price_store._STORE['dir'] == price_store.PRICE_STORE_DIR
+    assert price_store._PROVIDER['fetch'] is price_store.yfinance_provider
@@ -0,0 +1,78 @@
+""" Candlestick detections against recorded outputs of the per-day pattern implementation """
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import libs.tools.candlesticks  # pylint: disable=unused-import
+
+# 'libs.tools.candlesticks' is shadowed by the function of the same name on 'libs.tools'
+candlesticks = sys.modules['libs.tools.candlesticks']
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+BODIES = ['body', 'vol_body']
+
+
+@pytest.fixture(scope='module')
+def expected() -> dict:
+    with open(os.path.join(FIXTURES, 'candlestick_expected.json')) as expected_file:
+        return json.load(expected_file)
+
+
+@pytest.fixture(scope='module')
+def detected() -> dict:
+    fund = pd.read_csv(os.path.join(FIXTURES, 'candlestick_ohlc.csv'),
+                       index_col=0, parse_dates=True)
+    candle = dict()
+    candle['thresholds'] = candlesticks.thresholding_determination(fund, plot_output=False)
+    columns = candlesticks.candle_columns(fund, candle['thresholds'])
+    candle['classification'] = candlesticks.day_classification(
+        fund, candle['thresholds'], columns=columns)
+    candle = candlesticks.pattern_detection(
+        fund, candle, plot_output=False, columns=columns)
+    candle['signals'] = candlesticks.get_pattern_signals(candle, fund)
+    # Recorded through json: dates as strings, tuples as lists
+    return json.loads(json.dumps(candle, default=str))
+
+
+@pytest.fixture(scope='module')
+def fuzzed_columns() -> dict:
+    frame = pd.read_csv(os.path.join(FIXTURES, 'candlestick_columns.csv'))
+    columns = {key: frame[key].to_numpy()
+               for key in ['open', 'high', 'low', 'close', 'shadow_ratio']}
+    columns['flags'] = frame['flags'].to_numpy(dtype=np.uint8)
+    return columns
+
+
+def test_thresholds(expected, detected):
+    recorded = expected['ohlc']['thresholds']
+    thresholds = detected['thresholds']
+    assert thresholds.keys() == recorded.keys()
+    for key, value in recorded.items():
+        if key == 'volatility':
+            for vol_key, vol_values in value.items():
+                np.testing.assert_allclose(thresholds[key][vol_key], vol_values)
+        else:
+            assert thresholds[key] == pytest.approx(value)
+
+
+def test_patterns(expected, detected):
+    patterns = [[i, pattern['value'], pattern['patterns']]
+                for i, pattern in enumerate(detected['patterns'])
+                if pattern['value'] != 0 or pattern['patterns']]
+    assert patterns == expected['ohlc']['patterns']
+
+
+def test_signals(expected, detected):
+    assert detected['signals'] == expected['ohlc']['signals']
+
+
+@pytest.mark.parametrize('body', BODIES)
+@pytest.mark.parametrize('pattern', list(candlesticks.PATTERNS))
+def test_pattern_library(expected, fuzzed_columns, pattern, body):
+    values, styles = candlesticks.pattern_library(pattern, fuzzed_columns, body=body)
+    hits = [[int(i), int(values[i]), styles[i]] for i in np.flatnonzero(values)]
+    assert hits == expected['columns'][f"{pattern}|{body}"]
@@ -0,0 +1,45 @@
+""" FundFrame attached to a dataframe's attrs: reused for that dataframe only """
+import numpy as np
+import pandas as pd
+
+from libs.utils.fund_frame import as_fund_frame
+
+
+def fund_dataframe(bars: int = 50) -> pd.DataFrame:
+    dates = pd.bdate_range('2020-01-01', periods=bars, name='Date')
+    fund = pd.DataFrame({key: np.arange(bars, dtype=np.float64) + i
+                         for i, key in enumerate(['Open', 'High', 'Low', 'Close', 'Adj Close'])},
+                        index=dates)
+    fund['Volume'] = np.arange(bars)
+    return fund
+
+
+def test_reused_for_same_dataframe():
+    fund = fund_dataframe()
+    frame = as_fund_frame(fund)
+    assert as_fund_frame(fund) is frame
+
+
+def test_edited_copy_is_rebuilt():
+    fund = fund_dataframe()
+    frame = as_fund_frame(fund)
+
+    # attrs follow the copy; first / last bars and length are unchanged
+    edited = fund.copy()
+    edited.iloc[10, edited.columns.get_loc('Open')] = -1.0
+    edited['Volume'] = edited['Volume'] * 2
+
+    rebuilt = as_fund_frame(edited)
+    assert rebuilt is not frame
+    assert rebuilt['Open'][10] == -1.0
+    assert rebuilt['Volume'][3] == 6.0
+    assert as_fund_frame(fund) is frame
+    assert frame['Open'][10] == 10.0
+
+
+def test_slice_is_rebuilt():
+    fund = fund_dataframe()
+    frame = as_fund_frame(fund)
+    sliced = as_fund_frame(fund.iloc[5:])
+    assert sliced is not frame
+    assert len(sliced) == 45
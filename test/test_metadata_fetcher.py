@@ -0,0 +1,58 @@
+""" Metadata fetcher caching: genuine results (empty ones included) are cached, failed requests are not """
+import pytest
+
+from libs.utils.api import MetadataFetcher, MetadataRequestError, request_failed
+from libs.utils.metadata_cache import MetadataCache
+
+
+def no_dividends():
+    return {'dividends': [], 'dates': []}
+
+
+def failed_dividends():
+    return request_failed("dividends: connection refused", {'dividends': [], 'dates': []},
+                          ['dividends'], strict=True)
+
+
+def partial_fundamentals():
+    raise MetadataRequestError("financials: scrape failed",
+                               {'info': {'sector': 'Technology'}, 'financials': {}},
+                               ['financials'])
+
+
+@pytest.fixture
+def fetcher(tmp_path):
+    fetcher = MetadataFetcher(workers=2, cache=MetadataCache(str(tmp_path)))
+    yield fetcher
+    fetcher.close()
+
+
+def fetch(fetcher: MetadataFetcher, endpoint: str, keys: list, function) -> dict:
+    fetcher.pending['AAA'] = {
+        endpoint: fetcher.submit_endpoint('AAA', endpoint, keys, function)}
+    return fetcher.result('AAA')
+
+
+def test_empty_result_is_cached(fetcher):
+    assert fetch(fetcher, 'dividends', ['dividends'], no_dividends) == \
+        {'dividends': no_dividends()}
+    state, cached = fetcher.cache.lookup('AAA', ['dividends'])
+    assert state == 'fresh'
+    assert cached == {'dividends': no_dividends()}
+
+
+def test_failed_request_is_not_cached(fetcher):
+    assert fetch(fetcher, 'dividends', ['dividends'], failed_dividends) == \
+        {'dividends': no_dividends()}
+    assert fetcher.cache.lookup('AAA', ['dividends'])[0] == 'missing'
+
+
+def test_only_genuine_fundamentals_are_cached(fetcher):
+    fetched = fetch(fetcher, 'fundamentals', ['info', 'financials'], partial_fundamentals)
+    assert fetched == {'info': {'sector': 'Technology'}, 'financials': {}}
+    assert fetcher.cache.lookup('AAA', ['info'])[0] == 'fresh'
+    assert fetcher.cache.lookup('AAA', ['financials'])[0] == 'missing'
+
+
+def test_non_strict_getter_returns_fallback():
+    assert request_failed("dividends: timeout", no_dividends(), ['dividends']) == no_dividends()
@@ -0,0 +1,169 @@
+""" Price store coverage bookkeeping: failed backfills are retried, not recorded as covered """
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from libs.utils import price_store
+from libs.utils.price_store import FixtureProvider, PRICE_COLUMNS
+
+
+def write_fixture(fixture_dir: str, ticker: str, years: int = 6, scale: float = 1.0):
+    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+    dates = pd.bdate_range(today - timedelta(days=365 * years), today, name='Date')
+    close = 100.0 + np.cumsum(np.random.default_rng(7).normal(0.0, 1.0, len(dates)))
+    close = close * scale
+    frame = pd.DataFrame({col: close for col in PRICE_COLUMNS}, index=dates)
+    frame['Volume'] = 1000.0
+    frame.to_csv(os.path.join(fixture_dir, f"{ticker}.csv"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    fixture_dir = tmp_path / "fixtures"
+    empty_dir = tmp_path / "empty"
+    fixture_dir.mkdir()
+    empty_dir.mkdir()
+    write_fixture(str(fixture_dir), 'AAA')
+
+    price_store.set_price_store_dir(str(tmp_path / "store"))
+    yield {"working": FixtureProvider(str(fixture_dir)), "failing": FixtureProvider(str(empty_dir)),
+           "fixture_dir": str(fixture_dir)}
+    price_store.set_price_provider()
+    price_store.set_price_store_dir()
+
+
+def test_failed_backfill_is_retried(store):
+    price_store.set_price_provider(store['working'])
+    one_year = price_store.store_download('AAA', period='1y')
+    covered = price_store.load_stored_fund('AAA', '1d')['covered_from']
+
+    # Backfill returns nothing: the store keeps its 1y coverage and fetch time
+    price_store.set_price_provider(store['failing'])
+    served = price_store.store_download('AAA', period='5y')
+    assert len(store['failing'].requests) == 1
+    assert len(served.index) == len(one_year.index)
+    assert price_store.load_stored_fund('AAA', '1d')['covered_from'] == covered
+
+    # A later 5y request with a working provider fetches the backfill
+    price_store.set_price_provider(store['working'])
+    five_years = price_store.store_download('AAA', period='5y')
+    assert len(store['working'].requests) == 2
+    assert store['working'].requests[-1]['start'] < covered
+    assert len(five_years.index) > len(one_year.index)
+    assert price_store.load_stored_fund('AAA', '1d')['covered_from'] < covered
+
+    # ...and once covered, the range is served from the store
+    price_store.store_download('AAA', period='5y')
+    assert len(store['working'].requests) == 2
+
+
+def test_short_backfill_warns(store, capsys):
+    price_store.set_price_provider(store['working'])
+    price_store.store_download('AAA', period='1y')
+    capsys.readouterr()
+
+    price_store.set_price_provider(store['failing'])
+    price_store.store_download('AAA', period='5y')
+    assert "AAA prices from" in capsys.readouterr().out
+
+
+def test_failed_first_fetch_is_not_stored(store):
+    price_store.set_price_provider(store['failing'])
+    served = price_store.store_download('AAA', period='1y')
+    assert len(served.index) == 0
+    assert not os.path.exists(price_store.stored_fund_path('AAA', '1d'))
+
+    price_store.set_price_provider(store['working'])
+    served = price_store.store_download('AAA', period='1y')
+    assert len(store['working'].requests) == 1
+    assert len(served.index) > 0
+
+
+def test_concurrent_saves_do_not_share_temp_files(store):
+    price_store.set_price_provider(store['working'])
+    price_store.store_download('AAA', period='1y')
+    stored = price_store.load_stored_fund('AAA', '1d')
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        saves = [executor.submit(price_store.save_stored_fund, 'AAA', '1d', stored)
+                 for _ in range(16)]
+        for save in saves:
+            save.result()
+
+    path = price_store.stored_fund_path('AAA', '1d')
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+    assert len(price_store.load_stored_fund('AAA', '1d')['frame'].index) == \
+        len(stored['frame'].index)
+
+
+def test_provider_calls_are_serialized(store):
+    write_fixture(store['fixture_dir'], 'BBB')
+    active = []
+    overlaps = []
+
+    def tracking_provider(tickers, start, end, interval='1d'):
+        active.append(tickers)
+        overlaps.append(len(active) > 1)
+        time.sleep(0.05)
+        frame = store['working'](tickers, start, end, interval=interval)
+        active.remove(tickers)
+        return frame
+
+    price_store.set_price_provider(tracking_provider)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        downloads = [executor.submit(price_store.store_download, ticker, period='1y')
+                     for ticker in ['AAA', 'BBB']]
+        for download in downloads:
+            assert len(download.result().index) > 0
+
+    assert overlaps == [False, False]
+
+
+def test_rebased_history_is_refetched(store):
+    price_store.set_price_provider(store['working'])
+    price_store.store_download('AAA', period='1y')
+    stored = price_store.load_stored_fund('AAA', '1d')
+    covered = stored['covered_from']
+
+    # A 2:1 split re-adjusts the provider's history; the stored copy is due for a refresh
+    write_fixture(store['fixture_dir'], 'AAA', scale=0.5)
+    stored['fetched'] = 0.0
+    price_store.save_stored_fund('AAA', '1d', stored)
+
+    served = price_store.store_download('AAA', period='1y')
+    assert store['working'].requests[-1]['start'] == covered
+    np.testing.assert_allclose(served['Close'].to_numpy(),
+                               stored['frame']['Close'].to_numpy() * 0.5)
+    assert price_store.load_stored_fund('AAA', '1d')['covered_from'] == covered
+
+
+def test_refresh_keeps_unadjusted_history(store):
+    price_store.set_price_provider(store['working'])
+    price_store.store_download('AAA', period='1y')
+    stored = price_store.load_stored_fund('AAA', '1d')
+    stored['fetched'] = 0.0
+    price_store.save_stored_fund('AAA', '1d', stored)
+
+    price_store.store_download('AAA', period='1y')
+    assert len(store['working'].requests) == 2
+    assert store['working'].requests[-1]['start'] == stored['frame'].index[-2]
+
+
+@pytest.mark.parametrize('period, delta', [
+    ('60d', relativedelta(days=60)), ('730d', relativedelta(days=730)),
+    ('2wk', relativedelta(weeks=2)), ('3mo', relativedelta(months=3)),
+    ('10y', relativedelta(years=10))])
+def test_period_date_range(period, delta):
+    today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+    assert price_store.get_date_range(period=period)[0] == today - delta
+
+
+def test_unknown_period_raises():
+    with pytest.raises(ValueError):
+        price_store.get_date_range(period='2 years')
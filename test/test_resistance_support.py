@@ -0,0 +1,73 @@
+""" Support / resistance points and lines against recorded outputs of the per-window implementation """
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from libs.tools import resistance_support
+from libs.utils import RENDER_POOL
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+TIMEFRAMES = [5, 13, 21, 34, 55]
+
+
+def fund_variants() -> dict:
+    fund = pd.read_csv(os.path.join(FIXTURES, 'resistance_support_ohlc.csv'),
+                       index_col=0, parse_dates=True)
+    # Mutual fund style: no close on the latest bar
+    last_nan = fund.copy()
+    last_nan.loc[last_nan.index[-1], 'Close'] = np.nan
+    # Many equal closes within a window
+    ties = fund.copy()
+    ties['Close'] = np.round(ties['Close'], 0)
+    return {'recorded': fund, 'last_nan': last_nan, 'ties': ties, 'short': fund.iloc[-60:]}
+
+
+def recorded(value):
+    """ As recorded through json: numpy scalars and dates as strings, tuples as lists """
+    return json.loads(json.dumps(value, default=str))
+
+
+@pytest.fixture(scope='module')
+def expected() -> dict:
+    with open(os.path.join(FIXTURES, 'resistance_support_expected.json')) as expected_file:
+        return json.load(expected_file)
+
+
+@pytest.fixture(scope='module')
+def no_charts():
+    previous = RENDER_POOL.summary()
+    RENDER_POOL.configure(mode='off')
+    yield
+    RENDER_POOL.configure(mode=previous['mode'], workers=previous['workers'])
+
+
+@pytest.mark.parametrize('variant', list(fund_variants()))
+def test_find_points(expected, variant):
+    fund = fund_variants()[variant]
+    points = {f"{timeframe}|{line_type}|{filter_type}": resistance_support.find_points(
+        fund, timeframe, line_type=line_type, filter_type=filter_type)
+        for timeframe in TIMEFRAMES for line_type in ['support', 'resistance']
+        for filter_type in ['windowed', 'convolution']}
+    assert recorded(points) == expected[variant]['points']
+
+
+@pytest.mark.parametrize('variant', list(fund_variants()))
+def test_sort_and_cluster(expected, variant):
+    fund = fund_variants()[variant]
+    points = {str(timeframe): dict(zip(['x', 'y'], resistance_support.find_points(
+        fund, timeframe, line_type='support'))) for timeframe in TIMEFRAMES[1:]}
+    sorted_points = resistance_support.sort_and_group(points)
+    assert recorded(sorted_points) == expected[variant]['sorted']
+    clusters = resistance_support.cluster_notables(sorted_points, fund)
+    assert recorded(clusters) == expected[variant]['clusters']
+
+
+@pytest.mark.parametrize('variant', list(fund_variants()))
+def test_find_resistance_support_lines(expected, no_charts, variant):
+    fund = fund_variants()[variant]
+    analysis = resistance_support.find_resistance_support_lines(
+        fund, plot_output=False, name='RS', view='2y')
+    assert recorded(analysis) == expected[variant]['lines']
@@ -0,0 +1,118 @@
+""" Incremental run state: resumed indicators equal a full computation from their anchor date """
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from libs.utils import RENDER_POOL
+from libs.utils.run_state import resume_point
+from libs.tools.rsi import generate_rsi_signal
+from libs.tools.full_stochastic import generate_full_stoch_signal
+from libs.tools.know_sure_thing import kst_signal
+from libs.tools.on_balance_volume import generate_obv_signal
+from libs.tools.moving_average import triple_exp_mov_average
+from libs.tools.macd import generate_macd_signal
+
+WINDOW = 300
+
+
+def fund_dataframe(bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range('2018-01-01', periods=bars, name='Date')
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, bars))
+    fund = pd.DataFrame({'Open': close + rng.normal(0.0, 0.5, bars),
+                         'High': close + np.abs(rng.normal(0.0, 1.0, bars)),
+                         'Low': close - np.abs(rng.normal(0.0, 1.0, bars)),
+                         'Close': close, 'Adj Close': close}, index=dates)
+    fund['Volume'] = rng.integers(1000, 5000, bars).astype(np.float64)
+    # Repeated closes exercise the unchanged-close branches
+    fund.iloc[200:204, fund.columns.get_loc('Close')] = fund['Close'].iloc[199]
+    return fund
+
+
+def rsi(fund, state):
+    return {'rsi': generate_rsi_signal(fund, state=state)}
+
+
+def stochastic(fund, state):
+    return generate_full_stoch_signal(
+        fund, plot_output=False, out_suppress=True, state=state)
+
+
+def kst(fund, state):
+    signal, signal_line = kst_signal(
+        fund, plot_output=False, name='AAA', views='2y', state=state)
+    return {'signal': signal, 'signal_line': signal_line}
+
+
+def ema(fund, state):
+    return triple_exp_mov_average(
+        fund, plot_output=False, name='AAA', out_suppress=True, state=state)['tabular']
+
+
+def macd(fund, state):
+    macd_data = generate_macd_signal(
+        fund, plot_output=False, name='AAA', view='2y', state=state)
+    return {key: macd_data['tabular'][key] for key in ['macd', 'signal_line']}
+
+
+def obv(fund, state):
+    return {'obv': generate_obv_signal(fund, state=state)}
+
+
+INDICATORS = [rsi, stochastic, kst, ema, macd]
+
+
+@pytest.fixture(autouse=True)
+def no_charts():
+    previous = RENDER_POOL.summary()
+    RENDER_POOL.configure(mode='off')
+    yield
+    RENDER_POOL.configure(mode=previous['mode'], workers=previous['workers'])
+
+
+def run(indicator, fund: pd.DataFrame, state: dict) -> dict:
+    """ One run of an indicator, with its state saved and loaded as between runs """
+    signals = indicator(fund, state)
+    return signals, json.loads(json.dumps(state))
+
+
+@pytest.mark.parametrize('new_bars', [1, 3, 40])
+@pytest.mark.parametrize('indicator', INDICATORS, ids=lambda indicator: indicator.__name__)
+def test_resume_matches_computation_from_anchor(indicator, new_bars):
+    history = fund_dataframe(WINDOW + 2 * new_bars)
+    _, state = run(indicator, history.iloc[:WINDOW], {})
+    assert state['anchor'] == str(history.index[0])
+
+    # Two later runs, each window slid forward by the bars that arrived since
+    for day in [1, 2]:
+        window = history.iloc[day * new_bars:WINDOW + day * new_bars]
+        assert resume_point(window, state) == new_bars
+        resumed, state = run(indicator, window, state)
+        assert state['anchor'] == str(history.index[0])
+
+        anchored = indicator(history.iloc[:WINDOW + day * new_bars], None)
+        for key, signal in resumed.items():
+            assert len(signal) == WINDOW
+            np.testing.assert_allclose(signal, anchored[key][-WINDOW:], rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('new_bars', [1, 40])
+def test_obv_resume_is_rebased_to_window(new_bars):
+    history = fund_dataframe(WINDOW + new_bars)
+    _, state = run(obv, history.iloc[:WINDOW], {})
+
+    window = history.iloc[new_bars:]
+    resumed, state = run(obv, window, state)
+    np.testing.assert_allclose(resumed['obv'], obv(window, None)['obv'])
+
+
+def test_longer_window_is_recomputed_and_reanchored():
+    history = fund_dataframe(WINDOW + 50)
+    _, state = run(rsi, history.iloc[50:], {})
+    assert resume_point(history, state) is None
+
+    signals, state = run(rsi, history, state)
+    assert state['anchor'] == str(history.index[0])
+    np.testing.assert_allclose(signals['rsi'], rsi(history, None)['rsi'])